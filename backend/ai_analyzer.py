@@ -3,14 +3,15 @@ Modul pentru analiza fake news folosind servicii AI externe.
 Implementeaza detectia fake news cu OpenAI GPT si Google Perspective API.
 """
 
-import openai
-import requests
+import asyncio
 from langdetect import detect
 import json
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import logging
 
+from async_http import ProviderClient
+
 try:
     from config import *
     GOOGLE_API_KEY = GOOGLE_PERSPECTIVE_API_KEY
@@ -33,6 +34,16 @@ except ImportError:
     TOXICITY_THRESHOLD = 0.6
     SUPPORTED_LANGUAGES = ['ro', 'en', 'fr', 'es', 'de', 'it']
 
+try:
+    import config as _config
+except ImportError:
+    _config = None
+
+OPENAI_API_BASE = getattr(_config, 'OPENAI_API_BASE', "https://api.openai.com/v1")
+PERSPECTIVE_API_BASE = getattr(_config, 'PERSPECTIVE_API_BASE', "https://commentanalyzer.googleapis.com/v1alpha1")
+OPENAI_MAX_CONCURRENCY = getattr(_config, 'OPENAI_MAX_CONCURRENCY', 4)
+PERSPECTIVE_MAX_CONCURRENCY = getattr(_config, 'PERSPECTIVE_MAX_CONCURRENCY', 8)
+
 class AIAnalyzer:
     """
     Clasa pentru analiza fake news folosind servicii AI externe.
@@ -42,8 +53,10 @@ class AIAnalyzer:
     def __init__(self):
         """Initializeaza analizorul AI cu configuratiile necesare."""
         self.logger = logging.getLogger(__name__)
-        if OPENAI_API_KEY:
-            openai.api_key = OPENAI_API_KEY
+        
+        # Clienți HTTP asincroni cu pool de conexiuni și limită de concurență per furnizor
+        self.openai_client = ProviderClient('openai', OPENAI_API_BASE, max_concurrency=OPENAI_MAX_CONCURRENCY)
+        self.perspective_client = ProviderClient('perspective', PERSPECTIVE_API_BASE, max_concurrency=PERSPECTIVE_MAX_CONCURRENCY)
 
     def detect_language(self, text: str) -> str:
         """
@@ -157,17 +170,21 @@ MANDATORY JSON RESPONSE FORMAT:
 CRITICAL: Match the language of your response exactly to the language of the input text."""
 
         try:
-            response = openai.ChatCompletion.create(
-                model=DEFAULT_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a fake news detection expert. CRITICAL RULE: Always respond in the exact same language as the input text. Detect the input language carefully and match it exactly in your response."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.05,
-                max_tokens=1000
+            response = await self.openai_client.post_json(
+                '/chat/completions',
+                {
+                    "model": DEFAULT_MODEL,
+                    "messages": [
+                        {"role": "system", "content": "You are a fake news detection expert. CRITICAL RULE: Always respond in the exact same language as the input text. Detect the input language carefully and match it exactly in your response."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0.05,
+                    "max_tokens": 1000
+                },
+                headers={"Authorization": f"Bearer {OPENAI_API_KEY}"}
             )
             
-            content = response.choices[0].message.content
+            content = response['choices'][0]['message']['content']
             try:
                 result = json.loads(content)
                 result['source'] = 'openai'
@@ -192,7 +209,7 @@ CRITICAL: Match the language of your response exactly to the language of the inp
             self.logger.error(f"Eroare OpenAI: {e}")
             return {"error": f"Eroare OpenAI: {str(e)}"}
 
-    def analyze_toxicity_perspective(self, text: str) -> Dict:
+    async def analyze_toxicity_perspective(self, text: str) -> Dict:
         """
         Analizeaza toxicitatea textului folosind Google Perspective API.
         
@@ -205,8 +222,6 @@ CRITICAL: Match the language of your response exactly to the language of the inp
         if not ENABLE_PERSPECTIVE or not GOOGLE_API_KEY:
             return {"error": "Perspective API nu este configurat"}
 
-        url = f'https://commentanalyzer.googleapis.com/v1alpha1/comments:analyze?key={GOOGLE_API_KEY}'
-        
         data = {
             'requestedAttributes': {
                 'TOXICITY': {}
@@ -216,8 +231,7 @@ CRITICAL: Match the language of your response exactly to the language of the inp
         }
 
         try:
-            response = requests.post(url, data=json.dumps(data), headers={'Content-Type': 'application/json'})
-            result = response.json()
+            result = await self.perspective_client.post_json('/comments:analyze', data, params={'key': GOOGLE_API_KEY})
             
             if 'attributeScores' in result:
                 scores = {}
@@ -298,17 +312,18 @@ CRITICAL: Match the language of your response exactly to the language of the inp
 
     async def analyze_text(self, text: str) -> Dict:
         """Funcția principală de analiză care combină toate metodele"""
-        analyses = []
+        tasks = []
         
         # Analiză OpenAI - lasă OpenAI să detecteze limba automat
         if ENABLE_OPENAI:
-            openai_result = await self.analyze_with_openai(text)
-            analyses.append(openai_result)
+            tasks.append(self.analyze_with_openai(text))
         
         # Analiză Perspective API
         if ENABLE_PERSPECTIVE:
-            perspective_result = self.analyze_toxicity_perspective(text)
-            analyses.append(perspective_result)
+            tasks.append(self.analyze_toxicity_perspective(text))
+        
+        # Cele două servicii rulează concurent
+        analyses = list(await asyncio.gather(*tasks))
         
         # Combină rezultatele
         final_result = self.combine_analyses(analyses)
@@ -316,4 +331,11 @@ CRITICAL: Match the language of your response exactly to the language of the inp
         # Folosește doar limba detectată de OpenAI
         # Nu mai suprascrie cu detectarea locală
         
-        return final_result 
\ No newline at end of file
+        return final_result
+
+    def get_status(self) -> Dict:
+        """Metrici despre clienții HTTP ai serviciilor AI."""
+        return {
+            'openai': self.openai_client.get_status(),
+            'perspective': self.perspective_client.get_status()
+        }
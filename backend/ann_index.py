@@ -0,0 +1,274 @@
+"""
+Indexuri de cautare a celor mai apropiati vecini (ANN) pentru embedding-uri normalizate.
+Implementeaza o interfata comuna, un index exact si un index IVF in NumPy pur,
+plus indexul semantic peste intregul dataset etichetat (simple_large_dataset.json).
+"""
+
+import json
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from embedding_index import ReferenceEmbeddingIndex, normalize_rows
+
+try:
+    import config
+except ImportError:
+    config = None
+
+ANN_BACKEND = getattr(config, 'ANN_BACKEND', 'ivf')
+ANN_NPROBE = getattr(config, 'ANN_NPROBE', 8)
+ANN_MIN_IVF_SIZE = getattr(config, 'ANN_MIN_IVF_SIZE', 5000)
+
+
+class NearestNeighborIndex:
+    """
+    Interfata comuna pentru indexurile de vecini.
+    Vectorii si interogarile sunt normalizate L2, deci scorul este similaritatea cosinus.
+    """
+
+    name = 'base'
+
+    def build(self, vectors: np.ndarray, ids: List[str]) -> 'NearestNeighborIndex':
+        """
+        Construieste indexul peste vectori.
+
+        Args:
+            vectors: Matrice (N, D) de embedding-uri normalizate
+            ids: Identificatorii celor N vectori
+
+        Returns:
+            NearestNeighborIndex: Indexul insusi, pentru inlantuire
+        """
+        raise NotImplementedError
+
+    def search(self, query: np.ndarray, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        Cauta cei mai apropiati k vecini ai interogarii.
+
+        Args:
+            query: Vector (D,) normalizat L2
+            k: Numarul de vecini returnati
+
+        Returns:
+            list: Perechi (id, similaritate) in ordine descrescatoare a similaritatii
+        """
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        return len(getattr(self, 'ids', []))
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Returneaza pozitiile celor mai mari k scoruri, sortate descrescator."""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind='stable')]
+
+
+class ExactIndex(NearestNeighborIndex):
+    """Cautare exhaustiva: un singur produs matrice-vector peste toti vectorii."""
+
+    name = 'exact'
+
+    def build(self, vectors: np.ndarray, ids: List[str]) -> 'ExactIndex':
+        self.vectors = np.asarray(vectors, dtype=np.float32)
+        self.ids = list(ids)
+        return self
+
+    def search(self, query: np.ndarray, k: int = 5) -> List[Tuple[str, float]]:
+        scores = self.vectors @ np.asarray(query, dtype=np.float32)
+        return [(self.ids[i], float(scores[i])) for i in _top_k(scores, k)]
+
+
+class IVFIndex(NearestNeighborIndex):
+    """
+    Index IVF (inverted file): vectorii sunt grupati cu k-means sferic in nlist liste,
+    iar interogarea scaneaza doar cele mai apropiate nprobe liste.
+    Listele sunt stocate contiguu, astfel incat fiecare lista este o vedere fara copiere.
+    """
+
+    name = 'ivf'
+
+    def __init__(self, nlist: Optional[int] = None, nprobe: int = ANN_NPROBE,
+                 train_iterations: int = 10, max_train_size: int = 20000, seed: int = 42):
+        """
+        Args:
+            nlist: Numarul de liste (None = aproximativ sqrt(N))
+            nprobe: Numarul de liste scanate la cautare
+            train_iterations: Iteratii k-means
+            max_train_size: Numarul maxim de vectori folositi la antrenarea centroizilor
+            seed: Seed pentru reproductibilitate
+        """
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_iterations = train_iterations
+        self.max_train_size = max_train_size
+        self.seed = seed
+
+    def _assign(self, vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 8192) -> np.ndarray:
+        """Atribuie fiecare vector celui mai apropiat centroid, pe bucati pentru memorie limitata."""
+        assignments = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), chunk_size):
+            block = vectors[start:start + chunk_size] @ centroids.T
+            assignments[start:start + chunk_size] = np.argmax(block, axis=1)
+        return assignments
+
+    def _train(self, vectors: np.ndarray, nlist: int) -> np.ndarray:
+        """Antreneaza centroizii cu k-means sferic pe un esantion."""
+        rng = np.random.default_rng(self.seed)
+        if len(vectors) > self.max_train_size:
+            sample = vectors[rng.choice(len(vectors), self.max_train_size, replace=False)]
+        else:
+            sample = vectors
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+
+        for _ in range(self.train_iterations):
+            assignments = self._assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            counts = np.bincount(assignments, minlength=nlist)
+            empty = counts == 0
+            if np.any(empty):
+                # Listele goale primesc vectori aleatori din esantion
+                sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            centroids = normalize_rows(sums)
+        return centroids
+
+    def build(self, vectors: np.ndarray, ids: List[str]) -> 'IVFIndex':
+        vectors = np.asarray(vectors, dtype=np.float32)
+        self.ids = list(ids)
+        nlist = self.nlist or max(1, int(np.sqrt(len(vectors))))
+        nlist = max(1, min(nlist, len(vectors)))
+
+        self.centroids = self._train(vectors, nlist)
+        assignments = self._assign(vectors, self.centroids)
+
+        # Reordonează vectorii astfel încât fiecare listă să fie un bloc contiguu
+        order = np.argsort(assignments, kind='stable')
+        self.vectors = np.ascontiguousarray(vectors[order])
+        self.positions = order
+        counts = np.bincount(assignments, minlength=nlist)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+        return self
+
+    def search(self, query: np.ndarray, k: int = 5) -> List[Tuple[str, float]]:
+        query = np.asarray(query, dtype=np.float32)
+        probes = _top_k(self.centroids @ query, self.nprobe)
+
+        score_blocks = []
+        position_blocks = []
+        for list_id in probes:
+            start, end = self.offsets[list_id], self.offsets[list_id + 1]
+            if start == end:
+                continue
+            score_blocks.append(self.vectors[start:end] @ query)
+            position_blocks.append(np.arange(start, end))
+
+        if not score_blocks:
+            return []
+        scores = np.concatenate(score_blocks)
+        rows = np.concatenate(position_blocks)
+        return [(self.ids[self.positions[rows[i]]], float(scores[i])) for i in _top_k(scores, k)]
+
+
+def create_index(size: int, backend: Optional[str] = None) -> NearestNeighborIndex:
+    """
+    Creeaza indexul potrivit pentru numarul de vectori.
+
+    Args:
+        size: Numarul de vectori ce vor fi indexati
+        backend: 'ivf' sau 'exact' (None = ANN_BACKEND din config)
+
+    Returns:
+        NearestNeighborIndex: Index neconstruit
+    """
+    backend = backend or ANN_BACKEND
+    if backend == 'ivf' and size >= ANN_MIN_IVF_SIZE:
+        return IVFIndex()
+    return ExactIndex()
+
+
+class LabelledCorpusIndex:
+    """
+    Index semantic peste un dataset etichetat (fake/real).
+    Pastreaza cate un index ANN pentru fiecare eticheta, astfel incat
+    cautarea returneaza mereu top-k vecini fake si top-k vecini reali.
+    """
+
+    LABELS = {1: 'fake', 0: 'real'}
+
+    def __init__(self, articles: List[Dict], model, model_name: str,
+                 backend: Optional[str] = None, cache_dir: Optional[str] = None):
+        """
+        Args:
+            articles: Articole cu cheile 'id', 'text' si 'label' (1 = fake, 0 = real)
+            model: Modelul Sentence Transformer
+            model_name: Numele modelului, folosit in cheia de cache
+            backend: Backend-ul ANN ('ivf' sau 'exact')
+            cache_dir: Directorul cache-ului de embedding-uri (None = implicit)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.articles = {}
+        self.indexes = {}
+
+        for label, label_name in self.LABELS.items():
+            subset = [a for a in articles if a.get('label') == label and a.get('text')]
+            if not subset:
+                continue
+            ids = [str(a.get('id', f"{label_name}_{i}")) for i, a in enumerate(subset)]
+            embeddings = ReferenceEmbeddingIndex([a['text'] for a in subset], model, model_name, cache_dir)
+            self.indexes[label_name] = create_index(len(subset), backend).build(embeddings.matrix, ids)
+            self.articles.update(zip(ids, subset))
+
+        self.logger.info(
+            f"Index semantic construit: {', '.join(f'{n}={len(i)}' for n, i in self.indexes.items())}"
+        )
+
+    @classmethod
+    def from_dataset(cls, path: str, model, model_name: str, backend: Optional[str] = None) -> Optional['LabelledCorpusIndex']:
+        """
+        Construieste indexul din fisierul JSON al datasetului.
+
+        Args:
+            path: Calea catre datasetul etichetat
+            model: Modelul Sentence Transformer
+            model_name: Numele modelului
+
+        Returns:
+            LabelledCorpusIndex sau None daca fisierul nu exista
+        """
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            articles = json.load(f)
+        return cls(articles, model, model_name, backend)
+
+    def __len__(self) -> int:
+        return sum(len(index) for index in self.indexes.values())
+
+    def search(self, query: np.ndarray, k: int = 5) -> Dict[str, List[Dict]]:
+        """
+        Cauta vecinii fake si reali cei mai apropiati de interogare.
+
+        Args:
+            query: Embedding normalizat L2
+            k: Numarul de vecini per eticheta
+
+        Returns:
+            dict: {'fake': [...], 'real': [...]} cu id, similaritate si text pentru fiecare vecin
+        """
+        results = {}
+        for label_name, index in self.indexes.items():
+            results[label_name] = [
+                {'id': article_id, 'similarity': score, 'text': self.articles[article_id]['text']}
+                for article_id, score in index.search(query, k)
+            ]
+        return results
@@ -1,11 +1,13 @@
-from flask import Flask, request, jsonify, session
+from flask import Flask, Request, Response, request, jsonify, send_file, session, stream_with_context
 from flask_cors import CORS
-import pickle
-import requests
-from bs4 import BeautifulSoup
 import os
+import queue
+import sys
+import threading
+import time
 from datetime import timedelta, datetime
 import json
+import mimetypes
 import asyncio
 import logging
 import numpy as np
@@ -13,13 +15,28 @@ from werkzeug.security import generate_password_hash, check_password_hash
 
 # Import sistemul hibrid
 from hybrid_analyzer import HybridAnalyzer
-from video_analyzer import VideoAnalyzer
+from ml_analyzer import MODEL_WARMUP_ON_STARTUP
+from model_registry import get_model_registry
+from async_runtime import run_async, run_blocking_io
+from result_cache import get_result_cache
+from url_fetcher import get_url_fetcher
+from job_queue import PermanentJobError, SUCCEEDED, QUEUED, RUNNING, FINISHED_STATUSES, get_job_queue
+from progress import format_sse, format_sse_comment, partial_result, track_stage
+from upload_store import BlobStore, StreamingUpload
 
 # Import baza de date
-from models import db, User, Analysis
+from sqlalchemy.exc import IntegrityError
+from models import db, User, Analysis, VideoBlob, VideoUpload, VideoAnalysisResult
 from database import init_database, create_admin_user, get_user_stats, get_system_stats
 
+class UploadRequest(Request):
+    """Request whose uploaded files are written straight into the upload folder, hashed on the way."""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return StreamingUpload(UPLOAD_FOLDER)
+
 app = Flask(__name__)
+app.request_class = UploadRequest
 CORS(app, supports_credentials=True, origins=["http://localhost:3000", "http://localhost:5173"])
 # Cheie secretă fixă pentru development (în producție ar trebui să fie din variabilă de mediu)
 app.secret_key = 'dev-secret-key-fake-news-detector-2025'
@@ -45,31 +62,37 @@ logging.basicConfig(level=logging.INFO)
 
 # Configurare upload-uri
 UPLOAD_FOLDER = 'uploads'
+VIDEO_BLOB_FOLDER = os.path.join(UPLOAD_FOLDER, 'blobs')  # Conținutul unic al videoclipurilor, după SHA-256
 ALLOWED_VIDEO_EXTENSIONS = {'mp4', 'avi', 'mov', 'mkv', 'wmv', 'flv', 'webm'}
 MAX_CONTENT_LENGTH = 100 * 1024 * 1024  # 100MB max file size
+PREDICT_BATCH_MAX_ITEMS = 100  # Numărul maxim de texte într-o cerere /predict/batch
+ANALYSIS_MODES = ('hybrid', 'cascade', 'ai_only', 'ml_only', 'traditional')
+SSE_POLL_INTERVAL = 0.25  # Cât de des verifică un flux SSE evenimentele noi ale unui job (secunde)
+SSE_HEARTBEAT_SECONDS = 15  # Comentariu keep-alive trimis când nu există evenimente
+SSE_HEADERS = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
 
 if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+blob_store = BlobStore(VIDEO_BLOB_FOLDER)
 app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 
-# Inițializare sistem hibrid și video analyzer
+# Inițializare sistem hibrid (modelele transformer se încarcă la prima utilizare; analizorul video
+# și OpenCV se încarcă la prima analiză video, vezi get_video_analyzer)
 hybrid_analyzer = HybridAnalyzer()
-video_analyzer = VideoAnalyzer()
-
-# Păstrăm încărcarea modelului tradițional ca fallback
-try:
-    with open("vectorizer.pkl", "rb") as f:
-        vectorizer = pickle.load(f)
-    with open("model.pkl", "rb") as f:
-        traditional_model = pickle.load(f)
+
+# Modelele se încarcă în paralel, în fundal, ca prima cerere să nu aștepte
+if MODEL_WARMUP_ON_STARTUP:
+    hybrid_analyzer.ml_analyzer.warm_up(background=True)
+
+# Păstrăm modelul tradițional ca fallback; pickle-urile sunt încărcate o singură dată prin registru
+vectorizer, traditional_model = get_model_registry().get('traditional_pickles') or (None, None)
+if traditional_model is not None:
     print("Model tradițional încărcat ca backup")
-except Exception as e:
-    print(f"Model tradițional nu este disponibil: {e}")
+else:
+    print("Model tradițional nu este disponibil")
     print("Aplicația va folosi doar modelele moderne pentru analiză")
-    vectorizer = None
-    traditional_model = None
 
 # Funcții pentru gestionarea utilizatorilor cu baza de date
 def get_user_by_username(username):
@@ -176,33 +199,144 @@ def save_video_analysis(user_id, filename, result):
         technical_details=technical_details
     )
 
-def extract_text_from_url(url):
+def video_filename(owner, original_name):
+    """
+    Builds the public name of an uploaded video: '{owner}_{timestamp}_{original name}'.
+    
+    Args:
+        owner: The user id (or 'guest').
+        original_name (str): The uploaded file name.
+        
+    Returns:
+        str: The name used by /video/<filename> and /list-videos.
+    """
+    return f"{owner}_{datetime.now().strftime('%Y%m%d_%H%M%S%f')}_{original_name}"
+
+def store_video_upload(video_file, user_id, filename):
+    """
+    Adds an uploaded video to the content-addressed blob store and records the user's reference to it.
+    Identical content uploaded again (by anyone) reuses the stored blob instead of adding a copy.
+    
+    Args:
+        video_file (FileStorage): The uploaded file.
+        user_id (int): The uploading user, or None for guests.
+        filename (str): The public name of the upload (see video_filename).
+        
+    Returns:
+        VideoUpload: The saved reference; the file is at blob_store.path(upload.sha256).
+    """
+    stored = blob_store.add(video_file)
+    if db.session.get(VideoBlob, stored.sha256) is None:
+        db.session.add(VideoBlob(sha256=stored.sha256, size=stored.size))
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()  # Același conținut a fost înregistrat simultan de altă cerere
+    
+    upload = VideoUpload(user_id=user_id, sha256=stored.sha256, filename=filename,
+                         original_name=video_file.filename, content_type=video_file.content_type)
+    db.session.add(upload)
+    db.session.commit()
+    return upload
+
+def get_video_analyzer():
     """
-    Extracts readable text content from a web page URL.
+    Returns the process-wide video analyzer, importing the video modules on first use.
+    
+    OpenCV, the frame samplers and the detectors are only loaded when a video is analyzed,
+    not at app start; the analyzer, detectors and probed tools are shared by all requests.
+    
+    Returns:
+        VideoAnalyzer: The shared analyzer.
+    """
+    from video_analyzer import get_advanced_video_analyzer
+    return get_advanced_video_analyzer()
+
+def get_cached_video_result(sha256):
+    """
+    Returns the stored analysis of a video's content for the current analyzer version.
     
     Args:
-        url (str): The URL to extract text from.
+        sha256 (str): The content hash of the video.
         
     Returns:
-        str: The extracted text content, empty string if extraction fails.
+        dict: The analysis result marked with 'cached', or None.
     """
+    from video_analyzer import analyzer_version
+    row = VideoAnalysisResult.query.filter_by(sha256=sha256, analyzer_version=analyzer_version()).first()
+    if row is None:
+        return None
+    result = row.get_result()
+    result['cached'] = True
+    return result
+
+def cache_video_result(sha256, result):
+    """
+    Stores the analysis of a video's content, keyed by (content hash, analyzer version).
+    
+    Args:
+        sha256 (str): The content hash of the video.
+        result (dict): The analyzer output, before the per-upload metadata is added.
+    """
+    from video_analyzer import analyzer_version
+    db.session.add(VideoAnalysisResult(sha256=sha256, analyzer_version=analyzer_version(),
+                                       result=json.dumps(convert_numpy_types(result))))
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        resp = requests.get(url, headers=headers, timeout=10)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        # Get text from paragraphs and headings
-        text_elements = soup.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        text = ' '.join([elem.get_text().strip() for elem in text_elements])
-        return text
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()  # Rezultatul a fost salvat între timp de o analiză simultană
+
+def extract_article_from_url(url):
+    """
+    Extracts the main article from a web page URL.
+
+    Pages are downloaded through the shared pooled fetcher, which caps the download size
+    and caches the extracted article per URL (revalidated with ETag / Last-Modified).
+    Navigation, cookie banners and comment threads are dropped by the content extractor.
+    
+    Args:
+        url (str): The URL to extract the article from.
+        
+    Returns:
+        dict: 'title', 'published' and 'text' of the article, or None if extraction fails.
+    """
+    try:
+        return get_url_fetcher().fetch_article(url)
     except Exception as e:
         print(f"Error extracting text from URL: {str(e)}")
-        return ""
+        return None
+
+def extract_articles_from_urls(urls):
+    """
+    Extracts the articles of several URLs concurrently, on the shared I/O thread pool.
+    
+    Args:
+        urls (list): The URLs to fetch; duplicates are fetched once.
+        
+    Returns:
+        dict: The extracted article (or None, see extract_article_from_url) for each URL.
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    
+    async def fetch_all():
+        return await asyncio.gather(*(run_blocking_io(extract_article_from_url, url) for url in unique_urls))
+    
+    return dict(zip(unique_urls, run_async(fetch_all()))) if unique_urls else {}
+
+def article_metadata(article, url):
+    """
+    Returns the structured article fields included in responses and stored analyses.
+    
+    Args:
+        article (dict): The extracted article, or None for plain text submissions.
+        url (str): The source URL.
+        
+    Returns:
+        dict: The article metadata, or None.
+    """
+    if not article:
+        return None
+    return {'url': url, 'title': article.get('title'), 'published': article.get('published')}
 
 def convert_numpy_types(obj):
     """
@@ -369,6 +503,421 @@ def debug_session():
         'all_cookies': dict(request.cookies)
     })
 
+def traditional_heuristic_analysis(text, pred, proba):
+    """
+    Applies the heuristic corrections of the traditional mode on top of the
+    TF-IDF + Logistic Regression prediction for one text.
+    
+    Args:
+        text (str): The analyzed text.
+        pred (int): The model prediction (1 = fake, 0 = real).
+        proba (array): The class probabilities returned by the model.
+        
+    Returns:
+        dict: The analysis result with verdict, confidence, explanation and detected language.
+    """
+    # Analiză heuristică îmbunătățită pentru a corecta false pozitive
+    text_lower = text.lower()
+    
+    # Indicatori puternici de fake news
+    strong_fake_indicators = [
+        'urgent!', 'breaking!', 'breaking:', 'breaking', 'șocant!', 'incredibil!', 'secret!', 'ascuns!',
+        'experți anonimi', 'surse anonime', 'organizație secretă', 'complot',
+        'industria ascunde', 'guvernul ascunde', 'big pharma', 'agenda ascunsă',
+        'metoda secretă', 'descoperire revoluționară', 'rezultate incredibile',
+        'funcționează 100%', 'garantat', 'milioane au încercat', 'sunt șocați',
+        'premieră mondială', 'premiera mondiala', 'prima țară', 'prima tara',
+        'nicăieri în lume', 'nicaieri in lume', 'niciodată văzut', 'niciodată vazut',
+        'revoluționară', 'revolutionara', 'spectaculoase', 'transformă complet',
+        'transforma complet', 'rezultate spectaculoase', 'note cu 40%', 'reducere de 60%',
+        'miliarde euro', 'miliarde de euro', '40% mai mari', '60% reducere',
+        'sisteme de inteligență artificială', 'camere de recunoaștere facială',
+        'algoritmi predictivi', 'aplicația dedicată', 'rețeaua națională'
+    ]
+    
+    # Indicatori subtili de fake news (afirmații absurde cu aparență științifică)
+    subtle_fake_indicators = [
+        'să trăiască 200 de ani', 'să trăiască 150 de ani', 'să trăiască 100 de ani',
+        'vindecă cancerul în 48 de ore', 'vindecă cancerul complet', 'vindecă orice boală',
+        'crește iq-ul cu 50%', 'crește iq-ul cu 30%', 'face oamenii să zboare',
+        'controlează vremea', 'controlează timpul', 'controlează gravitația',
+        'energie infinită', 'mișcare perpetuă', 'teleportare', 'citește gândurile',
+        'industria medicală ascunde', 'medicii nu vor să știi', 'big pharma ascunde',
+        'rețeta secretă', 'metoda ascunsă', 'adevărul ascuns', 'conspirația medicală'
+    ]
+    
+    # Indicatori de credibilitate
+    credibility_indicators = [
+        'universitatea', 'cercetătorii', 'studiul', 'analiza', 'datele arată',
+        'conform', 'oficialii', 'experții', 'meteorologii', 'primăria',
+        'published', 'research', 'study', 'university', 'scientists',
+        'data shows', 'according to', 'officials', 'experts'
+    ]
+    
+    # Indicatori de știri simple/normale
+    normal_news_indicators = [
+        'ieri', 'astăzi', 'săptămâna', 'luna', 'anul', 'prețul', 'temperatura',
+        'lucrările', 'renovarea', 'parcul', 'strada', 'orașul', 'compania',
+        'yesterday', 'today', 'week', 'month', 'year', 'price', 'temperature'
+    ]
+    
+    # Calculează scorurile
+    fake_score = sum(1 for indicator in strong_fake_indicators if indicator in text_lower)
+    subtle_fake_score = sum(1 for indicator in subtle_fake_indicators if indicator in text_lower)
+    credibility_score = sum(1 for indicator in credibility_indicators if indicator in text_lower)
+    normal_score = sum(1 for indicator in normal_news_indicators if indicator in text_lower)
+    
+    # Logică îmbunătățită de decizie
+    original_verdict = "fake" if pred == 1 else "real"
+    max_proba = float(np.max(proba))
+    
+    # Corecții heuristice îmbunătățite
+    total_fake_score = fake_score + subtle_fake_score
+    
+    if fake_score >= 3:  # Multe indicatori evidenți de fake news
+        verdict = "fake"
+        confidence = min(0.85 + fake_score * 0.05, 0.95)
+    elif subtle_fake_score >= 1:  # Indicatori subtili de fake news (afirmații absurde)
+        verdict = "fake"
+        confidence = min(0.75 + subtle_fake_score * 0.1, 0.90)
+    elif credibility_score >= 2 and total_fake_score == 0:  # Indicatori de credibilitate fără fake
+        verdict = "real"
+        confidence = min(0.75 + credibility_score * 0.05, 0.90)
+    elif normal_score >= 2 and total_fake_score == 0:  # Știri normale fără indicatori fake
+        verdict = "real"
+        confidence = min(0.70 + normal_score * 0.03, 0.85)
+    elif total_fake_score == 0 and len(text) > 100 and len(text) < 300:  # Texte scurte normale
+        # Pentru texte scurte fără indicatori fake, favorizează real
+        if original_verdict == "fake" and max_proba < 0.8:
+            verdict = "real"
+            confidence = 0.70
+        else:
+            verdict = original_verdict
+            confidence = max_proba * 0.9
+    else:
+        # Folosește predicția originală cu ajustări
+        verdict = original_verdict
+        confidence = max_proba
+    
+        # Ajustări fine
+        if verdict == "fake" and total_fake_score == 0 and credibility_score > 0:
+            # Reduce confidența pentru fake news fără indicatori
+            confidence *= 0.7
+        elif verdict == "real" and total_fake_score > 0:
+            # Reduce confidența pentru real cu indicatori fake
+            confidence *= 0.8
+    
+    # Detectează limba
+    try:
+        from langdetect import detect
+        detected_language = detect(text)
+    except:
+        # Fallback simplu
+        ro_words = ['și', 'să', 'că', 'această', 'următoarele', 'primăria', 'meteorologii']
+        en_words = ['the', 'that', 'this', 'study', 'research', 'university']
+    
+        ro_count = sum(1 for word in ro_words if word in text_lower)
+        en_count = sum(1 for word in en_words if word in text_lower)
+    
+        if ro_count >= 2:
+            detected_language = 'ro'
+        elif en_count >= 2:
+            detected_language = 'en'
+        else:
+            detected_language = 'unknown'
+    
+    # Asigură-te că confidența este în intervalul corect
+    confidence = max(0.60, min(0.95, confidence))
+    
+    # Explicație detaliată
+    explanation_parts = [f"Analiză cu model tradițional (probabilitate: {max_proba:.2f})"]
+    if fake_score > 0:
+        explanation_parts.append(f"Indicatori fake evidenți: {fake_score}")
+    if subtle_fake_score > 0:
+        explanation_parts.append(f"Indicatori fake subtili: {subtle_fake_score}")
+    if credibility_score > 0:
+        explanation_parts.append(f"Indicatori credibilitate: {credibility_score}")
+    if normal_score > 0:
+        explanation_parts.append(f"Indicatori știri normale: {normal_score}")
+    
+    explanation = " | ".join(explanation_parts)
+    
+    result = {
+        'verdict': verdict,
+        'confidence': confidence,
+        'explanation': explanation,
+        'detected_language': detected_language,
+        'source': 'traditional'
+    }
+    
+    return result
+
+def analyze_traditional_batch(texts):
+    """
+    Runs the traditional mode for a batch of texts with a single vectorizer call.
+    Falls back to the ML analyzer when the traditional model is not available.
+    
+    Args:
+        texts (list): The texts to analyze.
+        
+    Returns:
+        list: One result per text, in the same order.
+    """
+    if not (traditional_model and vectorizer):
+        # Fallback la analiza ML dacă modelul tradițional nu este disponibil
+        return convert_numpy_types(hybrid_analyzer.ml_analyzer.analyze_texts(texts))
+    
+    result_cache = get_result_cache()
+    results = result_cache.get_many(texts, 'traditional')
+    missing = [i for i, result in enumerate(results) if result is None]
+    if not missing:
+        return results
+    
+    X = vectorizer.transform([texts[i] for i in missing])
+    preds = traditional_model.predict(X)
+    probas = traditional_model.predict_proba(X)
+    
+    for i, pred, proba in zip(missing, preds, probas):
+        try:
+            results[i] = traditional_heuristic_analysis(texts[i], pred, proba)
+        except Exception as e:
+            results[i] = {'error': str(e), 'verdict': 'unknown', 'confidence': 0.0}
+            continue
+        result_cache.set(texts[i], 'traditional', results[i])
+    return results
+
+def analyze_texts_for_mode(texts, analysis_mode):
+    """
+    Analyzes a batch of texts with the given analysis mode.
+    Every model runs once for the whole batch; failures are reported per text.
+    
+    Args:
+        texts (list): The texts to analyze.
+        analysis_mode (str): 'hybrid', 'cascade', 'ai_only', 'ml_only' or 'traditional'.
+        
+    Returns:
+        list: One result dict per text, in the same order.
+    """
+    if analysis_mode == 'hybrid':
+        results = run_async(hybrid_analyzer.analyze_texts(texts, include_details=True))
+    elif analysis_mode == 'cascade':
+        results = run_async(hybrid_analyzer.analyze_cascade_texts(texts, include_details=True))
+    elif analysis_mode == 'ai_only':
+        async def analyze_all():
+            return await asyncio.gather(
+                *(hybrid_analyzer.ai_analyzer.analyze_text(text) for text in texts), return_exceptions=True
+            )
+        results = run_async(analyze_all())
+        results = [
+            {'error': str(r), 'verdict': 'unknown', 'confidence': 0.0} if isinstance(r, Exception) else r
+            for r in results
+        ]
+    elif analysis_mode == 'ml_only':
+        results = hybrid_analyzer.ml_analyzer.analyze_texts(texts)
+    elif analysis_mode == 'traditional':
+        results = analyze_traditional_batch(texts)
+    else:
+        raise ValueError(f"Unknown analysis mode: {analysis_mode}")
+    
+    return convert_numpy_types(results)
+
+def build_technical_details(text, url, result, analysis_mode):
+    """
+    Builds the technical details stored with an analysis.
+    
+    Args:
+        text (str): The analyzed text.
+        url (str): The source URL, if any.
+        result (dict): The analysis result.
+        analysis_mode (str): The analysis mode used.
+        
+    Returns:
+        dict: The technical details.
+    """
+    technical_details = {
+        'original_text_length': len(text),
+        'url_source': url if url else None,
+        'processing_time_seconds': result.get('processing_time_seconds', 0)
+    }
+    
+    # Adaugă detalii suplimentare pentru modul hibrid
+    if analysis_mode == 'hybrid':
+        technical_details.update({
+            'risk_level': result.get('risk_level', 'unknown'),
+            'ai_ml_agreement': result.get('ai_ml_agreement', False),
+            'consensus_strength': result.get('consensus_strength', 'unknown'),
+            'individual_verdicts': result.get('individual_verdicts', {}),
+            'ensemble_score': result.get('ensemble_score', 0.0)
+        })
+    elif analysis_mode == 'cascade':
+        technical_details.update({
+            'risk_level': result.get('risk_level', 'unknown'),
+            'tiers_run': result.get('tiers_run', []),
+            'exit_tier': result.get('exit_tier', 'unknown')
+        })
+    return technical_details
+
+def build_predict_response(result, verdict, confidence, explanation, analysis_mode):
+    """
+    Builds the JSON response returned by the prediction endpoints.
+    
+    Args:
+        result (dict): The analysis result.
+        verdict (str): The final verdict.
+        confidence (float): The final confidence.
+        explanation (str): The explanation shown to the user.
+        analysis_mode (str): The analysis mode used.
+        
+    Returns:
+        dict: The JSON-serializable response.
+    """
+    response = {
+        'verdict': verdict,
+        'confidence': confidence,
+        'explanation': explanation,
+        'analysis_mode': analysis_mode,
+        'detected_language': result.get('detected_language', 'unknown'),
+        'processing_time': result.get('processing_time_seconds', 0)
+    }
+    
+    # Adaugă detalii pentru modul hibrid
+    if analysis_mode == 'hybrid':
+        response.update({
+            'risk_level': result.get('risk_level', 'unknown'),
+            'ai_ml_agreement': result.get('ai_ml_agreement', False),
+            'consensus_strength': result.get('consensus_strength', 'unknown'),
+            'individual_verdicts': result.get('individual_verdicts', {}),
+            'ensemble_score': result.get('ensemble_score', 0.0)
+        })
+    elif analysis_mode == 'cascade':
+        response.update({
+            'risk_level': result.get('risk_level', 'unknown'),
+            'tiers_run': result.get('tiers_run', []),
+            'exit_tier': result.get('exit_tier', 'unknown')
+        })
+    
+    # Convertește răspunsul final pentru a evita probleme de serializare
+    return convert_numpy_types(response)
+
+class InvalidAnalysisRequest(Exception):
+    """The submitted text, URL or mode cannot be analyzed (reported to the client as HTTP 400)."""
+
+def run_prediction(user_id, text, url, analysis_mode, progress=None):
+    """
+    Runs a single text or URL analysis, saves it and builds the response.
+    Shared by /predict, /predict/stream and the background prediction jobs.
+    
+    Args:
+        user_id (int): The user the analysis is saved for.
+        text (str): The text to analyze (ignored when a URL is given).
+        url (str): URL to extract and analyze the article from.
+        analysis_mode (str): 'hybrid', 'cascade', 'ai_only', 'ml_only' or 'traditional'.
+        progress (callable, optional): Receives stage start/end events with timings and partial results.
+        
+    Returns:
+        dict: The JSON-serializable prediction response.
+        
+    Raises:
+        InvalidAnalysisRequest: The URL has no extractable text or the mode is unknown.
+    """
+    article = None
+    if url:
+        with track_stage(progress, 'fetch') as partial:
+            article = extract_article_from_url(url)
+            if article:
+                partial.update(article_metadata(article, url), text_length=len(article['text']))
+        text = article['text'] if article else ''
+        if not text:
+            raise InvalidAnalysisRequest('Could not extract text from URL')
+
+    # Folosește sistemul hibrid pentru analiză
+    if analysis_mode == 'hybrid':
+        # Analiză hibridă completă
+        result = run_async(hybrid_analyzer.analyze_text(text, include_details=True, progress=progress))
+        result = convert_numpy_types(result)  # Convertește tipurile numpy
+        
+        verdict = result.get('verdict', 'unknown')
+        confidence = result.get('confidence', 0.0)
+        explanation = result.get('explanation', 'Nu s-a putut genera explicație')
+        
+    elif analysis_mode == 'cascade':
+        # Niveluri ieftine întâi; ML și AI doar când confidența nu este suficientă
+        result = run_async(hybrid_analyzer.analyze_cascade(text, include_details=True, progress=progress))
+        result = convert_numpy_types(result)
+        
+        verdict = result.get('verdict', 'unknown')
+        confidence = result.get('confidence', 0.0)
+        explanation = result.get('explanation', 'Nu s-a putut genera explicație')
+        
+    elif analysis_mode == 'ai_only':
+        # Doar analiza AI
+        with track_stage(progress, 'ai') as partial:
+            ai_result = run_async(hybrid_analyzer.ai_analyzer.analyze_text(text))
+            ai_result = convert_numpy_types(ai_result)  # Convertește tipurile numpy
+            partial.update(partial_result(ai_result))
+        
+        verdict = ai_result.get('verdict', 'unknown')
+        confidence = ai_result.get('confidence', 0.0)
+        explanation = ai_result.get('explanation', 'Analiză AI')
+        result = ai_result
+        
+    elif analysis_mode == 'ml_only':
+        # Doar analiza ML
+        with track_stage(progress, 'ml') as partial:
+            ml_result = hybrid_analyzer.ml_analyzer.analyze_text(text)
+            ml_result = convert_numpy_types(ml_result)  # Convertește tipurile numpy
+            partial.update(partial_result(ml_result))
+        verdict = ml_result.get('verdict', 'unknown')
+        confidence = ml_result.get('confidence', 0.0)
+        explanation = ml_result.get('explanation', 'Analiză ML')
+        result = ml_result
+        
+    elif analysis_mode == 'traditional':
+        # Modelul tradițional îmbunătățit cu analiză heuristică
+        with track_stage(progress, 'traditional') as partial:
+            result = analyze_traditional_batch([text])[0]
+            partial.update(partial_result(result))
+        verdict = result.get('verdict', 'unknown')
+        confidence = result.get('confidence', 0.0)
+        explanation = result.get('explanation', 'Analiză ML (fallback)')
+
+    else:
+        raise InvalidAnalysisRequest(f'Unknown analysis mode: {analysis_mode}')
+
+    # Determină tipul de conținut și titlul
+    content_type = 'url' if url else 'text'
+    title = (article.get('title') or url) if url else (text[:50] + '...' if len(text) > 50 else text)
+    content_preview = text[:500] if text else ''
+    
+    # Pregătește detaliile tehnice
+    technical_details = build_technical_details(text, url, result, analysis_mode)
+    if article:
+        technical_details['article'] = article_metadata(article, url)
+    
+    # Salvează în baza de date
+    save_analysis(
+        user_id=user_id,
+        content_type=content_type,
+        title=title,
+        content_preview=content_preview,
+        verdict=verdict,
+        confidence=confidence,
+        explanation=explanation,
+        analysis_mode=analysis_mode,
+        detected_language=result.get('detected_language', 'unknown'),
+        processing_time=result.get('processing_time_seconds', 0),
+        technical_details=technical_details
+    )
+
+    print("VERDICT:", verdict, "CONFIDENCE:", confidence)
+    
+    # Returnează rezultatul cu informații îmbunătățite
+    response = build_predict_response(result, verdict, confidence, explanation, analysis_mode)
+    if article:
+        response['article'] = article_metadata(article, url)
+    
+    return response
+
 @app.route('/predict', methods=['POST'])
 def predict():
     """
@@ -377,7 +926,7 @@ def predict():
     Expects JSON payload with:
         - text (str, optional): The text content to analyze
         - url (str, optional): URL to extract and analyze content from
-        - mode (str, optional): Analysis mode - 'hybrid', 'ai_only', 'ml_only', or 'traditional'
+        - mode (str, optional): Analysis mode - 'hybrid', 'cascade', 'ai_only', 'ml_only', or 'traditional'
         
     Returns:
         JSON response with analysis results including verdict, confidence, explanation,
@@ -402,274 +951,390 @@ def predict():
     if not text and not url:
         return jsonify({'error': 'Either text or URL must be provided'}), 400
 
-    if url:
-        text = extract_text_from_url(url)
+    try:
+        response = run_prediction(session['user_id'], text, url, analysis_mode)
+        return jsonify(response)
+        
+    except InvalidAnalysisRequest as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        import traceback
+        print("EROARE LA PREDICT:", e)
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/predict/stream', methods=['POST'])
+def predict_stream():
+    """
+    Analyzes text content or URL like /predict, streaming progress as Server-Sent Events.
+    
+    Expects the same JSON payload as /predict.
+    
+    Returns:
+        A text/event-stream response with 'stage_start', 'stage_end' and 'stage_error' events
+        (stage name, duration_ms and partial verdicts as soon as each stage finishes), then a final
+        'result' event with the /predict response or an 'error' event. HTTP 401 if unauthorized,
+        400 on validation error.
+    """
+    if 'username' not in session:
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    data = request.json or {}
+    text = data.get('text', '')
+    url = data.get('url', '')
+    analysis_mode = data.get('mode', 'hybrid')
+    if not text and not url:
+        return jsonify({'error': 'Either text or URL must be provided'}), 400
+    if analysis_mode not in ANALYSIS_MODES:
+        return jsonify({'error': f'Unknown analysis mode: {analysis_mode}'}), 400
+
+    user_id = session['user_id']
+    events = queue.Queue()
+
+    def analyze():
+        # Analiza continuă și dacă clientul se deconectează, ca rezultatul să fie salvat
+        with app.app_context():
+            try:
+                response = run_prediction(user_id, text, url, analysis_mode,
+                                          progress=lambda event: events.put((event['event'], event)))
+                events.put(('result', response))
+            except InvalidAnalysisRequest as e:
+                events.put(('error', {'error': str(e)}))
+            except Exception as e:
+                import traceback
+                print("EROARE LA PREDICT STREAM:", e)
+                traceback.print_exc()
+                events.put(('error', {'error': str(e)}))
+
+    threading.Thread(target=analyze, name='predict-stream', daemon=True).start()
+
+    def stream():
+        while True:
+            try:
+                name, payload = events.get(timeout=SSE_HEARTBEAT_SECONDS)
+            except queue.Empty:
+                yield format_sse_comment()
+                continue
+            yield format_sse(payload, event=name)
+            if name in ('result', 'error'):
+                return
+
+    return Response(stream_with_context(stream()), mimetype='text/event-stream', headers=SSE_HEADERS)
+
+@app.route('/predict/batch', methods=['POST'])
+def predict_batch():
+    """
+    Analyzes a batch of texts or URLs in a single request.
+    
+    Expects JSON payload with:
+        - items (list): Strings, or objects with 'text' or 'url' and an optional 'id'
+        - mode (str, optional): Analysis mode - 'hybrid', 'cascade', 'ai_only', 'ml_only', or 'traditional'
+        
+    Every model runs once over the whole batch. Failures are reported per item
+    (with an 'error' field) and do not fail the other items.
+        
+    Returns:
+        JSON response with one result per item, in request order. HTTP 200 on success,
+        401 if unauthorized, 400 on validation error, 500 on server error.
+    """
+    if 'username' not in session:
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    data = request.json or {}
+    items = data.get('items')
+    analysis_mode = data.get('mode', 'hybrid')
+
+    if not isinstance(items, list) or not items:
+        return jsonify({'error': 'items must be a non-empty list'}), 400
+    if len(items) > PREDICT_BATCH_MAX_ITEMS:
+        return jsonify({'error': f'At most {PREDICT_BATCH_MAX_ITEMS} items are allowed per batch'}), 400
+    if analysis_mode not in ANALYSIS_MODES:
+        return jsonify({'error': f'Unknown analysis mode: {analysis_mode}'}), 400
+
+    start_time = datetime.now()
+    results = [None] * len(items)
+    pending = []  # (index, item_id, text, url, article)
+    
+    items = [{'text': item} if isinstance(item, str) else item for item in items]
+    # Paginile tuturor URL-urilor din lot sunt descărcate în paralel, nu una după alta
+    articles = extract_articles_from_urls([item['url'] for item in items
+                                           if isinstance(item, dict) and isinstance(item.get('url'), str) and item['url']])
+    
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results[index] = {'index': index, 'error': 'Item must be a string or an object'}
+            continue
+        
+        item_id = item.get('id')
+        text = item.get('text', '') or ''
+        url = item.get('url', '') or ''
+        if not isinstance(text, str) or not isinstance(url, str):
+            results[index] = {'index': index, 'id': item_id, 'error': "'text' and 'url' must be strings"}
+            continue
+        article = None
+        if url:
+            article = articles.get(url)
+            text = article['text'] if article else ''
+            if not text:
+                results[index] = {'index': index, 'id': item_id, 'error': 'Could not extract text from URL'}
+                continue
         if not text:
-            return jsonify({'error': 'Could not extract text from URL'}), 400
+            results[index] = {'index': index, 'id': item_id, 'error': 'Either text or URL must be provided'}
+            continue
+        pending.append((index, item_id, text, url, article))
 
     try:
-        # Folosește sistemul hibrid pentru analiză
-        if analysis_mode == 'hybrid':
-            # Analiză hibridă completă
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = loop.run_until_complete(hybrid_analyzer.analyze_text(text, include_details=True))
-            result = convert_numpy_types(result)  # Convertește tipurile numpy
-            loop.close()
-            
-            verdict = result.get('verdict', 'unknown')
-            confidence = result.get('confidence', 0.0)
-            explanation = result.get('explanation', 'Nu s-a putut genera explicație')
-            
-        elif analysis_mode == 'ai_only':
-            # Doar analiza AI
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            ai_result = loop.run_until_complete(hybrid_analyzer.ai_analyzer.analyze_text(text))
-            ai_result = convert_numpy_types(ai_result)  # Convertește tipurile numpy
-            loop.close()
-            
-            verdict = ai_result.get('verdict', 'unknown')
-            confidence = ai_result.get('confidence', 0.0)
-            explanation = ai_result.get('explanation', 'Analiză AI')
-            result = ai_result
-            
-        elif analysis_mode == 'ml_only':
-            # Doar analiza ML
-            ml_result = hybrid_analyzer.ml_analyzer.analyze_text(text)
-            ml_result = convert_numpy_types(ml_result)  # Convertește tipurile numpy
-            verdict = ml_result.get('verdict', 'unknown')
-            confidence = ml_result.get('confidence', 0.0)
-            explanation = ml_result.get('explanation', 'Analiză ML')
-            result = ml_result
-            
-        elif analysis_mode == 'traditional':
-            # Modelul tradițional îmbunătățit cu analiză heuristică
-            if traditional_model and vectorizer:
-                X = vectorizer.transform([text])
-                pred = traditional_model.predict(X)[0]
-                proba = traditional_model.predict_proba(X)[0]
-                
-                # Analiză heuristică îmbunătățită pentru a corecta false pozitive
-                text_lower = text.lower()
-                
-                # Indicatori puternici de fake news
-                strong_fake_indicators = [
-                    'urgent!', 'breaking!', 'breaking:', 'breaking', 'șocant!', 'incredibil!', 'secret!', 'ascuns!',
-                    'experți anonimi', 'surse anonime', 'organizație secretă', 'complot',
-                    'industria ascunde', 'guvernul ascunde', 'big pharma', 'agenda ascunsă',
-                    'metoda secretă', 'descoperire revoluționară', 'rezultate incredibile',
-                    'funcționează 100%', 'garantat', 'milioane au încercat', 'sunt șocați',
-                    'premieră mondială', 'premiera mondiala', 'prima țară', 'prima tara',
-                    'nicăieri în lume', 'nicaieri in lume', 'niciodată văzut', 'niciodată vazut',
-                    'revoluționară', 'revolutionara', 'spectaculoase', 'transformă complet',
-                    'transforma complet', 'rezultate spectaculoase', 'note cu 40%', 'reducere de 60%',
-                    'miliarde euro', 'miliarde de euro', '40% mai mari', '60% reducere',
-                    'sisteme de inteligență artificială', 'camere de recunoaștere facială',
-                    'algoritmi predictivi', 'aplicația dedicată', 'rețeaua națională'
-                ]
-                
-                # Indicatori subtili de fake news (afirmații absurde cu aparență științifică)
-                subtle_fake_indicators = [
-                    'să trăiască 200 de ani', 'să trăiască 150 de ani', 'să trăiască 100 de ani',
-                    'vindecă cancerul în 48 de ore', 'vindecă cancerul complet', 'vindecă orice boală',
-                    'crește iq-ul cu 50%', 'crește iq-ul cu 30%', 'face oamenii să zboare',
-                    'controlează vremea', 'controlează timpul', 'controlează gravitația',
-                    'energie infinită', 'mișcare perpetuă', 'teleportare', 'citește gândurile',
-                    'industria medicală ascunde', 'medicii nu vor să știi', 'big pharma ascunde',
-                    'rețeta secretă', 'metoda ascunsă', 'adevărul ascuns', 'conspirația medicală'
-                ]
-                
-                # Indicatori de credibilitate
-                credibility_indicators = [
-                    'universitatea', 'cercetătorii', 'studiul', 'analiza', 'datele arată',
-                    'conform', 'oficialii', 'experții', 'meteorologii', 'primăria',
-                    'published', 'research', 'study', 'university', 'scientists',
-                    'data shows', 'according to', 'officials', 'experts'
-                ]
-                
-                # Indicatori de știri simple/normale
-                normal_news_indicators = [
-                    'ieri', 'astăzi', 'săptămâna', 'luna', 'anul', 'prețul', 'temperatura',
-                    'lucrările', 'renovarea', 'parcul', 'strada', 'orașul', 'compania',
-                    'yesterday', 'today', 'week', 'month', 'year', 'price', 'temperature'
-                ]
-                
-                # Calculează scorurile
-                fake_score = sum(1 for indicator in strong_fake_indicators if indicator in text_lower)
-                subtle_fake_score = sum(1 for indicator in subtle_fake_indicators if indicator in text_lower)
-                credibility_score = sum(1 for indicator in credibility_indicators if indicator in text_lower)
-                normal_score = sum(1 for indicator in normal_news_indicators if indicator in text_lower)
-                
-                # Logică îmbunătățită de decizie
-                original_verdict = "fake" if pred == 1 else "real"
-                max_proba = float(np.max(proba))
-                
-                # Corecții heuristice îmbunătățite
-                total_fake_score = fake_score + subtle_fake_score
-                
-                if fake_score >= 3:  # Multe indicatori evidenți de fake news
-                    verdict = "fake"
-                    confidence = min(0.85 + fake_score * 0.05, 0.95)
-                elif subtle_fake_score >= 1:  # Indicatori subtili de fake news (afirmații absurde)
-                    verdict = "fake"
-                    confidence = min(0.75 + subtle_fake_score * 0.1, 0.90)
-                elif credibility_score >= 2 and total_fake_score == 0:  # Indicatori de credibilitate fără fake
-                    verdict = "real"
-                    confidence = min(0.75 + credibility_score * 0.05, 0.90)
-                elif normal_score >= 2 and total_fake_score == 0:  # Știri normale fără indicatori fake
-                    verdict = "real"
-                    confidence = min(0.70 + normal_score * 0.03, 0.85)
-                elif total_fake_score == 0 and len(text) > 100 and len(text) < 300:  # Texte scurte normale
-                    # Pentru texte scurte fără indicatori fake, favorizează real
-                    if original_verdict == "fake" and max_proba < 0.8:
-                        verdict = "real"
-                        confidence = 0.70
-                    else:
-                        verdict = original_verdict
-                        confidence = max_proba * 0.9
-                else:
-                    # Folosește predicția originală cu ajustări
-                    verdict = original_verdict
-                    confidence = max_proba
-                    
-                    # Ajustări fine
-                    if verdict == "fake" and total_fake_score == 0 and credibility_score > 0:
-                        # Reduce confidența pentru fake news fără indicatori
-                        confidence *= 0.7
-                    elif verdict == "real" and total_fake_score > 0:
-                        # Reduce confidența pentru real cu indicatori fake
-                        confidence *= 0.8
-                
-                # Detectează limba
-                try:
-                    from langdetect import detect
-                    detected_language = detect(text)
-                except:
-                    # Fallback simplu
-                    ro_words = ['și', 'să', 'că', 'această', 'următoarele', 'primăria', 'meteorologii']
-                    en_words = ['the', 'that', 'this', 'study', 'research', 'university']
-                    
-                    ro_count = sum(1 for word in ro_words if word in text_lower)
-                    en_count = sum(1 for word in en_words if word in text_lower)
-                    
-                    if ro_count >= 2:
-                        detected_language = 'ro'
-                    elif en_count >= 2:
-                        detected_language = 'en'
-                    else:
-                        detected_language = 'unknown'
-                
-                # Asigură-te că confidența este în intervalul corect
-                confidence = max(0.60, min(0.95, confidence))
-                
-                # Explicație detaliată
-                explanation_parts = [f"Analiză cu model tradițional (probabilitate: {max_proba:.2f})"]
-                if fake_score > 0:
-                    explanation_parts.append(f"Indicatori fake evidenți: {fake_score}")
-                if subtle_fake_score > 0:
-                    explanation_parts.append(f"Indicatori fake subtili: {subtle_fake_score}")
-                if credibility_score > 0:
-                    explanation_parts.append(f"Indicatori credibilitate: {credibility_score}")
-                if normal_score > 0:
-                    explanation_parts.append(f"Indicatori știri normale: {normal_score}")
-                
-                explanation = " | ".join(explanation_parts)
-                
-                result = {
-                    'verdict': verdict,
-                    'confidence': confidence,
-                    'explanation': explanation,
-                    'detected_language': detected_language,
-                    'source': 'traditional'
-                }
-            else:
-                # Fallback la analiza ML dacă modelul tradițional nu este disponibil
-                ml_result = hybrid_analyzer.ml_analyzer.analyze_text(text)
-                ml_result = convert_numpy_types(ml_result)
-                result = ml_result
-                verdict = ml_result.get('verdict', 'unknown')
-                confidence = ml_result.get('confidence', 0.0)
-                explanation = ml_result.get('explanation', 'Analiză ML (fallback)')
+        analyses = analyze_texts_for_mode([text for _, _, text, _, _ in pending], analysis_mode) if pending else []
+    except Exception as e:
+        import traceback
+        print("EROARE LA PREDICT BATCH:", e)
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
 
-        # Salvează analiza în baza de date
-        user_id = session['user_id']
-        
-        # Determină tipul de conținut și titlul
-        content_type = 'url' if url else 'text'
-        title = url if url else (text[:50] + '...' if len(text) > 50 else text)
-        content_preview = text[:500] if text else ''
-        
-        # Pregătește detaliile tehnice
-        technical_details = {
-            'original_text_length': len(text),
-            'url_source': url if url else None,
-            'processing_time_seconds': result.get('processing_time_seconds', 0)
-        }
+    user_id = session['user_id']
+    for (index, item_id, text, url, article), result in zip(pending, analyses):
+        if result.get('error'):
+            results[index] = {'index': index, 'id': item_id, 'error': result['error']}
+            continue
         
-        # Adaugă detalii suplimentare pentru modul hibrid
-        if analysis_mode == 'hybrid':
-            technical_details.update({
-                'risk_level': result.get('risk_level', 'unknown'),
-                'ai_ml_agreement': result.get('ai_ml_agreement', False),
-                'consensus_strength': result.get('consensus_strength', 'unknown'),
-                'individual_verdicts': result.get('individual_verdicts', {}),
-                'ensemble_score': result.get('ensemble_score', 0.0)
-            })
+        verdict = result.get('verdict', 'unknown')
+        confidence = result.get('confidence', 0.0)
+        explanation = result.get('explanation', 'Nu s-a putut genera explicație')
+        technical_details = build_technical_details(text, url, result, analysis_mode)
+        if article:
+            technical_details['article'] = article_metadata(article, url)
         
-        # Salvează în baza de date
-        save_analysis(
-            user_id=user_id,
-            content_type=content_type,
-            title=title,
-            content_preview=content_preview,
-            verdict=verdict,
-            confidence=confidence,
-            explanation=explanation,
-            analysis_mode=analysis_mode,
-            detected_language=result.get('detected_language', 'unknown'),
-            processing_time=result.get('processing_time_seconds', 0),
-            technical_details=technical_details
-        )
-
-        print("VERDICT:", verdict, "CONFIDENCE:", confidence)
-        
-        # Returnează rezultatul cu informații îmbunătățite
-        response = {
-            'verdict': verdict,
-            'confidence': confidence,
-            'explanation': explanation,
-            'analysis_mode': analysis_mode,
-            'detected_language': result.get('detected_language', 'unknown'),
-            'processing_time': result.get('processing_time_seconds', 0)
-        }
+        try:
+            save_analysis(
+                user_id=user_id,
+                content_type='url' if url else 'text',
+                title=(article.get('title') or url) if url else (text[:50] + '...' if len(text) > 50 else text),
+                content_preview=text[:500],
+                verdict=verdict,
+                confidence=confidence,
+                explanation=explanation,
+                analysis_mode=analysis_mode,
+                detected_language=result.get('detected_language', 'unknown'),
+                processing_time=result.get('processing_time_seconds', 0),
+                technical_details=technical_details
+            )
+        except Exception as e:
+            db.session.rollback()
+            print(f"Eroare la salvarea analizei din lot: {e}")
         
-        # Adaugă detalii pentru modul hibrid
-        if analysis_mode == 'hybrid':
-            response.update({
-                'risk_level': result.get('risk_level', 'unknown'),
-                'ai_ml_agreement': result.get('ai_ml_agreement', False),
-                'consensus_strength': result.get('consensus_strength', 'unknown'),
-                'individual_verdicts': result.get('individual_verdicts', {}),
-                'ensemble_score': result.get('ensemble_score', 0.0)
-            })
+        response = build_predict_response(result, verdict, confidence, explanation, analysis_mode)
+        response.update({'index': index, 'id': item_id})
+        if article:
+            response['article'] = article_metadata(article, url)
+        results[index] = response
+
+    return jsonify({
+        'results': results,
+        'analysis_mode': analysis_mode,
+        'total': len(items),
+        'errors': sum(1 for r in results if 'error' in r),
+        'processing_time': (datetime.now() - start_time).total_seconds()
+    })
+
+def predict_job(payload, job):
+    """Background handler for 'predict' jobs: the same analysis as /predict."""
+    with app.app_context():
+        try:
+            return run_prediction(int(job.user_id), payload.get('text', ''), payload.get('url', ''),
+                                  payload.get('mode', 'hybrid'), progress=job.report)
+        except InvalidAnalysisRequest as e:
+            raise PermanentJobError(str(e))
+
+def video_job(payload, job):
+    """Background handler for 'video' jobs: the same analysis as /analyze-video."""
+    if not os.path.exists(payload['path']):
+        raise PermanentJobError(f"Video file not found: {payload['filename']}")
+    with app.app_context():
+        return analyze_saved_video(payload['path'], payload['filename'], payload['content_type'],
+                                   payload['permanent_filename'], int(job.user_id), progress=job.report,
+                                   sha256=payload.get('sha256'))
+
+job_queue = get_job_queue()
+job_queue.register('predict', predict_job)
+job_queue.register('video', video_job)
+job_queue.start()
+
+def job_response(job):
+    """
+    Adds the polling links to a job returned by the job endpoints.
+    
+    Args:
+        job (dict): The job state from the queue.
         
-        # Convertește răspunsul final pentru a evita probleme de serializare
-        response = convert_numpy_types(response)
+    Returns:
+        dict: The job with 'status_url', 'result_url' and 'events_url'.
+    """
+    job = dict(job)
+    job['status_url'] = f"/jobs/{job['id']}"
+    job['result_url'] = f"/jobs/{job['id']}/result"
+    job['events_url'] = f"/jobs/{job['id']}/events"
+    return job
+
+def get_authorized_job(job_id, include_result=False):
+    """
+    Loads a job visible to the current user (its owner, or an admin).
+    
+    Returns:
+        tuple: (job, None) on success, or (None, (response, status)) on error.
+    """
+    if 'username' not in session:
+        return None, (jsonify({'error': 'Unauthorized'}), 401)
+    job = job_queue.get(job_id, include_result=include_result)
+    if job is None or (job['user_id'] != str(session.get('user_id')) and not session.get('is_admin', False)):
+        return None, (jsonify({'error': 'Job not found'}), 404)
+    return job, None
+
+@app.route('/jobs', methods=['POST'])
+def create_job():
+    """
+    Queues an analysis and returns the job id immediately; a background worker runs it.
+    
+    Accepts either:
+        - JSON payload with 'text' or 'url' and an optional 'mode' (same as /predict)
+        - multipart form with a 'video' file (same as /analyze-video)
         
-        return jsonify(response)
+    Returns:
+        JSON job state with 'status_url' and 'result_url'. HTTP 202 on success,
+        401 if unauthorized, 400 on validation error.
+    """
+    if 'username' not in session:
+        return jsonify({'error': 'Unauthorized'}), 401
+    user_id = session['user_id']
+    
+    if 'video' in request.files:
+        video_file = request.files['video']
+        if video_file.filename == '':
+            return jsonify({'error': 'Nu s-a selectat niciun fișier'}), 400
+        if not allowed_video_file(video_file.filename):
+            return jsonify({'error': 'Tip de fișier neacceptat. Acceptate: mp4, avi, mov, mkv, wmv, flv, webm'}), 400
         
-    except Exception as e:
-        import traceback
-        print("EROARE LA PREDICT:", e)
-        traceback.print_exc()
-        return jsonify({'error': str(e)}), 500
+        # Videoclipul este salvat permanent înainte de a intra în coadă; jobul îl citește de pe disc
+        upload = store_video_upload(video_file, user_id, video_filename(user_id, video_file.filename))
+        job = job_queue.submit('video', {
+            'path': blob_store.path(upload.sha256),
+            'filename': video_file.filename,
+            'content_type': video_file.content_type,
+            'permanent_filename': upload.filename,
+            'sha256': upload.sha256
+        }, user_id=user_id)
+        return jsonify(job_response(job)), 202
+    
+    data = request.json or {}
+    text = data.get('text', '')
+    url = data.get('url', '')
+    analysis_mode = data.get('mode', 'hybrid')
+    if not text and not url:
+        return jsonify({'error': 'Either text or URL must be provided'}), 400
+    if analysis_mode not in ANALYSIS_MODES:
+        return jsonify({'error': f'Unknown analysis mode: {analysis_mode}'}), 400
+    
+    job = job_queue.submit('predict', {'text': text, 'url': url, 'mode': analysis_mode}, user_id=user_id)
+    return jsonify(job_response(job)), 202
+
+@app.route('/jobs', methods=['GET'])
+def list_jobs():
+    """Returns the current user's most recent jobs."""
+    if 'username' not in session:
+        return jsonify({'error': 'Unauthorized'}), 401
+    limit = min(request.args.get('limit', 50, type=int), 200)
+    jobs = job_queue.list(user_id=session['user_id'], limit=limit)
+    return jsonify({'jobs': [job_response(job) for job in jobs]})
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Returns the state of a job: queued, running, succeeded, failed or cancelled."""
+    job, error = get_authorized_job(job_id)
+    if error:
+        return error
+    return jsonify(job_response(job))
+
+@app.route('/jobs/<job_id>/result', methods=['GET'])
+def get_job_result(job_id):
+    """
+    Returns the result of a finished job.
+    
+    Returns:
+        HTTP 200 with 'result' when the job succeeded, 202 while it is queued or running,
+        409 with 'error' when it failed or was cancelled.
+    """
+    job, error = get_authorized_job(job_id, include_result=True)
+    if error:
+        return error
+    if job['status'] == SUCCEEDED:
+        return jsonify(job_response(job))
+    if job['status'] in (QUEUED, RUNNING):
+        return jsonify(job_response(job)), 202
+    return jsonify(job_response(job)), 409
+
+@app.route('/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Cancels a queued job, or asks a running job to stop (its result is discarded)."""
+    job, error = get_authorized_job(job_id)
+    if error:
+        return error
+    return jsonify(job_response(job_queue.cancel(job_id)))
+
+@app.route('/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """
+    Streams a job's progress as Server-Sent Events until it finishes.
+    
+    Events: 'status' on every status change, 'stage_start' / 'stage_end' / 'stage_error'
+    (stage name, duration_ms and partial results), then a final 'result' event with the job
+    and its result, or an 'error' event if it failed or was cancelled. Stage events carry ids,
+    so a reconnecting client resumes after the Last-Event-ID it received.
+    """
+    job, error = get_authorized_job(job_id)
+    if error:
+        return error
+    try:
+        last_seq = int(request.headers.get('Last-Event-ID') or request.args.get('last_event_id') or 0)
+    except ValueError:
+        last_seq = 0
+
+    def stream():
+        seq = last_seq
+        status = None
+        last_sent = time.monotonic()
+        while True:
+            # Starea se citește înaintea evenimentelor: după un status final nu mai apar evenimente noi
+            current = job_queue.get(job_id, include_result=True)
+            for event in job_queue.events(job_id, after=seq):
+                seq = event.pop('seq')
+                yield format_sse(event, event=event['event'], event_id=seq)
+                last_sent = time.monotonic()
+            if current['status'] != status:
+                status = current['status']
+                yield format_sse({'status': status, 'attempts': current['attempts']}, event='status')
+                last_sent = time.monotonic()
+            if status == SUCCEEDED:
+                yield format_sse(job_response(current), event='result')
+                return
+            if status in FINISHED_STATUSES:
+                yield format_sse({'status': status, 'error': current['error']}, event='error')
+                return
+            if time.monotonic() - last_sent >= SSE_HEARTBEAT_SECONDS:
+                yield format_sse_comment()
+                last_sent = time.monotonic()
+            time.sleep(SSE_POLL_INTERVAL)
+
+    return Response(stream_with_context(stream()), mimetype='text/event-stream', headers=SSE_HEADERS)
 
 @app.route('/system-status', methods=['GET'])
 def system_status():
     """Endpoint pentru verificarea status-ului sistemului"""
     try:
         status = hybrid_analyzer.get_system_status()
+        status['url_fetcher'] = get_url_fetcher().get_status()
+        status['jobs'] = get_job_queue().get_status()
+        # Starea uneltelor video este raportată doar după ce modulele video au fost încărcate
+        video_toolkit = sys.modules.get('video_toolkit')
+        status['video'] = video_toolkit.get_video_toolkit().get_status() if video_toolkit else {'loaded': False}
         return jsonify(status)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -685,6 +1350,13 @@ def analysis_modes():
             'speed': 'Medie',
             'languages': ['ro', 'en', 'fr', 'es', 'de', 'it']
         },
+        'cascade': {
+            'name': 'Analiză în Cascadă',
+            'description': 'Model tradițional și pattern-uri întâi; ML și AI doar pentru textele incerte',
+            'accuracy': 'Mare',
+            'speed': 'Rapidă pentru textele clare',
+            'languages': ['ro', 'en', 'fr', 'es', 'de', 'it']
+        },
         'ai_only': {
             'name': 'Doar AI',
             'description': 'Folosește OpenAI GPT și Google Perspective API',
@@ -814,30 +1486,72 @@ def upload_video():
         return jsonify({'error': 'Nu s-a selectat fișier'}), 400
 
     if file and allowed_video_file(file.filename):
-        # Generează nume unic pentru fișier
-        filename = f"{session['username']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{file.filename}"
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        
         try:
-            file.save(filepath)
-            file_size = os.path.getsize(filepath)
+            upload = store_video_upload(file, session['user_id'], video_filename(session['user_id'], file.filename))
             
             return jsonify({
                 'message': 'Video încărcat cu succes',
-                'filename': filename,
-                'filepath': filepath,
-                'file_size': file_size
+                'filename': upload.filename,
+                'filepath': blob_store.path(upload.sha256),
+                'file_size': upload.blob.size,
+                'sha256': upload.sha256
             })
         except Exception as e:
             return jsonify({'error': f'Eroare la salvarea fișierului: {str(e)}'}), 500
     else:
         return jsonify({'error': 'Tip de fișier neacceptat. Acceptate: mp4, avi, mov, mkv, wmv, flv, webm'}), 400
 
+def analyze_saved_video(video_path, filename, content_type, permanent_filename, user_id=None, progress=None,
+                        sha256=None):
+    """
+    Runs the deepfake analysis on a saved video and stores the result for the user.
+    Shared by /analyze-video and the background video jobs.
+    
+    Args:
+        video_path (str): Path of the saved video file.
+        filename (str): The original file name.
+        content_type (str): The uploaded MIME type.
+        permanent_filename (str): Name of the copy kept in the upload folder for playback.
+        user_id (int, optional): The user the analysis is saved for.
+        progress (callable, optional): Receives stage start/end events with timings and partial results.
+        sha256 (str, optional): Content hash of the video; results are reused per (hash, analyzer version).
+        
+    Returns:
+        dict: The video analysis result.
+    """
+    print(f"🎬 Analizez videoclipul: {filename}")
+    
+    # Același conținut analizat anterior (de orice utilizator) nu mai este reanalizat
+    result = get_cached_video_result(sha256) if sha256 else None
+    if result is None:
+        # Efectuează analiza comprehensivă
+        result = get_video_analyzer().comprehensive_video_analysis(video_path, filename, progress=progress)
+        # Doar analiza completă este păstrată; cea simplificată depinde de numele fișierului
+        if sha256 and result.get('analysis_mode') == 'ffmpeg_advanced':
+            cache_video_result(sha256, result)
+    
+    # Adaugă informații suplimentare (analiza simplificată nu întoarce metadate)
+    video_metadata = result.setdefault('video_metadata', {})
+    video_metadata['size_mb'] = round(os.path.getsize(video_path) / 1024 / 1024, 2)
+    video_metadata['type'] = content_type
+    video_metadata['permanent_filename'] = permanent_filename  # Pentru vizualizare
+    if sha256:
+        video_metadata['sha256'] = sha256
+    
+    print(f"✅ Analiză completă: {result['verdict']} cu {result['confidence']*100:.1f}% confidență")
+    
+    # Salvează analiza în baza de date
+    if user_id is not None:
+        save_video_analysis(user_id, filename, result)
+    
+    return convert_numpy_types(result)
+
 @app.route('/analyze-video', methods=['POST'])
 def analyze_video():
     """
     Endpoint pentru analiza video - Deep Fake Detection cu FFmpeg
     """
+    upload = None
     try:
         # Verifică dacă există fișierul video în request
         if 'video' not in request.files:
@@ -852,90 +1566,41 @@ def analyze_video():
         if not video_file.content_type.startswith('video/'):
             return jsonify({'error': 'Fișierul nu este un video valid'}), 400
         
-        # Salvează fișierul temporar pentru analiză
-        import tempfile
-        import os
-        import time
-        from video_analyzer import AdvancedVideoAnalyzer
-        
-        temp_dir = tempfile.mkdtemp()
-        temp_video_path = os.path.join(temp_dir, f"temp_{video_file.filename}")
+        # Videoclipul a fost scris pe disc (o singură dată) în timp ce era primit; copia permanentă
+        # este blob-ul cu același SHA-256 (nou sau existent), iar analiza îl citește direct
+        upload = store_video_upload(video_file, session.get('user_id'),
+                                    video_filename(session.get('user_id', 'guest'), video_file.filename))
+        video_path = blob_store.path(upload.sha256)
+        print(f"💾 Calea permanentă: {video_path} ({upload.filename})")
         
-        try:
-            # Salvează videoclipul temporar pentru analiză
-            video_file.save(temp_video_path)
-            
-            # Salvează și videoclipul permanent pentru vizualizare
-            permanent_filename = f"{session.get('user_id', 'guest')}_{int(time.time())}_{video_file.filename}"
-            permanent_path = os.path.join(UPLOAD_FOLDER, permanent_filename)
-            
-            # Asigură-te că directorul uploads există
-            os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-            
-            # Copiază videoclipul în directorul permanent
-            import shutil
-            shutil.copy2(temp_video_path, permanent_path)
-            
-            # Inițializează analyzer-ul avansat
-            analyzer = AdvancedVideoAnalyzer()
-            
-            print(f"🎬 Analizez videoclipul: {video_file.filename}")
-            print(f"📁 Calea temporară: {temp_video_path}")
-            print(f"💾 Calea permanentă: {permanent_path}")
-            
-            # Efectuează analiza comprehensivă
-            result = analyzer.comprehensive_video_analysis(temp_video_path, video_file.filename)
-            
-            # Adaugă informații suplimentare
-            result['video_metadata']['size_mb'] = round(len(video_file.read()) / 1024 / 1024, 2)
-            video_file.seek(0)  # Reset pentru alte operații
-            result['video_metadata']['type'] = video_file.content_type
-            result['video_metadata']['permanent_filename'] = permanent_filename  # Pentru vizualizare
-            
-            print(f"✅ Analiză completă: {result['verdict']} cu {result['confidence']*100:.1f}% confidență")
-            
-            # Salvează analiza în baza de date
-            if 'user_id' in session:
-                save_video_analysis(session['user_id'], video_file.filename, result)
-            
-            return jsonify(result)
-            
-        finally:
-            # Curăță doar fișierele temporare (nu cele permanente)
-            import shutil
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        result = analyze_saved_video(video_path, video_file.filename, video_file.content_type,
+                                     upload.filename, session.get('user_id'), sha256=upload.sha256)
+        return jsonify(result)
         
     except ImportError as e:
         print(f"⚠️ Eroare import video_analyzer: {e}")
         # Fallback la analiza simplă
-        return analyze_video_fallback(video_file)
+        return analyze_video_fallback(video_file, upload)
         
     except Exception as e:
         print(f"❌ Eroare la analiza video: {str(e)}")
         # Fallback la analiza simplă
-        return analyze_video_fallback(video_file)
+        return analyze_video_fallback(video_file, upload)
 
-def analyze_video_fallback(video_file):
+def analyze_video_fallback(video_file, upload=None):
     """Analiză video fallback când AdvancedVideoAnalyzer nu funcționează"""
+    import random
     try:
         filename = video_file.filename
-        file_size = len(video_file.read())
-        video_file.seek(0)
         
-        # Salvează videoclipul permanent pentru vizualizare
-        import time
-        permanent_filename = f"{session.get('user_id', 'guest')}_{int(time.time())}_{filename}"
-        permanent_path = os.path.join(UPLOAD_FOLDER, permanent_filename)
-        
-        # Asigură-te că directorul uploads există
-        os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-        
-        # Salvează videoclipul
-        video_file.save(permanent_path)
-        video_file.seek(0)
+        # Salvează videoclipul permanent pentru vizualizare, dacă nu a fost deja salvat
+        if upload is None:
+            upload = store_video_upload(video_file, session.get('user_id'),
+                                        video_filename(session.get('user_id', 'guest'), filename))
+        permanent_filename = upload.filename
+        file_size = upload.blob.size
         
         # Simulează timp de procesare
-        import time
         time.sleep(2)
         
         # Generează rezultat demo bazat pe numele fișierului
@@ -1032,9 +1697,19 @@ def video_status(filename):
     if 'username' not in session:
         return jsonify({'error': 'Unauthorized'}), 401
 
+    upload = VideoUpload.query.filter_by(filename=filename).first()
+    if upload is not None:
+        return jsonify({
+            'exists': True,
+            'filename': filename,
+            'file_size': upload.blob.size,
+            'upload_path': blob_store.path(upload.sha256)
+        })
+    
+    # Videoclipurile salvate înainte de depozitul de blob-uri sunt fișiere separate în uploads/
     filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
     
-    if os.path.exists(filepath):
+    if os.path.isfile(filepath):
         file_size = os.path.getsize(filepath)
         return jsonify({
             'exists': True,
@@ -1052,9 +1727,13 @@ def list_videos():
         return jsonify({'error': 'Unauthorized'}), 401
 
     username = session['username']
-    videos = []
     
     try:
+        uploads = VideoUpload.query.filter_by(user_id=session.get('user_id')) \
+            .order_by(VideoUpload.created_at.desc()).all()
+        videos = [upload.to_dict() for upload in uploads]
+        
+        # Videoclipurile salvate înainte de depozitul de blob-uri
         for filename in os.listdir(app.config['UPLOAD_FOLDER']):
             if filename.startswith(f"{username}_") and allowed_video_file(filename):
                 filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
@@ -1079,12 +1758,23 @@ def serve_video(filename):
     if 'user_id' not in session:
         return jsonify({'error': 'Unauthorized'}), 401
     
+    upload = VideoUpload.query.filter_by(filename=filename).first()
+    
     # Verifică că utilizatorul poate accesa doar propriile videoclipuri
     user_id = str(session['user_id'])
-    if not filename.startswith(f"{user_id}_"):
+    if upload is not None:
+        allowed = upload.user_id is not None and str(upload.user_id) == user_id
+    else:
+        allowed = filename.startswith(f"{user_id}_")
+    if not allowed:
         return jsonify({'error': 'Access denied'}), 403
     
     try:
+        if upload is not None:
+            # Blob-ul nu are extensie; tipul vine de la încărcare sau din numele public
+            mimetype = upload.content_type or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+            return send_file(os.path.abspath(blob_store.path(upload.sha256)), mimetype=mimetype,
+                             download_name=upload.original_name or filename, conditional=True)
         from flask import send_from_directory
         return send_from_directory(UPLOAD_FOLDER, filename)
     except FileNotFoundError:
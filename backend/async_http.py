@@ -0,0 +1,158 @@
+"""
+Client HTTP asincron pentru serviciile AI externe (OpenAI, Perspective).
+Fiecare furnizor are propriul pool de conexiuni keep-alive, o limita de cereri
+concurente, timeout-uri si reincercari cu backoff exponential si jitter.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+from typing import Dict, Optional
+
+import aiohttp
+
+try:
+    import config
+except ImportError:
+    config = None
+
+AI_HTTP_TIMEOUT = getattr(config, 'AI_HTTP_TIMEOUT', 30)
+AI_HTTP_MAX_RETRIES = getattr(config, 'AI_HTTP_MAX_RETRIES', 3)
+AI_HTTP_BACKOFF_BASE = getattr(config, 'AI_HTTP_BACKOFF_BASE', 0.5)
+AI_HTTP_BACKOFF_MAX = getattr(config, 'AI_HTTP_BACKOFF_MAX', 8.0)
+AI_HTTP_POOL_SIZE = getattr(config, 'AI_HTTP_POOL_SIZE', 32)
+
+# Coduri HTTP pentru care o nouă încercare are sens
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+class ProviderError(Exception):
+    """Cererea catre un furnizor extern a esuat definitiv."""
+
+    def __init__(self, provider: str, message: str, status: Optional[int] = None):
+        super().__init__(f"{provider}: {message}")
+        self.provider = provider
+        self.status = status
+
+
+class ProviderClient:
+    """
+    Client pentru un furnizor extern. Sesiunea aiohttp si semaforul sunt legate de bucla
+    de evenimente, deci sunt create la prima cerere din fiecare bucla si refolosite apoi.
+    """
+
+    def __init__(self, name: str, base_url: str, max_concurrency: int = 4,
+                 timeout: float = AI_HTTP_TIMEOUT, max_retries: int = AI_HTTP_MAX_RETRIES,
+                 backoff_base: float = AI_HTTP_BACKOFF_BASE, backoff_max: float = AI_HTTP_BACKOFF_MAX,
+                 pool_size: int = AI_HTTP_POOL_SIZE):
+        """
+        Args:
+            name: Numele furnizorului (folosit in loguri si metrici)
+            base_url: URL-ul de baza al API-ului
+            max_concurrency: Numarul maxim de cereri simultane catre furnizor
+            timeout: Timpul maxim al unei incercari (secunde)
+            max_retries: Numarul de reincercari dupa prima incercare
+            backoff_base: Intarzierea de baza pentru backoff (secunde)
+            backoff_max: Intarzierea maxima intre incercari (secunde)
+            pool_size: Numarul maxim de conexiuni deschise
+        """
+        self.logger = logging.getLogger(__name__)
+        self.name = name
+        self.base_url = base_url.rstrip('/')
+        self.max_concurrency = max_concurrency
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.pool_size = pool_size
+        self._per_loop: Dict[asyncio.AbstractEventLoop, tuple] = {}
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'retries': 0, 'failures': 0}
+
+    def _resources(self):
+        """Returneaza (sesiune, semafor) pentru bucla curenta, creandu-le la nevoie."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            resources = self._per_loop.get(loop)
+            if resources is None or resources[0].closed:
+                # Buclele închise nu mai pot folosi sesiunile lor
+                for old_loop in [l for l in self._per_loop if l.is_closed()]:
+                    del self._per_loop[old_loop]
+                connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=30, ttl_dns_cache=300)
+                session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+                resources = (session, asyncio.Semaphore(self.max_concurrency))
+                self._per_loop[loop] = resources
+            return resources
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Intarzierea inaintea reincercarii: Retry-After daca exista, altfel backoff cu jitter complet."""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    async def post_json(self, path: str, payload: Dict, headers: Optional[Dict] = None,
+                        params: Optional[Dict] = None) -> Dict:
+        """
+        Trimite o cerere POST cu corp JSON si returneaza raspunsul JSON.
+
+        Args:
+            path: Calea relativa la base_url (sau URL complet)
+            payload: Corpul cererii
+            headers: Header-e suplimentare
+            params: Parametri de query
+
+        Returns:
+            dict: Raspunsul decodat
+
+        Raises:
+            ProviderError: Dupa epuizarea reincercarilor sau la un raspuns care nu merita reincercat
+        """
+        url = path if path.startswith('http') else f"{self.base_url}/{path.lstrip('/')}"
+        session, semaphore = self._resources()
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats['retries'] += 1
+            retry_after = None
+            async with semaphore:
+                self.stats['requests'] += 1
+                try:
+                    async with session.post(url, json=payload, headers=headers, params=params) as response:
+                        if response.status < 400:
+                            return await response.json(content_type=None)
+                        body = await response.text()
+                        last_error = ProviderError(self.name, f"HTTP {response.status}: {body[:200]}", response.status)
+                        if response.status not in RETRYABLE_STATUSES:
+                            break
+                        retry_after = response.headers.get('Retry-After')
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    last_error = ProviderError(self.name, f"{type(e).__name__}: {e}")
+
+            if attempt < self.max_retries:
+                delay = self._backoff(attempt, retry_after)
+                self.logger.warning(f"{self.name}: încercarea {attempt + 1} a eșuat ({last_error}); reîncerc în {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+        self.stats['failures'] += 1
+        raise last_error
+
+    async def close(self):
+        """Inchide sesiunea buclei curente."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            resources = self._per_loop.pop(loop, None)
+        if resources is not None:
+            await resources[0].close()
+
+    def get_status(self) -> Dict:
+        """Metrici despre cererile catre furnizor."""
+        return {
+            'base_url': self.base_url,
+            'max_concurrency': self.max_concurrency,
+            **self.stats,
+        }
@@ -0,0 +1,194 @@
+"""
+Runtime asincron al procesului: o singura bucla asyncio care ruleaza permanent
+intr-un thread de fundal si un pool limitat de thread-uri pentru etapele CPU (ML).
+Handler-ele Flask (sincrone) trimit corutine in bucla prin run_async().
+"""
+
+import asyncio
+import atexit
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Coroutine, Dict, Optional
+
+try:
+    import config
+except ImportError:
+    config = None
+
+ASYNC_WORKER_THREADS = getattr(config, 'ASYNC_WORKER_THREADS', min(4, os.cpu_count() or 1))
+ASYNC_IO_THREADS = getattr(config, 'ASYNC_IO_THREADS', 16)
+ASYNC_REQUEST_TIMEOUT = getattr(config, 'ASYNC_REQUEST_TIMEOUT', 120)
+
+
+class AsyncRuntime:
+    """
+    Bucla de evenimente de lunga durata plus doua pool-uri limitate de thread-uri:
+    unul pentru etapele CPU (ML) si unul, executorul implicit al buclei, pentru apeluri I/O blocante.
+    """
+
+    def __init__(self, worker_threads: int = ASYNC_WORKER_THREADS, io_threads: int = ASYNC_IO_THREADS):
+        """
+        Porneste bucla intr-un thread daemon.
+
+        Args:
+            worker_threads: Numarul maxim de thread-uri pentru etapele CPU
+            io_threads: Numarul maxim de thread-uri pentru apelurile I/O blocante
+        """
+        self.logger = logging.getLogger(__name__)
+        self.pid = os.getpid()
+        self.worker_threads = max(1, worker_threads)
+        self.io_threads = max(1, io_threads)
+        self.executor = ThreadPoolExecutor(max_workers=self.worker_threads, thread_name_prefix='ml-worker')
+        self.io_executor = ThreadPoolExecutor(max_workers=self.io_threads, thread_name_prefix='io-worker')
+        self.loop = asyncio.new_event_loop()
+        self.loop.set_default_executor(self.io_executor)
+        self._in_flight = 0
+        self._counter_lock = threading.Lock()
+
+        started = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, args=(started,), name='async-runtime', daemon=True)
+        self._thread.start()
+        started.wait()
+        self.logger.info(f"Runtime asincron pornit ({self.worker_threads} thread-uri de lucru)")
+
+    def _run_loop(self, started: threading.Event):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(started.set)
+        self.loop.run_forever()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive() and self.loop.is_running()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        Programeaza o corutina in bucla runtime-ului, din orice thread.
+
+        Args:
+            coro: Corutina de executat
+
+        Returns:
+            concurrent.futures.Future: Rezultatul corutinei
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("submit() nu poate fi apelat din bucla runtime-ului; folositi await")
+
+        with self._counter_lock:
+            self._in_flight += 1
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        future.add_done_callback(self._task_done)
+        return future
+
+    def _task_done(self, _future: Future):
+        with self._counter_lock:
+            self._in_flight -= 1
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = ASYNC_REQUEST_TIMEOUT) -> Any:
+        """
+        Ruleaza o corutina in bucla runtime-ului si asteapta rezultatul (blocant).
+
+        Args:
+            coro: Corutina de executat
+            timeout: Timpul maxim de asteptare in secunde (None = fara limita)
+
+        Returns:
+            Rezultatul corutinei; exceptiile corutinei sunt propagate
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def get_status(self) -> Dict:
+        """Metrici despre bucla si pool-ul de thread-uri."""
+        return {
+            'running': self.is_running,
+            'worker_threads': self.worker_threads,
+            'io_threads': self.io_threads,
+            'in_flight': self._in_flight,
+        }
+
+    def shutdown(self):
+        """Opreste bucla si pool-ul de thread-uri."""
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=5)
+        self.executor.shutdown(wait=False)
+        self.io_executor.shutdown(wait=False)
+
+
+_runtime: Optional[AsyncRuntime] = None
+_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> AsyncRuntime:
+    """
+    Returneaza runtime-ul procesului curent, creat la prima utilizare.
+    Dupa fork (ex. workeri gunicorn) procesul copil isi creeaza propriul runtime.
+    """
+    global _runtime
+    runtime = _runtime
+    if runtime is None or runtime.pid != os.getpid():
+        with _runtime_lock:
+            if _runtime is None or _runtime.pid != os.getpid():
+                _runtime = AsyncRuntime()
+            runtime = _runtime
+    return runtime
+
+
+def run_async(coro: Coroutine, timeout: Optional[float] = ASYNC_REQUEST_TIMEOUT) -> Any:
+    """
+    Ruleaza o corutina din cod sincron (ex. handler Flask) in bucla persistenta.
+
+    Args:
+        coro: Corutina de executat
+        timeout: Timpul maxim de asteptare in secunde
+
+    Returns:
+        Rezultatul corutinei
+    """
+    return get_runtime().run(coro, timeout)
+
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """
+    Ruleaza o functie blocanta (ex. inferenta ML) in pool-ul limitat de thread-uri.
+
+    Args:
+        func: Functia de apelat
+        *args, **kwargs: Argumentele functiei
+
+    Returns:
+        Rezultatul functiei
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_runtime().executor, functools.partial(func, *args, **kwargs))
+
+
+async def run_blocking_io(func: Callable, *args, **kwargs) -> Any:
+    """
+    Ruleaza un apel I/O blocant (ex. descarcarea unei pagini cu clientul HTTP sincron) in
+    pool-ul I/O de ASYNC_IO_THREADS thread-uri, astfel incat sa nu blocheze bucla comuna si
+    nici thread-urile ML.
+
+    Args:
+        func: Functia de apelat
+        *args, **kwargs: Argumentele functiei
+
+    Returns:
+        Rezultatul functiei
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_runtime().io_executor, functools.partial(func, *args, **kwargs))
+
+
+@atexit.register
+def _shutdown_runtime():
+    if _runtime is not None and _runtime.pid == os.getpid():
+        _runtime.shutdown()
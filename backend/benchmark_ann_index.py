@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru cautarea vecinilor in corpusul semantic.
+Masoara latenta per interogare pentru indexul exact si IVF la 100k+ articole.
+
+Utilizare: python benchmark_ann_index.py [numar_articole] [dimensiune]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from ann_index import ExactIndex, IVFIndex
+from embedding_index import normalize_rows
+
+
+def benchmark(index, queries, k: int = 5) -> float:
+    """Returneaza latenta medie per interogare in milisecunde."""
+    for query in queries[:10]:
+        index.search(query, k)
+    start = time.perf_counter()
+    for query in queries:
+        index.search(query, k)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    dim = int(sys.argv[2]) if len(sys.argv) > 2 else 384
+
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(500, dim))
+    vectors = normalize_rows(centers[rng.integers(0, 500, size)] + 0.5 * rng.normal(size=(size, dim)))
+    queries = normalize_rows(centers[rng.integers(0, 500, 200)] + 0.5 * rng.normal(size=(200, dim)))
+    ids = [str(i) for i in range(size)]
+
+    print(f"📊 BENCHMARK ANN: {size} articole, dimensiune {dim}")
+    print("=" * 50)
+
+    exact = ExactIndex().build(vectors, ids)
+    print(f"Exact: {benchmark(exact, queries):.3f} ms/interogare")
+
+    start = time.perf_counter()
+    ivf = IVFIndex().build(vectors, ids)
+    print(f"IVF construit în {time.perf_counter() - start:.1f}s ({len(ivf.centroids)} liste)")
+    print(f"IVF:   {benchmark(ivf, queries):.3f} ms/interogare")
+
+    recall = np.mean([
+        len({i for i, _ in exact.search(q, 10)} & {i for i, _ in ivf.search(q, 10)}) / 10
+        for q in queries[:50]
+    ])
+    print(f"Recall@10 IVF: {recall:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru extragerea frame-urilor de analiza.
+Compara metoda veche (salt cu CAP_PROP_POS_FRAMES pentru fiecare frame) cu decodarea
+secventiala grab() / retrieve() si cu cadrele cheie extrase de ffmpeg, pe videoclipuri
+de lungimi diferite; afiseaza si metoda aleasa automat.
+
+Utilizare: python benchmark_frame_sampler.py [video ...] [--frames N]
+Fara argumente, se genereaza videoclipuri sintetice MPEG-4 de 10 s, 1 min si 4 min.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from frame_sampler import SAMPLERS, FrameSampler, choose_sampler, ffmpeg_available
+
+
+def write_synthetic_video(path: str, frame_count: int, size=(640, 360)):
+    width, height = size
+    base = np.random.default_rng(0).integers(0, 255, (height, width, 3), dtype=np.uint8)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), 25, size)
+    for i in range(frame_count):
+        writer.write(np.roll(base, i * 3, axis=1))
+    writer.release()
+
+
+def benchmark(path: str, max_frames: int):
+    sampler = FrameSampler(path, max_frames)
+    info = sampler.info
+    print(f"\n🎬 {os.path.basename(path)}: {info['total_frames']} frame-uri, {info['duration']:.0f}s, "
+          f"{info['width']}x{info['height']}, codec {info['codec']}")
+    print(f"Metoda aleasă automat: {choose_sampler(info, len(sampler.indices))}")
+
+    for method in SAMPLERS:
+        if method == 'keyframes' and not ffmpeg_available():
+            print(f"  {method:<11} - (ffmpeg nu este instalat)")
+            continue
+        start = time.perf_counter()
+        frames = list(FrameSampler(path, max_frames, method=method))
+        elapsed = time.perf_counter() - start
+        print(f"  {method:<11} {elapsed * 1000:8.0f} ms  ({len(frames)} frame-uri)")
+
+
+def main():
+    args = sys.argv[1:]
+    max_frames = 50
+    if '--frames' in args:
+        position = args.index('--frames')
+        max_frames = int(args[position + 1])
+        del args[position:position + 2]
+
+    print(f"📊 BENCHMARK EXTRAGERE FRAME-URI ({max_frames} frame-uri per videoclip)")
+    print("=" * 50)
+    if args:
+        for path in args:
+            benchmark(path, max_frames)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        for seconds in (10, 60, 240):
+            path = os.path.join(directory, f"sintetic_{seconds}s.mp4")
+            write_synthetic_video(path, seconds * 25)
+            benchmark(path, max_frames)
+
+
+if __name__ == "__main__":
+    main()
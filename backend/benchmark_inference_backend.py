@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru backend-urile de inferenta ale Sentence Transformer si mBERT.
+Compara backend-urile int8 cu fp32: paritate (cosinus / etichete), latenta per text
+(un text pe apel si loturi) si memoria (greutati si RSS-ul procesului).
+
+Utilizare: python benchmark_inference_backend.py [backend ...] [--texts N]
+Backend-uri: torch_int8, onnx_int8 (implicit: toate cele disponibile)
+"""
+
+import json
+import resource
+import sys
+import time
+
+from inference_backend import (
+    BACKEND_ONNX_INT8, BACKEND_PYTORCH, BACKEND_TORCH_INT8, classifier_parity, encoder_parity,
+    load_sentence_encoder, load_text_classifier, model_size_bytes,
+)
+from ml_analyzer import MBERT_CLASSIFIER_MODEL, ML_BATCH_SIZE, SENTENCE_TRANSFORMER_MODEL
+
+
+def load_texts(count: int):
+    """Primele articole din datasetul etichetat."""
+    with open("simple_large_dataset.json", "r", encoding='utf-8') as f:
+        dataset = json.load(f)
+    return [article['text'][:512] for article in dataset[:count]]
+
+
+def rss_mb() -> float:
+    """Varful memoriei rezidente a procesului (MB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def latency_ms(run, texts, batch_size: int) -> float:
+    """Latenta medie per text, in milisecunde, pentru apeluri cu loturi de batch_size texte."""
+    run(texts[:batch_size])
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        run(texts[i:i + batch_size])
+    return (time.perf_counter() - start) / len(texts) * 1000
+
+
+def report(name: str, model, run, texts):
+    print(f"  {name:<11} greutăți {model_size_bytes(model) / 2**20:7.1f} MB | "
+          f"1 text/apel {latency_ms(run, texts, 1):7.2f} ms/text | "
+          f"lot {ML_BATCH_SIZE} {latency_ms(run, texts, ML_BATCH_SIZE):7.2f} ms/text | "
+          f"RSS maxim {rss_mb():7.0f} MB")
+
+
+def main():
+    args = sys.argv[1:]
+    count = 128
+    if '--texts' in args:
+        index = args.index('--texts')
+        count = int(args[index + 1])
+        del args[index:index + 2]
+    backends = args or [BACKEND_TORCH_INT8, BACKEND_ONNX_INT8]
+    texts = load_texts(count)
+
+    print(f"📊 BENCHMARK BACKEND-URI DE INFERENȚĂ: {len(texts)} texte")
+    print("=" * 50)
+
+    print(f"Sentence Transformer ({SENTENCE_TRANSFORMER_MODEL})")
+    reference = load_sentence_encoder(SENTENCE_TRANSFORMER_MODEL, BACKEND_PYTORCH)
+    report(BACKEND_PYTORCH, reference, lambda batch: reference.encode(batch, batch_size=ML_BATCH_SIZE), texts)
+    for backend in backends:
+        encoder = load_sentence_encoder(SENTENCE_TRANSFORMER_MODEL, backend)
+        report(backend, encoder, lambda batch: encoder.encode(batch, batch_size=ML_BATCH_SIZE), texts)
+        parity = encoder_parity(reference, encoder, texts)
+        print(f"  {'':<11} paritate: cosinus mediu {parity['mean_cosine']:.4f}, minim {parity['min_cosine']:.4f}")
+
+    print(f"mBERT ({MBERT_CLASSIFIER_MODEL})")
+    reference = load_text_classifier(MBERT_CLASSIFIER_MODEL, BACKEND_PYTORCH)
+    report(BACKEND_PYTORCH, reference, lambda batch: reference(batch, batch_size=ML_BATCH_SIZE), texts)
+    for backend in backends:
+        classifier = load_text_classifier(MBERT_CLASSIFIER_MODEL, backend)
+        report(backend, classifier, lambda batch: classifier(batch, batch_size=ML_BATCH_SIZE), texts)
+        parity = classifier_parity(reference, classifier, texts)
+        print(f"  {'':<11} paritate: etichete identice {parity['label_agreement']:.1%}, "
+              f"diferență maximă de scor {parity['max_score_diff']:.4f}")
+
+
+if __name__ == "__main__":
+    main()
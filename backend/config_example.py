@@ -3,6 +3,8 @@ Fisier de configurare exemplu pentru sistemul de detectie fake news.
 Copiaza acest fisier ca 'config.py' si completeaza cu chei API reale.
 """
 
+import os
+
 # API Keys pentru serviciile AI
 OPENAI_API_KEY = "sk-your-openai-api-key-here"
 """str: Cheia API pentru serviciul OpenAI GPT. Obtine de la platform.openai.com"""
@@ -45,4 +47,178 @@ SENTENCE_TRANSFORMER_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
 """str: Modelul Sentence Transformers pentru analiza semantica multilingva"""
 
 MULTILINGUAL_BERT_MODEL = "bert-base-multilingual-cased"
-"""str: Modelul mBERT pentru analiza contextuala multilingva""" 
\ No newline at end of file
+"""str: Modelul mBERT pentru analiza contextuala multilingva""" 
+
+EMBEDDING_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "embeddings_cache")
+"""str: Directorul pentru embedding-urile de referinta precalculate (fisiere .npy)"""
+
+ENABLE_SEMANTIC_CORPUS = True
+"""bool: Compara textul si cu toate articolele din simple_large_dataset.json (index ANN)"""
+
+SEMANTIC_CORPUS_TOP_K = 5
+"""int: Numarul de vecini fake/reali returnati din corpusul semantic"""
+
+ANN_BACKEND = "ivf"
+"""str: Backend-ul pentru cautarea vecinilor ('ivf' aproximativ sau 'exact')"""
+
+ANN_NPROBE = 8
+"""int: Numarul de liste IVF scanate la fiecare cautare (mai mare = recall mai bun, mai lent)"""
+
+ANN_MIN_IVF_SIZE = 5000
+"""int: Sub acest numar de articole se foloseste cautarea exacta"""
+
+KEYWORDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "enhanced_keywords.json")
+"""str: Fisierul de keywords pentru clasificatorul euristic (JSON, comentariile // sunt permise); cale absoluta, independenta de directorul curent"""
+
+KEYWORDS_RELOAD_INTERVAL = 1.0
+"""float: Intervalul minim (secunde) intre verificarile modificarii fisierului de keywords"""
+
+ML_BATCH_SIZE = 32
+"""int: Dimensiunea loturilor trimise modelelor Sentence Transformer si mBERT la analiza pe loturi"""
+
+ML_MICRO_BATCHING = True
+"""bool: Grupeaza cererile concurente in loturi comune inainte de apelul modelelor Sentence Transformer si mBERT"""
+
+ML_MICRO_BATCH_MAX_SIZE = 32
+"""int: Numarul maxim de texte dintr-un micro-lot"""
+
+ML_MICRO_BATCH_MAX_WAIT_MS = 5
+"""float: Cat asteapta (milisecunde) primul text dintr-un micro-lot sosirea altor cereri"""
+
+MODEL_PRELOAD = ['sentence_transformer', 'mbert']
+"""list: Modelele incarcate in paralel, in fundal, la pornire (celelalte se incarca la prima utilizare)"""
+
+MODEL_WARMUP_ON_STARTUP = True
+"""bool: Porneste la pornirea aplicatiei incarcarea modelelor si o analiza de proba, ca prima cerere sa nu fie lenta"""
+
+MODEL_LOAD_THREADS = 2
+"""int: Numarul de thread-uri folosite pentru incarcarea modelelor in fundal"""
+
+ML_INFERENCE_BACKEND = 'pytorch'
+"""str: Backend-ul de inferenta pentru Sentence Transformer si mBERT: 'pytorch' (fp32), 'torch_int8' sau 'onnx_int8' (necesita onnxruntime)"""
+
+ML_ONNX_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'onnx_models')
+"""str: Directorul in care modelele sunt exportate o singura data in ONNX si cuantizate int8"""
+
+MBERT_CHUNKING = True
+"""bool: Analizeaza tot articolul cu mBERT, in ferestre de tokeni suprapuse, in loc de primele 512 caractere"""
+
+MBERT_CHUNK_OVERLAP = 64
+"""int: Numarul de tokeni comuni intre doua ferestre consecutive"""
+
+MBERT_MAX_CHUNKS = 8
+"""int: Numarul maxim de ferestre per text; peste limita se aleg ferestre distribuite uniform in articol"""
+
+MBERT_CHUNK_AGGREGATION = 'max'
+"""str: Agregarea predictiilor ferestrelor: 'max' (fereastra cea mai sigura) sau 'mean' (media probabilitatilor)"""
+
+CASCADE_FAST_THRESHOLD = 0.85
+"""float: Modul 'cascade' se opreste dupa modelul traditional si pattern-uri daca acestea au cel putin aceasta confidenta"""
+
+CASCADE_ML_THRESHOLD = 0.85
+"""float: Modul 'cascade' se opreste dupa modelele ML (fara apeluri AI) daca analiza ML are cel putin aceasta confidenta"""
+
+ASYNC_WORKER_THREADS = 4
+"""int: Numarul maxim de thread-uri pentru etapa ML (CPU) in runtime-ul asincron al procesului"""
+
+ASYNC_IO_THREADS = 16
+"""int: Numarul maxim de thread-uri pentru apelurile I/O blocante (ex. descarcarea in paralel a URL-urilor din /predict/batch)"""
+
+ASYNC_REQUEST_TIMEOUT = 120
+"""int: Timpul maxim (secunde) cat un handler asteapta rezultatul unei analize asincrone"""
+
+RESULT_CACHE_ENABLED = True
+"""bool: Pastreaza rezultatele analizelor pentru textele trimise repetat"""
+
+RESULT_CACHE_MAX_ENTRIES = 1024
+"""int: Numarul maxim de rezultate pastrate in memorie (eliminare LRU)"""
+
+RESULT_CACHE_TTL = 21600
+"""int: Durata de viata a unui rezultat in cache (secunde)"""
+
+RESULT_CACHE_SQLITE_PATH = None
+"""str: Fisierul SQLite pentru cache-ul persistent intre reporniri (None = doar in memorie)"""
+
+OPENAI_API_BASE = "https://api.openai.com/v1"
+"""str: URL-ul de baza al API-ului OpenAI (poate indica un proxy compatibil)"""
+
+PERSPECTIVE_API_BASE = "https://commentanalyzer.googleapis.com/v1alpha1"
+"""str: URL-ul de baza al Google Perspective API"""
+
+OPENAI_MAX_CONCURRENCY = 4
+"""int: Numarul maxim de cereri simultane catre OpenAI"""
+
+PERSPECTIVE_MAX_CONCURRENCY = 8
+"""int: Numarul maxim de cereri simultane catre Perspective API"""
+
+AI_HTTP_TIMEOUT = 30
+"""int: Timpul maxim (secunde) al unei cereri catre un serviciu AI"""
+
+AI_HTTP_MAX_RETRIES = 3
+"""int: Numarul de reincercari pentru erorile temporare (timeout, 429, 5xx)"""
+
+AI_HTTP_POOL_SIZE = 32
+"""int: Numarul maxim de conexiuni keep-alive deschise per furnizor"""
+
+URL_FETCH_TIMEOUT = 10
+"""int: Timpul maxim (secunde) de conectare / citire la descarcarea unui articol de la URL"""
+
+URL_FETCH_MAX_BYTES = 5242880
+"""int: Dimensiunea maxima (octeti) a unei pagini descarcate; paginile mai mari sunt refuzate"""
+
+URL_FETCH_POOL_SIZE = 16
+"""int: Numarul maxim de conexiuni keep-alive pastrate per site"""
+
+URL_FETCH_CACHE_ENTRIES = 256
+"""int: Numarul maxim de URL-uri al caror text extras este pastrat in cache (0 = fara cache)"""
+
+URL_FETCH_CACHE_FRESH_SECONDS = 300
+"""int: Cat timp (secunde) textul din cache este folosit fara revalidare (ETag / Last-Modified)"""
+
+JOB_QUEUE_DB_PATH = "instance/jobs.db"
+"""str: Fisierul SQLite al cozii de joburi (POST /jobs); poate fi folosit de mai multe procese"""
+
+JOB_WORKERS = 2
+"""int: Numarul de thread-uri care executa joburile de analiza in fundal"""
+
+JOB_MAX_ATTEMPTS = 3
+"""int: Numarul maxim de incercari ale unui job (erorile de validare nu sunt reincercate)"""
+
+JOB_RETRY_BACKOFF = 2.0
+"""float: Intarzierea de baza (secunde) inainte de reincercare, dublata la fiecare incercare"""
+
+JOB_PER_USER_CONCURRENCY = 2
+"""int: Numarul maxim de joburi ale unui utilizator executate simultan (0 = nelimitat)"""
+
+JOB_LEASE_SECONDS = 1800
+"""int: Dupa acest timp fara progres raportat, un job ramas in executie (proces oprit) este reluat sau marcat esuat"""
+
+JOB_RETENTION_SECONDS = 604800
+"""int: Cat timp (secunde) sunt pastrate joburile terminate si rezultatele lor"""
+
+VIDEO_FRAME_SAMPLER = "auto"
+"""str: Metoda de citire a frame-urilor: 'auto' (dupa metadatele containerului), 'sequential', 'seek' sau 'keyframes' (ffmpeg)"""
+
+VIDEO_ASSUMED_GOP = 60
+"""int: Distanta presupusa intre cadrele cheie (codecuri inter-frame), folosita in estimarea costului fiecarei metode"""
+
+VIDEO_FEATURE_WORKERS = 0
+"""int: Numarul de thread-uri / procese pentru calculele per frame din analiza video (0 = numarul de nuclee, 1 = secvential)"""
+
+VIDEO_FEATURE_EXECUTOR = "thread"
+"""str: 'thread' (OpenCV si numpy elibereaza GIL-ul) sau 'process' (frame-urile sunt transmise prin memorie partajata)"""
+
+VIDEO_TOOL_PROBE_INTERVAL = 300
+"""int: Secundele dupa care disponibilitatea ffmpeg / ffprobe este reverificata (rezultatul este pastrat intre cereri)"""
+
+VIDEO_TEMP_DIR = None
+"""str: Directorul sub care se creeaza fisierele temporare ale analizei video (None = directorul temporar al sistemului)"""
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+"""int: Dimensiunea bucatilor (bytes) cu care fisierele incarcate sunt copiate si hash-uite"""
+
+VIDEO_ANALYZER_VERSION = "1"
+"""str: Versiunea analizei video; rezultatele pastrate per continut (SHA-256) sunt refolosite doar pentru aceeasi versiune"""
+
+VIDEO_ANALYSIS_MAX_SIDE = 640
+"""int: Latura maxima (pixeli) a copiei micsorate pe care ruleaza spectrul si detectia fetelor (0 = rezolutia completa)"""
@@ -0,0 +1,243 @@
+"""
+Extragerea continutului principal din paginile de stiri (in stilul Readability).
+Blocurile DOM sunt punctate dupa densitatea textului, densitatea linkurilor si semantica
+tagurilor / claselor; se pastreaza doar corpul articolului, fara meniuri, bannere de cookie-uri
+sau comentarii. Titlul si data publicarii sunt extrase separat, ca campuri structurate.
+Parsarea si punctarea folosesc direct lxml, astfel incat o pagina obisnuita se proceseaza
+in cateva milisecunde.
+"""
+
+import json
+import re
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import lxml.html
+from lxml import etree
+
+# Elemente care nu conțin niciodată textul articolului
+NOISE_TAGS = [
+    'script', 'style', 'noscript', 'iframe', 'form', 'nav', 'footer', 'aside', 'svg',
+    'button', 'select', 'textarea', 'template', 'header', 'menu', 'figure',
+]
+NEGATIVE_HINTS = re.compile(
+    r'comment|cookie|consent|banner|share|social|related|sidebar|footer|masthead|menu|navbar|'
+    r'promo|advert|sponsor|newsletter|subscribe|popup|modal|breadcrumb|widget|tags|author-bio|disqus',
+    re.IGNORECASE,
+)
+POSITIVE_HINTS = re.compile(r'article|body|content|entry|main|news|post|story|text|stire', re.IGNORECASE)
+# Elemente eliminate chiar dacă ar avea text mult, după clasă / id
+UNLIKELY_CANDIDATES = re.compile(
+    r'comment|cookie|consent|banner|share|social|sidebar|footer|navbar|menu|popup|modal|newsletter|disqus',
+    re.IGNORECASE,
+)
+MAYBE_CANDIDATES = re.compile(r'article|body|content|main|story|post', re.IGNORECASE)
+
+TAG_WEIGHTS = {
+    'article': 10, 'main': 8, 'div': 5, 'section': 3, 'pre': 3, 'td': 3, 'blockquote': 3,
+    'address': -3, 'ol': -3, 'ul': -3, 'dl': -3, 'dd': -3, 'dt': -3, 'li': -3,
+    'h1': -5, 'h2': -5, 'h3': -5, 'h4': -5, 'h5': -5, 'h6': -5, 'th': -5,
+}
+PARAGRAPH_TAGS = ('p', 'pre', 'td', 'blockquote')
+CONTENT_TAGS = ('p', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote', 'pre', 'li')
+FALLBACK_TAGS = ('p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+MIN_PARAGRAPH_LENGTH = 25
+MAX_LINK_DENSITY = 0.5
+
+DATE_META = [
+    ('property', 'article:published_time'), ('property', 'og:published_time'),
+    ('name', 'article:published_time'), ('itemprop', 'datePublished'), ('name', 'pubdate'),
+    ('name', 'publishdate'), ('name', 'publish-date'), ('name', 'date'), ('name', 'dc.date.issued'),
+    ('name', 'dc.date'), ('name', 'sailthru.date'), ('name', 'parsely-pub-date'),
+]
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _text(element) -> str:
+    return _WHITESPACE.sub(' ', element.text_content()).strip()
+
+
+def _class_weight(element) -> int:
+    """+25 / -25 dupa indiciile din class si id."""
+    weight = 0
+    for hint in (element.get('class'), element.get('id')):
+        if hint:
+            if NEGATIVE_HINTS.search(hint):
+                weight -= 25
+            if POSITIVE_HINTS.search(hint):
+                weight += 25
+    return weight
+
+
+def _link_density(element, text_length: int) -> float:
+    if text_length == 0:
+        return 0.0
+    link_length = sum(len(_text(link)) for link in element.iter('a'))
+    return min(1.0, link_length / text_length)
+
+
+def _parse(html, encoding: Optional[str] = None):
+    parser = lxml.html.HTMLParser(encoding=encoding, remove_comments=True) if encoding else \
+        lxml.html.HTMLParser(remove_comments=True)
+    return lxml.html.document_fromstring(html, parser=parser)
+
+
+def _remove_noise(root):
+    """Elimina elementele care nu fac parte din articol."""
+    etree.strip_elements(root, *NOISE_TAGS, with_tail=False)
+    for element in list(root.iter('div', 'section', 'span', 'ul', 'ol', 'p', 'table')):
+        hint = f"{element.get('class', '')} {element.get('id', '')}"
+        if hint.strip() and UNLIKELY_CANDIDATES.search(hint) and not MAYBE_CANDIDATES.search(hint) \
+                and element.getparent() is not None and element.tag != 'body':
+            element.drop_tree()
+
+
+def _score_candidates(root) -> Dict:
+    """
+    Fiecare paragraf suficient de lung adauga puncte parintelui (integral) si bunicului (jumatate):
+    1 + numarul de virgule + cate un punct pentru fiecare 100 de caractere (maxim 3).
+    """
+    scores = {}
+    for paragraph in root.iter(*PARAGRAPH_TAGS):
+        text = _text(paragraph)
+        if len(text) < MIN_PARAGRAPH_LENGTH:
+            continue
+        points = 1 + text.count(',') + min(len(text) // 100, 3)
+        parent = paragraph.getparent()
+        grandparent = parent.getparent() if parent is not None else None
+        for ancestor, share in ((parent, points), (grandparent, points / 2)):
+            if ancestor is None:
+                continue
+            if ancestor not in scores:
+                scores[ancestor] = TAG_WEIGHTS.get(ancestor.tag, 0) + _class_weight(ancestor)
+            scores[ancestor] += share
+
+    # Blocurile formate mai ales din linkuri (meniuri, liste de articole) pierd din scor
+    for element in scores:
+        scores[element] *= 1 - _link_density(element, len(_text(element)))
+    return scores
+
+
+def _inside_content_block(element, container) -> bool:
+    """Blocurile imbricate (p in blockquote, li in li) sunt preluate o singura data, prin parinte."""
+    for parent in element.iterancestors():
+        if parent is container:
+            return False
+        if parent.tag in CONTENT_TAGS:
+            return True
+    return False
+
+
+def _content_blocks(container) -> List[str]:
+    """Textele blocurilor de continut dintr-un container, in ordinea din document."""
+    blocks = []
+    for element in container.iter(*CONTENT_TAGS):
+        if _inside_content_block(element, container):
+            continue
+        text = _text(element)
+        if not text:
+            continue
+        if element.tag == 'li' and len(text) < MIN_PARAGRAPH_LENGTH:
+            continue
+        if _link_density(element, len(text)) > MAX_LINK_DENSITY:
+            continue
+        blocks.append(text)
+    return blocks
+
+
+def extract_title(root) -> Optional[str]:
+    """Titlul articolului: og:title, apoi primul <h1>, apoi <title>."""
+    for xpath in ('//meta[@property="og:title"]/@content', '//meta[@name="twitter:title"]/@content'):
+        values = root.xpath(xpath)
+        if values and values[0].strip():
+            return values[0].strip()
+    for tag in ('h1', 'title'):
+        element = next(root.iter(tag), None)
+        if element is not None and _text(element):
+            return _text(element)
+    return None
+
+
+def _normalize_date(value: str) -> str:
+    """Converteste data in format ISO 8601 cand poate fi interpretata; altfel o lasa neschimbata."""
+    value = value.strip()
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).isoformat()
+    except ValueError:
+        return value
+
+
+def _json_ld_date(root) -> Optional[str]:
+    for script in root.xpath('//script[@type="application/ld+json"]'):
+        try:
+            data = json.loads(script.text or '')
+        except ValueError:
+            continue
+        items = data if isinstance(data, list) else data.get('@graph', [data]) if isinstance(data, dict) else []
+        for item in items:
+            if isinstance(item, dict) and item.get('datePublished'):
+                return str(item['datePublished'])
+    return None
+
+
+def extract_published(root) -> Optional[str]:
+    """Data publicarii din meta-taguri, JSON-LD sau primul <time datetime>."""
+    metas = {}
+    for meta in root.iter('meta'):
+        for attribute in ('property', 'name', 'itemprop'):
+            key = (meta.get(attribute) or '').lower()
+            if key and meta.get('content', '').strip():
+                metas.setdefault((attribute, key), meta.get('content'))
+    for key in DATE_META:
+        if key in metas:
+            return _normalize_date(metas[key])
+    value = _json_ld_date(root)
+    if value:
+        return _normalize_date(value)
+    values = root.xpath('//time[@datetime]/@datetime')
+    if values and values[0].strip():
+        return _normalize_date(values[0])
+    return None
+
+
+def extract_article(html, encoding: Optional[str] = None) -> Dict:
+    """
+    Extrage articolul dintr-o pagina HTML.
+
+    Args:
+        html: Pagina (octeti sau text)
+        encoding: Codificarea din antetul Content-Type; fara ea, lxml o detecteaza din <meta>
+
+    Returns:
+        dict: {'title', 'published', 'text', 'method'}; method este 'article' cand a fost gasit
+            un bloc principal si 'fallback' cand s-au folosit toate paragrafele si titlurile paginii
+    """
+    if not html or not html.strip():
+        return {'title': None, 'published': None, 'text': '', 'method': 'fallback'}
+    root = _parse(html, encoding)
+
+    # Metadatele se citesc înainte de curățare (JSON-LD stă în <script>, titlul poate fi în <header>)
+    title = extract_title(root)
+    published = extract_published(root)
+
+    _remove_noise(root)
+    scores = _score_candidates(root)
+    blocks = []
+    method = 'fallback'
+    if scores:
+        top = max(scores, key=scores.get)
+        threshold = max(10.0, scores[top] * 0.2)
+        parent = top.getparent()
+        # Frații blocului principal cu scor apropiat fac parte tot din articol (ex. pagini împărțite în secțiuni)
+        containers = [sibling for sibling in parent if sibling is top or scores.get(sibling, 0) >= threshold] \
+            if parent is not None else [top]
+        for container in containers:
+            blocks.extend(_content_blocks(container))
+        method = 'article' if blocks else method
+
+    if not blocks:
+        blocks = [text for text in (_text(element) for element in root.iter(*FALLBACK_TAGS)) if text]
+
+    return {'title': title, 'published': published, 'text': ' '.join(blocks), 'method': method}
@@ -0,0 +1,141 @@
+"""
+Index de embedding-uri pentru propozitiile de referinta folosite de MLAnalyzer.
+Embedding-urile sunt calculate o singura data, normalizate si salvate pe disc
+intr-un fisier .npy identificat prin numele modelului si hash-ul corpusului.
+"""
+
+import hashlib
+import logging
+import os
+import re
+from typing import List, Optional
+
+import numpy as np
+
+try:
+    import config
+except ImportError:
+    config = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+EMBEDDING_CACHE_DIR = getattr(config, 'EMBEDDING_CACHE_DIR', os.path.join(BASE_DIR, 'embeddings_cache'))
+
+
+def corpus_fingerprint(model_name: str, texts: List[str]) -> str:
+    """
+    Calculeaza amprenta unui corpus de referinta pentru un anumit model.
+
+    Args:
+        model_name: Numele modelului Sentence Transformer
+        texts: Propozitiile de referinta
+
+    Returns:
+        str: Hash SHA-256 hexazecimal al modelului si al textelor
+    """
+    digest = hashlib.sha256(model_name.encode('utf-8'))
+    for text in texts:
+        digest.update(b'\x00')
+        digest.update(text.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    Normalizeaza L2 fiecare rand al matricei (randurile nule raman nule).
+
+    Args:
+        matrix: Matrice 2D de embedding-uri
+
+    Returns:
+        np.ndarray: Matrice float32 cu randuri de norma 1
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class ReferenceEmbeddingIndex:
+    """
+    Matrice de embedding-uri normalizate pentru o lista de propozitii de referinta.
+    Similaritatea cosinus fata de un vector normalizat devine un singur produs matrice-vector.
+    """
+
+    def __init__(self, texts: List[str], model, model_name: str, cache_dir: Optional[str] = None):
+        """
+        Construieste sau incarca din cache indexul pentru lista de texte.
+
+        Args:
+            texts: Propozitiile de referinta
+            model: Modelul Sentence Transformer (are metoda encode)
+            model_name: Numele modelului, folosit in cheia de cache
+            cache_dir: Directorul pentru fisierele .npy (None = EMBEDDING_CACHE_DIR)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.texts = list(texts)
+        self.model_name = model_name
+        self.fingerprint = corpus_fingerprint(model_name, self.texts)
+        self.cache_dir = cache_dir if cache_dir is not None else EMBEDDING_CACHE_DIR
+        self.matrix = self._load_or_build(model)
+
+    @property
+    def cache_path(self) -> str:
+        """Calea fisierului .npy pentru combinatia model + corpus."""
+        safe_model = re.sub(r'[^A-Za-z0-9_.-]+', '_', self.model_name)
+        return os.path.join(self.cache_dir, f"{safe_model}_{self.fingerprint[:16]}.npy")
+
+    def _load_or_build(self, model) -> np.ndarray:
+        """Incarca matricea memory-mapped de pe disc sau o recalculeaza."""
+        path = self.cache_path
+        if os.path.exists(path):
+            try:
+                matrix = np.load(path, mmap_mode='r')
+                if matrix.shape[0] == len(self.texts):
+                    self.logger.info(f"Embedding-uri de referință încărcate din cache: {path}")
+                    return matrix
+            except Exception as e:
+                self.logger.warning(f"Cache de embedding-uri invalid ({path}): {e}")
+
+        self.logger.info(f"Calculez embedding-urile pentru {len(self.texts)} propoziții de referință...")
+        matrix = normalize_rows(model.encode(self.texts))
+        self._save(matrix, path)
+        return matrix
+
+    def _save(self, matrix: np.ndarray, path: str):
+        """Salveaza atomic matricea in cache; erorile de scriere nu sunt fatale."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, matrix)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Nu s-a putut salva cache-ul de embedding-uri: {e}")
+
+    def is_current(self, texts: List[str], model_name: str) -> bool:
+        """
+        Verifica daca indexul corespunde inca listei de texte si modelului.
+
+        Args:
+            texts: Lista curenta de propozitii de referinta
+            model_name: Numele modelului curent
+
+        Returns:
+            bool: True daca indexul poate fi refolosit
+        """
+        if model_name != self.model_name or len(texts) != len(self.texts):
+            return False
+        return corpus_fingerprint(model_name, texts) == self.fingerprint
+
+    def similarities(self, query: np.ndarray) -> np.ndarray:
+        """
+        Calculeaza similaritatea cosinus fata de toate propozitiile de referinta.
+
+        Args:
+            query: Embedding-ul textului (D,) sau un lot de embedding-uri (D, N), normalizate L2
+
+        Returns:
+            np.ndarray: O similaritate pentru fiecare propozitie (si pentru fiecare text din lot)
+        """
+        return self.matrix @ np.asarray(query, dtype=np.float32)
@@ -0,0 +1,193 @@
+"""
+Extragerea frame-urilor de analiza dintr-un videoclip.
+Pozitionarea cu cv2.CAP_PROP_POS_FRAMES inainte de fiecare frame forteaza un salt la cadrul
+cheie anterior si redecodarea GOP-ului, ceea ce este scump pentru H.264 / H.265. Samplerul
+alege metoda cea mai ieftina dupa metadatele containerului (numar de frame-uri, codec):
+- 'sequential': decodare secventiala cu grab(), retrieve() doar pentru frame-urile dorite;
+- 'seek': salt direct la fiecare frame (codecuri intra-only sau pas mare intre frame-uri);
+- 'keyframes': ffmpeg decodeaza doar cadrele cheie, la interval fix, direct intr-un pipe raw.
+"""
+
+import logging
+import subprocess
+from typing import Dict, Iterator, List, Optional
+
+import cv2
+import numpy as np
+
+from video_toolkit import get_video_toolkit
+
+try:
+    import config
+except ImportError:
+    config = None
+
+VIDEO_FRAME_SAMPLER = getattr(config, 'VIDEO_FRAME_SAMPLER', 'auto')
+VIDEO_ASSUMED_GOP = getattr(config, 'VIDEO_ASSUMED_GOP', 60)
+
+SAMPLERS = ('sequential', 'seek', 'keyframes')
+
+# Codecuri în care fiecare frame este cadru cheie (saltul nu redecodează nimic)
+INTRA_ONLY_CODECS = {
+    'MJPG', 'AVRN', 'JPEG', 'PNG', 'MPNG', 'AP4H', 'APCH', 'APCN', 'APCS', 'APCO', 'DVSD', 'DVHD',
+    'DV25', 'DV50', 'HFYU', 'FFVH', 'FFV1', 'I420', 'YUY2', 'RAW', 'V210', 'UYVY', 'AVDN', 'AVDH',
+}
+# Costuri fixe exprimate în frame-uri decodate, măsurate cu backend-ul FFmpeg al OpenCV
+SEEK_COST_FRAMES = 16
+FFMPEG_START_COST_FRAMES = 30
+
+logger = logging.getLogger(__name__)
+
+
+def ffmpeg_available() -> bool:
+    return get_video_toolkit().tool_available('ffmpeg')
+
+
+def _fourcc(capture) -> str:
+    code = int(capture.get(cv2.CAP_PROP_FOURCC))
+    return ''.join(chr((code >> 8 * i) & 0xFF) for i in range(4)).strip('\x00 ')
+
+
+def sample_indices(total_frames: int, max_frames: int) -> List[int]:
+    """Indicii frame-urilor de analiza, distribuiti uniform pe durata videoclipului."""
+    if total_frames <= 0 or max_frames <= 0:
+        return []
+    return np.unique(np.linspace(0, total_frames - 1, min(max_frames, total_frames), dtype=int)).tolist()
+
+
+def _gop(info: Dict) -> int:
+    """Distanta presupusa intre cadrele cheie."""
+    return 1 if info['codec'].upper() in INTRA_ONLY_CODECS else VIDEO_ASSUMED_GOP
+
+
+def estimated_cost(method: str, info: Dict, count: int) -> float:
+    """
+    Numarul estimat de frame-uri decodate de fiecare metoda.
+    'sequential' decodeaza tot videoclipul, 'seek' cate o jumatate de GOP plus costul saltului
+    pentru fiecare frame, iar 'keyframes' doar cadrele cheie.
+    """
+    gop = _gop(info)
+    if method == 'sequential':
+        return info['total_frames']
+    if method == 'seek':
+        return count * (SEEK_COST_FRAMES + gop / 2)
+    return info['total_frames'] / gop + FFMPEG_START_COST_FRAMES
+
+
+def choose_sampler(info: Dict, count: int) -> str:
+    """Metoda configurata (VIDEO_FRAME_SAMPLER) sau, in modul 'auto', cea mai ieftina estimata."""
+    if VIDEO_FRAME_SAMPLER in SAMPLERS and (VIDEO_FRAME_SAMPLER != 'keyframes' or ffmpeg_available()):
+        return VIDEO_FRAME_SAMPLER
+    candidates = ['sequential', 'seek']
+    gop = _gop(info)
+    # Cadrele cheie sunt folosite doar dacă sunt destule pentru numărul de frame-uri cerut
+    if (gop > 1 and info['duration'] > 0 and info['total_frames'] / gop >= count
+            and info['width'] > 0 and info['height'] > 0 and ffmpeg_available()):
+        candidates.append('keyframes')
+    return min(candidates, key=lambda method: estimated_cost(method, info, count))
+
+
+class FrameSampler:
+    """
+    Frame-urile de analiza ale unui videoclip, citite cu metoda aleasa automat.
+
+    Exemplu:
+        sampler = FrameSampler(video_path, max_frames=50)
+        frames = list(sampler)   # sampler.method, sampler.info
+    """
+
+    def __init__(self, video_path: str, max_frames: int = 50, method: Optional[str] = None):
+        self.video_path = video_path
+        self.capture = cv2.VideoCapture(video_path)
+        if not self.capture.isOpened():
+            raise ValueError("Nu se poate deschide videoclipul")
+
+        total_frames = int(self.capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = self.capture.get(cv2.CAP_PROP_FPS)
+        self.info = {
+            'total_frames': total_frames,
+            'fps': fps,
+            'duration': total_frames / fps if fps > 0 else 0,
+            'width': int(self.capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            'height': int(self.capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            'codec': _fourcc(self.capture),
+        }
+        self.indices = sample_indices(total_frames, max_frames)
+        self.method = method or choose_sampler(self.info, len(self.indices))
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        try:
+            if not self.indices:
+                return
+            if self.method == 'keyframes':
+                self.capture.release()
+                yielded = 0
+                for frame in self._read_keyframes():
+                    yielded += 1
+                    yield frame
+                if yielded:
+                    return
+                # ffmpeg a eșuat înainte de primul frame: se revine la salturi directe
+                logger.warning(f"ffmpeg nu a extras cadre cheie din {self.video_path}, se folosește 'seek'")
+                self.method = 'seek'
+                self.capture = cv2.VideoCapture(self.video_path)
+            if self.method == 'sequential':
+                yield from self._read_sequential()
+            else:
+                yield from self._read_seek()
+        finally:
+            self.capture.release()
+
+    def _read_seek(self) -> Iterator[np.ndarray]:
+        for frame_idx in self.indices:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
+            ret, frame = self.capture.read()
+            if ret:
+                yield frame
+
+    def _read_sequential(self) -> Iterator[np.ndarray]:
+        wanted = iter(self.indices)
+        next_idx = next(wanted)
+        for frame_idx in range(self.indices[-1] + 1):
+            if not self.capture.grab():
+                return
+            if frame_idx == next_idx:
+                ret, frame = self.capture.retrieve()
+                if ret:
+                    yield frame
+                next_idx = next(wanted, None)
+
+    def _read_keyframes(self) -> Iterator[np.ndarray]:
+        """
+        ffmpeg decodeaza doar cadrele cheie (-skip_frame nokey) si pastreaza cate unul la fiecare
+        durata / numar_frame-uri secunde; frame-urile BGR sunt citite direct din pipe, fara fisiere.
+        """
+        width, height = self.info['width'], self.info['height']
+        if width <= 0 or height <= 0:
+            # Fără dimensiuni, frame-urile citite din pipe ar fi goale la nesfârșit
+            logger.warning(f"Dimensiuni necunoscute pentru {self.video_path}, cadrele cheie nu pot fi citite")
+            return
+        interval = self.info['duration'] / len(self.indices)
+        cmd = [
+            'ffmpeg', '-v', 'error', '-nostdin', '-skip_frame', 'nokey', '-i', self.video_path,
+            '-an', '-sn', '-dn',
+            '-vf', f"select=isnan(prev_selected_t)+gte(t-prev_selected_t\\,{interval:.6f}),scale={width}:{height}",
+            '-vsync', '0', '-frames:v', str(len(self.indices)),
+            '-f', 'rawvideo', '-pix_fmt', 'bgr24', 'pipe:1',
+        ]
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError as e:
+            logger.warning(f"ffmpeg nu poate fi pornit: {e}")
+            return
+        try:
+            while True:
+                frame = np.empty((height, width, 3), dtype=np.uint8)
+                if process.stdout.readinto(memoryview(frame).cast('B')) < frame.nbytes:
+                    return
+                yield frame
+        finally:
+            process.stdout.close()
+            if process.poll() is None:
+                process.kill()
+            process.wait()
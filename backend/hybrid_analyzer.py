@@ -4,13 +4,31 @@ Implementeaza un ensemble de modele pentru analiza completa.
 """
 
 import asyncio
-from typing import Dict, List
+from typing import Awaitable, Dict, List, Optional
 import logging
 from datetime import datetime
 import json
 
 from ai_analyzer import AIAnalyzer
+from async_runtime import get_runtime, run_blocking
 from ml_analyzer import MLAnalyzer
+from keyword_registry import get_keyword_registry
+from model_registry import get_model_registry
+from inference_backend import ML_INFERENCE_BACKEND
+from progress import ProgressCallback, emit, partial_result, track_stage
+from result_cache import get_result_cache
+
+try:
+    import config
+except ImportError:
+    config = None
+
+CASCADE_FAST_THRESHOLD = getattr(config, 'CASCADE_FAST_THRESHOLD', 0.85)
+CASCADE_ML_THRESHOLD = getattr(config, 'CASCADE_ML_THRESHOLD', 0.85)
+
+# Nivelurile analizei în cascadă, de la cel mai ieftin la cel mai scump
+CASCADE_TIERS = ('fast', 'ml', 'ai')
+
 
 class HybridAnalyzer:
     """
@@ -31,36 +49,41 @@ class HybridAnalyzer:
             'ai': 0.5,      # 50% pentru analiza AI (OpenAI + Perspective)
             'ml': 0.5       # 50% pentru analiza ML (mBERT + ST + Traditional)
         }
+        
+        # Câte analize în cascadă s-au oprit la fiecare nivel
+        self.cascade_exits = {tier: 0 for tier in CASCADE_TIERS}
 
-    async def analyze_text(self, text: str, include_details: bool = True) -> Dict:
+    async def analyze_text(self, text: str, include_details: bool = True,
+                           progress: Optional[ProgressCallback] = None) -> Dict:
         """
         Functia principala care realizeaza analiza hibrida completa.
         
         Args:
             text: Textul de analizat
             include_details: Daca sa includa detaliile complete ale fiecarei analize
+            progress: Callback optional pentru evenimentele etapelor 'ai', 'ml' si 'ensemble'
             
         Returns:
             dict: Rezultatul final si toate detaliile
         """
+        result_cache = get_result_cache()
+        cache_mode = self._cache_mode(include_details)
+        cached = result_cache.get(text, cache_mode)
+        if cached is not None:
+            emit(progress, 'cache_hit', partial=partial_result(cached))
+            return cached
+        
         start_time = datetime.now()
         
         # Realizează analizele în paralel pentru performanță
         try:
-            ai_task = self.ai_analyzer.analyze_text(text)
-            ml_task = asyncio.create_task(asyncio.to_thread(self.ml_analyzer.analyze_text, text))
+            ai_task = self._staged(progress, 'ai', self.ai_analyzer.analyze_text(text))
+            ml_task = asyncio.create_task(
+                self._staged(progress, 'ml', run_blocking(self.ml_analyzer.analyze_text, text))
+            )
             
             ai_result, ml_result = await asyncio.gather(ai_task, ml_task, return_exceptions=True)
             
-            # Verifică dacă au fost excepții
-            if isinstance(ai_result, Exception):
-                self.logger.error(f"Eroare în analiza AI: {ai_result}")
-                ai_result = {"error": str(ai_result), "verdict": "unknown", "confidence": 0.0}
-            
-            if isinstance(ml_result, Exception):
-                self.logger.error(f"Eroare în analiza ML: {ml_result}")
-                ml_result = {"error": str(ml_result), "verdict": "unknown", "confidence": 0.0}
-                
         except Exception as e:
             self.logger.error(f"Eroare în analiza hibridă: {e}")
             return {
@@ -70,11 +93,187 @@ class HybridAnalyzer:
                 "timestamp": datetime.now().isoformat()
             }
 
-        # Combină rezultatele
-        final_result = self._ensemble_decision(ai_result, ml_result)
-        
         # Calculează timpul de procesare
         processing_time = (datetime.now() - start_time).total_seconds()
+        with track_stage(progress, 'ensemble') as partial:
+            final_result = self._finalize_result(ai_result, ml_result, processing_time, include_details)
+            partial.update(partial_result(final_result))
+        if self._is_cacheable(ai_result, ml_result):
+            result_cache.set(text, cache_mode, final_result)
+        return final_result
+
+    @staticmethod
+    async def _staged(progress: Optional[ProgressCallback], stage: str, awaitable: Awaitable) -> Dict:
+        """Asteapta o etapa a analizei si ii raporteaza durata si verdictul partial."""
+        with track_stage(progress, stage) as partial:
+            result = await awaitable
+            partial.update(partial_result(result))
+        return result
+
+    async def analyze_texts(self, texts: List[str], include_details: bool = True) -> List[Dict]:
+        """
+        Analiza hibrida pentru un lot de texte. Partea ML ruleaza o singura data pe tot lotul,
+        iar analizele AI ale textelor ruleaza concurent.
+        
+        Args:
+            texts: Textele de analizat
+            include_details: Daca sa includa detaliile complete ale fiecarei analize
+            
+        Returns:
+            list: Cate un rezultat pentru fiecare text, in aceeasi ordine; erorile sunt per text
+        """
+        texts = list(texts)
+        result_cache = get_result_cache()
+        cache_mode = self._cache_mode(include_details)
+        results = result_cache.get_many(texts, cache_mode)
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+        
+        start_time = datetime.now()
+        pending = [texts[i] for i in missing]
+        
+        ml_task = asyncio.create_task(run_blocking(self.ml_analyzer.analyze_texts, pending))
+        ai_results = await asyncio.gather(
+            *(self.ai_analyzer.analyze_text(text) for text in pending), return_exceptions=True
+        )
+        try:
+            ml_results = await ml_task
+        except Exception as e:
+            ml_results = [e] * len(pending)
+        
+        # Timpul lotului este împărțit egal între texte
+        processing_time = (datetime.now() - start_time).total_seconds() / len(pending)
+        
+        for i, ai_result, ml_result in zip(missing, ai_results, ml_results):
+            try:
+                results[i] = self._finalize_result(ai_result, ml_result, processing_time, include_details)
+            except Exception as e:
+                self.logger.error(f"Eroare în analiza hibridă: {e}")
+                results[i] = {
+                    "error": f"Eroare în sistemul hibrid: {str(e)}",
+                    "verdict": "unknown",
+                    "confidence": 0.0,
+                    "timestamp": datetime.now().isoformat()
+                }
+                continue
+            if self._is_cacheable(ai_result, ml_result):
+                result_cache.set(texts[i], cache_mode, results[i])
+        return results
+
+    async def analyze_cascade(self, text: str, include_details: bool = True,
+                              progress: Optional[ProgressCallback] = None) -> Dict:
+        """
+        Analiza in cascada: modelul traditional si pattern-urile ruleaza primele, modelele
+        transformer doar daca nivelul ieftin nu este suficient de sigur, iar serviciile AI
+        doar daca nici analiza ML nu depaseste pragul. Rezultatul noteaza nivelurile rulate.
+        
+        Args:
+            text: Textul de analizat
+            include_details: Daca sa includa rezultatele fiecarui nivel rulat
+            progress: Callback optional; fiecare nivel rulat este raportat ca etapa, cu verdictul lui
+            
+        Returns:
+            dict: Rezultatul final, cu 'tiers_run' si 'exit_tier'
+        """
+        result_cache = get_result_cache()
+        cache_mode = 'cascade' if include_details else 'cascade:summary'
+        cached = result_cache.get(text, cache_mode)
+        if cached is not None:
+            emit(progress, 'cache_hit', partial=partial_result(cached))
+            return cached
+        
+        start_time = datetime.now()
+        tiers_run = ['fast']
+        details = {}
+        try:
+            fast_result = await self._staged(progress, 'fast', run_blocking(self.ml_analyzer.analyze_fast, text))
+            details['fast_analysis'] = fast_result
+            cacheable = 'error' not in fast_result
+            
+            if cacheable and fast_result['confidence'] >= CASCADE_FAST_THRESHOLD:
+                final_result = self._tier_decision(fast_result, self.ml_analyzer._detect_language(text))
+            else:
+                tiers_run.append('ml')
+                ml_result = await self._staged(progress, 'ml', run_blocking(self.ml_analyzer.analyze_text, text))
+                details['ml_analysis'] = ml_result
+                cacheable = 'error' not in ml_result
+                
+                if cacheable and ml_result.get('confidence', 0.0) >= CASCADE_ML_THRESHOLD:
+                    final_result = self._tier_decision(ml_result, ml_result.get('detected_language', 'unknown'))
+                else:
+                    tiers_run.append('ai')
+                    try:
+                        ai_result = await self._staged(progress, 'ai', self.ai_analyzer.analyze_text(text))
+                    except Exception as e:
+                        ai_result = e
+                    final_result = self._finalize_result(ai_result, ml_result, 0.0, include_details=False)
+                    details['ai_analysis'] = ai_result if isinstance(ai_result, dict) else {"error": str(ai_result)}
+                    cacheable = self._is_cacheable(ai_result, ml_result)
+        except Exception as e:
+            self.logger.error(f"Eroare în analiza în cascadă: {e}")
+            return {
+                "error": f"Eroare în analiza în cascadă: {str(e)}",
+                "verdict": "unknown",
+                "confidence": 0.0,
+                "tiers_run": tiers_run,
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        self.cascade_exits[tiers_run[-1]] += 1
+        final_result['tiers_run'] = tiers_run
+        final_result['exit_tier'] = tiers_run[-1]
+        final_result['processing_time_seconds'] = (datetime.now() - start_time).total_seconds()
+        if include_details:
+            final_result['detailed_analysis'] = details
+        if cacheable:
+            result_cache.set(text, cache_mode, final_result)
+        return final_result
+
+    async def analyze_cascade_texts(self, texts: List[str], include_details: bool = True) -> List[Dict]:
+        """Analiza in cascada pentru un lot de texte; etapele ML ale textelor sunt grupate de micro-batcher."""
+        return list(await asyncio.gather(*(self.analyze_cascade(text, include_details) for text in texts)))
+
+    def _tier_decision(self, tier_result: Dict, detected_language: str) -> Dict:
+        """Rezultatul final cand cascada se opreste inainte de nivelul AI."""
+        confidence = float(tier_result.get('confidence', 0.0))
+        consensus_strength = 'strong' if confidence >= 0.8 else 'moderate' if confidence >= 0.6 else 'weak'
+        return {
+            'verdict': tier_result.get('verdict', 'unknown'),
+            'confidence': confidence,
+            'risk_level': self._assess_risk_level(confidence, True, consensus_strength),
+            'explanation': tier_result.get('explanation', ''),
+            'consensus_strength': consensus_strength,
+            'detected_language': detected_language,
+            'timestamp': datetime.now().isoformat()
+        }
+
+    @staticmethod
+    def _cache_mode(include_details: bool) -> str:
+        """Modul folosit în cheia de cache (rezultatele cu și fără detalii diferă)."""
+        return 'hybrid' if include_details else 'hybrid:summary'
+
+    @staticmethod
+    def _is_cacheable(ai_result, ml_result) -> bool:
+        """Rezultatele obținute după erori (ex. API indisponibil temporar) nu sunt păstrate în cache."""
+        for result in (ai_result, ml_result):
+            if not isinstance(result, dict) or 'error' in result:
+                return False
+        return not any('error' in analysis for analysis in ai_result.get('detailed_results', []))
+
+    def _finalize_result(self, ai_result, ml_result, processing_time: float, include_details: bool) -> Dict:
+        """Tratează excepțiile analizelor, combină rezultatele și adaugă detaliile."""
+        # Verifică dacă au fost excepții
+        if isinstance(ai_result, Exception):
+            self.logger.error(f"Eroare în analiza AI: {ai_result}")
+            ai_result = {"error": str(ai_result), "verdict": "unknown", "confidence": 0.0}
+        
+        if isinstance(ml_result, Exception):
+            self.logger.error(f"Eroare în analiza ML: {ml_result}")
+            ml_result = {"error": str(ml_result), "verdict": "unknown", "confidence": 0.0}
+
+        # Combină rezultatele
+        final_result = self._ensemble_decision(ai_result, ml_result)
         final_result['processing_time_seconds'] = processing_time
         
         # Adaugă detaliile dacă sunt cerute
@@ -275,13 +474,22 @@ class HybridAnalyzer:
             'ai_services': {
                 'enabled': ai_enabled,
                 'openai': getattr(self.ai_analyzer, 'openai', None) is not None,
-                'perspective': True  # Verificare simplificată
+                'perspective': True,  # Verificare simplificată
+                'http_clients': self.ai_analyzer.get_status()
             },
             'ml_models': {
                 'enabled': ml_enabled,
-                'sentence_transformer': self.ml_analyzer.sentence_model is not None,
-                'mbert': self.ml_analyzer.classifier_model is not None,
-                'traditional': self.ml_analyzer.traditional_model is not None
+                **self.ml_analyzer.get_model_readiness(),
+                'inference_backend': ML_INFERENCE_BACKEND,
+                'registry': get_model_registry().get_status(),
+                'micro_batching': self.ml_analyzer.get_batching_status()
+            },
+            'keywords': get_keyword_registry().get_status(),
+            'async_runtime': get_runtime().get_status(),
+            'result_cache': get_result_cache().get_status(),
+            'cascade': {
+                'thresholds': {'fast': CASCADE_FAST_THRESHOLD, 'ml': CASCADE_ML_THRESHOLD},
+                'exits': dict(self.cascade_exits)
             },
             'supported_languages': getattr(self, 'SUPPORTED_LANGUAGES', ['ro', 'en', 'fr', 'es']),
             'timestamp': datetime.now().isoformat()
@@ -0,0 +1,411 @@
+"""
+Backend-uri de inferenta pe CPU pentru Sentence Transformer si pipeline-ul mBERT.
+- 'pytorch': modelele originale (fp32, mod eager)
+- 'torch_int8': cuantizare dinamica int8 a straturilor Linear, direct in PyTorch
+- 'onnx_int8': export ONNX o singura data, cuantizare dinamica int8 si rulare prin onnxruntime
+Backend-ul este ales din config (ML_INFERENCE_BACKEND). Daca dependintele unui backend lipsesc,
+se foloseste modelul PyTorch original. Modelele returnate pastreaza interfata folosita de MLAnalyzer:
+encode(texte, batch_size=...) pentru embedding-uri si clasificator(texte, batch_size=...) pentru mBERT.
+"""
+
+import io
+import logging
+import os
+import re
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+try:
+    import config
+except ImportError:
+    config = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+BACKEND_PYTORCH = 'pytorch'
+BACKEND_TORCH_INT8 = 'torch_int8'
+BACKEND_ONNX_INT8 = 'onnx_int8'
+BACKENDS = (BACKEND_PYTORCH, BACKEND_TORCH_INT8, BACKEND_ONNX_INT8)
+
+ML_INFERENCE_BACKEND = getattr(config, 'ML_INFERENCE_BACKEND', BACKEND_PYTORCH)
+ML_ONNX_CACHE_DIR = getattr(config, 'ML_ONNX_CACHE_DIR', os.path.join(BASE_DIR, 'onnx_models'))
+ONNX_OPSET = 14
+
+logger = logging.getLogger(__name__)
+
+
+def embedding_model_id(model_name: str, backend: str = ML_INFERENCE_BACKEND) -> str:
+    """
+    Identificatorul modelului de embedding pentru cache-urile de embedding-uri.
+    Embedding-urile int8 difera putin de cele fp32, deci nu pot folosi aceleasi fisiere.
+    """
+    return model_name if backend == BACKEND_PYTORCH else f"{model_name}-{backend}"
+
+
+def quantize_torch_module(module):
+    """Cuantizare dinamica int8 (pe loc) a straturilor Linear ale unui model PyTorch."""
+    import torch
+    return torch.ao.quantization.quantize_dynamic(module, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+def load_sentence_encoder(model_name: str, backend: str = ML_INFERENCE_BACKEND, cache_dir: str = ML_ONNX_CACHE_DIR):
+    """
+    Incarca Sentence Transformer-ul pentru backend-ul ales.
+
+    Args:
+        model_name: Numele sau calea modelului
+        backend: Unul dintre BACKENDS
+        cache_dir: Directorul pentru modelele ONNX exportate
+
+    Returns:
+        Un model cu metoda encode(texte, batch_size=...)
+    """
+    from sentence_transformers import SentenceTransformer
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend de inferență necunoscut: {backend}")
+    if backend == BACKEND_PYTORCH:
+        return SentenceTransformer(model_name)
+
+    model = SentenceTransformer(model_name, device='cpu')
+    if backend == BACKEND_TORCH_INT8:
+        return quantize_torch_module(model)
+    try:
+        return OnnxSentenceEncoder.from_sentence_transformer(model, model_name, cache_dir)
+    except ImportError as e:
+        logger.warning(f"onnxruntime nu este disponibil ({e}); folosesc Sentence Transformer fp32")
+        return model
+
+
+def load_text_classifier(model_name: str, backend: str = ML_INFERENCE_BACKEND, cache_dir: str = ML_ONNX_CACHE_DIR):
+    """
+    Incarca clasificatorul de sentiment (pipeline transformers) pentru backend-ul ales.
+
+    Args:
+        model_name: Numele sau calea modelului
+        backend: Unul dintre BACKENDS
+        cache_dir: Directorul pentru modelele ONNX exportate
+
+    Returns:
+        Un obiect apelabil cu aceeasi interfata ca pipeline-ul "sentiment-analysis"
+    """
+    import torch
+    from transformers import pipeline
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Backend de inferență necunoscut: {backend}")
+    if backend == BACKEND_PYTORCH:
+        return pipeline(
+            "sentiment-analysis",
+            model=model_name,
+            tokenizer=model_name,
+            device=0 if torch.cuda.is_available() else -1
+        )
+
+    classifier = pipeline("sentiment-analysis", model=model_name, tokenizer=model_name, device=-1)
+    if backend == BACKEND_TORCH_INT8:
+        quantize_torch_module(classifier.model)
+        return classifier
+    try:
+        return OnnxTextClassifier.from_pipeline(classifier, model_name, cache_dir)
+    except ImportError as e:
+        logger.warning(f"onnxruntime nu este disponibil ({e}); folosesc pipeline-ul mBERT fp32")
+        return classifier
+
+
+def _export_dir(cache_dir: str, model_name: str) -> str:
+    return os.path.join(cache_dir, re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name))
+
+
+def _export_quantized_onnx(module, tokenizer, output_name: str, directory: str) -> str:
+    """
+    Exporta modelul in ONNX (intrari input_ids / attention_mask, axe dinamice) si il cuantizeaza int8.
+    Exportul se face o singura data; fisierele existente sunt refolosite.
+
+    Returns:
+        str: Calea modelului ONNX cuantizat
+    """
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantized_path = os.path.join(directory, 'model.int8.onnx')
+    if os.path.exists(quantized_path):
+        return quantized_path
+
+    os.makedirs(directory, exist_ok=True)
+    fp32_path = os.path.join(directory, 'model.onnx')
+
+    class _FirstOutput(torch.nn.Module):
+        """Expune doar primul tensor de iesire (last_hidden_state sau logits)."""
+
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, input_ids, attention_mask):
+            return self.model(input_ids=input_ids, attention_mask=attention_mask)[0]
+
+    sample = tokenizer(["export"], return_tensors='pt')
+    dynamic_axes = {'input_ids': {0: 'batch', 1: 'sequence'}, 'attention_mask': {0: 'batch', 1: 'sequence'}}
+    dynamic_axes[output_name] = {0: 'batch'} if output_name == 'logits' else {0: 'batch', 1: 'sequence'}
+    with torch.no_grad():
+        torch.onnx.export(
+            _FirstOutput(module.eval()), (sample['input_ids'], sample['attention_mask']), fp32_path,
+            input_names=['input_ids', 'attention_mask'], output_names=[output_name],
+            dynamic_axes=dynamic_axes, opset_version=ONNX_OPSET
+        )
+    quantize_dynamic(fp32_path, quantized_path, weight_type=QuantType.QInt8)
+    logger.info(f"Model ONNX int8 exportat în {quantized_path}")
+    return quantized_path
+
+
+def _onnx_session(path: str):
+    import onnxruntime
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return onnxruntime.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+
+
+def _pooling_mode(pooling) -> str:
+    """Modul de pooling al Sentence Transformer-ului, indiferent de versiunea bibliotecii."""
+    if hasattr(pooling, 'get_pooling_mode_str'):
+        return pooling.get_pooling_mode_str()
+    mode = getattr(pooling, 'pooling_mode', 'mean')
+    if isinstance(mode, (list, tuple)):
+        mode = '+'.join(str(m) for m in mode)
+    return str(getattr(mode, 'value', mode))
+
+
+class OnnxSentenceEncoder:
+    """Sentence Transformer rulat prin onnxruntime: tokenizare, model int8, pooling si normalizare."""
+
+    POOLING_MODES = ('mean', 'cls', 'max')
+
+    def __init__(self, session, tokenizer, pooling: str = 'mean', normalize: bool = False,
+                 max_seq_length: int = 128, path: str = None):
+        if pooling not in self.POOLING_MODES:
+            raise ValueError(f"Pooling nesuportat pentru ONNX: {pooling}")
+        self.session = session
+        self.tokenizer = tokenizer
+        self.pooling = pooling
+        self.normalize = normalize
+        self.max_seq_length = max_seq_length
+        self.path = path
+
+    @classmethod
+    def from_sentence_transformer(cls, model, model_name: str, cache_dir: str = ML_ONNX_CACHE_DIR):
+        """Exporta (o singura data) modelul si construieste encoder-ul ONNX."""
+        transformer = model[0]
+        modules = list(model)
+        pooling = _pooling_mode(modules[1]) if len(modules) > 1 else 'mean'
+        normalize = any(type(module).__name__ == 'Normalize' for module in modules)
+        path = _export_quantized_onnx(
+            transformer.auto_model, model.tokenizer, 'last_hidden_state', _export_dir(cache_dir, model_name)
+        )
+        return cls(_onnx_session(path), model.tokenizer, pooling, normalize, model.max_seq_length, path)
+
+    def encode(self, sentences: Union[str, Sequence[str]], batch_size: int = 32, **kwargs) -> np.ndarray:
+        """
+        Calculeaza embedding-urile, cu aceeasi interfata ca SentenceTransformer.encode.
+
+        Args:
+            sentences: Un text sau o lista de texte
+            batch_size: Dimensiunea loturilor trimise modelului
+
+        Returns:
+            np.ndarray: (D,) pentru un text, (N, D) pentru o lista
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        chunks = []
+        for start in range(0, len(texts), batch_size):
+            batch = self.tokenizer(
+                texts[start:start + batch_size], padding=True, truncation=True,
+                max_length=self.max_seq_length, return_tensors='np'
+            )
+            mask = batch['attention_mask'].astype(np.int64)
+            hidden = self.session.run(None, {
+                'input_ids': batch['input_ids'].astype(np.int64), 'attention_mask': mask
+            })[0]
+            chunks.append(self._pool(hidden, mask))
+
+        embeddings = np.vstack(chunks) if chunks else np.zeros((0, 0), dtype=np.float32)
+        if self.normalize and len(embeddings):
+            embeddings = embeddings / np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+        return embeddings[0] if single else embeddings
+
+    def _pool(self, hidden: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        if self.pooling == 'cls':
+            return hidden[:, 0].astype(np.float32)
+        weights = mask[:, :, None].astype(np.float32)
+        if self.pooling == 'max':
+            return np.where(weights > 0, hidden, -1e9).max(axis=1).astype(np.float32)
+        return ((hidden * weights).sum(axis=1) / np.maximum(weights.sum(axis=1), 1e-9)).astype(np.float32)
+
+
+class OnnxTextClassifier:
+    """Clasificator de secvente rulat prin onnxruntime, cu iesirea pipeline-ului 'sentiment-analysis'."""
+
+    def __init__(self, session, tokenizer, id2label: Dict[int, str], max_length: int = 512, path: str = None):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.id2label = {int(k): v for k, v in id2label.items()}
+        self.max_length = max_length
+        self.path = path
+
+    @classmethod
+    def from_pipeline(cls, classifier, model_name: str, cache_dir: str = ML_ONNX_CACHE_DIR):
+        """Exporta (o singura data) modelul pipeline-ului si construieste clasificatorul ONNX."""
+        path = _export_quantized_onnx(
+            classifier.model, classifier.tokenizer, 'logits', _export_dir(cache_dir, model_name)
+        )
+        max_length = min(getattr(classifier.tokenizer, 'model_max_length', 512), 512)
+        return cls(_onnx_session(path), classifier.tokenizer, classifier.model.config.id2label, max_length, path)
+
+    def __call__(self, inputs: Union[str, Sequence[str]], batch_size: int = 32, **kwargs) -> List[Dict]:
+        """
+        Clasifica unul sau mai multe texte.
+
+        Returns:
+            list: Cate un dict {'label', 'score'} pentru fiecare text
+        """
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        results = []
+        for start in range(0, len(texts), batch_size):
+            batch = self.tokenizer(
+                texts[start:start + batch_size], padding=True, truncation=True,
+                max_length=self.max_length, return_tensors='np'
+            )
+            results.extend(self._predict(batch))
+        return [{'label': r['label'], 'score': r['score']} for r in results]
+
+    def classify_ids(self, windows: Sequence[Sequence[int]], batch_size: int = 32) -> List[Dict]:
+        """Clasifica ferestre deja tokenizate (fara tokenii speciali), fara o noua tokenizare."""
+        results = []
+        for start in range(0, len(windows), batch_size):
+            batch = _pad_windows(self.tokenizer, windows[start:start + batch_size], 'np')
+            results.extend(self._predict(batch))
+        return results
+
+    def _predict(self, batch) -> List[Dict]:
+        logits = self.session.run(None, {
+            'input_ids': np.asarray(batch['input_ids'], dtype=np.int64),
+            'attention_mask': np.asarray(batch['attention_mask'], dtype=np.int64),
+        })[0]
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return _predictions_from_probabilities(exp / exp.sum(axis=1, keepdims=True), self.id2label)
+
+
+def _predictions_from_probabilities(probabilities: np.ndarray, id2label: Dict[int, str]) -> List[Dict]:
+    """Transforma distributiile de probabilitate in predictii {'label', 'score', 'probabilities'}."""
+    results = []
+    for row in probabilities:
+        best = int(row.argmax())
+        results.append({
+            'label': id2label[best],
+            'score': float(row[best]),
+            'probabilities': {id2label[i]: float(p) for i, p in enumerate(row)},
+        })
+    return results
+
+
+def _with_special_tokens(tokenizer, ids: Sequence[int]) -> List[int]:
+    """Adauga tokenii speciali ([CLS] ... [SEP] sau echivalentele) unei secvente deja tokenizate."""
+    if hasattr(tokenizer, 'build_inputs_with_special_tokens'):
+        return tokenizer.build_inputs_with_special_tokens(list(ids))
+    return [tokenizer.cls_token_id] + list(ids) + [tokenizer.sep_token_id]
+
+
+def _pad_windows(tokenizer, windows: Sequence[Sequence[int]], tensor_type: str):
+    """Adauga tokenii speciali fiecarei ferestre si completeaza lotul la aceeasi lungime."""
+    encoded = [_with_special_tokens(tokenizer, window) for window in windows]
+    return tokenizer.pad({'input_ids': encoded}, padding=True, return_attention_mask=True, return_tensors=tensor_type)
+
+
+def classifier_window_length(classifier) -> int:
+    """
+    Numarul maxim de tokeni de continut dintr-o fereastra a clasificatorului
+    (lungimea maxima a modelului minus tokenii speciali) sau 0 daca nu are tokenizer.
+    """
+    tokenizer = getattr(classifier, 'tokenizer', None)
+    if tokenizer is None or getattr(tokenizer, 'cls_token_id', None) is None:
+        return 0
+    max_length = min(getattr(tokenizer, 'model_max_length', 512) or 512, 512)
+    return max_length - tokenizer.num_special_tokens_to_add(pair=False)
+
+
+def classify_token_windows(classifier, windows: Sequence[Sequence[int]], batch_size: int = 32) -> List[Dict]:
+    """
+    Ruleaza clasificatorul direct pe ferestre de tokeni, fara sa retokenizeze textul.
+
+    Args:
+        classifier: Pipeline-ul transformers sau OnnxTextClassifier
+        windows: Ferestre de id-uri de tokeni, fara tokenii speciali
+        batch_size: Dimensiunea loturilor trimise modelului
+
+    Returns:
+        list: Cate o predictie {'label', 'score', 'probabilities'} pentru fiecare fereastra
+    """
+    if hasattr(classifier, 'classify_ids'):
+        return classifier.classify_ids(windows, batch_size)
+
+    import torch
+    model = classifier.model
+    id2label = {int(k): v for k, v in model.config.id2label.items()}
+    results = []
+    for start in range(0, len(windows), batch_size):
+        batch = _pad_windows(classifier.tokenizer, windows[start:start + batch_size], 'pt')
+        with torch.no_grad():
+            logits = model(**{k: v.to(model.device) for k, v in batch.items()}).logits
+        results.extend(_predictions_from_probabilities(torch.softmax(logits.float(), dim=-1).cpu().numpy(), id2label))
+    return results
+
+
+def model_size_bytes(model) -> int:
+    """Dimensiunea greutatilor modelului (fisierul ONNX sau state_dict serializat)."""
+    path = getattr(model, 'path', None)
+    if path and os.path.exists(path):
+        return os.path.getsize(path)
+
+    import torch
+    module = getattr(model, 'model', model)
+    buffer = io.BytesIO()
+    torch.save(module.state_dict(), buffer)
+    return buffer.tell()
+
+
+def encoder_parity(reference, candidate, texts: Sequence[str], batch_size: int = 32) -> Dict:
+    """
+    Compara embedding-urile unui backend cu cele de referinta (fp32).
+
+    Returns:
+        dict: Similaritatea cosinus medie si minima intre perechile de embedding-uri
+    """
+    expected = np.asarray(reference.encode(list(texts), batch_size=batch_size), dtype=np.float32)
+    actual = np.asarray(candidate.encode(list(texts), batch_size=batch_size), dtype=np.float32)
+    cosines = (expected * actual).sum(axis=1) / np.maximum(
+        np.linalg.norm(expected, axis=1) * np.linalg.norm(actual, axis=1), 1e-12
+    )
+    return {'texts': len(texts), 'mean_cosine': float(cosines.mean()), 'min_cosine': float(cosines.min())}
+
+
+def classifier_parity(reference, candidate, texts: Sequence[str], batch_size: int = 32) -> Dict:
+    """
+    Compara predictiile unui backend cu cele de referinta (fp32).
+
+    Returns:
+        dict: Procentul de etichete identice si diferenta maxima de scor
+    """
+    def first(prediction):
+        return prediction[0] if isinstance(prediction, list) else prediction
+
+    expected = [first(p) for p in reference(list(texts), batch_size=batch_size)]
+    actual = [first(p) for p in candidate(list(texts), batch_size=batch_size)]
+    same_label = [e['label'] == a['label'] for e, a in zip(expected, actual)]
+    score_diffs = [abs(e['score'] - a['score']) for e, a, same in zip(expected, actual, same_label) if same]
+    return {
+        'texts': len(texts),
+        'label_agreement': sum(same_label) / len(texts) if texts else 1.0,
+        'max_score_diff': max(score_diffs) if score_diffs else 0.0,
+    }
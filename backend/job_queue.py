@@ -0,0 +1,467 @@
+"""
+Coada de joburi pentru analizele de lunga durata (text, URL, video).
+Joburile sunt pastrate intr-o baza SQLite locala (fara broker extern), iar un pool de
+thread-uri de lucru le executa cu handler-ele inregistrate pe tip de job. Coada suporta
+reincercari cu backoff, anulare, limita de joburi simultane per utilizator si recuperarea
+joburilor ramase in executie dupa oprirea procesului (pe baza unui termen de lease).
+Evenimentele de progres raportate de handler-e sunt pastrate in tabela job_events,
+de unde sunt transmise clientilor (SSE) si din alte procese.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import config
+except ImportError:
+    config = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+JOB_QUEUE_DB_PATH = os.path.join(BASE_DIR, getattr(config, 'JOB_QUEUE_DB_PATH', os.path.join('instance', 'jobs.db')))
+JOB_WORKERS = getattr(config, 'JOB_WORKERS', 2)
+JOB_MAX_ATTEMPTS = getattr(config, 'JOB_MAX_ATTEMPTS', 3)
+JOB_RETRY_BACKOFF = getattr(config, 'JOB_RETRY_BACKOFF', 2.0)
+JOB_PER_USER_CONCURRENCY = getattr(config, 'JOB_PER_USER_CONCURRENCY', 2)
+JOB_LEASE_SECONDS = getattr(config, 'JOB_LEASE_SECONDS', 1800)
+JOB_RETENTION_SECONDS = getattr(config, 'JOB_RETENTION_SECONDS', 7 * 24 * 3600)
+JOB_POLL_INTERVAL = getattr(config, 'JOB_POLL_INTERVAL', 1.0)
+
+QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED = 'queued', 'running', 'succeeded', 'failed', 'cancelled'
+FINISHED_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    user_id TEXT,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    available_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    lease_until REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (status, available_at, created_at);
+CREATE INDEX IF NOT EXISTS jobs_user ON jobs (user_id, status);
+CREATE TABLE IF NOT EXISTS job_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    event TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS job_events_job ON job_events (job_id, seq);
+"""
+
+
+class PermanentJobError(Exception):
+    """Eroare pentru care o noua incercare nu are sens (date de intrare invalide)."""
+
+
+class JobCancelled(Exception):
+    """Ridicata de handler cand observa ca jobul a fost anulat."""
+
+
+class JobContext:
+    """Informatiile despre jobul curent, transmise handler-ului."""
+
+    def __init__(self, queue: 'JobQueue', job_id: str, user_id: Optional[str], attempt: int):
+        self.queue = queue
+        self.id = job_id
+        self.user_id = user_id
+        self.attempt = attempt
+
+    def cancelled(self) -> bool:
+        """
+        True daca s-a cerut anularea jobului sau daca aceasta incercare nu mai detine jobul
+        (lease-ul a expirat si jobul a fost reluat). Fiecare verificare prelungeste lease-ul.
+        """
+        if not self.queue.renew_lease(self.id, self.attempt):
+            return True
+        row = self.queue._fetch_one('SELECT cancel_requested FROM jobs WHERE id = ?', (self.id,))
+        return bool(row and row['cancel_requested'])
+
+    def raise_if_cancelled(self):
+        """Opreste handler-ul la un punct sigur daca jobul a fost anulat."""
+        if self.cancelled():
+            raise JobCancelled(self.id)
+
+    def report(self, event: Dict):
+        """
+        Pastreaza un eveniment de progres (callback-ul progress al analizoarelor) si prelungeste
+        lease-ul; evenimentele unei incercari care nu mai detine jobul sunt ignorate.
+        """
+        if self.queue.renew_lease(self.id, self.attempt):
+            self.queue.add_event(self.id, dict(event, attempt=self.attempt))
+
+
+def _json_default(value):
+    """Tipurile numpy din evenimentele de progres devin tipuri Python."""
+    return value.item() if hasattr(value, 'item') else str(value)
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+
+class JobQueue:
+    """
+    Coada persistenta cu thread-uri de lucru. Mai multe procese pot folosi acelasi fisier:
+    preluarea unui job se face intr-o tranzactie IMMEDIATE, deci fiecare job ruleaza o singura data.
+    """
+
+    def __init__(self, db_path: str = JOB_QUEUE_DB_PATH, workers: int = JOB_WORKERS,
+                 max_attempts: int = JOB_MAX_ATTEMPTS, retry_backoff: float = JOB_RETRY_BACKOFF,
+                 per_user_concurrency: int = JOB_PER_USER_CONCURRENCY, lease_seconds: float = JOB_LEASE_SECONDS,
+                 retention_seconds: float = JOB_RETENTION_SECONDS, poll_interval: float = JOB_POLL_INTERVAL):
+        """
+        Args:
+            db_path: Fisierul SQLite al cozii
+            workers: Numarul de thread-uri de lucru
+            max_attempts: Numarul maxim de incercari ale unui job
+            retry_backoff: Intarzierea de baza intre incercari (secunde, dublata la fiecare incercare)
+            per_user_concurrency: Numarul maxim de joburi ale unui utilizator executate simultan (0 = nelimitat)
+            lease_seconds: Dupa acest timp fara progres raportat sau verificari de anulare, un job
+                ramas 'running' este considerat abandonat si reluat
+            retention_seconds: Cat timp sunt pastrate joburile terminate
+            poll_interval: Intervalul maxim de asteptare intre verificarile cozii (secunde)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db_path = db_path
+        self.workers = max(1, workers)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = retry_backoff
+        self.per_user_concurrency = per_user_concurrency
+        self.lease_seconds = lease_seconds
+        self.retention_seconds = retention_seconds
+        self.poll_interval = poll_interval
+
+        self._handlers: Dict[str, Callable[[Dict, JobContext], Any]] = {}
+        self._local = threading.local()
+        self._wakeup = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._stopping = False
+        self.stats = {'completed': 0, 'failed': 0, 'retried': 0, 'cancelled': 0, 'recovered': 0}
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """O conexiune per thread; tranzactiile sunt controlate explicit."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def _fetch_one(self, sql: str, params=()) -> Optional[sqlite3.Row]:
+        return self._connection().execute(sql, params).fetchone()
+
+    def register(self, kind: str, handler: Callable[[Dict, JobContext], Any]):
+        """
+        Inregistreaza handler-ul pentru un tip de job.
+
+        Args:
+            kind: Tipul jobului ('predict', 'video', ...)
+            handler: handler(payload, context) -> rezultat serializabil JSON
+        """
+        self._handlers[kind] = handler
+
+    def start(self):
+        """Porneste thread-urile de lucru (o singura data)."""
+        if self._threads:
+            return
+        self._stopping = False
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker_loop, name=f'job-worker-{index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self.logger.info(f"Coada de joburi pornită ({self.workers} thread-uri, {self.db_path})")
+
+    def stop(self, timeout: float = 5.0):
+        """Opreste thread-urile dupa ce termina jobul curent."""
+        self._stopping = True
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, kind: str, payload: Dict, user_id: Optional[Any] = None,
+               max_attempts: Optional[int] = None) -> Dict:
+        """
+        Adauga un job in coada.
+
+        Returns:
+            dict: Starea jobului (vezi get)
+
+        Raises:
+            ValueError: Tipul de job nu are handler
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Tip de job necunoscut: {kind}")
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._connection().execute(
+            'INSERT INTO jobs (id, kind, user_id, payload, status, max_attempts, created_at, available_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (job_id, kind, None if user_id is None else str(user_id), json.dumps(payload), QUEUED,
+             max_attempts or self.max_attempts, now, now)
+        )
+        with self._wakeup:
+            self._wakeup.notify()
+        return self.get(job_id)
+
+    def get(self, job_id: str, include_result: bool = False) -> Optional[Dict]:
+        """Starea unui job sau None daca nu exista."""
+        row = self._fetch_one('SELECT * FROM jobs WHERE id = ?', (job_id,))
+        return self._to_dict(row, include_result) if row else None
+
+    def list(self, user_id: Optional[Any] = None, limit: int = 50) -> List[Dict]:
+        """Joburile cele mai recente (ale unui utilizator, daca este dat)."""
+        if user_id is None:
+            rows = self._connection().execute('SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?', (limit,))
+        else:
+            rows = self._connection().execute(
+                'SELECT * FROM jobs WHERE user_id = ? ORDER BY created_at DESC LIMIT ?', (str(user_id), limit)
+            )
+        return [self._to_dict(row) for row in rows]
+
+    def cancel(self, job_id: str) -> Optional[Dict]:
+        """
+        Anuleaza un job. Joburile din coada sunt anulate imediat; pentru cele in executie se
+        marcheaza cererea de anulare, iar rezultatul lor este ignorat la terminare.
+        """
+        conn = self._connection()
+        conn.execute(
+            'UPDATE jobs SET status = ?, cancel_requested = 1, finished_at = ? WHERE id = ? AND status = ?',
+            (CANCELLED, time.time(), job_id, QUEUED)
+        )
+        conn.execute('UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = ?', (job_id, RUNNING))
+        return self.get(job_id)
+
+    def renew_lease(self, job_id: str, attempt: int) -> bool:
+        """
+        Prelungeste lease-ul unui job aflat in executie, cat timp incercarea data il detine.
+
+        Returns:
+            bool: False daca jobul nu mai ruleaza sau a fost preluat de o alta incercare
+        """
+        cursor = self._connection().execute(
+            'UPDATE jobs SET lease_until = ? WHERE id = ? AND status = ? AND attempts = ?',
+            (time.time() + self.lease_seconds, job_id, RUNNING, attempt)
+        )
+        return cursor.rowcount > 0
+
+    def add_event(self, job_id: str, event: Dict):
+        """Adauga un eveniment de progres la un job."""
+        self._connection().execute(
+            'INSERT INTO job_events (job_id, event, created_at) VALUES (?, ?, ?)',
+            (job_id, json.dumps(event, default=_json_default), time.time())
+        )
+
+    def events(self, job_id: str, after: int = 0) -> List[Dict]:
+        """
+        Evenimentele de progres ale unui job, in ordine.
+
+        Args:
+            job_id: Jobul
+            after: Numarul de secventa al ultimului eveniment deja primit
+
+        Returns:
+            list: Evenimente cu campul 'seq' (identificatorul SSE)
+        """
+        rows = self._connection().execute(
+            'SELECT seq, event FROM job_events WHERE job_id = ? AND seq > ? ORDER BY seq', (job_id, after)
+        )
+        return [dict(json.loads(row['event']), seq=row['seq']) for row in rows]
+
+    def _to_dict(self, row: sqlite3.Row, include_result: bool = False) -> Dict:
+        job = {
+            'id': row['id'],
+            'type': row['kind'],
+            'user_id': row['user_id'],
+            'status': row['status'],
+            'attempts': row['attempts'],
+            'max_attempts': row['max_attempts'],
+            'cancel_requested': bool(row['cancel_requested']),
+            'error': row['error'],
+            'created_at': _iso(row['created_at']),
+            'started_at': _iso(row['started_at']),
+            'finished_at': _iso(row['finished_at']),
+        }
+        if include_result:
+            job['result'] = json.loads(row['result']) if row['result'] else None
+        return job
+
+    def _claim(self) -> Optional[sqlite3.Row]:
+        """Preia atomic urmatorul job disponibil, respectand limita per utilizator."""
+        conn = self._connection()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            self._recover_expired(conn, now)
+            params = [QUEUED, now]
+            user_filter = ''
+            if self.per_user_concurrency > 0:
+                user_filter = (' AND (user_id IS NULL OR user_id NOT IN ('
+                               'SELECT user_id FROM jobs WHERE status = ? AND user_id IS NOT NULL '
+                               'GROUP BY user_id HAVING COUNT(*) >= ?))')
+                params += [RUNNING, self.per_user_concurrency]
+            row = conn.execute(
+                f'SELECT * FROM jobs WHERE status = ? AND available_at <= ?{user_filter} '
+                'ORDER BY available_at, created_at LIMIT 1', params
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    'UPDATE jobs SET status = ?, attempts = attempts + 1, started_at = ?, lease_until = ? WHERE id = ?',
+                    (RUNNING, now, now + self.lease_seconds, row['id'])
+                )
+                row = conn.execute('SELECT * FROM jobs WHERE id = ?', (row['id'],)).fetchone()
+            conn.execute('COMMIT')
+            return row
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def _recover_expired(self, conn: sqlite3.Connection, now: float):
+        """
+        Joburile 'running' cu lease expirat (proces oprit) sunt reluate sau marcate esuate, iar
+        joburile terminate mai vechi decat perioada de pastrare sunt sterse impreuna cu evenimentele lor.
+        """
+        expired = conn.execute(
+            'SELECT id, attempts, max_attempts, cancel_requested FROM jobs WHERE status = ? AND lease_until < ?',
+            (RUNNING, now)
+        ).fetchall()
+        for row in expired:
+            self.stats['recovered'] += 1
+            if row['cancel_requested']:
+                status, error = CANCELLED, None
+            elif row['attempts'] < row['max_attempts']:
+                status, error = QUEUED, None
+            else:
+                status, error = FAILED, 'Jobul a fost întrerupt (procesul s-a oprit)'
+            conn.execute(
+                'UPDATE jobs SET status = ?, error = ?, available_at = ?, lease_until = NULL, finished_at = ? WHERE id = ?',
+                (status, error, now, None if status == QUEUED else now, row['id'])
+            )
+        if self.retention_seconds:
+            expired_jobs = (f'SELECT id FROM jobs WHERE status IN ({",".join("?" * len(FINISHED_STATUSES))}) '
+                            'AND finished_at < ?')
+            params = (*FINISHED_STATUSES, now - self.retention_seconds)
+            conn.execute(f'DELETE FROM job_events WHERE job_id IN ({expired_jobs})', params)
+            conn.execute(f'DELETE FROM jobs WHERE id IN ({expired_jobs})', params)
+
+    def _worker_loop(self):
+        while not self._stopping:
+            try:
+                row = self._claim()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Eroare la preluarea unui job: {e}")
+                row = None
+            if row is None:
+                with self._wakeup:
+                    if not self._stopping:
+                        self._wakeup.wait(self.poll_interval)
+                continue
+            try:
+                self._execute(row)
+            except Exception as e:
+                # Jobul rămâne 'running' și va fi reluat după expirarea lease-ului
+                self.logger.error(f"Eroare internă la execuția jobului {row['id']}: {e}")
+
+    def _execute(self, row: sqlite3.Row):
+        job_id = row['id']
+        context = JobContext(self, job_id, row['user_id'], row['attempts'])
+        handler = self._handlers.get(row['kind'])
+        try:
+            if handler is None:
+                raise PermanentJobError(f"Tip de job necunoscut: {row['kind']}")
+            result = json.dumps(handler(json.loads(row['payload']), context))
+        except JobCancelled:
+            self._finish(job_id, row['attempts'], CANCELLED)
+        except Exception as e:
+            retryable = not isinstance(e, PermanentJobError)
+            if retryable and row['attempts'] < row['max_attempts'] and not context.cancelled():
+                delay = self.retry_backoff * (2 ** (row['attempts'] - 1))
+                self.logger.warning(f"Jobul {job_id} a eșuat (încercarea {row['attempts']}), reîncerc în {delay:.1f}s: {e}")
+                cursor = self._connection().execute(
+                    'UPDATE jobs SET status = ?, error = ?, available_at = ?, lease_until = NULL '
+                    'WHERE id = ? AND status = ? AND attempts = ?',
+                    (QUEUED, str(e), time.time() + delay, job_id, RUNNING, row['attempts'])
+                )
+                if cursor.rowcount:
+                    self.stats['retried'] += 1
+            else:
+                self.logger.error(f"Jobul {job_id} a eșuat definitiv: {e}")
+                self._finish(job_id, row['attempts'], CANCELLED if context.cancelled() else FAILED, error=str(e))
+        else:
+            if context.cancelled():
+                self._finish(job_id, row['attempts'], CANCELLED)
+            else:
+                self._finish(job_id, row['attempts'], SUCCEEDED, result=result)
+        with self._wakeup:
+            # Un loc eliberat poate debloca joburile aceluiași utilizator
+            self._wakeup.notify_all()
+
+    def _finish(self, job_id: str, attempt: int, status: str, result: Optional[str] = None,
+                error: Optional[str] = None):
+        """
+        Marcheaza jobul ca terminat; result este rezultatul deja serializat JSON. O incercare care
+        nu mai detine jobul (lease expirat, job reluat de alt worker) nu modifica starea lui.
+        """
+        cursor = self._connection().execute(
+            'UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, lease_until = NULL '
+            'WHERE id = ? AND status = ? AND attempts = ?',
+            (status, result, error, time.time(), job_id, RUNNING, attempt)
+        )
+        if cursor.rowcount:
+            self.stats[{SUCCEEDED: 'completed', FAILED: 'failed', CANCELLED: 'cancelled'}[status]] += 1
+        else:
+            self.logger.warning(f"Încercarea {attempt} a jobului {job_id} nu mai deține jobul; rezultatul este ignorat")
+
+    def get_status(self) -> Dict:
+        """Numarul de joburi pe stare si contoarele thread-urilor de lucru."""
+        counts = {status: 0 for status in (QUEUED, RUNNING, *FINISHED_STATUSES)}
+        for row in self._connection().execute('SELECT status, COUNT(*) AS n FROM jobs GROUP BY status'):
+            counts[row['status']] = row['n']
+        return {
+            'workers': self.workers,
+            'running_threads': sum(1 for t in self._threads if t.is_alive()),
+            'per_user_concurrency': self.per_user_concurrency,
+            'max_attempts': self.max_attempts,
+            'jobs': counts,
+            **self.stats,
+        }
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Returneaza coada de joburi a procesului, creata la prima utilizare."""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = JobQueue()
+    return _queue
@@ -0,0 +1,255 @@
+"""
+Registrul de keywords pentru clasificatorul euristic (enhanced_keywords.json).
+Fisierul este citit o singura data, validat si compilat intr-un automat de potrivire;
+la modificarea fisierului (mtime) snapshot-ul este reincarcat si inlocuit atomic.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, Sequence, Tuple
+
+from pattern_matcher import MultiPatternMatcher
+from text_patterns import FALLBACK_FAKE_KEYWORDS, FALLBACK_REAL_KEYWORDS, build_classifier_matcher
+
+try:
+    import config
+except ImportError:
+    config = None
+
+KEYWORDS_FILE = getattr(
+    config, 'KEYWORDS_FILE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'enhanced_keywords.json')
+)
+KEYWORDS_RELOAD_INTERVAL = getattr(config, 'KEYWORDS_RELOAD_INTERVAL', 1.0)
+
+SOURCE_FILE = 'file'
+SOURCE_FALLBACK = 'fallback'
+
+
+class KeywordFileError(ValueError):
+    """Fisierul de keywords nu poate fi interpretat sau nu are structura asteptata."""
+
+
+def strip_json_comments(text: str) -> str:
+    """
+    Elimina comentariile '//' si '/* */' din afara sirurilor JSON.
+
+    Args:
+        text: Continutul fisierului
+
+    Returns:
+        str: JSON valid (daca restul continutului este valid)
+    """
+    result = []
+    i = 0
+    length = len(text)
+    in_string = False
+    while i < length:
+        char = text[i]
+        if in_string:
+            result.append(char)
+            if char == '\\' and i + 1 < length:
+                result.append(text[i + 1])
+                i += 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+            result.append(char)
+        elif text.startswith('//', i):
+            end = text.find('\n', i)
+            i = length if end == -1 else end
+            continue
+        elif text.startswith('/*', i):
+            end = text.find('*/', i + 2)
+            i = length if end == -1 else end + 2
+            continue
+        else:
+            result.append(char)
+        i += 1
+    return ''.join(result)
+
+
+def _validate_keyword_list(data: Dict, key: str) -> Tuple[str, ...]:
+    """Valideaza o lista de keywords si o normalizeaza (litere mici, fara duplicate)."""
+    values = data.get(key)
+    if not isinstance(values, list):
+        raise KeywordFileError(f"'{key}' lipsește sau nu este o listă")
+
+    keywords = []
+    seen = set()
+    for value in values:
+        if not isinstance(value, str):
+            raise KeywordFileError(f"'{key}' conține o valoare care nu este text: {value!r}")
+        keyword = value.strip().lower()
+        if keyword and keyword not in seen:
+            seen.add(keyword)
+            keywords.append(keyword)
+
+    if not keywords:
+        raise KeywordFileError(f"'{key}' nu conține niciun keyword")
+    return tuple(keywords)
+
+
+def parse_keywords_file(text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Interpreteaza si valideaza continutul fisierului de keywords.
+
+    Args:
+        text: Continutul fisierului (JSON, eventual cu comentarii)
+
+    Returns:
+        tuple: (fake_keywords, real_keywords) normalizate
+
+    Raises:
+        KeywordFileError: Daca fisierul nu este valid
+    """
+    try:
+        data = json.loads(strip_json_comments(text))
+    except json.JSONDecodeError as e:
+        raise KeywordFileError(f"JSON invalid: {e}") from e
+    if not isinstance(data, dict):
+        raise KeywordFileError("Rădăcina fișierului trebuie să fie un obiect JSON")
+    return _validate_keyword_list(data, 'fake_keywords'), _validate_keyword_list(data, 'real_keywords')
+
+
+class KeywordSnapshot:
+    """
+    Set imutabil de keywords impreuna cu automatul compilat pentru clasificator.
+    Un snapshot nu se modifica niciodata; reincarcarea creeaza unul nou.
+    """
+
+    __slots__ = ('fake_keywords', 'real_keywords', 'matcher', 'source', 'mtime', 'loaded_at')
+
+    def __init__(self, fake_keywords: Sequence[str], real_keywords: Sequence[str],
+                 source: str, mtime: Optional[float] = None):
+        """
+        Args:
+            fake_keywords: Keywords asociate stirilor false
+            real_keywords: Keywords asociate stirilor reale
+            source: 'file' sau 'fallback'
+            mtime: Momentul modificarii fisierului sursa (None pentru fallback)
+        """
+        self.fake_keywords = tuple(fake_keywords)
+        self.real_keywords = tuple(real_keywords)
+        self.matcher: MultiPatternMatcher = build_classifier_matcher(self.fake_keywords, self.real_keywords)
+        self.source = source
+        self.mtime = mtime
+        self.loaded_at = datetime.now().isoformat()
+
+
+class KeywordRegistry:
+    """
+    Pastreaza snapshot-ul activ de keywords si il reincarca la schimbarea fisierului.
+    Citirile sunt fara lock (o singura atribuire de referinta); doar reincarcarea este serializata.
+    """
+
+    def __init__(self, path: str = KEYWORDS_FILE, reload_interval: float = KEYWORDS_RELOAD_INTERVAL):
+        """
+        Args:
+            path: Calea fisierului de keywords
+            reload_interval: Intervalul minim (secunde) intre doua verificari ale mtime
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._last_check = 0.0
+        self._attempted_mtime: Optional[float] = None
+        self.reload_count = 0
+        self.last_error: Optional[str] = None
+        self._snapshot = KeywordSnapshot(FALLBACK_FAKE_KEYWORDS, FALLBACK_REAL_KEYWORDS, SOURCE_FALLBACK)
+        self.reload(force=True)
+
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.path).st_mtime
+        except OSError:
+            return None
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Reincarca fisierul daca s-a modificat de la ultima incarcare.
+
+        Args:
+            force: Reincarca indiferent de mtime
+
+        Returns:
+            bool: True daca snapshot-ul activ a fost inlocuit
+        """
+        with self._lock:
+            self._last_check = time.monotonic()
+            mtime = self._file_mtime()
+            current = self._snapshot
+
+            if mtime is None:
+                if current.source == SOURCE_FALLBACK:
+                    return False
+                self.last_error = f"Fișierul de keywords nu există: {self.path}"
+                self.logger.warning(f"{self.last_error}; folosesc keywords de bază")
+                self._snapshot = KeywordSnapshot(FALLBACK_FAKE_KEYWORDS, FALLBACK_REAL_KEYWORDS, SOURCE_FALLBACK)
+                self.reload_count += 1
+                return True
+
+            if not force and mtime in (current.mtime, self._attempted_mtime):
+                return False
+
+            self._attempted_mtime = mtime
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    fake_keywords, real_keywords = parse_keywords_file(f.read())
+            except (OSError, KeywordFileError) as e:
+                # Un fișier invalid nu înlocuiește snapshot-ul activ
+                self.last_error = str(e)
+                self.logger.error(f"Fișier de keywords invalid ({self.path}): {e}")
+                return False
+
+            self._snapshot = KeywordSnapshot(fake_keywords, real_keywords, SOURCE_FILE, mtime)
+            self.last_error = None
+            self.reload_count += 1
+            self.logger.info(
+                f"Keywords încărcate din {self.path}: {len(fake_keywords)} fake, {len(real_keywords)} real"
+            )
+            return True
+
+    def snapshot(self) -> KeywordSnapshot:
+        """
+        Returneaza snapshot-ul activ, verificand periodic daca fisierul s-a modificat.
+
+        Returns:
+            KeywordSnapshot: Keywords si automatul compilat
+        """
+        if time.monotonic() - self._last_check >= self.reload_interval:
+            self.reload()
+        return self._snapshot
+
+    def get_status(self) -> Dict:
+        """Metrici despre sursa de keywords activa."""
+        snapshot = self._snapshot
+        return {
+            'source': snapshot.source,
+            'path': self.path,
+            'fake_keywords': len(snapshot.fake_keywords),
+            'real_keywords': len(snapshot.real_keywords),
+            'loaded_at': snapshot.loaded_at,
+            'reload_count': self.reload_count,
+            'last_error': self.last_error,
+        }
+
+
+_registry: Optional[KeywordRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_keyword_registry() -> KeywordRegistry:
+    """Returneaza registrul de keywords al procesului, creat la prima utilizare."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = KeywordRegistry()
+    return _registry
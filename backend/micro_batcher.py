@@ -0,0 +1,155 @@
+"""
+Planificator de micro-loturi (dynamic batching) pentru modelele ML.
+Cererile concurente sunt puse intr-o coada, grupate in loturi limitate de dimensiune
+si de timpul maxim de asteptare, rulate o singura data, iar rezultatele sunt
+distribuite inapoi apelantilor.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Sequence
+
+try:
+    import config
+except ImportError:
+    config = None
+
+ML_MICRO_BATCHING = getattr(config, 'ML_MICRO_BATCHING', True)
+ML_MICRO_BATCH_MAX_SIZE = getattr(config, 'ML_MICRO_BATCH_MAX_SIZE', 32)
+ML_MICRO_BATCH_MAX_WAIT_MS = getattr(config, 'ML_MICRO_BATCH_MAX_WAIT_MS', 5)
+
+
+class MicroBatcher:
+    """
+    Grupeaza elementele trimise din mai multe thread-uri in loturi pentru o functie vectorizata.
+    Un singur thread de lucru ruleaza loturile, deci modelul este apelat serial.
+    """
+
+    def __init__(self, name: str, batch_fn: Callable[[List[Any]], Sequence[Any]],
+                 max_batch_size: int = ML_MICRO_BATCH_MAX_SIZE, max_wait_ms: float = ML_MICRO_BATCH_MAX_WAIT_MS):
+        """
+        Args:
+            name: Numele planificatorului (folosit in metrici)
+            batch_fn: Functia care primeste o lista de elemente si returneaza cate un rezultat pentru fiecare
+            max_batch_size: Dimensiunea maxima a unui lot
+            max_wait_ms: Cat asteapta primul element din lot dupa altele (milisecunde)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: 'queue.Queue' = queue.Queue()
+        self._thread = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.max_queue_depth = 0
+        self.histogram: Dict[str, int] = {}
+
+    def _ensure_worker(self):
+        """Porneste thread-ul de lucru (si dupa fork, in procesul copil)."""
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+                if self._pid != os.getpid():
+                    self._queue = queue.Queue()
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name=f"batcher-{self.name}", daemon=True)
+                self._thread.start()
+
+    def submit_many(self, items: Sequence[Any]) -> List[Any]:
+        """
+        Trimite mai multe elemente si asteapta rezultatele lor.
+
+        Args:
+            items: Elementele de procesat
+
+        Returns:
+            list: Rezultatele, in ordinea elementelor
+
+        Raises:
+            Exception: Eroarea ridicata de batch_fn pentru lotul care continea elementul
+        """
+        if not items:
+            return []
+        self._ensure_worker()
+        futures = []
+        for item in items:
+            future = Future()
+            self._queue.put((item, future))
+            futures.append(future)
+
+        depth = self._queue.qsize()
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+        return [future.result() for future in futures]
+
+    def submit(self, item: Any) -> Any:
+        """Trimite un singur element si asteapta rezultatul."""
+        return self.submit_many([item])[0]
+
+    def _collect_batch(self) -> List[tuple]:
+        """Asteapta primul element, apoi adauga altele pana la dimensiunea maxima sau termenul limita."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    # Termenul a expirat: se adaugă doar ce este deja în coadă
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect_batch()
+            self._process(batch)
+
+    def _process(self, batch: List[tuple]):
+        """Ruleaza functia pe lot si distribuie rezultatele sau eroarea."""
+        items = [item for item, _ in batch]
+        try:
+            results = list(self.batch_fn(items))
+            if len(results) != len(items):
+                raise RuntimeError(f"{self.name}: {len(results)} rezultate pentru {len(items)} elemente")
+        except Exception as e:
+            self.logger.error(f"Eroare în lotul {self.name}: {e}")
+            for _, future in batch:
+                future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+        self._record(len(batch))
+
+    def _record(self, size: int):
+        """Actualizeaza contoarele si histograma dimensiunilor de lot (intervale puteri ale lui 2)."""
+        bucket = f"<={1 << (size - 1).bit_length()}"
+        with self._stats_lock:
+            self.batches += 1
+            self.items += size
+            self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def get_status(self) -> Dict:
+        """Metrici: adancimea cozii, numarul de loturi si histograma dimensiunilor."""
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000.0,
+            'queue_depth': self._queue.qsize(),
+            'max_queue_depth': self.max_queue_depth,
+            'batches': self.batches,
+            'items': self.items,
+            'avg_batch_size': self.items / self.batches if self.batches else 0.0,
+            'batch_size_histogram': dict(sorted(self.histogram.items(), key=lambda kv: int(kv[0][2:]))),
+        }
@@ -3,18 +3,28 @@ Modul pentru analiza fake news folosind modele de machine learning.
 Implementeaza detectia cu Sentence Transformers, mBERT si modele traditionale.
 """
 
-import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
-from sentence_transformers import SentenceTransformer
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 from typing import Dict, List, Tuple
 import logging
 import pickle
 import os
+import threading
+import time
 from datetime import datetime
 import json
 
+from embedding_index import ReferenceEmbeddingIndex, normalize_rows
+from ann_index import LabelledCorpusIndex
+from text_patterns import LANGUAGE_MATCHER, LINGUISTIC_MATCHER, SUBTLE_PATTERN_MATCHER
+from keyword_registry import get_keyword_registry
+from result_cache import get_result_cache
+from micro_batcher import MicroBatcher, ML_MICRO_BATCHING
+from model_registry import get_model_registry
+from inference_backend import (
+    classifier_window_length, classify_token_windows, embedding_model_id, load_sentence_encoder, load_text_classifier,
+)
+from token_chunking import MBERT_CHUNKING, aggregate_predictions, split_into_windows
+
 try:
     from config import *
 except ImportError:
@@ -23,23 +33,60 @@ except ImportError:
     ENABLE_ML_MODELS = True
     FAKE_NEWS_THRESHOLD = 0.7
 
+try:
+    from config import ENABLE_SEMANTIC_CORPUS, SEMANTIC_CORPUS_TOP_K
+except ImportError:
+    ENABLE_SEMANTIC_CORPUS = True
+    SEMANTIC_CORPUS_TOP_K = 5
+
+try:
+    from config import ML_BATCH_SIZE
+except ImportError:
+    ML_BATCH_SIZE = 32
+
+try:
+    from config import MODEL_PRELOAD, MODEL_WARMUP_ON_STARTUP
+except ImportError:
+    MODEL_PRELOAD = ['sentence_transformer', 'mbert']
+    MODEL_WARMUP_ON_STARTUP = True
+
+MBERT_CLASSIFIER_MODEL = "nlptown/bert-base-multilingual-uncased-sentiment"
+WARMUP_TEXT = "Breaking news: scientists confirm a new study about climate change."
+
 class MLAnalyzer:
     """
     Clasa pentru analiza fake news folosind modele de machine learning.
     Combina Sentence Transformers, mBERT si modele traditionale pentru detectie avansata.
     """
     
+    # Planificatoarele de micro-loturi (None = modelele sunt apelate direct)
+    _encode_batcher = None
+    _classify_batcher = None
+    _window_batcher = None
+    
+    # Modelele transformer sunt luate din registru la prima utilizare (None = fără încărcare lazy)
+    _models = None
+    _sentence_model = None
+    _classifier_model = None
+    sentence_model_name = None
+    
     def __init__(self):
-        """Initializeaza analizorul ML cu toate modelele disponibile."""
+        """
+        Initializeaza analizorul ML. Modelele transformer nu sunt incarcate aici, ci la prima
+        utilizare sau de warm_up(); instantele sunt partajate prin registrul de modele.
+        """
         self.logger = logging.getLogger(__name__)
-        self.sentence_model = None
-        self.classifier_model = None
         self.tokenizer = None
         self.vectorizer = None
         self.traditional_model = None
+        self._reference_indexes = {}
+        self.semantic_corpus = None
+        # Câte un lock per model: pregătirea unuia nu blochează încărcarea celuilalt
+        self._sentence_model_lock = threading.Lock()
+        self._classifier_model_lock = threading.Lock()
         
         if ENABLE_ML_MODELS:
-            self._load_models()
+            self._models = get_model_registry()
         
         self._load_traditional_model()
         
@@ -98,34 +145,170 @@ class MLAnalyzer:
             "Comunitatea locală strânge fonduri pentru caritate."
         ]
 
-    def _load_models(self):
-        """Incarca modelele pre-antrenate pentru analiza ML."""
+    @property
+    def sentence_model(self):
+        """Sentence Transformer-ul, luat din registrul de modele la primul acces."""
+        if self._sentence_model is None and self._models is not None:
+            with self._sentence_model_lock:
+                if self._sentence_model is None:
+                    model = self._models.get('sentence_transformer')
+                    if model is not None:
+                        self.sentence_model_name = embedding_model_id(SENTENCE_TRANSFORMER_MODEL)
+                        self._prepare_sentence_model(model)
+                        # Modelul devine vizibil abia dupa ce indexurile si micro-batcher-ul sunt gata
+                        self._sentence_model = model
+        return self._sentence_model
+
+    @sentence_model.setter
+    def sentence_model(self, model):
+        self._sentence_model = model
+
+    @property
+    def classifier_model(self):
+        """Pipeline-ul mBERT, luat din registrul de modele la primul acces."""
+        if self._classifier_model is None and self._models is not None:
+            with self._classifier_model_lock:
+                if self._classifier_model is None:
+                    model = self._models.get('mbert')
+                    if model is not None:
+                        if ML_MICRO_BATCHING:
+                            # Textele și ferestrele de tokeni sunt grupate separat: un lot are un singur tip
+                            self._classify_batcher = MicroBatcher('mbert', self._classify_texts)
+                            self._window_batcher = MicroBatcher('mbert_windows', self._classify_windows)
+                        # Modelul devine vizibil abia dupa ce micro-batcher-ele sunt create
+                        self._classifier_model = model
+        return self._classifier_model
+
+    @classifier_model.setter
+    def classifier_model(self, model):
+        self._classifier_model = model
+
+    def _prepare_sentence_model(self, model):
+        """Initializarea care depinde de Sentence Transformer: referinte, corpus semantic, micro-batcher."""
+        # Embedding-urile de referință se calculează o singură dată, la încărcarea modelului
         try:
-            self.logger.info("Încărcare Sentence Transformer...")
-            self.sentence_model = SentenceTransformer(SENTENCE_TRANSFORMER_MODEL)
-            
-            self.logger.info("Încărcare mBERT pentru clasificare...")
-            model_name = "nlptown/bert-base-multilingual-uncased-sentiment"
-            self.classifier_model = pipeline(
-                "sentiment-analysis", 
-                model=model_name,
-                tokenizer=model_name,
-                device=0 if torch.cuda.is_available() else -1
-            )
+            self._get_reference_index('fake', self.known_fake_news, model)
+            self._get_reference_index('real', self.known_real_news, model)
+        except Exception as e:
+            self.logger.warning(f"Nu s-au putut precalcula embedding-urile de referință: {e}")
+        
+        if ENABLE_SEMANTIC_CORPUS:
+            self._load_semantic_corpus(model)
+        
+        if ML_MICRO_BATCHING:
+            # Cererile concurente sunt grupate într-un singur apel al modelului
+            self._encode_batcher = MicroBatcher('sentence_transformer', self._encode_texts)
+
+    def get_model_readiness(self) -> Dict:
+        """Ce modele sunt deja incarcate (fara a declansa incarcarea)."""
+        return {
+            'sentence_transformer': self._sentence_model is not None,
+            'mbert': self._classifier_model is not None,
+            'traditional': self.traditional_model is not None,
+        }
+
+    def warm_up(self, background: bool = True):
+        """
+        Incarca in paralel modelele din MODEL_PRELOAD si ruleaza o analiza de proba,
+        astfel incat prima cerere reala sa nu astepte incarcarea modelelor.
+        
+        Args:
+            background: True ruleaza incalzirea intr-un thread de fundal
             
-            self.logger.info("Modele ML încărcate cu succes!")
+        Returns:
+            threading.Thread sau None: Thread-ul de fundal, daca exista
+        """
+        if not background:
+            self._warm_up()
+            return None
+        thread = threading.Thread(target=self._warm_up, name='model-warmup', daemon=True)
+        thread.start()
+        return thread
+
+    def _warm_up(self):
+        start = time.perf_counter()
+        if self._models is not None:
+            for future in self._models.preload(MODEL_PRELOAD):
+                future.result()
+        try:
+            # Rulează fără cache, ca să nu rămână un rezultat artificial
+            self._analyze_text_uncached(WARMUP_TEXT)
+        except Exception as e:
+            self.logger.warning(f"Analiza de încălzire a eșuat: {e}")
+        self.logger.info(f"Modele ML pregătite în {time.perf_counter() - start:.2f}s")
+
+    def _encode_texts(self, texts: List[str]) -> List[np.ndarray]:
+        """Un singur apel encode pentru un lot; returneaza cate un embedding pentru fiecare text."""
+        return list(self.sentence_model.encode(list(texts), batch_size=ML_BATCH_SIZE))
+
+    def _classify_texts(self, texts: List[str]) -> List:
+        """Un singur apel al pipeline-ului mBERT pentru un lot de texte deja trunchiate."""
+        return list(self.classifier_model(list(texts), batch_size=ML_BATCH_SIZE))
+
+    def _classify_windows(self, windows: List[List[int]]) -> List:
+        """Un singur apel al modelului mBERT pentru un lot de ferestre de tokeni (liste de id-uri)."""
+        return classify_token_windows(self.classifier_model, windows, batch_size=ML_BATCH_SIZE)
+
+    def _run_classifier(self, texts: List[str]) -> List:
+        """Trimite textele prin micro-batcher-ul de texte, daca exista, sau direct la model."""
+        if self._classify_batcher is not None:
+            return self._classify_batcher.submit_many(texts)
+        return self._classify_texts(texts)
+
+    def _run_window_classifier(self, windows: List[List[int]]) -> List:
+        """Trimite ferestrele de tokeni prin micro-batcher-ul de ferestre, daca exista, sau direct la model."""
+        if self._window_batcher is not None:
+            return self._window_batcher.submit_many(windows)
+        return self._classify_windows(windows)
+
+    def get_batching_status(self) -> Dict:
+        """Metricile planificatoarelor de micro-loturi (coada, loturi, histograma dimensiunilor)."""
+        return {
+            'enabled': self._encode_batcher is not None or self._classify_batcher is not None,
+            'sentence_transformer': self._encode_batcher.get_status() if self._encode_batcher else None,
+            'mbert': self._classify_batcher.get_status() if self._classify_batcher else None,
+            'mbert_windows': self._window_batcher.get_status() if self._window_batcher else None,
+        }
+
+    def _get_reference_index(self, name: str, texts: List[str], model=None) -> ReferenceEmbeddingIndex:
+        """
+        Returneaza indexul de embedding-uri pentru o lista de referinta,
+        reconstruindu-l daca lista sau modelul s-au schimbat.
+        
+        Args:
+            name: Numele listei ('fake' sau 'real')
+            texts: Propozitiile de referinta curente
+            model: Encoder-ul folosit (implicit self.sentence_model)
             
+        Returns:
+            ReferenceEmbeddingIndex: Indexul actualizat
+        """
+        index = self._reference_indexes.get(name)
+        if index is None or not index.is_current(texts, self.sentence_model_name):
+            encoder = model if model is not None else self.sentence_model
+            index = ReferenceEmbeddingIndex(texts, encoder, self.sentence_model_name)
+            self._reference_indexes[name] = index
+        return index
+
+    def _load_semantic_corpus(self, model=None):
+        """Construieste indexul ANN peste intregul dataset etichetat."""
+        try:
+            self.semantic_corpus = LabelledCorpusIndex.from_dataset(
+                "simple_large_dataset.json", model if model is not None else self.sentence_model,
+                self.sentence_model_name
+            )
+            if self.semantic_corpus:
+                self.logger.info(f"Corpus semantic indexat: {len(self.semantic_corpus)} articole")
         except Exception as e:
-            self.logger.error(f"Eroare la încărcarea modelelor ML: {e}")
-            self.sentence_model = None
-            self.classifier_model = None
+            self.logger.warning(f"Nu s-a putut construi corpusul semantic: {e}")
+            self.semantic_corpus = None
 
     def _load_traditional_model(self):
         """Incarca modelul traditional existent sau fallback."""
         try:
             if os.path.exists("simple_large_dataset.json"):
                 self.logger.info("📈 Folosesc modelul cu dataset mare (2000 articole)")
-                classifier, metadata = load_simple_large_model()
+                classifier, metadata = get_model_registry().get('simple_large_model') or (None, None)
                 if classifier:
                     self.traditional_model = classifier
                     self.model_metadata = metadata
@@ -133,12 +316,10 @@ class MLAnalyzer:
                     self.logger.info(f"Model mare încărcat: {metadata['total_articles']} articole, acuratețe: {metadata['accuracy']:.3f}")
                     return
             
-            with open("vectorizer.pkl", "rb") as f:
-                self.vectorizer = pickle.load(f)
-            with open("model.pkl", "rb") as f:
-                self.traditional_model = pickle.load(f)
+            self.vectorizer, self.traditional_model = get_model_registry().get('traditional_pickles') or (None, None)
             self.is_simple_model = False
-            self.logger.info("Model tradițional mic încărcat cu succes!")
+            if self.traditional_model is not None:
+                self.logger.info("Model tradițional mic încărcat cu succes!")
         except Exception as e:
             self.logger.warning(f"Nu s-a putut încărca modelul tradițional: {e}")
             self.is_simple_model = False
@@ -153,20 +334,62 @@ class MLAnalyzer:
         Returns:
             dict: Rezultatul analizei cu scor de similaritate si verdict
         """
+        return self.analyze_with_sentence_transformer_batch([text])[0]
+
+    def analyze_with_sentence_transformer_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Analiza Sentence Transformer pentru un lot de texte: un singur apel encode
+        si un singur produs matriceal fata de propozitiile de referinta.
+        
+        Args:
+            texts: Textele pentru analiza
+            
+        Returns:
+            list: Cate un rezultat pentru fiecare text, in aceeasi ordine
+        """
         if not self.sentence_model:
-            return {"error": "Sentence Transformer nu este disponibil"}
+            return [{"error": "Sentence Transformer nu este disponibil"} for _ in texts]
 
         try:
-            text_embedding = self.sentence_model.encode([text])
-            
-            fake_embeddings = self.sentence_model.encode(self.known_fake_news)
-            real_embeddings = self.sentence_model.encode(self.known_real_news)
-            
-            fake_similarities = cosine_similarity(text_embedding, fake_embeddings)[0]
-            real_similarities = cosine_similarity(text_embedding, real_embeddings)[0]
+            if self._encode_batcher is not None:
+                embeddings = np.asarray(self._encode_batcher.submit_many(list(texts)))
+            else:
+                embeddings = np.asarray(self._encode_texts(texts))
+            embeddings = normalize_rows(embeddings)
             
+            # Embedding-urile de referință sunt precalculate și normalizate
+            fake_similarities = self._get_reference_index('fake', self.known_fake_news).similarities(embeddings.T)
+            real_similarities = self._get_reference_index('real', self.known_real_news).similarities(embeddings.T)
+        except Exception as e:
+            self.logger.error(f"Eroare Sentence Transformer: {e}")
+            return [{"error": f"Eroare Sentence Transformer: {str(e)}"} for _ in texts]
+        
+        return [
+            self._score_sentence_embedding(text, embeddings[i], fake_similarities[:, i], real_similarities[:, i])
+            for i, text in enumerate(texts)
+        ]
+
+    def _score_sentence_embedding(self, text: str, text_embedding: np.ndarray,
+                                  fake_similarities: np.ndarray, real_similarities: np.ndarray) -> Dict:
+        """Calculeaza verdictul Sentence Transformer pentru un text din embedding-ul si similaritatile lui."""
+        try:
             max_fake_sim = np.max(fake_similarities)
             max_real_sim = np.max(real_similarities)
+            most_similar_fake = self.known_fake_news[np.argmax(fake_similarities)]
+            most_similar_real = self.known_real_news[np.argmax(real_similarities)]
+            
+            # Vecinii cei mai apropiați din datasetul etichetat complet
+            nearest_neighbors = {}
+            if self.semantic_corpus:
+                nearest_neighbors = self.semantic_corpus.search(text_embedding, SEMANTIC_CORPUS_TOP_K)
+                fake_neighbors = nearest_neighbors.get('fake', [])
+                real_neighbors = nearest_neighbors.get('real', [])
+                if fake_neighbors and fake_neighbors[0]['similarity'] > max_fake_sim:
+                    max_fake_sim = fake_neighbors[0]['similarity']
+                    most_similar_fake = fake_neighbors[0]['text']
+                if real_neighbors and real_neighbors[0]['similarity'] > max_real_sim:
+                    max_real_sim = real_neighbors[0]['similarity']
+                    most_similar_real = real_neighbors[0]['text']
             
             subtle_fake_indicators = self._detect_subtle_patterns(text)
             
@@ -203,8 +426,12 @@ class MLAnalyzer:
                 "adjusted_fake_score": float(adjusted_fake_score),
                 "adjusted_real_score": float(adjusted_real_score),
                 "subtle_indicators": subtle_fake_indicators,
-                "most_similar_fake": self.known_fake_news[np.argmax(fake_similarities)],
-                "most_similar_real": self.known_real_news[np.argmax(real_similarities)],
+                "most_similar_fake": most_similar_fake,
+                "most_similar_real": most_similar_real,
+                "nearest_neighbors": {
+                    label: [{"id": n['id'], "similarity": n['similarity']} for n in neighbors]
+                    for label, neighbors in nearest_neighbors.items()
+                },
                 "source": "sentence_transformer"
             }
             
@@ -214,115 +441,22 @@ class MLAnalyzer:
 
     def _detect_subtle_patterns(self, text: str) -> Dict:
         """Detectează pattern-uri subtile de fake news cu analiză îmbunătățită"""
-        text_lower = text.lower()
-        
-        # ÎMBUNĂTĂȚIRE MAJORĂ: Pattern-uri pentru afirmații absurde cu aparență științifică
-        absurd_scientific_claims = [
-            # Afirmații medicale absurde
-            'vindecă cancerul în', 'elimină complet diabetul', 'vindecă orice boală',
-            'crește iq-ul cu', 'dezvoltă puteri', 'puteri telepatice', 'puteri supranaturale',
-            'controlează vremea', 'controlează timpul', 'controlează gravitația',
-            'să trăiască 200', 'să trăiască 150', 'să trăiască 100 de ani',
-            'energie infinită', 'mișcare perpetuă', 'teleportare', 'citește gândurile',
-            'vindecă în 3 zile', 'vindecă în 48 ore', 'vindecă instant',
-            'elimină complet', 'vindecă 100%', 'funcționează 100%',
-            'prelungește viața cu', 'crește viața cu', 'adaugă ani de viață',
-            
-            # Afirmații tehnologice absurde
-            'cipuri microscopice', 'controlul mental', 'mind control',
-            'cipuri în apă', 'cipuri în vaccin', 'tracking chips',
-            'tehnologie secretă', 'arme secrete', 'experimente secrete',
-            
-            # Combinații absurde cu substanțe comune
-            'bicarbonatul vindecă', 'oțetul vindecă', 'mierea vindecă totul',
-            'apa vindecă', 'aerul vindecă', 'soarele vindecă',
-            'berea crește', 'cafeaua vindecă', 'ceaiul elimină',
-            'mirositul florilor', 'dormitul cu telefonul', 'privitul la',
-            
-            # Versiuni în engleză
-            'cures cancer in', 'eliminates diabetes completely', 'increases iq by',
-            'develops telepathic powers', 'live 200 years', 'live 150 years',
-            'microscopic chips', 'mind control chips', 'secret technology'
-        ]
-        
-        # Pattern-uri de exagerare (păstrate din versiunea anterioară)
-        exaggeration_patterns = [
-            'complet', 'total', 'absolut', 'perfect', 'exact', '100%', 'garantat',
-            'revoluționar', 'incredibil', 'șocant', 'uimitor', 'fantastic',
-            'completely', 'totally', 'absolutely', 'perfectly', 'guaranteed',
-            'revolutionary', 'incredible', 'shocking', 'amazing', 'fantastic'
-        ]
-        
-        # ÎMBUNĂTĂȚIRE: Surse false cu aparență credibilă
-        fake_credible_sources = [
-            # Instituții false care sună credibil
-            'institutul internațional de', 'centrul mondial pentru', 'fundația globală',
-            'organizația mondială de', 'institutul avansat de', 'centrul de cercetări avansate',
-            'laboratorul secret', 'institutul secret', 'centrul confidențial',
-            'international institute of', 'global center for', 'advanced research center',
-            'world organization of', 'secret laboratory', 'confidential center',
-            
-            # Autorități vagi cu universități reale (red flag când e combinat cu afirmații absurde)
-            'cercetătorii de la harvard', 'experții de la mit', 'oamenii de știință de la stanford',
-            'researchers from harvard', 'experts from mit', 'scientists from stanford',
-            
-            # Pattern-uri de autoritate falsă
-            'experții anonimi', 'surse anonime', 'informatori din interior',
-            'doctorii ascund', 'medicii nu vor să știi', 'industria ascunde',
-            'anonymous experts', 'anonymous sources', 'inside sources',
-            'doctors hide', 'medical industry hides', 'big pharma blocks'
-        ]
-        
-        # Pattern-uri de conspirație (îmbunătățite)
-        conspiracy_patterns = [
-            'big pharma', 'industria farmaceutică', 'industria medicală',
-            'guvernul ascunde', 'guvernele interzic', 'mass-media refuză',
-            'industria tech suprimă', 'companiile blochează', 'corporațiile ascund',
-            'agenda ascunsă', 'complot mondial', 'conspirația medicală',
-            'government hides', 'governments ban', 'mass media refuses',
-            'tech industry suppresses', 'companies block', 'corporations hide',
-            'hidden agenda', 'global conspiracy', 'medical conspiracy'
-        ]
-        
-        # Pattern-uri de urgență artificială
-        urgency_patterns = [
-            'urgent!', 'breaking!', 'ultimă oră!', 'atenție!', 'alertă!',
-            'acționează acum', 'nu aștepta', 'timpul se scurge', 'înainte să fie prea târziu',
-            'urgent!', 'breaking!', 'attention!', 'alert!',
-            'act now', 'don\'t wait', 'time running out', 'before it\'s too late'
-        ]
-        
-        # ÎMBUNĂTĂȚIRE: Detectează știința falsă cu aparență credibilă
-        fake_science_patterns = [
-            # Combinații periculoase: instituție credibilă + afirmație absurdă
-            'harvard.*vindecă', 'mit.*elimină', 'stanford.*crește',
-            'universitatea.*puteri', 'cercetătorii.*secret', 'studiul.*ascuns',
-            'journal.*vindecă', 'research.*elimină', 'scientists.*secret',
-            
-            # Afirmații medicale false cu aparență științifică
-            'studiile dovedesc că.*vindecă', 'cercetarea confirmă că.*elimină',
-            'analiza arată că.*crește', 'datele demonstrează că.*dezvoltă',
-            'research proves.*cures', 'studies confirm.*eliminates',
-            'analysis shows.*increases', 'data demonstrates.*develops',
-            
-            # Combinații de cuvinte științifice cu afirmații absurde
-            'metodă științifică.*secret', 'descoperire medicală.*ascuns',
-            'breakthrough.*hidden', 'discovery.*suppressed'
-        ]
+        # O singură trecere peste text pentru toate categoriile de pattern-uri
+        counts = SUBTLE_PATTERN_MATCHER.counts(text.lower())
         
         # Calculează scorurile pentru fiecare categorie (îmbunătățit)
-        absurd_score = sum(3 for pattern in absurd_scientific_claims if pattern in text_lower)  # Scor mare pentru absurdități
-        exaggeration_score = sum(1 for pattern in exaggeration_patterns if pattern in text_lower)
-        fake_credible_score = sum(2 for pattern in fake_credible_sources if pattern in text_lower)
-        conspiracy_score = sum(1 for pattern in conspiracy_patterns if pattern in text_lower)
-        urgency_score = sum(1 for pattern in urgency_patterns if pattern in text_lower)
-        fake_science_score = sum(2 for pattern in fake_science_patterns if pattern in text_lower)
+        absurd_score = 3 * counts['absurd_claims']  # Scor mare pentru absurdități
+        exaggeration_score = counts['exaggeration']
+        fake_credible_score = 2 * counts['fake_credible_sources']
+        conspiracy_score = counts['conspiracy']
+        urgency_score = counts['urgency']
+        fake_science_score = 2 * counts['fake_science']
         
         # ÎMBUNĂTĂȚIRE: Detectează combinații generale suspecte de pattern-uri
         combination_bonus = 0
         
         # BONUS MAJOR: Afirmații absurde cu surse credibile (cel mai periculos pattern)
-        if absurd_score > 0 and ('harvard' in text_lower or 'mit' in text_lower or 'stanford' in text_lower or 'cercetătorii' in text_lower):
+        if absurd_score > 0 and counts['credible_institutions'] > 0:
             combination_bonus += 3.0  # Bonus foarte mare
             
         # Bonus pentru combinația autoritate vagă + afirmații exagerate
@@ -352,28 +486,7 @@ class MLAnalyzer:
             combination_bonus               # Bonus pentru combinații periculoase
         )
         
-        # Pattern-uri pentru credibilitate reală (îmbunătățite)
-        credible_patterns = [
-            # Surse oficiale concrete
-            'ministerul', 'primăria', 'guvernul român', 'parlamentul',
-            'comisia europeană', 'organizația mondială a sănătății',
-            'ministry', 'government', 'parliament', 'european commission',
-            'world health organization', 'official statement',
-            
-            # Limbaj științific real
-            'conform studiului', 'potrivit cercetării', 'datele arată',
-            'statisticile indică', 'analiza dezvăluie', 'raportul confirmă',
-            'according to study', 'research indicates', 'data shows',
-            'statistics indicate', 'analysis reveals', 'report confirms',
-            
-            # Contexte normale de știri
-            'ieri', 'astăzi', 'săptămâna trecută', 'luna aceasta',
-            'prețul', 'temperatura', 'traficul', 'lucrările',
-            'yesterday', 'today', 'last week', 'this month',
-            'price', 'temperature', 'traffic', 'construction'
-        ]
-        
-        credible_score = sum(1 for pattern in credible_patterns if pattern in text_lower)
+        credible_score = counts['credible']
         
         # ÎMBUNĂTĂȚIRE: Calculează scorurile finale cu sensibilitate crescută pentru absurdități
         fake_score = min(total_fake_indicators / 12.0, 0.8)  # Normalizat la 0-0.8 (mai sensibil pentru absurdități)
@@ -408,15 +521,67 @@ class MLAnalyzer:
 
     def analyze_with_mbert(self, text: str) -> Dict:
         """Analiză îmbunătățită cu mBERT pentru detectarea manipulării lingvistice"""
+        return self.analyze_with_mbert_batch([text])[0]
+
+    def analyze_with_mbert_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Analiza mBERT pentru un lot de texte, cu un singur apel al pipeline-ului.
+        
+        Args:
+            texts: Textele pentru analiza
+            
+        Returns:
+            list: Cate un rezultat pentru fiecare text, in aceeasi ordine
+        """
         if not self.classifier_model:
-            return {"error": "mBERT classifier nu este disponibil"}
+            return [{"error": "mBERT classifier nu este disponibil"} for _ in texts]
 
         try:
-            # Analiză de sentiment de bază
-            result = self.classifier_model(text[:512])  # Limită la 512 tokeni
+            # Analiză de sentiment de bază, pe tot articolul când tokenizer-ul este disponibil
+            window_length = classifier_window_length(self.classifier_model) if MBERT_CHUNKING else 0
+            if window_length > 0:
+                predictions = self._predict_mbert_chunked(texts, window_length)
+            else:
+                predictions = self._run_classifier([text[:512] for text in texts])  # Limită la 512 caractere
+        except Exception as e:
+            self.logger.error(f"Eroare mBERT: {e}")
+            return [{"error": f"Eroare mBERT: {str(e)}"} for _ in texts]
+        
+        return [self._score_mbert_prediction(text, prediction) for text, prediction in zip(texts, predictions)]
+
+    def _predict_mbert_chunked(self, texts: List[str], window_length: int) -> List[Dict]:
+        """
+        Tokenizeaza fiecare text o singura data, il imparte in ferestre suprapuse, ruleaza
+        toate ferestrele lotului intr-un singur apel si agrega predictiile fiecarui text.
+        
+        Args:
+            texts: Textele pentru analiza
+            window_length: Numarul maxim de tokeni de continut dintr-o fereastra
             
-            label = result[0]['label']
-            score = result[0]['score']
+        Returns:
+            list: Cate o predictie agregata {'label', 'score', 'chunks'} pentru fiecare text
+        """
+        tokenizer = self.classifier_model.tokenizer
+        token_ids = tokenizer(list(texts), add_special_tokens=False, truncation=False, verbose=False)['input_ids']
+        
+        windows, owners = [], []
+        for i, ids in enumerate(token_ids):
+            for window in split_into_windows(ids, window_length):
+                windows.append(window)
+                owners.append(i)
+        
+        grouped = [[] for _ in texts]
+        for owner, prediction in zip(owners, self._run_window_classifier(windows)):
+            grouped[owner].append(prediction)
+        return [aggregate_predictions(group) for group in grouped]
+
+    def _score_mbert_prediction(self, text: str, prediction) -> Dict:
+        """Combina predictia de sentiment mBERT a unui text cu analiza lingvistica."""
+        try:
+            if isinstance(prediction, list):
+                prediction = prediction[0]
+            label = prediction['label']
+            score = prediction['score']
             
             # ÎMBUNĂTĂȚIRE: Analiză lingvistică avansată
             linguistic_analysis = self._analyze_linguistic_manipulation(text)
@@ -454,6 +619,7 @@ class MLAnalyzer:
                 "linguistic_flags": linguistic_analysis['flags'],
                 "confidence": float(confidence),
                 "reasoning": reasoning,
+                "chunks_analyzed": prediction.get('chunks', 1),
                 "source": "mbert"
             }
             
@@ -476,37 +642,24 @@ class MLAnalyzer:
             flags.append('long_sentences')
             reasoning.append('Propoziții neobișnuit de lungi')
         
-        # Verifică folosirea excesivă a adjectivelor superlative și de intensificare
-        superlatives = ['best', 'worst', 'most', 'least', 'greatest', 'smallest', 'highest', 'lowest',
-                       'only', 'perfect', 'ultimate', 'absolute', 'complete', 'total', 'entire',
-                       'cel mai bun', 'cel mai rău', 'cel mai mare', 'cel mai mic', 'cel mai înalt',
-                       'singurul', 'perfect', 'ultim', 'absolut', 'complet', 'total']
-        superlative_count = sum(1 for word in superlatives if word in text.lower())
+        # Verifică folosirea excesivă a adjectivelor superlative, a cuvintelor emoționale
+        # și a adverbelor de intensificare (o singură trecere peste text)
+        counts = LINGUISTIC_MATCHER.counts(text.lower())
+        superlative_count = counts['superlatives']
         
         if superlative_count > 2:  # Prag redus pentru mai multă sensibilitate
             manipulation_score += 0.18
             flags.append('excessive_superlatives')
             reasoning.append(f'Limbaj superlativ exagerat ({superlative_count} termeni)')
         
-        # Verifică cuvinte emoționale puternice și de manipulare
-        emotional_words = ['shocking', 'amazing', 'incredible', 'unbelievable', 'devastating', 'terrifying',
-                          'stunning', 'mind-blowing', 'extraordinary', 'phenomenal', 'miraculous',
-                          'outrageous', 'scandalous', 'explosive', 'bombshell', 'sensational',
-                          'șocant', 'uimitor', 'incredibil', 'de necrezut', 'devastator', 'terifiant',
-                          'extraordinar', 'fenomenal', 'miraculos', 'scandulos', 'senzațional']
-        emotional_count = sum(1 for word in emotional_words if word in text.lower())
+        emotional_count = counts['emotional']
         
         if emotional_count > 1:  # Prag redus pentru mai multă sensibilitate
             manipulation_score += 0.15
             flags.append('emotional_manipulation')
             reasoning.append(f'Limbaj emoțional manipulativ ({emotional_count} cuvinte)')
             
-        # Verifică adverbe de intensificare excesivă
-        intensifiers = ['extremely', 'incredibly', 'absolutely', 'completely', 'totally', 'perfectly',
-                       'dramatically', 'significantly', 'remarkably', 'extraordinarily', 'phenomenally',
-                       'extrem de', 'incredibil de', 'absolut', 'complet', 'total', 'perfect',
-                       'dramatic', 'semnificativ', 'remarcabil', 'extraordinar']
-        intensifier_count = sum(1 for word in intensifiers if word in text.lower())
+        intensifier_count = counts['intensifiers']
         
         if intensifier_count > 2:
             manipulation_score += 0.12
@@ -537,41 +690,65 @@ class MLAnalyzer:
 
     def analyze_with_traditional_ml(self, text: str) -> Dict:
         """Analiză cu modelul tradițional existent"""
+        return self.analyze_with_traditional_ml_batch([text])[0]
+
+    def analyze_with_traditional_ml_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Analiza cu modelul traditional pentru un lot de texte.
+        Pentru modelul sklearn, vectorizarea si predictia se fac o singura data pe tot lotul.
+        
+        Args:
+            texts: Textele pentru analiza
+            
+        Returns:
+            list: Cate un rezultat pentru fiecare text, in aceeasi ordine
+        """
         if not self.traditional_model:
-            return {"error": "Model tradițional nu este disponibil"}
+            return [{"error": "Model tradițional nu este disponibil"} for _ in texts]
 
+        # Verifică dacă folosim modelul simplu mare
+        if hasattr(self, 'is_simple_model') and self.is_simple_model:
+            return [self._analyze_with_simple_model(text) for text in texts]
+        
+        # Folosește modelul tradițional sklearn
+        if not self.vectorizer:
+            return [{"error": "Vectorizer nu este disponibil"} for _ in texts]
+        
         try:
-            # Verifică dacă folosim modelul simplu mare
-            if hasattr(self, 'is_simple_model') and self.is_simple_model:
-                pred, confidence = self.traditional_model(text)
-                is_fake = pred == 1
-                
-                return {
-                    "is_fake": is_fake,
-                    "confidence": float(confidence),
-                    "fake_probability": float(confidence) if is_fake else float(1 - confidence),
-                    "real_probability": float(1 - confidence) if is_fake else float(confidence),
-                    "source": "traditional_ml_large",
-                    "model_size": self.model_metadata.get('total_articles', 'unknown') if hasattr(self, 'model_metadata') else 'unknown'
-                }
-            
-            # Folosește modelul tradițional sklearn
-            if not self.vectorizer:
-                return {"error": "Vectorizer nu este disponibil"}
-                
-            X = self.vectorizer.transform([text])
-            pred = self.traditional_model.predict(X)[0]
-            proba = self.traditional_model.predict_proba(X)[0]
-            
+            X = self.vectorizer.transform(texts)
+            preds = self.traditional_model.predict(X)
+            probas = self.traditional_model.predict_proba(X)
+        except Exception as e:
+            self.logger.error(f"Eroare model tradițional: {e}")
+            return [{"error": f"Eroare model tradițional: {str(e)}"} for _ in texts]
+        
+        results = []
+        for pred, proba in zip(preds, probas):
             confidence = float(np.max(proba))
             is_fake = pred == 1
             
-            return {
+            results.append({
                 "is_fake": is_fake,
                 "confidence": confidence,
                 "fake_probability": float(proba[1]) if len(proba) > 1 else 0.5,
                 "real_probability": float(proba[0]) if len(proba) > 1 else 0.5,
                 "source": "traditional_ml_small"
+            })
+        return results
+
+    def _analyze_with_simple_model(self, text: str) -> Dict:
+        """Analiza unui text cu clasificatorul euristic antrenat pe datasetul mare."""
+        try:
+            pred, confidence = self.traditional_model(text)
+            is_fake = pred == 1
+            
+            return {
+                "is_fake": is_fake,
+                "confidence": float(confidence),
+                "fake_probability": float(confidence) if is_fake else float(1 - confidence),
+                "real_probability": float(1 - confidence) if is_fake else float(confidence),
+                "source": "traditional_ml_large",
+                "model_size": self.model_metadata.get('total_articles', 'unknown') if hasattr(self, 'model_metadata') else 'unknown'
             }
             
         except Exception as e:
@@ -742,8 +919,79 @@ class MLAnalyzer:
             }
         }
 
+    def analyze_fast(self, text: str) -> Dict:
+        """
+        Nivelul ieftin al analizei in cascada: modelul traditional si scorurile de pattern-uri,
+        fara modele transformer. Confidenta scade cand pattern-urile contrazic modelul traditional,
+        astfel incat cazurile ambigue sa fie trimise nivelurilor urmatoare.
+
+        Args:
+            text: Textul pentru analiza
+
+        Returns:
+            dict: Verdictul, confidenta si detaliile nivelului
+        """
+        traditional = self.analyze_with_traditional_ml(text)
+        if 'error' in traditional:
+            return {"error": traditional['error'], "verdict": "unknown", "confidence": 0.0, "source": "fast"}
+
+        patterns = self._detect_subtle_patterns(text)
+        linguistic = self._analyze_linguistic_manipulation(text)
+        verdict = 'fake' if traditional.get('is_fake') else 'real'
+        confidence = float(traditional.get('confidence', 0.0))
+
+        # Verdictul sugerat de pattern-uri (None = fără indicii clare)
+        if patterns['fake_score'] > patterns['real_score'] or linguistic['manipulation_score'] >= 0.3:
+            pattern_verdict = 'fake'
+        elif patterns['real_score'] > patterns['fake_score'] and linguistic['manipulation_score'] < 0.1:
+            pattern_verdict = 'real'
+        else:
+            pattern_verdict = None
+
+        if pattern_verdict == verdict:
+            explanation = f"Modelul tradițional și pattern-urile indică {verdict} (confidență {confidence:.2f})"
+        elif pattern_verdict is None:
+            confidence *= 0.9
+            explanation = f"Modelul tradițional indică {verdict}; pattern-urile nu sunt concludente"
+        else:
+            confidence *= 0.6
+            explanation = f"Modelul tradițional indică {verdict}, dar pattern-urile indică {pattern_verdict}"
+
+        return {
+            "verdict": verdict,
+            "confidence": confidence,
+            "pattern_verdict": pattern_verdict,
+            "explanation": explanation,
+            "traditional_analysis": traditional,
+            "pattern_analysis": {
+                "subtle_patterns": patterns,
+                "linguistic_manipulation": linguistic
+            },
+            "source": "fast"
+        }
+
     def analyze_text(self, text: str) -> Dict:
         """Funcția principală de analiză ML care combină toate metodele"""
+        result_cache = get_result_cache()
+        cached = result_cache.get(text, 'ml_only')
+        if cached is not None:
+            return cached
+        
+        final_result, cacheable = self._analyze_text_uncached(text)
+        if cacheable:
+            result_cache.set(text, 'ml_only', final_result)
+        return final_result
+
+    @staticmethod
+    def _is_cacheable(analyses: List[Dict]) -> bool:
+        """
+        Rezultatele obținute după erori ale unui model (ex. model neîncărcat încă sau indisponibil
+        temporar) nu sunt păstrate în cache, ca să nu fie servite pe toată durata RESULT_CACHE_TTL.
+        """
+        return all(isinstance(analysis, dict) and 'error' not in analysis for analysis in analyses)
+
+    def _analyze_text_uncached(self, text: str) -> Tuple[Dict, bool]:
+        """Rulează toate modelele ML pentru un text, fără cache; întoarce și dacă rezultatul poate fi păstrat."""
         analyses = []
         
         # Detectează limba textului
@@ -767,7 +1015,51 @@ class MLAnalyzer:
         # Adaugă limba detectată
         final_result['detected_language'] = detected_language
         
-        return final_result
+        return final_result, self._is_cacheable(analyses)
+
+    def analyze_texts(self, texts: List[str]) -> List[Dict]:
+        """
+        Analiza ML pentru un lot de texte. Fiecare model ruleaza o singura data pe tot lotul
+        (encode Sentence Transformer, pipeline mBERT, vectorizare TF-IDF), iar erorile
+        unui text nu afecteaza celelalte rezultate.
+        
+        Args:
+            texts: Textele pentru analiza
+            
+        Returns:
+            list: Cate un rezultat combinat pentru fiecare text, in aceeasi ordine
+        """
+        texts = list(texts)
+        result_cache = get_result_cache()
+        results = result_cache.get_many(texts, 'ml_only')
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            computed = self._analyze_texts_uncached([texts[i] for i in missing])
+            for i, (result, cacheable) in zip(missing, computed):
+                results[i] = result
+                if cacheable:
+                    result_cache.set(texts[i], 'ml_only', result)
+        return results
+
+    def _analyze_texts_uncached(self, texts: List[str]) -> List[Tuple[Dict, bool]]:
+        """Rulează modelele ML pe un lot de texte, fără cache; fiecare rezultat vine cu indicatorul de cache."""
+        st_results = self.analyze_with_sentence_transformer_batch(texts)
+        mbert_results = self.analyze_with_mbert_batch(texts)
+        traditional_results = self.analyze_with_traditional_ml_batch(texts)
+        
+        results = []
+        for text, st_result, mbert_result, traditional_result in zip(texts, st_results, mbert_results, traditional_results):
+            analyses = [st_result, mbert_result, traditional_result]
+            try:
+                final_result = self.combine_ml_analyses(analyses)
+                final_result['detected_language'] = self._detect_language(text)
+                cacheable = self._is_cacheable(analyses)
+            except Exception as e:
+                self.logger.error(f"Eroare în analiza ML: {e}")
+                final_result = {"error": f"Eroare în analiza ML: {str(e)}", "verdict": "unknown", "confidence": 0.0}
+                cacheable = False
+            results.append((final_result, cacheable))
+        return results
     
     def _detect_language(self, text: str) -> str:
         """Detectează limba textului folosind heuristici simple"""
@@ -778,14 +1070,9 @@ class MLAnalyzer:
             # Fallback la detecție heuristică
             text_lower = text.lower()
             
-            # Cuvinte caracteristice românești
-            ro_words = ['și', 'sau', 'este', 'sunt', 'pentru', 'cu', 'de', 'la', 'în', 'pe', 'că', 'să', 'nu', 'se', 'ce', 'mai', 'foarte', 'după', 'până', 'către', 'asupra', 'dintre', 'printre']
-            
-            # Cuvinte caracteristice engleze
-            en_words = ['the', 'and', 'or', 'is', 'are', 'for', 'with', 'of', 'at', 'in', 'on', 'that', 'to', 'not', 'what', 'more', 'very', 'after', 'until', 'towards', 'among', 'between']
-            
-            ro_count = sum(1 for word in ro_words if word in text_lower)
-            en_count = sum(1 for word in en_words if word in text_lower)
+            counts = LANGUAGE_MATCHER.counts(text_lower)
+            ro_count = counts['ro']
+            en_count = counts['en']
             
             if ro_count > en_count and ro_count > 2:
                 return 'ro'
@@ -838,10 +1125,7 @@ def load_traditional_model():
             return load_simple_large_model()
         
         # Fallback la modelul mic
-        with open("vectorizer.pkl", "rb") as f:
-            vectorizer = pickle.load(f)
-        with open("model.pkl", "rb") as f:
-            model = pickle.load(f)
+        vectorizer, model = load_traditional_pickles()
         
         print("📊 Modelul tradițional ML încărcat (dataset mic)")
         return vectorizer, model
@@ -860,150 +1144,33 @@ def load_simple_large_model():
         
         print(f"✅ Model mare încărcat: {metadata['total_articles']} articole, acuratețe: {metadata['accuracy']:.3f}")
         
+        keyword_registry = get_keyword_registry()
+        
         # Returnează funcția de clasificare îmbunătățită pentru detectarea subtilă
         def simple_classifier(text):
-            # Încarcă cuvintele din fișierul de keywords
-            try:
-                with open("enhanced_keywords.json", "r", encoding='utf-8') as f:
-                    keywords_data = json.load(f)
-                
-                fake_keywords = keywords_data['fake_keywords']
-                real_keywords = keywords_data['real_keywords']
-                
-            except Exception as e:
-                # Fallback la cuvinte de bază dacă fișierul nu există
-                fake_keywords = [
-                    'breaking', 'urgent', 'shocking', 'secret', 'conspiracy', 'hoax',
-                    'ultimă oră fals', 'conspirație', 'minciună', 'fals'
-                ]
-                real_keywords = [
-                    'research', 'study', 'analysis', 'experts', 'officials', 'data',
-                    'cercetare', 'studiu', 'analiză', 'experți', 'oficiali', 'date'
-                ]
-            
-            text_lower = text.lower()
+            # Keywords compilate o singură dată; fișierul este reîncărcat doar când se modifică
+            matcher = keyword_registry.snapshot().matcher
+            matches = matcher.matches(text.lower())
+            counts = {name: len(found) for name, found in matches.items()}
             
             # ÎMBUNĂTĂȚIRE: Analiză mai sofisticată pentru fake news subtile
             
             # 1. Calculează scorurile de bază pentru keywords
-            fake_score = 0
-            real_score = 0
-            
-            # Scoruri ponderate pentru keywords
-            for keyword in fake_keywords:
-                if keyword in text_lower:
-                    # Pondere mai mare pentru keywords mai specifici
-                    if len(keyword) > 10:  # Keywords lungi sunt mai specifici
-                        fake_score += 2
-                    else:
-                        fake_score += 1
-            
-            for keyword in real_keywords:
-                if keyword in text_lower:
-                    if len(keyword) > 10:
-                        real_score += 2
-                    else:
-                        real_score += 1
-            
-            # 2. Detectează pattern-uri generale de exagerare și manipulare
-            subtle_fake_patterns = [
-                # Pattern-uri de exagerare generală
-                'completely', 'totally', 'absolutely', 'perfectly', 'exactly',
-                'instantly', 'immediately', 'suddenly', 'dramatically', 'massively',
-                'revolutionary', 'groundbreaking', 'unprecedented', 'extraordinary', 'incredible',
-                'shocking', 'stunning', 'amazing', 'remarkable', 'outstanding',
-                'never seen before', 'first time ever', 'only solution', 'best ever',
-                'guaranteed', 'proven', 'confirmed', 'established', 'demonstrated',
-                
-                # Pattern-uri de urgență artificială  
-                'breaking', 'urgent', 'immediate', 'emergency', 'crisis',
-                'act now', 'limited time', 'don\'t wait', 'hurry', 'quickly',
-                'before it\'s too late', 'last chance', 'final warning', 'deadline',
-                
-                # Pattern-uri de autoritate falsă
-                'experts agree', 'scientists confirm', 'studies prove', 'research shows',
-                'according to experts', 'leading authorities', 'top specialists', 'renowned',
-                'prestigious', 'leading', 'world-class', 'internationally recognized',
-                
-                # Pattern-uri de conspirație subtile
-                'they don\'t want you to know', 'hidden truth', 'secret information',
-                'cover up', 'suppressed', 'censored', 'banned', 'forbidden',
-                'mainstream media won\'t tell you', 'government doesn\'t want',
-                
-                # Versiuni în română
-                'complet', 'total', 'absolut', 'perfect', 'exact',
-                'instant', 'imediat', 'brusc', 'dramatic', 'masiv',
-                'revoluționar', 'revoluționar', 'fără precedent', 'extraordinar',
-                'ultimă oră', 'urgent', 'imediat', 'criză', 'acționează',
-                'experții confirmă', 'studiile dovedesc', 'cercetările arată'
-            ]
-            
-            # 3. Detectează surse vagi și credibilitate suspectă
-            dubious_sources = [
-                # Surse anonime/vagi
-                'anonymous source', 'unnamed expert', 'confidential report', 'insider information',
-                'leaked documents', 'whistleblower reveals', 'off-the-record', 'sources say',
-                'according to sources', 'reliable sources', 'inside sources', 'trusted sources',
-                
-                # Autorități vagi
-                'experts', 'specialists', 'authorities', 'officials', 'insiders',
-                'top people', 'those in the know', 'industry leaders', 'key figures',
-                
-                # Organizații vagi sau false
-                'international organization', 'global foundation', 'research institute',
-                'prestigious university', 'leading center', 'advanced facility',
-                'renowned organization', 'world-class institute', 'top-rated center',
-                
-                # Pattern-uri de temporalitate suspectă
-                'will soon reveal', 'about to announce', 'preparing to release',
-                'plans to publish', 'expected to confirm', 'will shortly disclose',
-                
-                # Afirmații absolute fără dovezi
-                'it\'s proven that', 'everyone knows', 'it\'s obvious that',
-                'common knowledge', 'well established', 'widely accepted',
-                
-                # Versiuni în română
-                'sursă anonimă', 'expert neidentificat', 'raport confidențial', 'informații din interior',
-                'documente scurse', 'informator dezvăluie', 'organizație internațională',
-                'institut de cercetare', 'universitate prestigioasă', 'centru de cercetare'
-            ]
-            
-            # 4. Detectează urgență artificială
-            artificial_urgency = [
-                'breaking news', 'urgent', 'act now', 'don\'t wait', 'time running out',
-                'limited time', 'exclusive offer', 'once in a lifetime',
-                'ultimă oră', 'urgent', 'acționează acum', 'nu aștepta', 'timpul se scurge',
-                'timp limitat', 'ofertă exclusivă', 'o dată în viață'
-            ]
-            
-            # 5. Detectează conspirații
-            conspiracy_indicators = [
-                'government control', 'mind control', 'cover-up', 'suppresses truth', 'hidden agenda',
-                'they don\'t want you to know', 'mainstream media', 'big pharma',
-                'guvernul controlează', 'controlul minții', 'mușamalizare', 'suprimă adevărul',
-                'agende ascunse', 'nu vor să știi', 'media mainstream'
-            ]
-            
-            # Calculează scorurile pentru pattern-uri subtile
-            subtle_score = sum(2 for pattern in subtle_fake_patterns if pattern in text_lower)
-            dubious_score = sum(3 for pattern in dubious_sources if pattern in text_lower)  # Pondere mare
-            urgency_score = sum(1.5 for pattern in artificial_urgency if pattern in text_lower)
-            conspiracy_score = sum(2.5 for pattern in conspiracy_indicators if pattern in text_lower)
+            # Pondere mai mare pentru keywords mai specifici (keywords lungi)
+            fake_score = sum(2 if len(keyword) > 10 else 1 for keyword in matches['fake_keywords'])
+            real_score = sum(2 if len(keyword) > 10 else 1 for keyword in matches['real_keywords'])
+            
+            # 2-5. Pattern-uri de exagerare, surse vagi, urgență artificială și conspirații
+            subtle_score = 2 * counts['subtle']
+            dubious_score = 3 * counts['dubious']  # Pondere mare
+            urgency_score = 1.5 * counts['urgency']
+            conspiracy_score = 2.5 * counts['conspiracy']
             
             # Adaugă scorurile subtile la scorul fake
             fake_score += subtle_score + dubious_score + urgency_score + conspiracy_score
             
-            # 6. Detectează indicatori de credibilitate
-            credibility_indicators = [
-                'according to', 'data shows', 'statistics indicate', 'research suggests',
-                'experts say', 'officials confirm', 'study finds', 'analysis reveals',
-                'published in', 'peer-reviewed', 'university study', 'scientific journal',
-                'conform cu', 'datele arată', 'statisticile indică', 'cercetarea sugerează',
-                'experții spun', 'oficialii confirmă', 'studiul găsește', 'analiza dezvăluie',
-                'publicat în', 'evaluat de colegi', 'studiu universitar', 'revistă științifică'
-            ]
-            
-            credibility_score = sum(1.5 for indicator in credibility_indicators if indicator in text_lower)
+            # 6. Indicatori de credibilitate
+            credibility_score = 1.5 * counts['credibility']
             real_score += credibility_score
             
             # 7. Analiză lingvistică pentru manipulare
@@ -1020,9 +1187,7 @@ def load_simple_large_model():
                 manipulation_indicators += 1.5
             
             # Verifică cuvinte emoționale puternice
-            emotional_words = ['shocking', 'amazing', 'incredible', 'unbelievable', 'devastating',
-                             'șocant', 'uimitor', 'incredibil', 'de necrezut', 'devastator']
-            emotional_count = sum(1 for word in emotional_words if word in text_lower)
+            emotional_count = counts['emotional']
             if emotional_count > 2:
                 manipulation_indicators += emotional_count
             
@@ -1062,9 +1227,9 @@ def load_simple_large_model():
                     return 1, 0.70  # fake (manipulare detectată)
                 elif credibility_score > 0:
                     return 0, 0.75  # real (indicatori de credibilitate)
-                elif len(text) > 200 and any(word in text_lower for word in ['study', 'research', 'analysis', 'studiu', 'cercetare', 'analiză']):
+                elif len(text) > 200 and counts['academic'] > 0:
                     return 0, 0.70  # real (conținut academic lung)
-                elif any(word in text_lower for word in ['breaking', 'urgent', 'shocking', 'ultimă oră']):
+                elif counts['sensational'] > 0:
                     return 1, 0.68  # fake (limbaj senzațional)
                 else:
                     return 0, 0.65  # real (default conservativ)
@@ -1073,4 +1238,34 @@ def load_simple_large_model():
         
     except Exception as e:
         print(f"❌ Eroare la încărcarea modelului mare: {e}")
-        return None, None 
\ No newline at end of file
+        return None, None 
+
+
+def load_sentence_transformer():
+    """Încarcă Sentence Transformer pentru backend-ul de inferență configurat (importurile grele se fac doar acum)."""
+    return load_sentence_encoder(SENTENCE_TRANSFORMER_MODEL)
+
+
+def load_mbert_pipeline():
+    """Încarcă pipeline-ul mBERT pentru clasificare, pentru backend-ul de inferență configurat."""
+    return load_text_classifier(MBERT_CLASSIFIER_MODEL)
+
+
+def load_traditional_pickles():
+    """Încarcă vectorizer.pkl și model.pkl (o singură dată per proces, prin registru)."""
+    with open("vectorizer.pkl", "rb") as f:
+        vectorizer = pickle.load(f)
+    with open("model.pkl", "rb") as f:
+        model = pickle.load(f)
+    return vectorizer, model
+
+
+def register_models(registry):
+    """Înregistrează funcțiile de încărcare ale modelelor în registrul procesului."""
+    registry.register('sentence_transformer', load_sentence_transformer)
+    registry.register('mbert', load_mbert_pipeline)
+    registry.register('traditional_pickles', load_traditional_pickles)
+    registry.register('simple_large_model', load_simple_large_model)
+
+
+register_models(get_model_registry())
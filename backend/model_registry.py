@@ -0,0 +1,168 @@
+"""
+Registrul de modele al procesului.
+Fiecare model este inregistrat cu o functie de incarcare si este incarcat o singura data,
+la prima utilizare sau in fundal (in paralel), iar instanta este partajata de toti apelantii.
+Starea fiecarui model (neincarcat, in curs, gata, esuat) este raportata in /system-status.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    import config
+except ImportError:
+    config = None
+
+MODEL_LOAD_THREADS = getattr(config, 'MODEL_LOAD_THREADS', 2)
+
+STATE_NOT_LOADED = 'not_loaded'
+STATE_LOADING = 'loading'
+STATE_READY = 'ready'
+STATE_FAILED = 'failed'
+
+
+class _ModelEntry:
+    """Starea unui model inregistrat."""
+
+    __slots__ = ('name', 'loader', 'lock', 'state', 'instance', 'error', 'load_seconds', 'loaded_at')
+
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        self.name = name
+        self.loader = loader
+        self.lock = threading.Lock()
+        self.state = STATE_NOT_LOADED
+        self.instance = None
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.loaded_at: Optional[float] = None
+
+
+class ModelRegistry:
+    """
+    Incarca modelele la cerere, o singura data per proces. Un model care nu s-a putut incarca
+    ramane marcat 'failed' (get() returneaza None) pana la un reset() explicit.
+    """
+
+    def __init__(self, load_threads: int = MODEL_LOAD_THREADS):
+        """
+        Args:
+            load_threads: Numarul de thread-uri pentru incarcarea in fundal
+        """
+        self.logger = logging.getLogger(__name__)
+        self.load_threads = max(1, load_threads)
+        self._entries: Dict[str, _ModelEntry] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        """
+        Inregistreaza (sau inlocuieste) functia de incarcare a unui model.
+
+        Args:
+            name: Numele modelului
+            loader: Functia fara argumente care returneaza instanta modelului
+        """
+        with self._lock:
+            self._entries[name] = _ModelEntry(name, loader)
+
+    def _entry(self, name: str) -> _ModelEntry:
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"Model neînregistrat: {name}")
+        return entry
+
+    def get(self, name: str) -> Any:
+        """
+        Returneaza instanta modelului, incarcand-o la primul apel.
+        Apelurile concurente asteapta aceeasi incarcare.
+
+        Args:
+            name: Numele modelului
+
+        Returns:
+            Instanta modelului sau None daca incarcarea a esuat
+        """
+        entry = self._entry(name)
+        if entry.state == STATE_READY:
+            return entry.instance
+
+        with entry.lock:
+            if entry.state in (STATE_READY, STATE_FAILED):
+                return entry.instance
+
+            entry.state = STATE_LOADING
+            start = time.perf_counter()
+            try:
+                instance = entry.loader()
+            except Exception as e:
+                entry.error = str(e)
+                entry.state = STATE_FAILED
+                self.logger.error(f"Eroare la încărcarea modelului {name}: {e}")
+                return None
+            finally:
+                entry.load_seconds = time.perf_counter() - start
+
+            entry.instance = instance
+            entry.loaded_at = time.time()
+            entry.state = STATE_READY
+            self.logger.info(f"Model {name} încărcat în {entry.load_seconds:.2f}s")
+            return instance
+
+    def preload(self, names: Iterable[str]) -> List[Future]:
+        """
+        Porneste incarcarea in paralel, in fundal, a modelelor date.
+
+        Args:
+            names: Numele modelelor
+
+        Returns:
+            list: Cate un Future pentru fiecare model (rezultatul este instanta sau None)
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.load_threads, thread_name_prefix='model-loader')
+            executor = self._executor
+        return [executor.submit(self.get, name) for name in names if name in self._entries]
+
+    def is_ready(self, name: str) -> bool:
+        """True daca modelul este incarcat (nu declanseaza incarcarea)."""
+        entry = self._entries.get(name)
+        return entry is not None and entry.state == STATE_READY
+
+    def reset(self, name: str):
+        """Uita instanta si starea unui model; urmatorul get() il reincarca."""
+        entry = self._entry(name)
+        with entry.lock:
+            entry.state = STATE_NOT_LOADED
+            entry.instance = None
+            entry.error = None
+            entry.load_seconds = None
+            entry.loaded_at = None
+
+    def get_status(self) -> Dict:
+        """Starea fiecarui model inregistrat."""
+        return {
+            name: {
+                'state': entry.state,
+                'load_seconds': entry.load_seconds,
+                'error': entry.error,
+            }
+            for name, entry in list(self._entries.items())
+        }
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Returneaza registrul de modele al procesului, creat la prima utilizare."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+    return _registry
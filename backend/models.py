@@ -138,6 +138,92 @@ class Analysis(db.Model):
         """
         return json.loads(self.technical_details) if self.technical_details else {}
 
+class VideoBlob(db.Model):
+    """
+    Model pentru continutul unic al videoclipurilor incarcate (stocare adresata prin continut).
+    
+    Atribute:
+        sha256: Hash-ul continutului, cheia fisierului din depozitul de blob-uri
+        size: Dimensiunea in bytes
+    """
+    __tablename__ = 'video_blobs'
+    
+    sha256 = db.Column(db.String(64), primary_key=True)
+    size = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    uploads = db.relationship('VideoUpload', backref='blob', lazy=True)
+    
+    def __repr__(self):
+        """Reprezentare string pentru obiectul VideoBlob."""
+        return f'<VideoBlob {self.sha256[:12]} ({self.size} bytes)>'
+
+class VideoUpload(db.Model):
+    """
+    Model pentru o incarcare a unui utilizator: o referinta catre un VideoBlob, nu o copie.
+    
+    Atribute:
+        filename: Numele public ({user_id}_{timestamp}_{nume}), folosit de /video/<filename>
+        original_name: Numele fisierului trimis de utilizator
+        content_type: Tipul MIME trimis la incarcare
+    """
+    __tablename__ = 'video_uploads'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)  # None pentru vizitatori
+    sha256 = db.Column(db.String(64), db.ForeignKey('video_blobs.sha256'), nullable=False, index=True)
+    filename = db.Column(db.String(300), unique=True, nullable=False)
+    original_name = db.Column(db.String(255))
+    content_type = db.Column(db.String(100))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        """Reprezentare string pentru obiectul VideoUpload."""
+        return f'<VideoUpload {self.filename}>'
+    
+    def to_dict(self):
+        """
+        Converteste obiectul VideoUpload intr-un dictionar (formatul din /list-videos).
+        
+        Returns:
+            dict: Datele incarcarii serializate
+        """
+        return {
+            'filename': self.filename,
+            'original_name': self.original_name,
+            'file_size': self.blob.size,
+            'sha256': self.sha256,
+            'upload_date': self.created_at.isoformat() if self.created_at else None,
+            'status': 'ready'
+        }
+
+class VideoAnalysisResult(db.Model):
+    """
+    Model pentru rezultatele analizei video refolosite intre incarcari.
+    
+    Atribute:
+        sha256: Hash-ul continutului analizat
+        analyzer_version: Versiunea analizorului care a produs rezultatul
+        result: Rezultatul analizei (JSON)
+    """
+    __tablename__ = 'video_analysis_results'
+    __table_args__ = (db.UniqueConstraint('sha256', 'analyzer_version'),)
+    
+    id = db.Column(db.Integer, primary_key=True)
+    sha256 = db.Column(db.String(64), db.ForeignKey('video_blobs.sha256'), nullable=False)
+    analyzer_version = db.Column(db.String(64), nullable=False)
+    result = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def get_result(self):
+        """
+        Returneaza rezultatul ca dictionar.
+        
+        Returns:
+            dict: Rezultatul deserializat
+        """
+        return json.loads(self.result)
+
 class SystemStats(db.Model):
     """
     Model pentru statisticile sistemului pe zi.
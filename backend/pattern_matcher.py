@@ -0,0 +1,132 @@
+"""
+Potrivire simultana a mai multor pattern-uri de text (automat Aho-Corasick).
+Inlocuieste scanarile repetate 'pattern in text' cu o singura trecere peste text,
+indiferent de numarul de pattern-uri sau de categorii.
+"""
+
+from collections import deque
+from typing import Dict, List, Sequence, Set
+
+
+class MultiPatternMatcher:
+    """
+    Automat Aho-Corasick construit o singura data pentru mai multe categorii de pattern-uri.
+    Semantica este identica cu 'sum(1 for pattern in lista if pattern in text)':
+    fiecare intrare din lista unei categorii conteaza o data daca apare in text,
+    inclusiv intrarile duplicate.
+    """
+
+    def __init__(self, categories: Dict[str, Sequence[str]]):
+        """
+        Construieste automatul pentru toate categoriile.
+
+        Args:
+            categories: Dictionar categorie -> lista de pattern-uri (deja in litere mici)
+        """
+        self.categories = {name: tuple(patterns) for name, patterns in categories.items()}
+
+        # Fiecare pattern distinct primește un id; o intrare poate apărea în mai multe categorii
+        self.patterns: List[str] = []
+        self._pattern_ids: Dict[str, int] = {}
+        self._occurrences: List[List[str]] = []
+        for name, patterns in self.categories.items():
+            for pattern in patterns:
+                if not pattern:
+                    continue
+                pattern_id = self._pattern_ids.get(pattern)
+                if pattern_id is None:
+                    pattern_id = len(self.patterns)
+                    self._pattern_ids[pattern] = pattern_id
+                    self.patterns.append(pattern)
+                    self._occurrences.append([])
+                self._occurrences[pattern_id].append(name)
+
+        self._build_automaton()
+
+    def _build_automaton(self):
+        """Construieste trie-ul, legaturile de esec si iesirile fiecarei stari."""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(pattern_id)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(o) for o in outputs]
+
+    def find(self, text_lower: str) -> Set[str]:
+        """
+        Gaseste toate pattern-urile distincte prezente in text, intr-o singura trecere.
+
+        Args:
+            text_lower: Textul analizat, deja convertit la litere mici
+
+        Returns:
+            set: Pattern-urile gasite
+        """
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        found = set()
+        state = 0
+        for char in text_lower:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return {self.patterns[pattern_id] for pattern_id in found}
+
+    def matches(self, text_lower: str) -> Dict[str, List[str]]:
+        """
+        Returneaza intrarile potrivite pentru fiecare categorie.
+
+        Args:
+            text_lower: Textul analizat, deja convertit la litere mici
+
+        Returns:
+            dict: Categorie -> lista intrarilor gasite (cu duplicate, ca in lista originala)
+        """
+        found = self.find(text_lower)
+        return {
+            name: [pattern for pattern in patterns if pattern in found]
+            for name, patterns in self.categories.items()
+        }
+
+    def counts(self, text_lower: str) -> Dict[str, int]:
+        """
+        Numara intrarile potrivite pentru fiecare categorie, intr-o singura trecere.
+
+        Args:
+            text_lower: Textul analizat, deja convertit la litere mici
+
+        Returns:
+            dict: Categorie -> numarul de intrari gasite
+        """
+        result = {name: 0 for name in self.categories}
+        for pattern in self.find(text_lower):
+            for name in self._occurrences[self._pattern_ids[pattern]]:
+                result[name] += 1
+        return result
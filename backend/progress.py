@@ -0,0 +1,98 @@
+"""
+Evenimente de progres pentru analizele de lunga durata.
+Analizoarele primesc un callback optional `progress(event)` si raporteaza inceputul si
+sfarsitul fiecarei etape, cu durata si rezultatul partial al etapei. Evenimentele sunt
+transmise clientului ca Server-Sent Events (SSE).
+"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+ProgressCallback = Callable[[Dict], None]
+
+STAGE_START, STAGE_END, STAGE_ERROR = 'stage_start', 'stage_end', 'stage_error'
+
+logger = logging.getLogger(__name__)
+
+
+def emit(progress: Optional[ProgressCallback], event: str, **fields):
+    """
+    Trimite un eveniment catre callback. Erorile callback-ului (ex. client deconectat)
+    sunt doar inregistrate, fara sa opreasca analiza.
+    """
+    if progress is None:
+        return
+    try:
+        progress({'event': event, 'timestamp': time.time(), **fields})
+    except Exception as e:
+        logger.warning(f"Evenimentul de progres '{event}' nu a putut fi trimis: {e}")
+
+
+@contextmanager
+def track_stage(progress: Optional[ProgressCallback], stage: str):
+    """
+    Raporteaza o etapa: 'stage_start' la intrare, 'stage_end' cu durata si rezultatul partial
+    la iesire, sau 'stage_error' daca etapa ridica o exceptie (care este propagata).
+
+    Exemplu:
+        with track_stage(progress, 'ml') as partial:
+            result = analyze(...)
+            partial.update(partial_result(result))
+    """
+    partial: Dict[str, Any] = {}
+    emit(progress, STAGE_START, stage=stage)
+    start = time.perf_counter()
+    try:
+        yield partial
+    except BaseException as e:
+        emit(progress, STAGE_ERROR, stage=stage, duration_ms=(time.perf_counter() - start) * 1000, error=str(e))
+        raise
+    emit(progress, STAGE_END, stage=stage, duration_ms=(time.perf_counter() - start) * 1000, partial=partial)
+
+
+def partial_result(result: Any) -> Dict:
+    """Verdictul si confidenta unui rezultat intermediar (sau eroarea lui)."""
+    if not isinstance(result, dict):
+        return {'error': str(result)}
+    return {key: result[key] for key in ('verdict', 'confidence', 'error') if key in result}
+
+
+def _json_default(value):
+    """Converteste tipurile numpy din rezultatele partiale."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def format_sse(data: Any, event: Optional[str] = None, event_id: Optional[Any] = None) -> str:
+    """
+    Formateaza un mesaj Server-Sent Events.
+
+    Args:
+        data: Continutul, serializat JSON
+        event: Numele evenimentului (campul 'event:')
+        event_id: Identificatorul folosit de client pentru reluare (Last-Event-ID)
+
+    Returns:
+        str: Mesajul, terminat cu o linie goala
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    payload = json.dumps(data, default=_json_default, ensure_ascii=False)
+    lines.extend(f"data: {line}" for line in payload.splitlines() or [''])
+    return "\n".join(lines) + "\n\n"
+
+
+def format_sse_comment(comment: str = 'keep-alive') -> str:
+    """Comentariu SSE, folosit ca heartbeat ca proxy-urile sa nu inchida conexiunea."""
+    return f": {comment}\n\n"
@@ -0,0 +1,329 @@
+"""
+Cache de rezultate pentru analizele de text.
+Cheia este formata din hash-ul textului normalizat, modul de analiza si versiunea modelelor
+(amprenta fisierelor de model si a configuratiei). Nivelul in memorie este LRU cu TTL;
+optional, un nivel SQLite pastreaza rezultatele si dupa repornire.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import config
+except ImportError:
+    config = None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+RESULT_CACHE_ENABLED = getattr(config, 'RESULT_CACHE_ENABLED', True)
+RESULT_CACHE_MAX_ENTRIES = getattr(config, 'RESULT_CACHE_MAX_ENTRIES', 1024)
+RESULT_CACHE_TTL = getattr(config, 'RESULT_CACHE_TTL', 6 * 3600)
+RESULT_CACHE_SQLITE_PATH = getattr(config, 'RESULT_CACHE_SQLITE_PATH', None)
+RESULT_CACHE_ARTIFACTS = getattr(config, 'RESULT_CACHE_ARTIFACTS', [
+    'model.pkl', 'vectorizer.pkl', 'simple_model_metadata.json',
+    'simple_large_dataset.json', 'enhanced_keywords.json',
+])
+RESULT_CACHE_VERSION_CHECK_INTERVAL = getattr(config, 'RESULT_CACHE_VERSION_CHECK_INTERVAL', 1.0)
+
+# Setările din config care schimbă rezultatul analizei fac parte din versiune
+VERSIONED_SETTINGS = [
+    'SENTENCE_TRANSFORMER_MODEL', 'MULTILINGUAL_BERT_MODEL', 'DEFAULT_MODEL',
+    'ENABLE_OPENAI', 'ENABLE_PERSPECTIVE', 'ENABLE_ML_MODELS', 'ENABLE_SEMANTIC_CORPUS',
+    'ML_INFERENCE_BACKEND', 'MBERT_CHUNKING', 'MBERT_CHUNK_OVERLAP', 'MBERT_MAX_CHUNKS', 'MBERT_CHUNK_AGGREGATION',
+    'CASCADE_FAST_THRESHOLD', 'CASCADE_ML_THRESHOLD',
+]
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalizeaza textul pentru cheia de cache: forma Unicode NFC si spatii comprimate.
+    Majusculele si punctuatia sunt pastrate, deoarece influenteaza euristicile.
+
+    Args:
+        text: Textul original
+
+    Returns:
+        str: Textul normalizat
+    """
+    return _WHITESPACE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+
+
+def text_hash(text: str) -> str:
+    """Hash SHA-256 al textului normalizat."""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def artifact_fingerprint(paths: Sequence[str] = RESULT_CACHE_ARTIFACTS, base_dir: str = BASE_DIR) -> str:
+    """
+    Calculeaza versiunea modelelor din dimensiunea si mtime-ul fisierelor de model
+    si din setarile de configurare relevante.
+
+    Args:
+        paths: Fisierele de model (relative la base_dir sau absolute)
+        base_dir: Directorul de baza pentru caile relative
+
+    Returns:
+        str: Amprenta hexazecimala scurta
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        full_path = path if os.path.isabs(path) else os.path.join(base_dir, path)
+        try:
+            stat = os.stat(full_path)
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode('utf-8'))
+        except OSError:
+            digest.update(f"{path}:missing\n".encode('utf-8'))
+    for name in VERSIONED_SETTINGS:
+        digest.update(f"{name}={getattr(config, name, None)!r}\n".encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def _json_default(value):
+    """Converteste tipurile numpy pentru serializarea JSON."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Tip neserializabil: {type(value).__name__}")
+
+
+class ResultCache:
+    """
+    Cache LRU + TTL pentru rezultatele analizelor, cu nivel SQLite optional.
+    Rezultatele sunt copiate la scriere si la citire, deci apelantii le pot modifica liber.
+    """
+
+    def __init__(self, max_entries: int = RESULT_CACHE_MAX_ENTRIES, ttl: float = RESULT_CACHE_TTL,
+                 sqlite_path: Optional[str] = RESULT_CACHE_SQLITE_PATH, enabled: bool = RESULT_CACHE_ENABLED,
+                 artifacts: Sequence[str] = RESULT_CACHE_ARTIFACTS, base_dir: str = BASE_DIR,
+                 version_check_interval: float = RESULT_CACHE_VERSION_CHECK_INTERVAL):
+        """
+        Args:
+            max_entries: Numarul maxim de rezultate pastrate in memorie
+            ttl: Durata de viata a unui rezultat (secunde)
+            sqlite_path: Fisierul SQLite pentru nivelul persistent (None = dezactivat)
+            enabled: False dezactiveaza complet cache-ul
+            artifacts: Fisierele de model urmarite pentru invalidare
+            base_dir: Directorul fisierelor de model
+            version_check_interval: Intervalul minim (secunde) intre verificarile fisierelor de model
+        """
+        self.logger = logging.getLogger(__name__)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = enabled
+        self.artifacts = list(artifacts)
+        self.base_dir = base_dir
+        self.version_check_interval = version_check_interval
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        self._version = artifact_fingerprint(self.artifacts, self.base_dir)
+        self._last_version_check = time.monotonic()
+
+        self._db = None
+        self.sqlite_path = sqlite_path
+        if enabled and sqlite_path:
+            self._open_sqlite(sqlite_path)
+
+    def _open_sqlite(self, path: str):
+        """Deschide nivelul SQLite; la eroare cache-ul functioneaza doar in memorie."""
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS results ('
+                'key TEXT PRIMARY KEY, version TEXT NOT NULL, expires_at REAL NOT NULL, value TEXT NOT NULL)'
+            )
+            # Rândurile scrise de alte versiuni de modele nu mai pot fi folosite
+            self._db.execute('DELETE FROM results WHERE version != ? OR expires_at < ?', (self._version, time.time()))
+            self._db.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Nivelul SQLite al cache-ului nu este disponibil ({path}): {e}")
+            self._db = None
+
+    @property
+    def version(self) -> str:
+        """Versiunea curenta a modelelor; la schimbare cache-ul este golit."""
+        now = time.monotonic()
+        if now - self._last_version_check >= self.version_check_interval:
+            self._last_version_check = now
+            version = artifact_fingerprint(self.artifacts, self.base_dir)
+            if version != self._version:
+                self.logger.info("Fișierele de model s-au schimbat; golesc cache-ul de rezultate")
+                with self._lock:
+                    self._version = version
+                    self._entries.clear()
+                    self.invalidations += 1
+                    if self._db is not None:
+                        try:
+                            self._db.execute('DELETE FROM results WHERE version != ?', (version,))
+                            self._db.commit()
+                        except sqlite3.Error as e:
+                            self.logger.warning(f"Nu s-a putut goli cache-ul SQLite: {e}")
+        return self._version
+
+    def make_key(self, text: str, mode: str) -> str:
+        """Cheia de cache pentru un text si un mod de analiza."""
+        return f"{mode}:{self.version}:{text_hash(text)}"
+
+    def get(self, text: str, mode: str) -> Optional[Dict]:
+        """
+        Returneaza rezultatul din cache sau None.
+
+        Args:
+            text: Textul analizat
+            mode: Modul de analiza ('hybrid', 'ml_only', 'traditional', ...)
+
+        Returns:
+            dict sau None: O copie a rezultatului, marcata cu 'cached': True
+        """
+        if not self.enabled:
+            return None
+
+        key = self.make_key(text, mode)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._mark_cached(value)
+                del self._entries[key]
+
+            value = self._get_from_disk(key, now)
+            if value is not None:
+                self.disk_hits += 1
+                self._store(key, value, now)
+                return self._mark_cached(value)
+
+            self.misses += 1
+            return None
+
+    def get_many(self, texts: List[str], mode: str) -> List[Optional[Dict]]:
+        """Returneaza rezultatele din cache pentru mai multe texte (None pentru lipsuri)."""
+        return [self.get(text, mode) for text in texts]
+
+    def set(self, text: str, mode: str, result: Dict):
+        """
+        Salveaza un rezultat. Rezultatele cu 'error' nu sunt salvate.
+
+        Args:
+            text: Textul analizat
+            mode: Modul de analiza
+            result: Rezultatul analizei
+        """
+        if not self.enabled or not isinstance(result, dict) or 'error' in result:
+            return
+
+        key = self.make_key(text, mode)
+        value = copy.deepcopy(result)
+        value.pop('cached', None)
+        now = time.time()
+        with self._lock:
+            self._store(key, value, now)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        'INSERT OR REPLACE INTO results (key, version, expires_at, value) VALUES (?, ?, ?, ?)',
+                        (key, self._version, now + self.ttl, json.dumps(value, default=_json_default))
+                    )
+                    self._db.commit()
+                except (sqlite3.Error, TypeError, ValueError) as e:
+                    self.logger.warning(f"Nu s-a putut salva rezultatul în cache-ul SQLite: {e}")
+
+    def _store(self, key: str, value: Dict, now: float):
+        """Adauga in nivelul de memorie si elimina intrarile cele mai vechi (apelat cu lock)."""
+        self._entries[key] = (now + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _get_from_disk(self, key: str, now: float) -> Optional[Dict]:
+        """Citeste un rezultat valid din nivelul SQLite (apelat cu lock)."""
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                'SELECT value, expires_at FROM results WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                self._db.execute('DELETE FROM results WHERE key = ?', (key,))
+                self._db.commit()
+                return None
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.warning(f"Eroare la citirea cache-ului SQLite: {e}")
+            return None
+
+    @staticmethod
+    def _mark_cached(value: Dict) -> Dict:
+        result = copy.deepcopy(value)
+        result['cached'] = True
+        return result
+
+    def clear(self):
+        """Goleste ambele niveluri ale cache-ului."""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM results')
+                self._db.commit()
+
+    def get_status(self) -> Dict:
+        """Contoare de utilizare a cache-ului."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl,
+            'sqlite': self._db is not None,
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'model_version': self._version,
+        }
+
+
+_cache: Optional[ResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Returneaza cache-ul de rezultate al procesului, creat la prima utilizare."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResultCache()
+    return _cache
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Teste pentru indexurile ANN si indexul semantic al datasetului (ann_index.py)
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from ann_index import ExactIndex, IVFIndex, LabelledCorpusIndex
+from embedding_index import normalize_rows
+
+
+def clustered_vectors(n: int = 6000, dim: int = 32, clusters: int = 60, seed: int = 0):
+    """Genereaza vectori normalizati grupati in jurul unor centre aleatoare."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    labels = rng.integers(0, clusters, size=n)
+    return normalize_rows(centers[labels] + 0.3 * rng.normal(size=(n, dim)))
+
+
+def test_exact_index_returns_sorted_ids():
+    """Indexul exact returneaza vecinii in ordinea descrescatoare a similaritatii"""
+    vectors = clustered_vectors(200)
+    ids = [f"doc_{i}" for i in range(len(vectors))]
+    index = ExactIndex().build(vectors, ids)
+
+    results = index.search(vectors[17], k=5)
+    assert results[0][0] == "doc_17"
+    assert abs(results[0][1] - 1.0) < 1e-5
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_ivf_recall_against_exact():
+    """IVF trebuie sa gaseasca aproape aceiasi vecini ca indexul exact"""
+    vectors = clustered_vectors()
+    ids = [str(i) for i in range(len(vectors))]
+    exact = ExactIndex().build(vectors, ids)
+    ivf = IVFIndex(nprobe=8).build(vectors, ids)
+    assert len(ivf) == len(vectors)
+
+    queries = clustered_vectors(100, seed=1)
+    hits = 0
+    for query in queries:
+        expected = {doc_id for doc_id, _ in exact.search(query, 10)}
+        found = {doc_id for doc_id, _ in ivf.search(query, 10)}
+        hits += len(expected & found)
+    assert hits / (10 * len(queries)) > 0.9
+
+
+class CharEncoder:
+    """Encoder simplu bazat pe frecventa literelor, suficient pentru teste."""
+
+    def encode(self, texts):
+        vectors = np.zeros((len(texts), 26))
+        for row, text in enumerate(texts):
+            for char in text.lower():
+                if 'a' <= char <= 'z':
+                    vectors[row, ord(char) - ord('a')] += 1
+        return vectors
+
+
+def test_labelled_corpus_returns_fake_and_real_neighbors():
+    """Indexul semantic returneaza top-k vecini pentru fiecare eticheta, cu id-uri"""
+    articles = [
+        {'id': 'fake_1', 'text': 'aliens control the moon', 'label': 1},
+        {'id': 'fake_2', 'text': 'zzz secret xyz', 'label': 1},
+        {'id': 'real_1', 'text': 'council approves budget', 'label': 0},
+    ]
+    with tempfile.TemporaryDirectory() as cache_dir:
+        corpus = LabelledCorpusIndex(articles, CharEncoder(), 'char-model', cache_dir=cache_dir)
+        assert os.listdir(cache_dir)
+
+    query = normalize_rows(CharEncoder().encode(['aliens on the moon']))[0]
+    results = corpus.search(query, k=2)
+    assert [n['id'] for n in results['fake']][0] == 'fake_1'
+    assert len(results['fake']) == 2
+    assert [n['id'] for n in results['real']] == ['real_1']
+
+
+if __name__ == "__main__":
+    test_exact_index_returns_sorted_ids()
+    test_ivf_recall_against_exact()
+    test_labelled_corpus_returns_fake_and_real_neighbors()
+    print("✅ Toate testele pentru ann_index au trecut")
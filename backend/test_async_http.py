@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Teste pentru clientii HTTP asincroni (async_http.py) si AIAnalyzer, rulate
+contra unui server local care simuleaza OpenAI si Perspective.
+"""
+
+import asyncio
+import json
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import ai_analyzer
+from ai_analyzer import AIAnalyzer
+from async_http import ProviderClient, ProviderError
+
+DELAY = 0.2
+
+
+class StubProviders:
+    """Server local care imita API-urile OpenAI si Perspective."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.flaky_calls = 0
+        self.ports = set()
+        app = web.Application()
+        app.router.add_post('/chat/completions', self.openai)
+        app.router.add_post('/comments:analyze', self.perspective)
+        app.router.add_post('/flaky', self.flaky)
+        app.router.add_post('/bad', self.bad)
+        app.router.add_post('/slow', self.slow)
+        self.server = TestServer(app)
+
+    async def _track(self, request):
+        self.ports.add(request.transport.get_extra_info('peername')[1])
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(DELAY)
+        finally:
+            self.active -= 1
+
+    async def openai(self, request):
+        assert request.headers['Authorization'] == 'Bearer test-key'
+        await self._track(request)
+        content = json.dumps({'is_fake': True, 'confidence': 0.9, 'reasoning': 'stub', 'detected_language': 'en'})
+        return web.json_response({'choices': [{'message': {'content': content}}]})
+
+    async def perspective(self, request):
+        assert request.query['key'] == 'test-key'
+        await self._track(request)
+        return web.json_response({'attributeScores': {'TOXICITY': {'summaryScore': {'value': 0.8}}}})
+
+    async def flaky(self, request):
+        self.flaky_calls += 1
+        if self.flaky_calls < 3:
+            return web.Response(status=503, text='busy')
+        return web.json_response({'ok': True})
+
+    async def bad(self, request):
+        return web.Response(status=400, text='invalid request')
+
+    async def slow(self, request):
+        await asyncio.sleep(1)
+        return web.json_response({'ok': True})
+
+    def url(self, path=''):
+        return str(self.server.make_url(path))
+
+
+async def with_stub(scenario):
+    stub = StubProviders()
+    await stub.server.start_server()
+    try:
+        return await scenario(stub)
+    finally:
+        await stub.server.close()
+
+
+def test_connections_are_reused_and_concurrency_is_capped():
+    """Cererile refolosesc conexiunile keep-alive si respecta limita de concurenta"""
+    async def scenario(stub):
+        client = ProviderClient('perspective', stub.url(), max_concurrency=2, max_retries=0)
+        try:
+            for _ in range(3):
+                await client.post_json('/comments:analyze', {}, params={'key': 'test-key'})
+            assert len(stub.ports) == 1
+
+            await asyncio.gather(*(client.post_json('/comments:analyze', {}, params={'key': 'test-key'})
+                                   for _ in range(6)))
+            assert stub.peak == 2
+        finally:
+            await client.close()
+
+    asyncio.run(with_stub(scenario))
+
+
+def test_retries_with_backoff_and_failures():
+    """Erorile temporare sunt reincercate; erorile 4xx si timeout-urile sunt raportate"""
+    async def scenario(stub):
+        client = ProviderClient('stub', stub.url(), max_retries=3, backoff_base=0.01, timeout=0.3)
+        try:
+            assert await client.post_json('/flaky', {}) == {'ok': True}
+            assert stub.flaky_calls == 3 and client.stats['retries'] == 2
+
+            try:
+                await client.post_json('/bad', {})
+            except ProviderError as e:
+                assert e.status == 400
+            else:
+                raise AssertionError("Eroarea 400 nu a fost raportata")
+
+            started = client.stats['requests']
+            try:
+                await client.post_json('/slow', {})
+            except ProviderError:
+                assert client.stats['requests'] - started == 4
+            else:
+                raise AssertionError("Timeout-ul nu a fost raportat")
+        finally:
+            await client.close()
+
+    asyncio.run(with_stub(scenario))
+
+
+def test_ai_analyzer_calls_providers_concurrently():
+    """OpenAI si Perspective sunt apelate concurent de AIAnalyzer.analyze_text"""
+    async def scenario(stub):
+        analyzer = AIAnalyzer()
+        analyzer.openai_client.base_url = stub.url().rstrip('/')
+        analyzer.perspective_client.base_url = stub.url().rstrip('/')
+        try:
+            started = time.perf_counter()
+            result = await analyzer.analyze_text("Breaking: aliens landed")
+            elapsed = time.perf_counter() - started
+        finally:
+            await analyzer.openai_client.close()
+            await analyzer.perspective_client.close()
+
+        assert result['verdict'] == 'fake'
+        assert {r['source'] for r in result['detailed_results']} == {'openai', 'perspective'}
+        assert elapsed < 2 * DELAY
+
+    settings = {'ENABLE_OPENAI': True, 'OPENAI_API_KEY': 'test-key',
+                'ENABLE_PERSPECTIVE': True, 'GOOGLE_API_KEY': 'test-key'}
+    previous = {name: getattr(ai_analyzer, name) for name in settings}
+    for name, value in settings.items():
+        setattr(ai_analyzer, name, value)
+    try:
+        asyncio.run(with_stub(scenario))
+    finally:
+        for name, value in previous.items():
+            setattr(ai_analyzer, name, value)
+
+
+if __name__ == "__main__":
+    test_connections_are_reused_and_concurrency_is_capped()
+    test_retries_with_backoff_and_failures()
+    test_ai_analyzer_calls_providers_concurrently()
+    print("✅ Toate testele pentru async_http au trecut")
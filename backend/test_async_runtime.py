@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Teste pentru runtime-ul asincron persistent (async_runtime.py)
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from async_runtime import AsyncRuntime, get_runtime, run_async, run_blocking, run_blocking_io
+
+
+async def current_loop():
+    return asyncio.get_running_loop()
+
+
+def test_loop_is_reused_across_calls():
+    """Toate cererile folosesc aceeasi bucla, care ruleaza intr-un thread de fundal"""
+    first = run_async(current_loop())
+    second = run_async(current_loop())
+    assert first is second is get_runtime().loop
+    assert get_runtime().get_status()['running']
+
+
+def test_exceptions_and_timeouts_propagate():
+    """Exceptiile corutinei si depasirea timpului ajung la apelant"""
+    async def failing():
+        raise ValueError("eroare de test")
+
+    try:
+        run_async(failing())
+    except ValueError as e:
+        assert str(e) == "eroare de test"
+    else:
+        raise AssertionError("Exceptia nu a fost propagata")
+
+    try:
+        run_async(asyncio.sleep(5), timeout=0.05)
+    except FutureTimeoutError:
+        pass
+    else:
+        raise AssertionError("Timeout-ul nu a fost respectat")
+
+
+def test_blocking_work_is_bounded():
+    """Etapele blocante nu depasesc numarul de thread-uri configurat"""
+    lock = threading.Lock()
+    state = {'active': 0, 'peak': 0}
+
+    def work():
+        with lock:
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        time.sleep(0.02)
+        with lock:
+            state['active'] -= 1
+        return threading.current_thread().name
+
+    async def many():
+        return await asyncio.gather(*(run_blocking(work) for _ in range(20)))
+
+    names = run_async(many())
+    assert len(names) == 20
+    assert all(name.startswith('ml-worker') for name in names)
+    assert state['peak'] <= get_runtime().worker_threads
+
+
+def test_blocking_io_runs_on_the_io_pool():
+    """Apelurile I/O blocante ruleaza in pool-ul I/O, separat de thread-urile ML, si in paralel"""
+    def fetch():
+        time.sleep(0.1)
+        return threading.current_thread().name
+
+    async def many():
+        return await asyncio.gather(*(run_blocking_io(fetch) for _ in range(8)))
+
+    start = time.monotonic()
+    names = run_async(many())
+    assert all(name.startswith('io-worker') for name in names)
+    assert time.monotonic() - start < 0.1 * 8 / 2
+
+
+def test_submit_from_runtime_thread_is_rejected():
+    """Apelul blocant din interiorul buclei ar bloca runtime-ul, deci este refuzat"""
+    runtime = AsyncRuntime(worker_threads=1, io_threads=1)
+    try:
+        async def nested():
+            try:
+                runtime.run(asyncio.sleep(0))
+            except RuntimeError:
+                return True
+            return False
+
+        assert runtime.run(nested())
+    finally:
+        runtime.shutdown()
+
+
+if __name__ == "__main__":
+    test_loop_is_reused_across_calls()
+    test_exceptions_and_timeouts_propagate()
+    test_blocking_work_is_bounded()
+    test_blocking_io_runs_on_the_io_pool()
+    test_submit_from_runtime_thread_is_rejected()
+    print("✅ Toate testele pentru async_runtime au trecut")
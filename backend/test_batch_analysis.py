@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Teste pentru analiza pe loturi (MLAnalyzer.analyze_texts)
+"""
+
+import logging
+import tempfile
+import threading
+
+import numpy as np
+
+import embedding_index
+import ml_analyzer
+from embedding_index import ReferenceEmbeddingIndex
+from micro_batcher import MicroBatcher
+from ml_analyzer import MLAnalyzer, load_simple_large_model
+from result_cache import get_result_cache
+from test_embedding_index import HashingEncoder
+
+TEXTS = [
+    "Breaking: scientists baffled as miracle cure makes people live 200 years!!!",
+    "City council approves new infrastructure project according to officials.",
+    "URGENT! Share before they delete this, the government hides the truth.",
+    "Studiul publicat de universitate arată o creștere moderată a temperaturilor.",
+]
+
+
+class FakeSentimentPipeline:
+    """Inlocuieste pipeline-ul mBERT; accepta un text sau o lista de texte."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, inputs, **kwargs):
+        self.calls += 1
+        single = isinstance(inputs, str)
+        texts = [inputs] if single else inputs
+        outputs = [{'label': 'NEGATIVE' if '!' in t else 'POSITIVE', 'score': 0.5 + (len(t) % 50) / 100}
+                   for t in texts]
+        return outputs
+
+
+class FakeVectorizer:
+    def __init__(self):
+        self.calls = 0
+
+    def transform(self, texts):
+        self.calls += 1
+        return np.array([[len(t), t.count('!')] for t in texts], dtype=float)
+
+
+class FakeModel:
+    def predict(self, X):
+        return (X[:, 1] > 0).astype(int)
+
+    def predict_proba(self, X):
+        fake = np.clip(0.2 + X[:, 1] * 0.2, 0, 1)
+        return np.stack([1 - fake, fake], axis=1)
+
+
+def make_analyzer(cache_dir):
+    """Creeaza un MLAnalyzer fara a incarca modelele reale"""
+    analyzer = MLAnalyzer.__new__(MLAnalyzer)
+    analyzer.logger = logging.getLogger(__name__)
+    analyzer.sentence_model = HashingEncoder()
+    analyzer.sentence_model_name = 'hashing'
+    analyzer.semantic_corpus = None
+    analyzer.classifier_model = FakeSentimentPipeline()
+    analyzer.known_fake_news = ["Aliens landed in New York", "Miracle cure hidden by doctors"]
+    analyzer.known_real_news = ["City council approves budget", "Study shows benefits of exercise"]
+    analyzer._reference_indexes = {
+        'fake': ReferenceEmbeddingIndex(analyzer.known_fake_news, analyzer.sentence_model, 'hashing', cache_dir),
+        'real': ReferenceEmbeddingIndex(analyzer.known_real_news, analyzer.sentence_model, 'hashing', cache_dir),
+    }
+    analyzer.vectorizer = None
+    analyzer.traditional_model, analyzer.model_metadata = load_simple_large_model()
+    analyzer.is_simple_model = True
+    return analyzer
+
+
+def without_language(result):
+    return {k: v for k, v in result.items() if k != 'detected_language'}
+
+
+def test_batch_matches_single_analysis():
+    """analyze_texts da aceleasi rezultate ca analyze_text apelat pe rand"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        analyzer = make_analyzer(cache_dir)
+        get_result_cache().clear()
+        single = [analyzer.analyze_text(text) for text in TEXTS]
+        get_result_cache().clear()
+
+        encode_calls = analyzer.sentence_model.calls
+        pipeline_calls = analyzer.classifier_model.calls
+        batch = analyzer.analyze_texts(TEXTS)
+
+        assert analyzer.sentence_model.calls == encode_calls + 1
+        assert analyzer.classifier_model.calls == pipeline_calls + 1
+        assert [without_language(r) for r in batch] == [without_language(r) for r in single]
+        assert all("error" not in r for r in analyzer.analyze_with_sentence_transformer_batch(TEXTS))
+        assert analyzer.analyze_texts([]) == []
+
+
+def test_sklearn_model_is_vectorized_once():
+    """Modelul sklearn vectorizeaza tot lotul intr-un singur apel"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        analyzer = make_analyzer(cache_dir)
+        analyzer.is_simple_model = False
+        analyzer.vectorizer = FakeVectorizer()
+        analyzer.traditional_model = FakeModel()
+
+        batch = analyzer.analyze_with_traditional_ml_batch(TEXTS)
+        assert analyzer.vectorizer.calls == 1
+        assert batch == [analyzer.analyze_with_traditional_ml(text) for text in TEXTS]
+
+
+def test_errors_are_reported_per_item():
+    """O eroare a unui model apare in rezultatele fiecarui text, fara a opri lotul"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        analyzer = make_analyzer(cache_dir)
+
+        def failing_pipeline(inputs, **kwargs):
+            raise RuntimeError("model indisponibil")
+
+        analyzer.classifier_model = failing_pipeline
+        get_result_cache().clear()
+        results = analyzer.analyze_with_mbert_batch(TEXTS)
+        assert all('error' in r for r in results) and len(results) == len(TEXTS)
+
+        combined = analyzer.analyze_texts(TEXTS)
+        assert len(combined) == len(TEXTS)
+        assert all(r['verdict'] in ('fake', 'real') for r in combined)
+
+
+def test_results_with_model_errors_are_not_cached():
+    """Rezultatele obtinute cand un model a esuat nu raman in cache; cele complete raman"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        analyzer = make_analyzer(cache_dir)
+        working = analyzer.classifier_model
+
+        def failing_pipeline(inputs, **kwargs):
+            raise RuntimeError("model indisponibil")
+
+        analyzer.classifier_model = failing_pipeline
+        get_result_cache().clear()
+        analyzer.analyze_text(TEXTS[0])
+        analyzer.analyze_texts(TEXTS[1:])
+        assert all(get_result_cache().get(text, 'ml_only') is None for text in TEXTS)
+
+        analyzer.classifier_model = working
+        analyzer.analyze_text(TEXTS[0])
+        analyzer.analyze_texts(TEXTS[1:])
+        assert all(get_result_cache().get(text, 'ml_only') is not None for text in TEXTS)
+
+
+def test_lazy_sentence_model_is_published_after_preparation():
+    """Modelul incarcat lazy devine vizibil doar dupa ce indexurile de referinta si micro-batcher-ul sunt gata"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        analyzer = make_analyzer(cache_dir)
+        seen_during_preparation = []
+
+        class RecordingEncoder(HashingEncoder):
+            def encode(self, texts, **kwargs):
+                seen_during_preparation.append(analyzer._sentence_model)
+                return super().encode(texts, **kwargs)
+
+        encoder = RecordingEncoder()
+        analyzer._sentence_model = None
+        analyzer._encode_batcher = None
+        analyzer._reference_indexes = {}
+        analyzer._models = {'sentence_transformer': encoder}
+        analyzer._sentence_model_lock = threading.Lock()
+
+        cache_dir_before, corpus_before = embedding_index.EMBEDDING_CACHE_DIR, ml_analyzer.ENABLE_SEMANTIC_CORPUS
+        embedding_index.EMBEDDING_CACHE_DIR, ml_analyzer.ENABLE_SEMANTIC_CORPUS = cache_dir, False
+        try:
+            assert analyzer.sentence_model is encoder
+        finally:
+            embedding_index.EMBEDDING_CACHE_DIR, ml_analyzer.ENABLE_SEMANTIC_CORPUS = cache_dir_before, corpus_before
+
+        assert seen_during_preparation and all(model is None for model in seen_during_preparation)
+        assert set(analyzer._reference_indexes) == {'fake', 'real'}
+        assert analyzer._encode_batcher is not None
+        assert analyzer.get_model_readiness()['sentence_transformer']
+
+
+def test_concurrent_single_requests_share_model_calls():
+    """Analizele concurente ale unor texte separate sunt grupate de micro-batcher, cu aceleasi rezultate"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        analyzer = make_analyzer(cache_dir)
+        expected = [analyzer.analyze_with_sentence_transformer(text) for text in TEXTS]
+        expected_mbert = [analyzer.analyze_with_mbert(text) for text in TEXTS]
+
+        analyzer._encode_batcher = MicroBatcher('st', analyzer._encode_texts, max_batch_size=8, max_wait_ms=100)
+        analyzer._classify_batcher = MicroBatcher('mbert', analyzer._classify_texts, max_batch_size=8, max_wait_ms=100)
+        results = [None] * len(TEXTS)
+        barrier = threading.Barrier(len(TEXTS))
+
+        def worker(i):
+            barrier.wait()
+            results[i] = (analyzer.analyze_with_sentence_transformer(TEXTS[i]), analyzer.analyze_with_mbert(TEXTS[i]))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(TEXTS))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [r[0] for r in results] == expected
+        assert [r[1] for r in results] == expected_mbert
+        status = analyzer.get_batching_status()
+        assert status['enabled']
+        assert status['sentence_transformer']['items'] == len(TEXTS)
+        assert status['sentence_transformer']['batches'] < len(TEXTS)
+
+
+def test_texts_and_token_windows_are_batched_separately():
+    """Textele si ferestrele de tokeni trimise simultan ajung in loturi separate, fiecare la functia potrivita"""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        analyzer = make_analyzer(cache_dir)
+
+        class WindowPipeline(FakeSentimentPipeline):
+            def __call__(self, inputs, **kwargs):
+                assert all(isinstance(text, str) for text in inputs)
+                return super().__call__(inputs, **kwargs)
+
+            def classify_ids(self, windows, batch_size):
+                assert all(isinstance(window, list) for window in windows)
+                return [{'label': 'WINDOW', 'score': len(window) / 100} for window in windows]
+
+        analyzer.classifier_model = WindowPipeline()
+        analyzer._classify_batcher = MicroBatcher('mbert', analyzer._classify_texts, max_batch_size=8, max_wait_ms=100)
+        analyzer._window_batcher = MicroBatcher('mbert_windows', analyzer._classify_windows,
+                                                max_batch_size=8, max_wait_ms=100)
+        windows = [[1] * (i + 1) for i in range(len(TEXTS))]
+        results = {}
+        barrier = threading.Barrier(len(TEXTS) * 2)
+
+        def submit_text(i):
+            barrier.wait()
+            results[('text', i)] = analyzer._run_classifier([TEXTS[i]])[0]
+
+        def submit_window(i):
+            barrier.wait()
+            results[('window', i)] = analyzer._run_window_classifier([windows[i]])[0]
+
+        threads = [threading.Thread(target=target, args=(i,))
+                   for i in range(len(TEXTS)) for target in (submit_text, submit_window)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [results[('text', i)] for i in range(len(TEXTS))] == FakeSentimentPipeline()(TEXTS)
+        assert [results[('window', i)]['score'] for i in range(len(TEXTS))] == [0.01, 0.02, 0.03, 0.04]
+        status = analyzer.get_batching_status()
+        assert status['mbert']['items'] == status['mbert_windows']['items'] == len(TEXTS)
+
+
+if __name__ == "__main__":
+    test_batch_matches_single_analysis()
+    test_sklearn_model_is_vectorized_once()
+    test_errors_are_reported_per_item()
+    test_results_with_model_errors_are_not_cached()
+    test_lazy_sentence_model_is_published_after_preparation()
+    test_concurrent_single_requests_share_model_calls()
+    test_texts_and_token_windows_are_batched_separately()
+    print("✅ Toate testele pentru analiza pe loturi au trecut")
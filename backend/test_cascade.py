@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Teste pentru modul de analiza in cascada (HybridAnalyzer.analyze_cascade)
+"""
+
+import logging
+
+import hybrid_analyzer
+from async_runtime import run_async
+from hybrid_analyzer import CASCADE_TIERS, HybridAnalyzer
+from result_cache import get_result_cache
+
+
+class FakeML:
+    """Analizor ML fals: confidentele fiecarui nivel sunt fixate de test."""
+
+    def __init__(self, fast_confidence: float, ml_confidence: float):
+        self.fast_confidence = fast_confidence
+        self.ml_confidence = ml_confidence
+        self.calls = []
+
+    def analyze_fast(self, text):
+        self.calls.append('fast')
+        return {'verdict': 'fake', 'confidence': self.fast_confidence, 'explanation': 'nivel ieftin', 'source': 'fast'}
+
+    def analyze_text(self, text):
+        self.calls.append('ml')
+        return {'verdict': 'fake', 'confidence': self.ml_confidence, 'explanation': 'ML',
+                'detected_language': 'en', 'source': 'ml_combined'}
+
+    def _detect_language(self, text):
+        return 'en'
+
+
+class FakeAI:
+    def __init__(self):
+        self.calls = 0
+
+    async def analyze_text(self, text):
+        self.calls += 1
+        return {'verdict': 'real', 'confidence': 0.9, 'explanation': 'AI', 'detailed_results': []}
+
+
+def make_analyzer(fast_confidence: float, ml_confidence: float) -> HybridAnalyzer:
+    analyzer = HybridAnalyzer.__new__(HybridAnalyzer)
+    analyzer.logger = logging.getLogger(__name__)
+    analyzer.ml_analyzer = FakeML(fast_confidence, ml_confidence)
+    analyzer.ai_analyzer = FakeAI()
+    analyzer.weights = {'ai': 0.5, 'ml': 0.5}
+    analyzer.cascade_exits = {tier: 0 for tier in CASCADE_TIERS}
+    get_result_cache().clear()
+    return analyzer
+
+
+def test_confident_fast_tier_exits_early():
+    """Un nivel ieftin sigur opreste cascada: fara modele transformer si fara AI"""
+    analyzer = make_analyzer(0.99, 0.99)
+    result = run_async(analyzer.analyze_cascade("text clar"))
+
+    assert result['tiers_run'] == ['fast'] and result['exit_tier'] == 'fast'
+    assert analyzer.ml_analyzer.calls == ['fast'] and analyzer.ai_analyzer.calls == 0
+    assert result['verdict'] == 'fake' and result['confidence'] == 0.99
+    assert set(result['detailed_analysis']) == {'fast_analysis'}
+    assert analyzer.cascade_exits['fast'] == 1
+
+
+def test_ml_tier_runs_when_fast_tier_is_unsure():
+    """Modelele ML ruleaza doar cand nivelul ieftin este sub prag"""
+    analyzer = make_analyzer(0.5, 0.99)
+    result = run_async(analyzer.analyze_cascade("text incert"))
+
+    assert result['tiers_run'] == ['fast', 'ml']
+    assert analyzer.ai_analyzer.calls == 0
+    assert result['detected_language'] == 'en'
+
+
+def test_ai_tier_runs_last_and_uses_the_ensemble():
+    """Cand nici ML nu este sigur, se foloseste ansamblul AI + ML"""
+    analyzer = make_analyzer(0.5, 0.6)
+    result = run_async(analyzer.analyze_cascade("text dificil"))
+
+    assert result['tiers_run'] == list(CASCADE_TIERS)
+    assert analyzer.ai_analyzer.calls == 1
+    assert 'ai_ml_agreement' in result
+    assert set(result['detailed_analysis']) == {'fast_analysis', 'ml_analysis', 'ai_analysis'}
+
+
+def test_thresholds_and_cache():
+    """Pragurile sunt configurabile, iar un rezultat repetat vine din cache"""
+    analyzer = make_analyzer(0.8, 0.99)
+    original = hybrid_analyzer.CASCADE_FAST_THRESHOLD
+    hybrid_analyzer.CASCADE_FAST_THRESHOLD = 0.75
+    try:
+        first = run_async(analyzer.analyze_cascade("text de prag"))
+        second = run_async(analyzer.analyze_cascade("text de prag"))
+    finally:
+        hybrid_analyzer.CASCADE_FAST_THRESHOLD = original
+
+    assert first['tiers_run'] == ['fast']
+    assert second.get('cached') and analyzer.ml_analyzer.calls == ['fast']
+
+    batch = run_async(analyzer.analyze_cascade_texts(["a", "b"]))
+    assert [r['tiers_run'] for r in batch] == [['fast', 'ml'], ['fast', 'ml']]
+
+
+if __name__ == "__main__":
+    test_confident_fast_tier_exits_early()
+    test_ml_tier_runs_when_fast_tier_is_unsure()
+    test_ai_tier_runs_last_and_uses_the_ensemble()
+    test_thresholds_and_cache()
+    print("✅ Toate testele pentru analiza în cascadă au trecut")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Teste pentru extragerea continutului principal din paginile de stiri (content_extractor.py)
+"""
+
+import time
+
+from content_extractor import extract_article
+
+BODY = [
+    "Guvernul a anunțat marți un nou pachet de măsuri economice, care include reduceri de taxe pentru IMM-uri.",
+    "Potrivit ministrului de finanțe, măsurile vor intra în vigoare de la 1 ianuarie, după aprobarea în parlament.",
+    "Economiștii consultați de redacție spun că impactul asupra deficitului bugetar va fi limitat, dar vizibil.",
+]
+
+NEWS_PAGE = f"""<!DOCTYPE html>
+<html><head>
+<meta charset="utf-8">
+<title>Măsuri economice noi | Ziarul Exemplu</title>
+<meta property="og:title" content="Guvernul anunță măsuri economice noi">
+<meta property="article:published_time" content="2024-03-05T10:30:00Z">
+<script>window.tracking = {{}};</script>
+</head><body>
+<header><a href="/">Ziarul Exemplu</a><nav><a href="/politica">Politică</a> <a href="/economie">Economie</a></nav></header>
+<div class="cookie-banner">Folosim cookie-uri pentru a îmbunătăți experiența, pentru statistici și pentru reclame personalizate.</div>
+<div id="page">
+  <div class="article-body">
+    <h1>Guvernul anunță măsuri economice noi</h1>
+    <p>{BODY[0]}</p>
+    <h2>Calendarul aplicării</h2>
+    <p>{BODY[1]}</p>
+    <p>{BODY[2]}</p>
+  </div>
+  <div class="related">
+    <p><a href="/a">Alte știri economice din aceeași săptămână, pe care nu trebuie să le ratați</a></p>
+    <p><a href="/b">Cele mai citite articole ale zilei, selectate de redacția noastră</a></p>
+  </div>
+  <div id="comments">
+    <p>Comentariu: bineînțeles, încă o minciună a guvernului, nu credeți nimic din ce spun ei, toți sunt la fel!</p>
+  </div>
+</div>
+<footer><p>© Ziarul Exemplu. Toate drepturile rezervate, reproducerea interzisă fără acordul scris al redacției.</p></footer>
+</body></html>"""
+
+
+def test_keeps_only_the_article_body():
+    """Meniul, bannerul de cookie-uri, articolele similare, comentariile si subsolul sunt eliminate"""
+    article = extract_article(NEWS_PAGE.encode('utf-8'))
+    assert article['method'] == 'article'
+    assert article['text'] == " ".join([BODY[0], "Calendarul aplicării", BODY[1], BODY[2]])
+    for noise in ("cookie", "Comentariu", "Alte știri", "drepturile", "Politică"):
+        assert noise not in article['text']
+
+
+def test_title_and_publish_date():
+    """Titlul vine din og:title, iar data este normalizata in format ISO 8601"""
+    article = extract_article(NEWS_PAGE)
+    assert article['title'] == "Guvernul anunță măsuri economice noi"
+    assert article['published'] == "2024-03-05T10:30:00+00:00"
+
+
+def test_date_from_json_ld_and_time_element():
+    """Fara meta-taguri, data este cautata in JSON-LD si apoi in <time datetime>"""
+    json_ld = ('<html><head><script type="application/ld+json">'
+               '{"@type": "NewsArticle", "datePublished": "2023-11-02"}</script></head>'
+               '<body><h1>Titlu</h1><p>text</p></body></html>')
+    article = extract_article(json_ld)
+    assert article['published'] == "2023-11-02T00:00:00"
+    assert article['title'] == "Titlu"
+
+    time_element = '<html><body><time datetime="ieri, 12:00">ieri</time><p>text</p></body></html>'
+    assert extract_article(time_element)['published'] == "ieri, 12:00"
+
+
+def test_pages_without_an_article_fall_back_to_all_blocks():
+    """Paginile fara paragrafe lungi pastreaza comportamentul vechi (toate paragrafele si titlurile)"""
+    article = extract_article("<html><body><h1>Scurt</h1><p>Un rând.</p><p>Altul.</p></body></html>")
+    assert article['method'] == 'fallback'
+    assert article['text'] == "Scurt Un rând. Altul."
+    assert extract_article(b"")['text'] == ""
+
+
+def test_runs_in_a_few_milliseconds():
+    """O pagina mare (meniu lung, multe paragrafe si comentarii) se proceseaza rapid"""
+    menu = "".join(f'<li><a href="/c{i}">Categoria {i}</a></li>' for i in range(300))
+    paragraphs = "".join(f"<p>{BODY[i % 3]} Paragraful {i}.</p>" for i in range(150))
+    comments = "".join(f'<div class="comment"><p>{BODY[0]}</p></div>' for i in range(100))
+    page = (f"<html><body><nav><ul>{menu}</ul></nav><article>{paragraphs}</article>"
+            f"<section id='comments'>{comments}</section></body></html>").encode('utf-8')
+
+    extract_article(page)
+    start = time.perf_counter()
+    for _ in range(10):
+        article = extract_article(page)
+    elapsed = (time.perf_counter() - start) / 10
+    assert article['text'].count("Paragraful") == 150
+    assert "Categoria" not in article['text']
+    assert elapsed < 0.05, f"{elapsed * 1000:.1f} ms per pagina"
+
+
+if __name__ == "__main__":
+    test_keeps_only_the_article_body()
+    test_title_and_publish_date()
+    test_date_from_json_ld_and_time_element()
+    test_pages_without_an_article_fall_back_to_all_blocks()
+    test_runs_in_a_few_milliseconds()
+    print("✅ Toate testele pentru content_extractor au trecut")
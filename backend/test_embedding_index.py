@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Teste pentru indexul de embedding-uri de referinta (embedding_index.py)
+"""
+
+import tempfile
+
+import numpy as np
+
+from embedding_index import ReferenceEmbeddingIndex, corpus_fingerprint
+
+
+class HashingEncoder:
+    """Encoder determinist folosit in locul modelului Sentence Transformer."""
+
+    def __init__(self, dim: int = 16):
+        self.dim = dim
+        self.calls = 0
+
+    def encode(self, texts, **kwargs):
+        self.calls += 1
+        vectors = []
+        for text in texts:
+            rng = np.random.default_rng(int(corpus_fingerprint('seed', [text])[:8], 16))
+            vectors.append(rng.normal(size=self.dim))
+        return np.array(vectors)
+
+
+def cosine(a, b):
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+def test_similarities_match_cosine():
+    """Produsul matrice-vector trebuie sa fie identic cu similaritatea cosinus"""
+    texts = ["Breaking: aliens landed", "City council approves project", "Moon made of cheese"]
+    encoder = HashingEncoder()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        index = ReferenceEmbeddingIndex(texts, encoder, "test-model", cache_dir=cache_dir)
+        query = encoder.encode(["Some query"])[0]
+        sims = index.similarities(query / np.linalg.norm(query))
+        expected = [cosine(query, ref) for ref in encoder.encode(texts)]
+        assert np.allclose(sims, expected, atol=1e-5)
+
+
+def test_cache_is_reused_and_invalidated():
+    """Indexul se incarca din cache si se invalideaza la schimbarea corpusului sau modelului"""
+    texts = ["first sentence", "second sentence"]
+    with tempfile.TemporaryDirectory() as cache_dir:
+        encoder = HashingEncoder()
+        first = ReferenceEmbeddingIndex(texts, encoder, "test-model", cache_dir=cache_dir)
+        second = ReferenceEmbeddingIndex(texts, encoder, "test-model", cache_dir=cache_dir)
+        assert encoder.calls == 1
+        assert np.array_equal(np.asarray(first.matrix), np.asarray(second.matrix))
+
+        assert second.is_current(list(texts), "test-model")
+        assert not second.is_current(texts + ["third sentence"], "test-model")
+        assert not second.is_current(texts, "other-model")
+
+        ReferenceEmbeddingIndex(texts, encoder, "other-model", cache_dir=cache_dir)
+        assert encoder.calls == 2
+
+
+if __name__ == "__main__":
+    test_similarities_match_cosine()
+    test_cache_is_reused_and_invalidated()
+    print("✅ Toate testele pentru embedding_index au trecut")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Teste pentru extragerea frame-urilor de analiza (frame_sampler.py)
+"""
+
+import os
+import tempfile
+
+import cv2
+import numpy as np
+import pytest
+
+import frame_sampler
+from frame_sampler import FrameSampler, choose_sampler, ffmpeg_available, sample_indices
+
+
+def write_video(path: str, frame_count: int, fourcc: str = 'mp4v', size=(96, 64)):
+    """Videoclip sintetic: un zgomot fix deplasat cu 3 pixeli pe frame, deci frame-uri distincte."""
+    width, height = size
+    base = np.random.default_rng(0).integers(0, 255, (height, width, 3), dtype=np.uint8)
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*fourcc), 25, size)
+    for i in range(frame_count):
+        writer.write(np.roll(base, i * 3, axis=1))
+    writer.release()
+
+
+def test_sample_indices_are_evenly_spaced():
+    """Indicii sunt aceiasi ca inainte (np.linspace), fara duplicate"""
+    assert sample_indices(100, 5) == [0, 24, 49, 74, 99]
+    assert sample_indices(3, 50) == [0, 1, 2]
+    assert sample_indices(0, 50) == [] and sample_indices(10, 0) == []
+
+
+def test_sequential_and_seek_read_the_same_frames():
+    """Decodarea secventiala returneaza exact frame-urile obtinute prin salturi directe"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'clip.mp4')
+        write_video(path, 120)
+
+        seek = list(FrameSampler(path, max_frames=10, method='seek'))
+        sequential = FrameSampler(path, max_frames=10, method='sequential')
+        frames = list(sequential)
+        assert len(frames) == len(seek) == 10
+        assert all(np.array_equal(a, b) for a, b in zip(frames, seek))
+        assert sequential.info['total_frames'] == 120 and sequential.info['codec']
+
+
+def test_sampler_is_chosen_from_container_metadata():
+    """Videoclipurile scurte se decodeaza secvential; pasii mari folosesc salturi sau cadre cheie"""
+    short = {'total_frames': 300, 'duration': 12.0, 'codec': 'avc1', 'width': 1280, 'height': 720}
+    long = {'total_frames': 90000, 'duration': 3600.0, 'codec': 'avc1', 'width': 1280, 'height': 720}
+    intra = {'total_frames': 3000, 'duration': 120.0, 'codec': 'MJPG', 'width': 1280, 'height': 720}
+
+    original = frame_sampler.ffmpeg_available
+    try:
+        frame_sampler.ffmpeg_available = lambda: False
+        assert choose_sampler(short, 50) == 'sequential'
+        assert choose_sampler(long, 50) == 'seek'
+        assert choose_sampler(intra, 50) == 'seek'
+
+        frame_sampler.ffmpeg_available = lambda: True
+        assert choose_sampler(long, 50) == 'keyframes'
+        # MJPG nu are GOP: fiecare salt este ieftin, iar ffmpeg nu ar sari peste nimic
+        assert choose_sampler(intra, 50) == 'seek'
+        assert choose_sampler(short, 50) == 'sequential'
+        # Fără dimensiuni cunoscute, pipe-ul ffmpeg nu poate fi citit
+        assert choose_sampler(dict(long, width=0), 50) == 'seek'
+    finally:
+        frame_sampler.ffmpeg_available = original
+
+
+def test_unreadable_videos():
+    """Un fisier care nu este video ridica ValueError, iar extract_frames intoarce o lista goala"""
+    from video_analyzer import VideoAnalyzer
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'clip.mp4')
+        with open(path, 'wb') as f:
+            f.write(b'nu este video')
+        with pytest.raises(ValueError):
+            FrameSampler(path)
+        assert VideoAnalyzer().extract_frames(path) == []
+
+
+def test_keyframes_without_dimensions_fall_back_to_seek():
+    """Cu latimea sau inaltimea 0, cadrele cheie nu sunt citite (ar fi frame-uri goale la nesfarsit)"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'clip.mp4')
+        write_video(path, 30)
+
+        started = []
+        original = frame_sampler.subprocess.Popen
+        frame_sampler.subprocess.Popen = lambda *args, **kwargs: started.append(args)
+        try:
+            sampler = FrameSampler(path, max_frames=5, method='keyframes')
+            sampler.info['height'] = 0
+            frames = list(sampler)
+        finally:
+            frame_sampler.subprocess.Popen = original
+        assert not started
+        assert sampler.method == 'seek' and len(frames) == 5
+
+
+def test_keyframes_through_ffmpeg_pipe():
+    """ffmpeg extrage doar cadre cheie, cu dimensiunile videoclipului, direct din pipe"""
+    if not ffmpeg_available():
+        pytest.skip("ffmpeg nu este instalat")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'clip.mp4')
+        write_video(path, 600)
+
+        sampler = FrameSampler(path, max_frames=10, method='keyframes')
+        frames = list(sampler)
+        assert sampler.method == 'keyframes'
+        assert 1 <= len(frames) <= 10
+        assert all(frame.shape == (64, 96, 3) for frame in frames)
+        seek = list(FrameSampler(path, max_frames=600, method='seek'))
+        assert all(any(np.mean(cv2.absdiff(frame, other)) < 5 for other in seek) for frame in frames)
+
+
+if __name__ == "__main__":
+    test_sample_indices_are_evenly_spaced()
+    test_sequential_and_seek_read_the_same_frames()
+    test_sampler_is_chosen_from_container_metadata()
+    test_unreadable_videos()
+    test_keyframes_without_dimensions_fall_back_to_seek()
+    if ffmpeg_available():
+        test_keyframes_through_ffmpeg_pipe()
+    print("✅ Toate testele pentru frame_sampler au trecut")
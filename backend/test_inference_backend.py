@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Teste pentru backend-urile de inferenta (inference_backend.py).
+Folosesc un model BERT mic, creat local, deci nu descarca nimic.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+from inference_backend import (
+    BACKEND_ONNX_INT8, BACKEND_PYTORCH, BACKEND_TORCH_INT8, classifier_parity, embedding_model_id,
+    encoder_parity, load_sentence_encoder, load_text_classifier, model_size_bytes,
+)
+
+WORDS = ("the news is fake real breaking shocking scientists government truth study shows "
+         "moderate growth city council approves project share before delete").split()
+
+TEXTS = [
+    "breaking shocking truth the government is fake",
+    "scientists study shows moderate growth",
+    "city council approves project",
+    "share before delete the truth",
+]
+
+
+def make_tiny_bert(directory: str):
+    """Creeaza un model BERT mic de clasificare (5 etichete) si tokenizer-ul lui."""
+    import torch
+    from transformers import BertConfig, BertForSequenceClassification, BertTokenizer
+
+    vocab_path = os.path.join(directory, 'vocab.txt')
+    with open(vocab_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + WORDS))
+    labels = {i: f"{i + 1} stars" for i in range(5)}
+    bert_config = BertConfig(
+        vocab_size=len(WORDS) + 5, hidden_size=64, num_hidden_layers=2, num_attention_heads=4,
+        intermediate_size=128, num_labels=5, id2label=labels, label2id={v: k for k, v in labels.items()}
+    )
+    torch.manual_seed(0)
+    BertForSequenceClassification(bert_config).save_pretrained(directory)
+    BertTokenizer(vocab_path).save_pretrained(directory)
+    return directory
+
+
+@pytest.fixture(scope='module')
+def tiny_model():
+    with tempfile.TemporaryDirectory() as directory:
+        yield make_tiny_bert(directory)
+
+
+def test_torch_int8_encoder_matches_fp32(tiny_model):
+    """Embedding-urile int8 raman aproape identice cu cele fp32, iar greutatile sunt mai mici"""
+    reference = load_sentence_encoder(tiny_model, BACKEND_PYTORCH)
+    quantized = load_sentence_encoder(tiny_model, BACKEND_TORCH_INT8)
+
+    parity = encoder_parity(reference, quantized, TEXTS, batch_size=2)
+    assert parity['texts'] == len(TEXTS)
+    assert parity['min_cosine'] > 0.99
+    assert model_size_bytes(quantized) < model_size_bytes(reference)
+
+    single = quantized.encode(TEXTS[0])
+    assert single.ndim == 1
+
+
+def test_torch_int8_classifier_matches_fp32(tiny_model):
+    """Clasificatorul int8 pastreaza formatul pipeline-ului si etichetele fp32"""
+    reference = load_text_classifier(tiny_model, BACKEND_PYTORCH)
+    quantized = load_text_classifier(tiny_model, BACKEND_TORCH_INT8)
+
+    predictions = quantized(TEXTS, batch_size=2)
+    assert len(predictions) == len(TEXTS)
+    assert all({'label', 'score'} <= set(p) for p in predictions)
+
+    parity = classifier_parity(reference, quantized, TEXTS, batch_size=2)
+    assert parity['label_agreement'] == 1.0
+    assert parity['max_score_diff'] < 0.05
+
+
+def test_onnx_int8_backend(tiny_model):
+    """Exportul ONNX int8 se face o singura data si da aceleasi rezultate ca fp32"""
+    pytest.importorskip('onnxruntime')
+    with tempfile.TemporaryDirectory() as cache_dir:
+        reference = load_sentence_encoder(tiny_model, BACKEND_PYTORCH)
+        encoder = load_sentence_encoder(tiny_model, BACKEND_ONNX_INT8, cache_dir)
+        assert encoder_parity(reference, encoder, TEXTS)['min_cosine'] > 0.98
+        mtime = os.path.getmtime(encoder.path)
+        assert load_sentence_encoder(tiny_model, BACKEND_ONNX_INT8, cache_dir).path == encoder.path
+        assert os.path.getmtime(encoder.path) == mtime
+
+        classifier = load_text_classifier(tiny_model, BACKEND_ONNX_INT8, cache_dir)
+        parity = classifier_parity(load_text_classifier(tiny_model, BACKEND_PYTORCH), classifier, TEXTS)
+        assert parity['label_agreement'] == 1.0
+
+
+def test_backend_selection():
+    """Backend-urile necunoscute sunt refuzate; cache-ul de embedding-uri depinde de backend"""
+    with pytest.raises(ValueError):
+        load_sentence_encoder('model', 'gpu_fp4')
+    assert embedding_model_id('m', BACKEND_PYTORCH) == 'm'
+    assert embedding_model_id('m', BACKEND_TORCH_INT8) != embedding_model_id('m', BACKEND_PYTORCH)
+
+
+def test_parity_reports_disagreement():
+    """classifier_parity numara etichetele diferite"""
+    def positive(texts, **kwargs):
+        return [{'label': '5 stars', 'score': 0.9} for _ in texts]
+
+    def negative(texts, **kwargs):
+        return [[{'label': '1 star', 'score': 0.8}] for _ in texts]
+
+    assert classifier_parity(positive, negative, TEXTS)['label_agreement'] == 0.0
+    assert np.isclose(classifier_parity(positive, positive, TEXTS)['max_score_diff'], 0.0)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        model_dir = make_tiny_bert(directory)
+        test_torch_int8_encoder_matches_fp32(model_dir)
+        test_torch_int8_classifier_matches_fp32(model_dir)
+    test_backend_selection()
+    test_parity_reports_disagreement()
+    print("✅ Toate testele pentru inference_backend au trecut")
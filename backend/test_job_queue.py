@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Teste pentru coada de joburi SQLite (job_queue.py)
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+from job_queue import CANCELLED, FAILED, QUEUED, RUNNING, SUCCEEDED, JobQueue, PermanentJobError
+
+
+def make_queue(directory, **kwargs):
+    options = {'workers': 2, 'retry_backoff': 0.01, 'poll_interval': 0.05}
+    options.update(kwargs)
+    return JobQueue(db_path=os.path.join(directory, 'jobs.db'), **options)
+
+
+def wait_for(queue, job_id, statuses=(SUCCEEDED, FAILED, CANCELLED), timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id, include_result=True)
+        if job['status'] in statuses:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Jobul {job_id} nu a ajuns in {statuses}: {queue.get(job_id)}")
+
+
+def test_jobs_run_in_background_and_store_results():
+    """submit returneaza imediat, iar rezultatul este disponibil dupa executie"""
+    with tempfile.TemporaryDirectory() as directory:
+        queue = make_queue(directory)
+        release = threading.Event()
+
+        def echo(payload, job):
+            release.wait(5)
+            return {'echo': payload['text'], 'user': job.user_id}
+
+        queue.register('echo', echo)
+        queue.start()
+        try:
+            job = queue.submit('echo', {'text': 'salut'}, user_id=7)
+            assert job['status'] in (QUEUED, RUNNING) and job['user_id'] == '7'
+            release.set()
+            done = wait_for(queue, job['id'])
+            assert done['status'] == SUCCEEDED
+            assert done['result'] == {'echo': 'salut', 'user': '7'}
+            assert done['attempts'] == 1 and done['finished_at'] is not None
+            assert [j['id'] for j in queue.list(user_id=7)] == [job['id']]
+        finally:
+            queue.stop()
+
+
+def test_retries_with_backoff_then_failure():
+    """Erorile temporare sunt reincercate; erorile permanente si incercarile epuizate esueaza"""
+    with tempfile.TemporaryDirectory() as directory:
+        queue = make_queue(directory, max_attempts=3)
+        attempts = []
+
+        def flaky(payload, job):
+            attempts.append(job.attempt)
+            if len(attempts) < 3:
+                raise RuntimeError("serviciu indisponibil")
+            return {'ok': True}
+
+        def always_fails(payload, job):
+            raise RuntimeError("mereu")
+
+        def invalid(payload, job):
+            raise PermanentJobError("URL fara text")
+
+        queue.register('flaky', flaky)
+        queue.register('broken', always_fails)
+        queue.register('invalid', invalid)
+        queue.start()
+        try:
+            assert wait_for(queue, queue.submit('flaky', {})['id'])['status'] == SUCCEEDED
+            assert attempts == [1, 2, 3]
+
+            broken = wait_for(queue, queue.submit('broken', {})['id'])
+            assert broken['status'] == FAILED and broken['attempts'] == 3 and broken['error'] == "mereu"
+
+            bad = wait_for(queue, queue.submit('invalid', {})['id'])
+            assert bad['status'] == FAILED and bad['attempts'] == 1
+        finally:
+            queue.stop()
+
+
+def test_cancel_queued_and_running_jobs():
+    """Un job din coada este anulat imediat; unul in executie se opreste la urmatorul punct sigur"""
+    with tempfile.TemporaryDirectory() as directory:
+        queue = make_queue(directory, workers=1)
+        started = threading.Event()
+
+        def slow(payload, job):
+            started.set()
+            while True:
+                job.raise_if_cancelled()
+                time.sleep(0.01)
+
+        queue.register('slow', slow)
+        queue.start()
+        try:
+            running = queue.submit('slow', {})
+            waiting = queue.submit('slow', {})
+            assert started.wait(5)
+            assert queue.cancel(waiting['id'])['status'] == CANCELLED
+            queue.cancel(running['id'])
+            assert wait_for(queue, running['id'])['status'] == CANCELLED
+            assert queue.get(waiting['id'])['started_at'] is None
+        finally:
+            queue.stop()
+
+
+def test_per_user_concurrency_limit():
+    """Un utilizator nu poate ocupa mai multe thread-uri decat limita; ceilalti utilizatori nu asteapta"""
+    with tempfile.TemporaryDirectory() as directory:
+        queue = make_queue(directory, workers=3, per_user_concurrency=1)
+        running = {}
+        peak = {}
+        lock = threading.Lock()
+
+        def tracked(payload, job):
+            with lock:
+                running[job.user_id] = running.get(job.user_id, 0) + 1
+                peak[job.user_id] = max(peak.get(job.user_id, 0), running[job.user_id])
+            time.sleep(0.05)
+            with lock:
+                running[job.user_id] -= 1
+            return {}
+
+        queue.register('tracked', tracked)
+        jobs = [queue.submit('tracked', {}, user_id='a') for _ in range(4)]
+        jobs.append(queue.submit('tracked', {}, user_id='b'))
+        queue.start()
+        try:
+            for job in jobs:
+                assert wait_for(queue, job['id'])['status'] == SUCCEEDED
+            assert peak == {'a': 1, 'b': 1}
+        finally:
+            queue.stop()
+
+
+def test_abandoned_jobs_are_recovered():
+    """Un job ramas 'running' dupa oprirea procesului este reluat la expirarea lease-ului"""
+    with tempfile.TemporaryDirectory() as directory:
+        crashed = make_queue(directory, lease_seconds=0.05)
+        crashed.register('work', lambda payload, job: {'attempt': job.attempt})
+        job = crashed.submit('work', {})
+        assert crashed._claim()['id'] == job['id']  # preluat, dar procesul "se oprește"
+
+        restarted = make_queue(directory, lease_seconds=0.05)
+        restarted.register('work', lambda payload, job: {'attempt': job.attempt})
+        time.sleep(0.1)
+        restarted.start()
+        try:
+            done = wait_for(restarted, job['id'])
+            assert done['status'] == SUCCEEDED and done['result'] == {'attempt': 2}
+            assert restarted.get_status()['recovered'] == 1
+        finally:
+            restarted.stop()
+
+
+def test_progress_renews_the_lease_of_long_jobs():
+    """Un job care raporteaza progres nu este reluat, chiar daca dureaza mai mult decat lease-ul"""
+    with tempfile.TemporaryDirectory() as directory:
+        executions = []
+
+        def long_job(payload, job):
+            executions.append(job.attempt)
+            for step in range(8):
+                time.sleep(0.05)
+                job.report({'event': 'step', 'step': step})
+            return {'attempt': job.attempt}
+
+        queues = [make_queue(directory, workers=1, lease_seconds=0.15) for _ in range(2)]
+        for queue in queues:
+            queue.register('long', long_job)
+        job = queues[0].submit('long', {})
+        for queue in queues:
+            queue.start()
+        try:
+            done = wait_for(queues[0], job['id'])
+            assert done['status'] == SUCCEEDED and done['result'] == {'attempt': 1}
+            assert executions == [1] and done['attempts'] == 1
+            assert len(queues[0].events(job['id'])) == 8
+        finally:
+            for queue in queues:
+                queue.stop()
+
+
+def test_stale_attempt_cannot_overwrite_the_current_one():
+    """O incercare al carei lease a expirat nu mai scrie progres si nu suprascrie rezultatul incercarii curente"""
+    with tempfile.TemporaryDirectory() as directory:
+        def work(payload, job):
+            job.report({'event': 'step'})
+            return {'attempt': job.attempt}
+
+        stale = make_queue(directory, lease_seconds=0.05)
+        stale.register('work', work)
+        job = stale.submit('work', {})
+        row = stale._claim()  # încercarea 1 se blochează după preluare
+        time.sleep(0.1)
+
+        current = make_queue(directory, lease_seconds=60)
+        current.register('work', work)
+        current.start()
+        try:
+            done = wait_for(current, job['id'])
+        finally:
+            current.stop()
+        assert done['result'] == {'attempt': 2}
+
+        stale._execute(row)  # încercarea 1 își termină execuția abia acum
+        job = stale.get(job['id'], include_result=True)
+        assert job['status'] == SUCCEEDED and job['result'] == {'attempt': 2} and job['attempts'] == 2
+        assert [event['attempt'] for event in stale.events(job['id'])] == [2]
+        assert stale.get_status()['completed'] == 0
+
+
+def test_two_queues_on_one_database_run_each_job_once():
+    """Mai multe procese (aici, doua cozi) pe acelasi fisier nu executa un job de doua ori"""
+    with tempfile.TemporaryDirectory() as directory:
+        executions = []
+        lock = threading.Lock()
+
+        def record(payload, job):
+            with lock:
+                executions.append(payload['n'])
+            return {}
+
+        queues = [make_queue(directory, workers=2, per_user_concurrency=0) for _ in range(2)]
+        for queue in queues:
+            queue.register('record', record)
+        ids = [queues[0].submit('record', {'n': n})['id'] for n in range(20)]
+        for queue in queues:
+            queue.start()
+        try:
+            for job_id in ids:
+                wait_for(queues[0], job_id)
+            assert sorted(executions) == list(range(20))
+            assert queues[0].get_status()['jobs'][SUCCEEDED] == 20
+        finally:
+            for queue in queues:
+                queue.stop()
+
+
+if __name__ == "__main__":
+    test_jobs_run_in_background_and_store_results()
+    test_retries_with_backoff_then_failure()
+    test_cancel_queued_and_running_jobs()
+    test_per_user_concurrency_limit()
+    test_abandoned_jobs_are_recovered()
+    test_progress_renews_the_lease_of_long_jobs()
+    test_stale_attempt_cannot_overwrite_the_current_one()
+    test_two_queues_on_one_database_run_each_job_once()
+    print("✅ Toate testele pentru job_queue au trecut")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Teste pentru registrul de keywords (keyword_registry.py)
+"""
+
+import json
+import os
+import tempfile
+
+from keyword_registry import (SOURCE_FALLBACK, SOURCE_FILE, KeywordFileError, KeywordRegistry,
+                              parse_keywords_file, strip_json_comments)
+
+KEYWORDS_WITH_COMMENTS = """{
+  // comentariu pe linie
+  "fake_keywords": ["Breaking", "http://fake.example", "breaking", /* bloc */ "hoax"],
+  "real_keywords": ["according to"]
+}"""
+
+
+def write_keywords(path, fake, real, mtime):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'fake_keywords': fake, 'real_keywords': real}, f)
+    os.utime(path, (mtime, mtime))
+
+
+def test_comments_are_stripped_outside_strings():
+    """Comentariile sunt eliminate, dar '//' din interiorul sirurilor ramane"""
+    data = json.loads(strip_json_comments(KEYWORDS_WITH_COMMENTS))
+    assert "http://fake.example" in data['fake_keywords']
+
+    fake, real = parse_keywords_file(KEYWORDS_WITH_COMMENTS)
+    assert fake == ("breaking", "http://fake.example", "hoax")
+    assert real == ("according to",)
+
+
+def test_invalid_files_are_rejected():
+    """Structurile invalide ridica KeywordFileError"""
+    for content in ['[1, 2]', '{"fake_keywords": "x", "real_keywords": []}',
+                    '{"fake_keywords": ["a", 3], "real_keywords": ["b"]}',
+                    '{"fake_keywords": ["a"]}', '{"fake_keywords": ["a"], "real_keywords": [" "]}', '{']:
+        try:
+            parse_keywords_file(content)
+        except KeywordFileError:
+            continue
+        raise AssertionError(f"Fisier acceptat gresit: {content}")
+
+
+def test_reload_on_mtime_change():
+    """Registrul reincarca fisierul doar cand mtime se schimba si pastreaza snapshot-ul la erori"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'keywords.json')
+        write_keywords(path, ['hoax'], ['study'], 1000)
+        registry = KeywordRegistry(path, reload_interval=0)
+        first = registry.snapshot()
+        assert first.source == SOURCE_FILE
+        assert first.matcher.counts('a hoax study')['fake_keywords'] == 1
+        assert registry.snapshot() is first
+
+        write_keywords(path, ['hoax', 'aliens'], ['study'], 2000)
+        second = registry.snapshot()
+        assert second is not first and second.fake_keywords == ('hoax', 'aliens')
+        assert first.fake_keywords == ('hoax',)
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{"fake_keywords": [')
+        os.utime(path, (3000, 3000))
+        assert registry.snapshot() is second
+        assert registry.get_status()['last_error']
+
+        os.remove(path)
+        assert registry.snapshot().source == SOURCE_FALLBACK
+        assert registry.get_status()['source'] == SOURCE_FALLBACK
+
+
+def test_repository_keywords_file_is_valid():
+    """enhanced_keywords.json din repository este incarcat din fisier, nu din fallback"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'enhanced_keywords.json')
+    registry = KeywordRegistry(path)
+    assert registry.get_status()['source'] == SOURCE_FILE
+    assert registry.get_status()['fake_keywords'] > 0
+
+
+if __name__ == "__main__":
+    test_comments_are_stripped_outside_strings()
+    test_invalid_files_are_rejected()
+    test_reload_on_mtime_change()
+    test_repository_keywords_file_is_valid()
+    print("✅ Toate testele pentru keyword_registry au trecut")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Teste pentru planificatorul de micro-loturi (micro_batcher.py)
+"""
+
+import threading
+import time
+
+from micro_batcher import MicroBatcher
+
+
+class RecordingModel:
+    """Model fals care inregistreaza dimensiunea fiecarui lot primit."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.batch_sizes = []
+
+    def __call__(self, items):
+        self.batch_sizes.append(len(items))
+        time.sleep(self.delay)
+        return [item * 2 for item in items]
+
+
+def run_concurrently(batcher, values):
+    results = {}
+    barrier = threading.Barrier(len(values))
+
+    def worker(value):
+        barrier.wait()
+        results[value] = batcher.submit(value)
+
+    threads = [threading.Thread(target=worker, args=(value,)) for value in values]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_requests_are_coalesced():
+    """Cererile concurente sunt grupate in loturi, iar fiecare apelant primeste propriul rezultat"""
+    model = RecordingModel(delay=0.01)
+    batcher = MicroBatcher('test', model, max_batch_size=8, max_wait_ms=50)
+    values = list(range(20))
+
+    results = run_concurrently(batcher, values)
+
+    assert results == {value: value * 2 for value in values}
+    assert sum(model.batch_sizes) == len(values)
+    assert len(model.batch_sizes) < len(values)
+    assert max(model.batch_sizes) <= 8
+
+    status = batcher.get_status()
+    assert status['items'] == len(values)
+    assert status['batches'] == len(model.batch_sizes)
+    assert sum(status['batch_size_histogram'].values()) == status['batches']
+    assert status['queue_depth'] == 0
+
+
+def test_submit_many_keeps_order_and_splits_batches():
+    """Un lot mai mare decat dimensiunea maxima este impartit, iar ordinea rezultatelor se pastreaza"""
+    model = RecordingModel()
+    batcher = MicroBatcher('test', model, max_batch_size=4, max_wait_ms=1)
+
+    assert batcher.submit_many(list(range(10))) == [value * 2 for value in range(10)]
+    assert batcher.submit_many([]) == []
+    assert all(size <= 4 for size in model.batch_sizes)
+
+
+def test_errors_reach_every_caller_in_the_batch():
+    """Eroarea functiei de lot este propagata tuturor apelantilor, iar planificatorul continua"""
+    calls = {'count': 0}
+
+    def flaky(items):
+        calls['count'] += 1
+        if calls['count'] == 1:
+            raise ValueError("model indisponibil")
+        return items
+
+    batcher = MicroBatcher('test', flaky, max_batch_size=4, max_wait_ms=1)
+    try:
+        batcher.submit_many([1, 2, 3])
+    except ValueError as e:
+        assert str(e) == "model indisponibil"
+    else:
+        raise AssertionError("Exceptia nu a fost propagata")
+
+    assert batcher.submit(5) == 5
+
+
+def test_wrong_result_count_is_an_error():
+    """Un numar gresit de rezultate nu este distribuit apelantilor"""
+    batcher = MicroBatcher('test', lambda items: items[:-1], max_batch_size=4, max_wait_ms=1)
+    try:
+        batcher.submit_many([1, 2])
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("Numarul gresit de rezultate nu a fost detectat")
+
+
+def test_single_request_waits_at_most_max_wait():
+    """O cerere singura nu asteapta mult peste max_wait_ms"""
+    batcher = MicroBatcher('test', RecordingModel(), max_batch_size=64, max_wait_ms=20)
+    batcher.submit(0)  # pornește thread-ul de lucru
+
+    start = time.perf_counter()
+    assert batcher.submit(1) == 2
+    assert time.perf_counter() - start < 0.5
+
+
+if __name__ == "__main__":
+    test_concurrent_requests_are_coalesced()
+    test_submit_many_keeps_order_and_splits_batches()
+    test_errors_reach_every_caller_in_the_batch()
+    test_wrong_result_count_is_an_error()
+    test_single_request_waits_at_most_max_wait()
+    print("✅ Toate testele pentru micro_batcher au trecut")
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Teste pentru registrul de modele (model_registry.py) si incarcarea lazy din MLAnalyzer
+"""
+
+import tempfile
+import threading
+import time
+
+import embedding_index
+import ml_analyzer
+from ml_analyzer import MLAnalyzer
+from model_registry import ModelRegistry, STATE_FAILED, STATE_NOT_LOADED, STATE_READY
+from test_embedding_index import HashingEncoder
+
+
+class SlowLoader:
+    """Loader fals care numara apelurile si dureaza putin."""
+
+    def __init__(self, value, delay: float = 0.05):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.value
+
+
+def test_model_is_loaded_once_under_concurrency():
+    """Apelurile concurente asteapta aceeasi incarcare si primesc aceeasi instanta"""
+    registry = ModelRegistry()
+    loader = SlowLoader(object())
+    registry.register('model', loader)
+    assert registry.get_status()['model']['state'] == STATE_NOT_LOADED
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get('model'))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == 1
+    assert all(result is loader.value for result in results)
+    assert registry.is_ready('model')
+    assert registry.get_status()['model']['load_seconds'] > 0
+
+
+def test_failed_load_is_reported_and_not_retried():
+    """Un model care nu se incarca este marcat 'failed' pana la reset()"""
+    registry = ModelRegistry()
+    calls = {'count': 0}
+
+    def failing():
+        calls['count'] += 1
+        raise OSError("model lipsă")
+
+    registry.register('broken', failing)
+    assert registry.get('broken') is None
+    assert registry.get('broken') is None
+    assert calls['count'] == 1
+    status = registry.get_status()['broken']
+    assert status['state'] == STATE_FAILED and 'model lipsă' in status['error']
+
+    registry.reset('broken')
+    assert registry.get('broken') is None
+    assert calls['count'] == 2
+
+
+def test_preload_runs_loaders_in_parallel():
+    """preload() incarca modelele in fundal, in paralel"""
+    registry = ModelRegistry(load_threads=2)
+    registry.register('a', SlowLoader('a', delay=0.2))
+    registry.register('b', SlowLoader('b', delay=0.2))
+
+    start = time.perf_counter()
+    futures = registry.preload(['a', 'b', 'necunoscut'])
+    assert [future.result() for future in futures] == ['a', 'b']
+    assert time.perf_counter() - start < 0.35
+    assert all(state['state'] == STATE_READY for state in registry.get_status().values())
+
+
+def test_analyzer_loads_transformers_on_first_use():
+    """MLAnalyzer nu incarca modelele transformer la constructie, ci la primul acces"""
+    registry = ModelRegistry()
+    encoder = SlowLoader(HashingEncoder(), delay=0)
+    registry.register('sentence_transformer', encoder)
+    registry.register('mbert', SlowLoader(None, delay=0))
+
+    analyzer = MLAnalyzer.__new__(MLAnalyzer)
+    analyzer.logger = ml_analyzer.logging.getLogger(__name__)
+    analyzer._reference_indexes = {}
+    analyzer.semantic_corpus = None
+    analyzer._sentence_model_lock = threading.Lock()
+    analyzer._classifier_model_lock = threading.Lock()
+    analyzer._models = registry
+    analyzer.traditional_model = None
+    analyzer.known_fake_news = ["Breaking: aliens landed in New York City last night."]
+    analyzer.known_real_news = ["City council approves new infrastructure project."]
+
+    assert analyzer.get_model_readiness()['sentence_transformer'] is False
+    assert encoder.calls == 0
+
+    assert analyzer.sentence_model is encoder.value
+    assert analyzer.sentence_model is encoder.value
+    assert encoder.calls == 1
+    assert analyzer.get_model_readiness()['sentence_transformer'] is True
+    assert set(analyzer._reference_indexes) == {'fake', 'real'}
+
+    # Un loader care returnează None lasă modelul indisponibil
+    assert analyzer.classifier_model is None
+    assert analyzer.analyze_with_mbert("text")['error']
+
+
+def test_models_are_prepared_independently_and_published_last():
+    """mBERT se incarca in timp ce Sentence Transformer-ul este pregatit; fiecare model devine vizibil dupa batcher-e"""
+    preparing, release = threading.Event(), threading.Event()
+
+    class BlockingEncoder(HashingEncoder):
+        def encode(self, texts, **kwargs):
+            preparing.set()
+            release.wait(5)
+            return super().encode(texts, **kwargs)
+
+    pipeline = object()
+    registry = ModelRegistry()
+    registry.register('sentence_transformer', SlowLoader(BlockingEncoder(), delay=0))
+    registry.register('mbert', SlowLoader(pipeline, delay=0))
+
+    analyzer = MLAnalyzer.__new__(MLAnalyzer)
+    analyzer.logger = ml_analyzer.logging.getLogger(__name__)
+    analyzer._reference_indexes = {}
+    analyzer.semantic_corpus = None
+    analyzer._sentence_model_lock = threading.Lock()
+    analyzer._classifier_model_lock = threading.Lock()
+    analyzer._models = registry
+    analyzer.known_fake_news = ["Breaking: aliens landed in New York City last night."]
+    analyzer.known_real_news = ["City council approves new infrastructure project."]
+
+    visible_at_batcher_creation = []
+    original_batcher, original_corpus = ml_analyzer.MicroBatcher, ml_analyzer.ENABLE_SEMANTIC_CORPUS
+
+    def recording_batcher(name, *args, **kwargs):
+        visible_at_batcher_creation.append((name, analyzer._classifier_model, analyzer._sentence_model))
+        return original_batcher(name, *args, **kwargs)
+
+    ml_analyzer.MicroBatcher, ml_analyzer.ENABLE_SEMANTIC_CORPUS = recording_batcher, False
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            original_cache_dir = embedding_index.EMBEDDING_CACHE_DIR
+            embedding_index.EMBEDDING_CACHE_DIR = cache_dir
+            try:
+                loading = threading.Thread(target=lambda: analyzer.sentence_model)
+                loading.start()
+                assert preparing.wait(5)
+                # Sentence Transformer-ul este încă în pregătire, dar mBERT nu îl așteaptă
+                assert analyzer.classifier_model is pipeline
+                assert analyzer._sentence_model is None
+                release.set()
+                loading.join(5)
+            finally:
+                embedding_index.EMBEDDING_CACHE_DIR = original_cache_dir
+    finally:
+        ml_analyzer.MicroBatcher, ml_analyzer.ENABLE_SEMANTIC_CORPUS = original_batcher, original_corpus
+
+    assert analyzer._sentence_model is not None
+    assert analyzer._classify_batcher is not None and analyzer._window_batcher is not None
+    for name, classifier, sentence in visible_at_batcher_creation:
+        assert (sentence if name == 'sentence_transformer' else classifier) is None
+    assert {name for name, _, _ in visible_at_batcher_creation} == {'mbert', 'mbert_windows', 'sentence_transformer'}
+
+
+if __name__ == "__main__":
+    test_model_is_loaded_once_under_concurrency()
+    test_failed_load_is_reported_and_not_retried()
+    test_preload_runs_loaders_in_parallel()
+    test_analyzer_loads_transformers_on_first_use()
+    test_models_are_prepared_independently_and_published_last()
+    print("✅ Toate testele pentru model_registry au trecut")
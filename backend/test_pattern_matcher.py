@@ -0,0 +1,552 @@
+#!/usr/bin/env python3
+"""
+Teste de paritate pentru potrivirea multi-pattern (pattern_matcher.py, text_patterns.py).
+Rezultatele euristicilor din MLAnalyzer trebuie sa fie identice cu implementarea
+anterioara, care scana fiecare pattern separat cu 'pattern in text'.
+"""
+
+import json
+import os
+
+from pattern_matcher import MultiPatternMatcher
+from text_patterns import (CLASSIFIER_CATEGORIES, FALLBACK_FAKE_KEYWORDS,
+                           FALLBACK_REAL_KEYWORDS, SUBTLE_PATTERN_MATCHER)
+from ml_analyzer import MLAnalyzer
+
+
+# Implementarile anterioare, pastrate ca referinta pentru paritate
+
+def legacy_detect_subtle_patterns(text):
+    """Detectează pattern-uri subtile de fake news cu analiză îmbunătățită"""
+    text_lower = text.lower()
+
+    # ÎMBUNĂTĂȚIRE MAJORĂ: Pattern-uri pentru afirmații absurde cu aparență științifică
+    absurd_scientific_claims = [
+        # Afirmații medicale absurde
+        'vindecă cancerul în', 'elimină complet diabetul', 'vindecă orice boală',
+        'crește iq-ul cu', 'dezvoltă puteri', 'puteri telepatice', 'puteri supranaturale',
+        'controlează vremea', 'controlează timpul', 'controlează gravitația',
+        'să trăiască 200', 'să trăiască 150', 'să trăiască 100 de ani',
+        'energie infinită', 'mișcare perpetuă', 'teleportare', 'citește gândurile',
+        'vindecă în 3 zile', 'vindecă în 48 ore', 'vindecă instant',
+        'elimină complet', 'vindecă 100%', 'funcționează 100%',
+        'prelungește viața cu', 'crește viața cu', 'adaugă ani de viață',
+
+        # Afirmații tehnologice absurde
+        'cipuri microscopice', 'controlul mental', 'mind control',
+        'cipuri în apă', 'cipuri în vaccin', 'tracking chips',
+        'tehnologie secretă', 'arme secrete', 'experimente secrete',
+
+        # Combinații absurde cu substanțe comune
+        'bicarbonatul vindecă', 'oțetul vindecă', 'mierea vindecă totul',
+        'apa vindecă', 'aerul vindecă', 'soarele vindecă',
+        'berea crește', 'cafeaua vindecă', 'ceaiul elimină',
+        'mirositul florilor', 'dormitul cu telefonul', 'privitul la',
+
+        # Versiuni în engleză
+        'cures cancer in', 'eliminates diabetes completely', 'increases iq by',
+        'develops telepathic powers', 'live 200 years', 'live 150 years',
+        'microscopic chips', 'mind control chips', 'secret technology'
+    ]
+
+    # Pattern-uri de exagerare (păstrate din versiunea anterioară)
+    exaggeration_patterns = [
+        'complet', 'total', 'absolut', 'perfect', 'exact', '100%', 'garantat',
+        'revoluționar', 'incredibil', 'șocant', 'uimitor', 'fantastic',
+        'completely', 'totally', 'absolutely', 'perfectly', 'guaranteed',
+        'revolutionary', 'incredible', 'shocking', 'amazing', 'fantastic'
+    ]
+
+    # ÎMBUNĂTĂȚIRE: Surse false cu aparență credibilă
+    fake_credible_sources = [
+        # Instituții false care sună credibil
+        'institutul internațional de', 'centrul mondial pentru', 'fundația globală',
+        'organizația mondială de', 'institutul avansat de', 'centrul de cercetări avansate',
+        'laboratorul secret', 'institutul secret', 'centrul confidențial',
+        'international institute of', 'global center for', 'advanced research center',
+        'world organization of', 'secret laboratory', 'confidential center',
+
+        # Autorități vagi cu universități reale (red flag când e combinat cu afirmații absurde)
+        'cercetătorii de la harvard', 'experții de la mit', 'oamenii de știință de la stanford',
+        'researchers from harvard', 'experts from mit', 'scientists from stanford',
+
+        # Pattern-uri de autoritate falsă
+        'experții anonimi', 'surse anonime', 'informatori din interior',
+        'doctorii ascund', 'medicii nu vor să știi', 'industria ascunde',
+        'anonymous experts', 'anonymous sources', 'inside sources',
+        'doctors hide', 'medical industry hides', 'big pharma blocks'
+    ]
+
+    # Pattern-uri de conspirație (îmbunătățite)
+    conspiracy_patterns = [
+        'big pharma', 'industria farmaceutică', 'industria medicală',
+        'guvernul ascunde', 'guvernele interzic', 'mass-media refuză',
+        'industria tech suprimă', 'companiile blochează', 'corporațiile ascund',
+        'agenda ascunsă', 'complot mondial', 'conspirația medicală',
+        'government hides', 'governments ban', 'mass media refuses',
+        'tech industry suppresses', 'companies block', 'corporations hide',
+        'hidden agenda', 'global conspiracy', 'medical conspiracy'
+    ]
+
+    # Pattern-uri de urgență artificială
+    urgency_patterns = [
+        'urgent!', 'breaking!', 'ultimă oră!', 'atenție!', 'alertă!',
+        'acționează acum', 'nu aștepta', 'timpul se scurge', 'înainte să fie prea târziu',
+        'urgent!', 'breaking!', 'attention!', 'alert!',
+        'act now', 'don\'t wait', 'time running out', 'before it\'s too late'
+    ]
+
+    # ÎMBUNĂTĂȚIRE: Detectează știința falsă cu aparență credibilă
+    fake_science_patterns = [
+        # Combinații periculoase: instituție credibilă + afirmație absurdă
+        'harvard.*vindecă', 'mit.*elimină', 'stanford.*crește',
+        'universitatea.*puteri', 'cercetătorii.*secret', 'studiul.*ascuns',
+        'journal.*vindecă', 'research.*elimină', 'scientists.*secret',
+
+        # Afirmații medicale false cu aparență științifică
+        'studiile dovedesc că.*vindecă', 'cercetarea confirmă că.*elimină',
+        'analiza arată că.*crește', 'datele demonstrează că.*dezvoltă',
+        'research proves.*cures', 'studies confirm.*eliminates',
+        'analysis shows.*increases', 'data demonstrates.*develops',
+
+        # Combinații de cuvinte științifice cu afirmații absurde
+        'metodă științifică.*secret', 'descoperire medicală.*ascuns',
+        'breakthrough.*hidden', 'discovery.*suppressed'
+    ]
+
+    # Calculează scorurile pentru fiecare categorie (îmbunătățit)
+    absurd_score = sum(3 for pattern in absurd_scientific_claims if pattern in text_lower)  # Scor mare pentru absurdități
+    exaggeration_score = sum(1 for pattern in exaggeration_patterns if pattern in text_lower)
+    fake_credible_score = sum(2 for pattern in fake_credible_sources if pattern in text_lower)
+    conspiracy_score = sum(1 for pattern in conspiracy_patterns if pattern in text_lower)
+    urgency_score = sum(1 for pattern in urgency_patterns if pattern in text_lower)
+    fake_science_score = sum(2 for pattern in fake_science_patterns if pattern in text_lower)
+
+    # ÎMBUNĂTĂȚIRE: Detectează combinații generale suspecte de pattern-uri
+    combination_bonus = 0
+
+    # BONUS MAJOR: Afirmații absurde cu surse credibile (cel mai periculos pattern)
+    if absurd_score > 0 and ('harvard' in text_lower or 'mit' in text_lower or 'stanford' in text_lower or 'cercetătorii' in text_lower):
+        combination_bonus += 3.0  # Bonus foarte mare
+
+    # Bonus pentru combinația autoritate vagă + afirmații exagerate
+    if fake_science_score > 0 and exaggeration_score > 0:
+        combination_bonus += 2.0
+
+    # Bonus pentru urgență + autoritate falsă
+    if urgency_score > 0 and fake_credible_score > 0:
+        combination_bonus += 1.5
+
+    # Bonus pentru conspirație + exagerare
+    if conspiracy_score > 0 and exaggeration_score > 0:
+        combination_bonus += 1.4
+
+    # Bonus pentru pattern-uri multiple de exagerare
+    if exaggeration_score >= 3:
+        combination_bonus += 1.0
+
+    # ÎMBUNĂTĂȚIRE: Calculează scorul total de suspiciune cu bonusuri
+    total_fake_indicators = (
+        absurd_score * 3.5 +            # Afirmațiile absurde sunt cel mai important indicator
+        exaggeration_score * 1.8 +      # Exagerările sunt foarte suspecte
+        fake_credible_score * 2.5 +     # Sursele false cu aparență credibilă
+        urgency_score * 1.5 +           # Urgența artificială e suspectă
+        conspiracy_score * 2.0 +        # Teoriile conspirației sunt foarte suspecte
+        fake_science_score * 2.8 +      # Știința falsă e foarte suspectă
+        combination_bonus               # Bonus pentru combinații periculoase
+    )
+
+    # Pattern-uri pentru credibilitate reală (îmbunătățite)
+    credible_patterns = [
+        # Surse oficiale concrete
+        'ministerul', 'primăria', 'guvernul român', 'parlamentul',
+        'comisia europeană', 'organizația mondială a sănătății',
+        'ministry', 'government', 'parliament', 'european commission',
+        'world health organization', 'official statement',
+
+        # Limbaj științific real
+        'conform studiului', 'potrivit cercetării', 'datele arată',
+        'statisticile indică', 'analiza dezvăluie', 'raportul confirmă',
+        'according to study', 'research indicates', 'data shows',
+        'statistics indicate', 'analysis reveals', 'report confirms',
+
+        # Contexte normale de știri
+        'ieri', 'astăzi', 'săptămâna trecută', 'luna aceasta',
+        'prețul', 'temperatura', 'traficul', 'lucrările',
+        'yesterday', 'today', 'last week', 'this month',
+        'price', 'temperature', 'traffic', 'construction'
+    ]
+
+    credible_score = sum(1 for pattern in credible_patterns if pattern in text_lower)
+
+    # ÎMBUNĂTĂȚIRE: Calculează scorurile finale cu sensibilitate crescută pentru absurdități
+    fake_score = min(total_fake_indicators / 12.0, 0.8)  # Normalizat la 0-0.8 (mai sensibil pentru absurdități)
+    real_score = min(credible_score / 5.0, 0.3)  # Normalizat la 0-0.3
+
+    # ÎMBUNĂTĂȚIRE: Calculează bonus de confidență îmbunătățit
+    confidence_bonus = min(total_fake_indicators / 15.0, 0.2)  # Bonus mai mare pentru detectarea absurdităților
+
+    # Bonus suplimentar pentru fake news foarte subtile cu afirmații absurde
+    if absurd_score > 0:
+        confidence_bonus += 0.1  # Bonus mare pentru absurdități
+    if fake_science_score > 0 and exaggeration_score > 0:
+        confidence_bonus += 0.08
+    if combination_bonus > 2.0:  # Combinații foarte periculoase
+        confidence_bonus += 0.12
+
+    return {
+        'fake_score': fake_score,
+        'real_score': real_score,
+        'confidence_bonus': confidence_bonus,
+        'pattern_details': {
+            'absurd_claims': absurd_score,
+            'exaggeration': exaggeration_score,
+            'fake_credible_sources': fake_credible_score,
+            'artificial_urgency': urgency_score,
+            'conspiracy': conspiracy_score,
+            'fake_science': fake_science_score,
+            'credible_indicators': credible_score,
+            'combination_bonus': combination_bonus
+        }
+    }
+
+
+def legacy_analyze_linguistic_manipulation(text):
+    """Analizează manipularea lingvistică în text"""
+    manipulation_score = 0.0
+    flags = []
+    reasoning = []
+
+    # Verifică lungimea propozițiilor (propoziții foarte lungi pot indica manipulare)
+    sentences = text.split('.')
+    avg_sentence_length = sum(len(s.split()) for s in sentences) / max(len(sentences), 1)
+
+    if avg_sentence_length > 25:
+        manipulation_score += 0.1
+        flags.append('long_sentences')
+        reasoning.append('Propoziții neobișnuit de lungi')
+
+    # Verifică folosirea excesivă a adjectivelor superlative și de intensificare
+    superlatives = ['best', 'worst', 'most', 'least', 'greatest', 'smallest', 'highest', 'lowest',
+                   'only', 'perfect', 'ultimate', 'absolute', 'complete', 'total', 'entire',
+                   'cel mai bun', 'cel mai rău', 'cel mai mare', 'cel mai mic', 'cel mai înalt',
+                   'singurul', 'perfect', 'ultim', 'absolut', 'complet', 'total']
+    superlative_count = sum(1 for word in superlatives if word in text.lower())
+
+    if superlative_count > 2:  # Prag redus pentru mai multă sensibilitate
+        manipulation_score += 0.18
+        flags.append('excessive_superlatives')
+        reasoning.append(f'Limbaj superlativ exagerat ({superlative_count} termeni)')
+
+    # Verifică cuvinte emoționale puternice și de manipulare
+    emotional_words = ['shocking', 'amazing', 'incredible', 'unbelievable', 'devastating', 'terrifying',
+                      'stunning', 'mind-blowing', 'extraordinary', 'phenomenal', 'miraculous',
+                      'outrageous', 'scandalous', 'explosive', 'bombshell', 'sensational',
+                      'șocant', 'uimitor', 'incredibil', 'de necrezut', 'devastator', 'terifiant',
+                      'extraordinar', 'fenomenal', 'miraculos', 'scandulos', 'senzațional']
+    emotional_count = sum(1 for word in emotional_words if word in text.lower())
+
+    if emotional_count > 1:  # Prag redus pentru mai multă sensibilitate
+        manipulation_score += 0.15
+        flags.append('emotional_manipulation')
+        reasoning.append(f'Limbaj emoțional manipulativ ({emotional_count} cuvinte)')
+
+    # Verifică adverbe de intensificare excesivă
+    intensifiers = ['extremely', 'incredibly', 'absolutely', 'completely', 'totally', 'perfectly',
+                   'dramatically', 'significantly', 'remarkably', 'extraordinarily', 'phenomenally',
+                   'extrem de', 'incredibil de', 'absolut', 'complet', 'total', 'perfect',
+                   'dramatic', 'semnificativ', 'remarcabil', 'extraordinar']
+    intensifier_count = sum(1 for word in intensifiers if word in text.lower())
+
+    if intensifier_count > 2:
+        manipulation_score += 0.12
+        flags.append('excessive_intensifiers')
+        reasoning.append(f'Adverbe de intensificare excesive ({intensifier_count})')
+
+    # Verifică folosirea excesivă a majusculelor
+    caps_ratio = sum(1 for c in text if c.isupper()) / max(len(text), 1)
+    if caps_ratio > 0.1:  # Peste 10% majuscule
+        manipulation_score += 0.08
+        flags.append('excessive_caps')
+        reasoning.append('Folosire excesivă a majusculelor')
+
+    # Verifică punctuația excesivă
+    exclamation_count = text.count('!')
+    question_count = text.count('?')
+
+    if exclamation_count > 3 or question_count > 5:
+        manipulation_score += 0.1
+        flags.append('excessive_punctuation')
+        reasoning.append('Punctuație excesivă pentru efect dramatic')
+
+    return {
+        'manipulation_score': min(manipulation_score, 0.5),
+        'flags': flags,
+        'reasoning': reasoning
+    }
+
+
+def legacy_simple_classifier(text, fake_keywords, real_keywords):
+    text_lower = text.lower()
+
+    # ÎMBUNĂTĂȚIRE: Analiză mai sofisticată pentru fake news subtile
+
+    # 1. Calculează scorurile de bază pentru keywords
+    fake_score = 0
+    real_score = 0
+
+    # Scoruri ponderate pentru keywords
+    for keyword in fake_keywords:
+        if keyword in text_lower:
+            # Pondere mai mare pentru keywords mai specifici
+            if len(keyword) > 10:  # Keywords lungi sunt mai specifici
+                fake_score += 2
+            else:
+                fake_score += 1
+
+    for keyword in real_keywords:
+        if keyword in text_lower:
+            if len(keyword) > 10:
+                real_score += 2
+            else:
+                real_score += 1
+
+    # 2. Detectează pattern-uri generale de exagerare și manipulare
+    subtle_fake_patterns = [
+        # Pattern-uri de exagerare generală
+        'completely', 'totally', 'absolutely', 'perfectly', 'exactly',
+        'instantly', 'immediately', 'suddenly', 'dramatically', 'massively',
+        'revolutionary', 'groundbreaking', 'unprecedented', 'extraordinary', 'incredible',
+        'shocking', 'stunning', 'amazing', 'remarkable', 'outstanding',
+        'never seen before', 'first time ever', 'only solution', 'best ever',
+        'guaranteed', 'proven', 'confirmed', 'established', 'demonstrated',
+
+        # Pattern-uri de urgență artificială  
+        'breaking', 'urgent', 'immediate', 'emergency', 'crisis',
+        'act now', 'limited time', 'don\'t wait', 'hurry', 'quickly',
+        'before it\'s too late', 'last chance', 'final warning', 'deadline',
+
+        # Pattern-uri de autoritate falsă
+        'experts agree', 'scientists confirm', 'studies prove', 'research shows',
+        'according to experts', 'leading authorities', 'top specialists', 'renowned',
+        'prestigious', 'leading', 'world-class', 'internationally recognized',
+
+        # Pattern-uri de conspirație subtile
+        'they don\'t want you to know', 'hidden truth', 'secret information',
+        'cover up', 'suppressed', 'censored', 'banned', 'forbidden',
+        'mainstream media won\'t tell you', 'government doesn\'t want',
+
+        # Versiuni în română
+        'complet', 'total', 'absolut', 'perfect', 'exact',
+        'instant', 'imediat', 'brusc', 'dramatic', 'masiv',
+        'revoluționar', 'revoluționar', 'fără precedent', 'extraordinar',
+        'ultimă oră', 'urgent', 'imediat', 'criză', 'acționează',
+        'experții confirmă', 'studiile dovedesc', 'cercetările arată'
+    ]
+
+    # 3. Detectează surse vagi și credibilitate suspectă
+    dubious_sources = [
+        # Surse anonime/vagi
+        'anonymous source', 'unnamed expert', 'confidential report', 'insider information',
+        'leaked documents', 'whistleblower reveals', 'off-the-record', 'sources say',
+        'according to sources', 'reliable sources', 'inside sources', 'trusted sources',
+
+        # Autorități vagi
+        'experts', 'specialists', 'authorities', 'officials', 'insiders',
+        'top people', 'those in the know', 'industry leaders', 'key figures',
+
+        # Organizații vagi sau false
+        'international organization', 'global foundation', 'research institute',
+        'prestigious university', 'leading center', 'advanced facility',
+        'renowned organization', 'world-class institute', 'top-rated center',
+
+        # Pattern-uri de temporalitate suspectă
+        'will soon reveal', 'about to announce', 'preparing to release',
+        'plans to publish', 'expected to confirm', 'will shortly disclose',
+
+        # Afirmații absolute fără dovezi
+        'it\'s proven that', 'everyone knows', 'it\'s obvious that',
+        'common knowledge', 'well established', 'widely accepted',
+
+        # Versiuni în română
+        'sursă anonimă', 'expert neidentificat', 'raport confidențial', 'informații din interior',
+        'documente scurse', 'informator dezvăluie', 'organizație internațională',
+        'institut de cercetare', 'universitate prestigioasă', 'centru de cercetare'
+    ]
+
+    # 4. Detectează urgență artificială
+    artificial_urgency = [
+        'breaking news', 'urgent', 'act now', 'don\'t wait', 'time running out',
+        'limited time', 'exclusive offer', 'once in a lifetime',
+        'ultimă oră', 'urgent', 'acționează acum', 'nu aștepta', 'timpul se scurge',
+        'timp limitat', 'ofertă exclusivă', 'o dată în viață'
+    ]
+
+    # 5. Detectează conspirații
+    conspiracy_indicators = [
+        'government control', 'mind control', 'cover-up', 'suppresses truth', 'hidden agenda',
+        'they don\'t want you to know', 'mainstream media', 'big pharma',
+        'guvernul controlează', 'controlul minții', 'mușamalizare', 'suprimă adevărul',
+        'agende ascunse', 'nu vor să știi', 'media mainstream'
+    ]
+
+    # Calculează scorurile pentru pattern-uri subtile
+    subtle_score = sum(2 for pattern in subtle_fake_patterns if pattern in text_lower)
+    dubious_score = sum(3 for pattern in dubious_sources if pattern in text_lower)  # Pondere mare
+    urgency_score = sum(1.5 for pattern in artificial_urgency if pattern in text_lower)
+    conspiracy_score = sum(2.5 for pattern in conspiracy_indicators if pattern in text_lower)
+
+    # Adaugă scorurile subtile la scorul fake
+    fake_score += subtle_score + dubious_score + urgency_score + conspiracy_score
+
+    # 6. Detectează indicatori de credibilitate
+    credibility_indicators = [
+        'according to', 'data shows', 'statistics indicate', 'research suggests',
+        'experts say', 'officials confirm', 'study finds', 'analysis reveals',
+        'published in', 'peer-reviewed', 'university study', 'scientific journal',
+        'conform cu', 'datele arată', 'statisticile indică', 'cercetarea sugerează',
+        'experții spun', 'oficialii confirmă', 'studiul găsește', 'analiza dezvăluie',
+        'publicat în', 'evaluat de colegi', 'studiu universitar', 'revistă științifică'
+    ]
+
+    credibility_score = sum(1.5 for indicator in credibility_indicators if indicator in text_lower)
+    real_score += credibility_score
+
+    # 7. Analiză lingvistică pentru manipulare
+    manipulation_indicators = 0
+
+    # Verifică folosirea excesivă a majusculelor
+    caps_ratio = sum(1 for c in text if c.isupper()) / max(len(text), 1)
+    if caps_ratio > 0.1:  # Peste 10% majuscule
+        manipulation_indicators += 2
+
+    # Verifică punctuația excesivă
+    exclamation_count = text.count('!')
+    if exclamation_count > 3:
+        manipulation_indicators += 1.5
+
+    # Verifică cuvinte emoționale puternice
+    emotional_words = ['shocking', 'amazing', 'incredible', 'unbelievable', 'devastating',
+                     'șocant', 'uimitor', 'incredibil', 'de necrezut', 'devastator']
+    emotional_count = sum(1 for word in emotional_words if word in text_lower)
+    if emotional_count > 2:
+        manipulation_indicators += emotional_count
+
+    fake_score += manipulation_indicators
+
+    # 8. Calculează confidența îmbunătățită
+    total_indicators = fake_score + real_score
+
+    if fake_score > real_score:
+        # Calculează confidența bazată pe diferența și puterea indicatorilor
+        score_difference = fake_score - real_score
+        base_confidence = min(0.5 + (score_difference / max(total_indicators, 1)) * 0.4, 0.95)
+
+        # Bonus pentru pattern-uri multiple
+        if subtle_score > 0 and dubious_score > 0:
+            base_confidence += 0.05
+        if conspiracy_score > 0 and manipulation_indicators > 0:
+            base_confidence += 0.05
+
+        confidence = max(0.65, min(0.95, base_confidence))
+        return 1, confidence  # fake
+
+    elif real_score > fake_score:
+        score_difference = real_score - fake_score
+        base_confidence = min(0.5 + (score_difference / max(total_indicators, 1)) * 0.4, 0.95)
+
+        # Bonus pentru indicatori de credibilitate multipli
+        if credibility_score > 3:
+            base_confidence += 0.05
+
+        confidence = max(0.65, min(0.95, base_confidence))
+        return 0, confidence  # real
+
+    else:
+        # Heuristici îmbunătățite pentru egalitate
+        if manipulation_indicators > 2:
+            return 1, 0.70  # fake (manipulare detectată)
+        elif credibility_score > 0:
+            return 0, 0.75  # real (indicatori de credibilitate)
+        elif len(text) > 200 and any(word in text_lower for word in ['study', 'research', 'analysis', 'studiu', 'cercetare', 'analiză']):
+            return 0, 0.70  # real (conținut academic lung)
+        elif any(word in text_lower for word in ['breaking', 'urgent', 'shocking', 'ultimă oră']):
+            return 1, 0.68  # fake (limbaj senzațional)
+        else:
+            return 0, 0.65  # real (default conservativ)
+
+
+CRAFTED_TEXTS = [
+    "",
+    "URGENT! URGENT!! Distribuie urgent! Doctorii nu vor să știi acest secret ascuns.",
+    "Studiu Harvard: cercetătorii de la MIT și Stanford confirmă, conform datelor oficiale.",
+    "Scientists discovered that drinking water cures everything, big pharma hides the truth!!!",
+    "Incredibil, șocant, cel mai bun tratament miraculos din toate timpurile, 100% garantat.",
+    "Guvernul a aprobat bugetul conform raportului publicat de Institutul Național de Statistică.",
+    "The moon is made of cheese according to experts; share before they delete this!",
+]
+
+
+def load_texts(limit: int = 600):
+    """Texte din datasetul etichetat plus texte construite sa activeze multe pattern-uri"""
+    texts = list(CRAFTED_TEXTS)
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'simple_large_dataset.json')
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            texts.extend(article['text'] for article in json.load(f)[:limit])
+    # Concatenări pentru a acoperi texte lungi cu multe pattern-uri suprapuse
+    texts.append(" ".join(texts[:40]))
+    return texts
+
+
+def naive_counts(categories, text_lower):
+    return {name: sum(1 for p in patterns if p in text_lower) for name, patterns in categories.items()}
+
+
+def test_matcher_counts_match_naive_scan():
+    """Numararea intr-o singura trecere este identica cu scanarea fiecarui pattern"""
+    categories = dict(SUBTLE_PATTERN_MATCHER.categories)
+    categories.update(CLASSIFIER_CATEGORIES)
+    categories['fake_keywords'] = FALLBACK_FAKE_KEYWORDS
+    categories['real_keywords'] = FALLBACK_REAL_KEYWORDS
+    matcher = MultiPatternMatcher(categories)
+    for text in load_texts():
+        text_lower = text.lower()
+        assert matcher.counts(text_lower) == naive_counts(categories, text_lower)
+
+
+def test_overlapping_and_duplicate_patterns():
+    """Pattern-urile suprapuse, prefixele si intrarile duplicate sunt numarate ca inainte"""
+    categories = {'a': ['he', 'she', 'his', 'hers', 'he'], 'b': ['hers', 'x', '']}
+    matcher = MultiPatternMatcher(categories)
+    for text in ["ushers", "she", "hishe", "", "xx", "h"]:
+        assert matcher.counts(text) == naive_counts({'a': categories['a'], 'b': ['hers', 'x']}, text)
+    assert matcher.matches("ushers")['a'] == ['he', 'she', 'hers', 'he']
+
+
+def test_subtle_and_linguistic_parity():
+    """_detect_subtle_patterns si _analyze_linguistic_manipulation raman neschimbate"""
+    analyzer = MLAnalyzer.__new__(MLAnalyzer)
+    for text in load_texts():
+        assert analyzer._detect_subtle_patterns(text) == legacy_detect_subtle_patterns(text)
+        assert analyzer._analyze_linguistic_manipulation(text) == legacy_analyze_linguistic_manipulation(text)
+
+
+def test_simple_classifier_parity():
+    """Clasificatorul euristic da aceleasi predictii si probabilitati"""
+    from ml_analyzer import load_simple_large_model
+    from keyword_registry import get_keyword_registry
+
+    classifier, _ = load_simple_large_model()
+    snapshot = get_keyword_registry().snapshot()
+    for text in load_texts():
+        expected = legacy_simple_classifier(text, snapshot.fake_keywords, snapshot.real_keywords)
+        assert classifier(text) == expected
+
+
+if __name__ == "__main__":
+    test_matcher_counts_match_naive_scan()
+    test_overlapping_and_duplicate_patterns()
+    test_subtle_and_linguistic_parity()
+    test_simple_classifier_parity()
+    print("✅ Toate testele de paritate pentru pattern_matcher au trecut")
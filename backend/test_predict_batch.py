@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Teste pentru validarea elementelor din /predict/batch (app.py)
+"""
+
+ARTICLE = {'title': 'Articol', 'published': None, 'text': 'Studiul publicat arata o crestere moderata.'}
+
+
+def load_app():
+    """Aplicatia Flask este importata abia in test (importul initializeaza baza de date si modelele)."""
+    import app as app_module
+    return app_module
+
+
+def logged_in_client(app_module):
+    client = app_module.app.test_client()
+    with client.session_transaction() as session:
+        session['username'] = 'test_lot'
+        session['user_id'] = 1
+    return client
+
+
+def test_invalid_items_are_reported_per_item():
+    """Elementele cu 'text' sau 'url' care nu sunt siruri primesc o eroare proprie, fara a opri lotul"""
+    app_module = load_app()
+    original = app_module.extract_article_from_url
+    app_module.extract_article_from_url = lambda url: dict(ARTICLE)
+    try:
+        items = [
+            'Text simplu despre bugetul orasului.',
+            {'id': 'numar', 'text': 123},
+            {'id': 'obiect', 'text': {'a': 1}},
+            {'id': 'lista', 'url': ['http://exemplu.ro']},
+            {'id': 'pagina', 'url': 'http://exemplu.ro/articol'},
+            5,
+        ]
+        response = logged_in_client(app_module).post('/predict/batch', json={'items': items, 'mode': 'traditional'})
+    finally:
+        app_module.extract_article_from_url = original
+
+    assert response.status_code == 200
+    results = response.json['results']
+    assert [r['index'] for r in results] == list(range(len(items)))
+    assert 'error' not in results[0] and 'error' not in results[4]
+    assert results[4]['article']['url'] == 'http://exemplu.ro/articol'
+    for index, item_id in ((1, 'numar'), (2, 'obiect'), (3, 'lista')):
+        assert results[index]['id'] == item_id and 'must be strings' in results[index]['error']
+    assert 'error' in results[5]
+    assert response.json['errors'] == 4
+
+
+if __name__ == "__main__":
+    test_invalid_items_are_reported_per_item()
+    print("✅ Toate testele pentru /predict/batch au trecut")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Teste pentru evenimentele de progres ale analizelor (progress.py) si transmiterea lor prin SSE
+"""
+
+import json
+import os
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from async_runtime import run_async
+from job_queue import SUCCEEDED, JobQueue
+from progress import STAGE_END, STAGE_ERROR, STAGE_START, format_sse, format_sse_comment, track_stage
+from test_cascade import make_analyzer
+from video_analyzer import VideoAnalyzer
+
+
+def test_track_stage_reports_duration_and_partial_result():
+    """O etapa raporteaza inceputul, apoi sfarsitul cu durata si rezultatul partial"""
+    events = []
+    with track_stage(events.append, 'ml') as partial:
+        time.sleep(0.01)
+        partial['verdict'] = 'fake'
+
+    assert [event['event'] for event in events] == [STAGE_START, STAGE_END]
+    assert all(event['stage'] == 'ml' for event in events)
+    assert events[1]['duration_ms'] >= 10 and events[1]['partial'] == {'verdict': 'fake'}
+
+
+def test_track_stage_reports_errors_and_ignores_broken_callbacks():
+    """Exceptiile etapei sunt raportate si propagate; un callback defect nu opreste analiza"""
+    events = []
+    try:
+        with track_stage(events.append, 'ai'):
+            raise RuntimeError("timeout")
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("Exceptia etapei trebuia propagata")
+    assert events[-1]['event'] == STAGE_ERROR and events[-1]['error'] == "timeout"
+
+    def disconnected(event):
+        raise BrokenPipeError("client deconectat")
+
+    with track_stage(disconnected, 'ml') as partial:
+        partial['verdict'] = 'real'
+    with track_stage(None, 'ml'):
+        pass
+
+
+def test_format_sse():
+    """Mesajele SSE au id, nume de eveniment si date JSON (inclusiv tipuri numpy)"""
+    message = format_sse({'confidence': np.float32(0.5), 'text': 'linia 1\nlinia 2'}, event='stage_end', event_id=3)
+    assert message.endswith("\n\n")
+    lines = message.strip().split("\n")
+    assert lines[:2] == ["id: 3", "event: stage_end"]
+    assert json.loads(lines[2][len("data: "):]) == {'confidence': 0.5, 'text': 'linia 1\nlinia 2'}
+    assert format_sse_comment() == ": keep-alive\n\n"
+
+
+def test_hybrid_and_cascade_report_each_stage():
+    """Analiza hibrida raporteaza ai, ml si ensemble; cascada raporteaza doar nivelurile rulate"""
+    analyzer = make_analyzer(0.5, 0.6)
+    events = []
+    result = run_async(analyzer.analyze_text("text de analizat", progress=events.append))
+    ends = {event['stage']: event for event in events if event['event'] == STAGE_END}
+    assert set(ends) == {'ai', 'ml', 'ensemble'}
+    assert ends['ai']['partial'] == {'verdict': 'real', 'confidence': 0.9}
+    assert ends['ensemble']['partial']['verdict'] == result['verdict']
+
+    events.clear()
+    run_async(analyzer.analyze_text("text de analizat", progress=events.append))
+    assert [event['event'] for event in events] == ['cache_hit']
+
+    analyzer = make_analyzer(0.99, 0.99)
+    events = []
+    run_async(analyzer.analyze_cascade("text clar", progress=events.append))
+    assert [(event['event'], event['stage']) for event in events] == [(STAGE_START, 'fast'), (STAGE_END, 'fast')]
+
+
+def test_video_analysis_reports_each_stage():
+    """Analiza video raporteaza fiecare etapa, in ordine, cu rezultatul ei partial"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'clip.avi')
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 10, (64, 48))
+        for i in range(20):
+            writer.write(np.full((48, 64, 3), i * 10, dtype=np.uint8))
+        writer.release()
+
+        events = []
+        result = VideoAnalyzer().analyze_video_integrity(path, progress=events.append)
+        stages = ['metadata', 'frames', 'compression', 'temporal', 'deepfake', 'verdict']
+        started = [event['stage'] for event in events if event['event'] == STAGE_START]
+        assert started == stages[:len(started)]
+        ends = [event for event in events if event['event'] == STAGE_END]
+        assert ends[0]['stage'] == 'metadata'
+        if 'error' in result:
+            # Ex. OpenCV fara module de detectie faciala: etapa care a esuat este raportata
+            assert events[-1]['event'] == STAGE_ERROR and events[-1]['stage'] == started[-1]
+        else:
+            assert [event['stage'] for event in ends] == stages
+            assert ends[1]['partial']['frames'] > 0
+            assert ends[-1]['partial']['verdict'] == result['final_verdict']['verdict']
+
+
+def test_job_events_are_stored_in_order():
+    """Evenimentele raportate de un job sunt pastrate si pot fi citite incremental (Last-Event-ID)"""
+    with tempfile.TemporaryDirectory() as directory:
+        queue = JobQueue(db_path=os.path.join(directory, 'jobs.db'), workers=1, poll_interval=0.05)
+
+        def staged(payload, job):
+            for stage in ('fetch', 'ml'):
+                with track_stage(job.report, stage) as partial:
+                    partial['score'] = np.float64(0.25)
+            return {}
+
+        queue.register('staged', staged)
+        queue.start()
+        try:
+            job = queue.submit('staged', {})
+            deadline = time.monotonic() + 5
+            while queue.get(job['id'])['status'] != SUCCEEDED and time.monotonic() < deadline:
+                time.sleep(0.01)
+            events = queue.events(job['id'])
+            assert [(event['event'], event['stage']) for event in events] == [
+                (STAGE_START, 'fetch'), (STAGE_END, 'fetch'), (STAGE_START, 'ml'), (STAGE_END, 'ml')]
+            assert events[1]['partial'] == {'score': 0.25} and events[1]['attempt'] == 1
+            assert [event['seq'] for event in events] == sorted(event['seq'] for event in events)
+            assert queue.events(job['id'], after=events[1]['seq']) == events[2:]
+        finally:
+            queue.stop()
+
+
+if __name__ == "__main__":
+    test_track_stage_reports_duration_and_partial_result()
+    test_track_stage_reports_errors_and_ignores_broken_callbacks()
+    test_format_sse()
+    test_hybrid_and_cascade_report_each_stage()
+    test_video_analysis_reports_each_stage()
+    test_job_events_are_stored_in_order()
+    print("✅ Toate testele pentru progress au trecut")
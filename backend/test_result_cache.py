@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Teste pentru cache-ul de rezultate (result_cache.py)
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from result_cache import ResultCache, normalize_text
+
+
+def make_cache(tmp_dir, **kwargs):
+    """Cache care urmareste un singur fisier de model din directorul temporar"""
+    artifact = os.path.join(tmp_dir, 'model.pkl')
+    if not os.path.exists(artifact):
+        with open(artifact, 'wb') as f:
+            f.write(b'v1')
+    options = {'artifacts': ['model.pkl'], 'base_dir': tmp_dir, 'version_check_interval': 0}
+    options.update(kwargs)
+    return ResultCache(**options)
+
+
+def test_normalized_text_hits_and_counters():
+    """Textele care difera doar prin spatii folosesc aceeasi intrare; contoarele sunt actualizate"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = make_cache(tmp_dir)
+        assert cache.get("Breaking  news\n", 'ml_only') is None
+        cache.set("Breaking news", 'ml_only', {'verdict': 'fake', 'confidence': np.float32(0.9)})
+
+        hit = cache.get("  Breaking news ", 'ml_only')
+        assert hit['verdict'] == 'fake' and hit['cached'] is True
+        assert cache.get("Breaking news", 'hybrid') is None
+        assert cache.get("BREAKING news", 'ml_only') is None
+
+        hit['verdict'] = 'modified'
+        assert cache.get("Breaking news", 'ml_only')['verdict'] == 'fake'
+
+        status = cache.get_status()
+        assert status['hits'] == 2 and status['misses'] == 3
+        assert normalize_text(" a \t b ") == "a b"
+
+
+def test_lru_and_ttl_eviction():
+    """Memoria este limitata (LRU) si intrarile expira dupa TTL"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = make_cache(tmp_dir, max_entries=2)
+        cache.set("a", 'ml_only', {'verdict': 'real'})
+        cache.set("b", 'ml_only', {'verdict': 'real'})
+        assert cache.get("a", 'ml_only') is not None
+        cache.set("c", 'ml_only', {'verdict': 'fake'})
+        assert cache.get("b", 'ml_only') is None
+        assert cache.get("a", 'ml_only') is not None
+        assert cache.get_status()['evictions'] == 1
+
+        short = make_cache(tmp_dir, ttl=0.05)
+        short.set("x", 'ml_only', {'verdict': 'fake'})
+        time.sleep(0.1)
+        assert short.get("x", 'ml_only') is None
+
+
+def test_errors_are_not_cached():
+    """Rezultatele cu eroare nu sunt salvate"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = make_cache(tmp_dir)
+        cache.set("text", 'hybrid', {'error': 'API indisponibil', 'verdict': 'unknown'})
+        assert cache.get("text", 'hybrid') is None
+
+
+def test_sqlite_tier_survives_restart():
+    """Nivelul SQLite pastreaza rezultatele intre instante"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'cache', 'results.db')
+        first = make_cache(tmp_dir, sqlite_path=db_path)
+        first.set("viral article", 'hybrid', {'verdict': 'fake', 'flags': np.array([1, 2])})
+
+        second = make_cache(tmp_dir, sqlite_path=db_path)
+        hit = second.get("viral article", 'hybrid')
+        assert hit == {'verdict': 'fake', 'flags': [1, 2], 'cached': True}
+        assert second.get_status()['disk_hits'] == 1
+
+
+def test_model_change_invalidates_cache():
+    """Modificarea unui fisier de model goleste cache-ul si schimba cheile"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'results.db')
+        cache = make_cache(tmp_dir, sqlite_path=db_path)
+        cache.set("text", 'traditional', {'verdict': 'real'})
+        old_version = cache.version
+
+        artifact = os.path.join(tmp_dir, 'model.pkl')
+        with open(artifact, 'wb') as f:
+            f.write(b'v2 retrained')
+        os.utime(artifact, (time.time() + 10, time.time() + 10))
+
+        assert cache.get("text", 'traditional') is None
+        assert cache.version != old_version
+        assert cache.get_status()['invalidations'] == 1
+        assert make_cache(tmp_dir, sqlite_path=db_path).get("text", 'traditional') is None
+
+
+if __name__ == "__main__":
+    test_normalized_text_hits_and_counters()
+    test_lru_and_ttl_eviction()
+    test_errors_are_not_cached()
+    test_sqlite_tier_survives_restart()
+    test_model_change_invalidates_cache()
+    print("✅ Toate testele pentru result_cache au trecut")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Teste pentru impartirea in ferestre de tokeni (token_chunking.py) si analiza mBERT pe articole lungi
+"""
+
+import logging
+import tempfile
+
+import pytest
+
+from ml_analyzer import MLAnalyzer
+from test_inference_backend import make_tiny_bert
+from token_chunking import aggregate_predictions, plan_windows, split_into_windows
+
+
+def test_windows_cover_every_token_with_overlap():
+    """Ferestrele acopera tot textul, se suprapun si nu depasesc lungimea maxima"""
+    windows = plan_windows(1000, window=100, overlap=20, max_chunks=100)
+    assert windows[0][0] == 0 and windows[-1][1] == 1000
+    assert all(end - start == 100 for start, end in windows)
+    assert all(b[0] == a[0] + 80 for a, b in zip(windows[:-2], windows[1:-1]))
+    covered = set()
+    for start, end in windows:
+        covered.update(range(start, end))
+    assert covered == set(range(1000))
+
+
+def test_short_texts_use_a_single_window():
+    """Un text mai scurt decat fereastra ramane intreg"""
+    assert plan_windows(0, window=100) == [(0, 0)]
+    assert plan_windows(100, window=100) == [(0, 100)]
+    assert split_into_windows([5, 6, 7], window=10) == [[5, 6, 7]]
+
+
+def test_chunk_cap_keeps_first_last_and_spreads_the_rest():
+    """Limita de ferestre pastreaza inceputul, sfarsitul si ferestre distribuite uniform"""
+    windows = plan_windows(10_000, window=100, overlap=0, max_chunks=5)
+    assert len(windows) == 5
+    assert windows[0] == (0, 100) and windows[-1] == (9900, 10_000)
+    starts = [start for start, _ in windows]
+    assert starts == sorted(starts)
+
+
+def test_aggregation_methods():
+    """'max' alege fereastra cea mai sigura, 'mean' mediaza distributiile"""
+    predictions = [
+        {'label': 'a', 'score': 0.6, 'probabilities': {'a': 0.6, 'b': 0.4}},
+        {'label': 'b', 'score': 0.9, 'probabilities': {'a': 0.1, 'b': 0.9}},
+        {'label': 'a', 'score': 0.7, 'probabilities': {'a': 0.7, 'b': 0.3}},
+    ]
+    assert aggregate_predictions(predictions, 'max') == {'label': 'b', 'score': 0.9, 'chunks': 3}
+    mean = aggregate_predictions(predictions, 'mean')
+    assert mean['label'] == 'b' and mean['score'] == pytest.approx(1.6 / 3)
+    with pytest.raises(ValueError):
+        aggregate_predictions(predictions, 'median')
+
+
+def make_analyzer(model_dir):
+    from transformers import pipeline
+
+    analyzer = MLAnalyzer.__new__(MLAnalyzer)
+    analyzer.logger = logging.getLogger(__name__)
+    analyzer.classifier_model = pipeline("sentiment-analysis", model=model_dir, tokenizer=model_dir, device=-1)
+    return analyzer
+
+
+def test_long_articles_are_analyzed_in_chunks():
+    """Articolele lungi sunt tokenizate o data si analizate in mai multe ferestre, intr-un singur lot"""
+    with tempfile.TemporaryDirectory() as model_dir:
+        make_tiny_bert(model_dir)
+        analyzer = make_analyzer(model_dir)
+        short = "scientists study shows moderate growth"
+        long = " ".join(["breaking shocking truth the government is fake"] * 200)
+
+        calls = []
+        original = analyzer._classify_windows
+        analyzer._classify_windows = lambda windows: calls.append(len(windows)) or original(windows)
+
+        short_result, long_result = analyzer.analyze_with_mbert_batch([short, long])
+        assert len(calls) == 1
+        assert short_result['chunks_analyzed'] == 1
+        assert 1 < long_result['chunks_analyzed'] <= 8
+        assert calls[0] == short_result['chunks_analyzed'] + long_result['chunks_analyzed']
+
+        # Pentru un text scurt rezultatul este cel al pipeline-ului pe textul întreg
+        expected = analyzer.classifier_model(short)[0]
+        assert short_result['sentiment_label'] == expected['label']
+        assert short_result['sentiment_score'] == pytest.approx(expected['score'], abs=1e-5)
+
+
+if __name__ == "__main__":
+    test_windows_cover_every_token_with_overlap()
+    test_short_texts_use_a_single_window()
+    test_chunk_cap_keeps_first_last_and_spreads_the_rest()
+    test_aggregation_methods()
+    test_long_articles_are_analyzed_in_chunks()
+    print("✅ Toate testele pentru token_chunking au trecut")
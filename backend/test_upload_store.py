@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Teste pentru salvarea fisierelor incarcate intr-o singura trecere (upload_store.py)
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+
+import pytest
+from flask import Flask, Request, jsonify, request
+from sqlalchemy.exc import IntegrityError
+from werkzeug.datastructures import FileStorage
+
+from models import VideoAnalysisResult, VideoBlob, VideoUpload, db
+from upload_store import PARTIAL_SUFFIX, BlobStore, StreamingUpload, save_upload
+
+
+def test_streaming_upload_hashes_while_writing():
+    """Dimensiunea si SHA-256 sunt calculate din bucatile scrise, iar copia permanenta este o redenumire"""
+    data = os.urandom(300_000)
+    with tempfile.TemporaryDirectory() as directory:
+        with StreamingUpload(directory) as upload:
+            for start in range(0, len(data), 65536):
+                upload.write(data[start:start + 65536])
+            upload.seek(0)
+            assert upload.read(10) == data[:10]
+            inode = os.stat(upload.temp_path).st_ino
+            stored = upload.persist(os.path.join(directory, 'clip.mp4'))
+
+        assert stored.size == len(data) and stored.sha256 == hashlib.sha256(data).hexdigest()
+        assert stored.filename == 'clip.mp4'
+        assert os.stat(stored.path).st_ino == inode  # acelasi fisier, nu o copie
+        assert os.listdir(directory) == ['clip.mp4']
+
+
+def test_unpersisted_uploads_are_removed_on_close():
+    """Fisierele temporare care nu au fost pastrate sunt sterse cand cererea se incheie"""
+    with tempfile.TemporaryDirectory() as directory:
+        upload = StreamingUpload(directory)
+        upload.write(b'abc')
+        assert upload.temp_path.endswith(PARTIAL_SUFFIX)
+        upload.close()
+        assert os.listdir(directory) == []
+
+
+def test_rewrites_fall_back_to_hashing_the_file():
+    """O scriere in mijlocul fisierului invalideaza hash-ul incremental, care este recalculat"""
+    with tempfile.TemporaryDirectory() as directory:
+        with StreamingUpload(directory) as upload:
+            upload.write(b'aaaa')
+            upload.seek(1)
+            upload.write(b'b')
+            assert upload.size == 4
+            assert upload.sha256 == hashlib.sha256(b'abaa').hexdigest()
+
+
+def test_save_upload_copies_other_streams_once():
+    """Fisierele care nu au venit printr-un StreamingUpload sunt copiate pe bucati"""
+    data = os.urandom(5000)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'videos', 'clip.mp4')
+        stored = save_upload(FileStorage(io.BytesIO(data), filename='clip.mp4'), path, chunk_size=1024)
+        assert stored.size == len(data) and stored.sha256 == hashlib.sha256(data).hexdigest()
+        with open(path, 'rb') as f:
+            assert f.read() == data
+        assert os.listdir(os.path.dirname(path)) == ['clip.mp4']
+
+
+def test_multipart_upload_is_written_once():
+    """Intr-o cerere Flask, fisierul primit ajunge direct in director si este doar redenumit"""
+    data = os.urandom(700_000)
+    with tempfile.TemporaryDirectory() as directory:
+        class DirectoryRequest(Request):
+            def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+                return StreamingUpload(directory)
+
+        app = Flask(__name__)
+        app.request_class = DirectoryRequest
+
+        @app.route('/upload', methods=['POST'])
+        def upload():
+            video = request.files['video']
+            assert isinstance(video.stream, StreamingUpload)
+            stored = save_upload(video, os.path.join(directory, video.filename))
+            return jsonify(stored._asdict())
+
+        @app.route('/ignore', methods=['POST'])
+        def ignore():
+            request.files['video']
+            return jsonify({})
+
+        client = app.test_client()
+        response = client.post('/upload', data={'video': (io.BytesIO(data), 'clip.mp4')},
+                               content_type='multipart/form-data')
+        assert response.json['size'] == len(data)
+        assert response.json['sha256'] == hashlib.sha256(data).hexdigest()
+
+        client.post('/ignore', data={'video': (io.BytesIO(data), 'other.mp4')}, content_type='multipart/form-data')
+        assert os.listdir(directory) == ['clip.mp4']
+
+
+def test_blob_store_keeps_one_copy_per_content():
+    """Acelasi continut incarcat de mai multe ori este stocat o singura data, la calea data de SHA-256"""
+    data, other = os.urandom(4000), os.urandom(4000)
+    with tempfile.TemporaryDirectory() as directory:
+        store = BlobStore(os.path.join(directory, 'blobs'))
+        first = store.add(FileStorage(io.BytesIO(data), filename='a.mp4'))
+        with StreamingUpload(store.root) as received:
+            received.write(data)
+            again = store.add(FileStorage(received, filename='b.mp4'))
+        store.add(FileStorage(io.BytesIO(other), filename='c.mp4'))
+
+        assert again == first and first.path == store.path(hashlib.sha256(data).hexdigest())
+        assert store.exists(first.sha256)
+        blobs = [name for _, _, names in os.walk(store.root) for name in names]
+        assert sorted(blobs) == sorted([first.sha256, hashlib.sha256(other).hexdigest()])
+
+
+def test_upload_records_reference_shared_blobs():
+    """Incarcarile sunt referinte catre blob-uri; rezultatele sunt unice per (hash, versiune)"""
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite://'
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        db.session.add(VideoBlob(sha256='ab' * 32, size=10))
+        db.session.add_all([VideoUpload(user_id=user_id, sha256='ab' * 32, filename=f'{user_id}_x_clip.mp4',
+                                        original_name='clip.mp4') for user_id in (1, 2)])
+        db.session.add(VideoAnalysisResult(sha256='ab' * 32, analyzer_version='1', result='{"verdict": "authentic"}'))
+        db.session.commit()
+
+        blob = db.session.get(VideoBlob, 'ab' * 32)
+        assert len(blob.uploads) == 2
+        assert blob.uploads[0].to_dict()['file_size'] == 10
+        assert VideoAnalysisResult.query.one().get_result() == {'verdict': 'authentic'}
+
+        db.session.add(VideoAnalysisResult(sha256='ab' * 32, analyzer_version='1', result='{}'))
+        with pytest.raises(IntegrityError):
+            db.session.commit()
+        db.session.rollback()
+        db.session.add(VideoAnalysisResult(sha256='ab' * 32, analyzer_version='2', result='{}'))
+        db.session.commit()
+
+
+if __name__ == "__main__":
+    test_streaming_upload_hashes_while_writing()
+    test_unpersisted_uploads_are_removed_on_close()
+    test_rewrites_fall_back_to_hashing_the_file()
+    test_save_upload_copies_other_streams_once()
+    test_multipart_upload_is_written_once()
+    test_blob_store_keeps_one_copy_per_content()
+    test_upload_records_reference_shared_blobs()
+    print("✅ Toate testele pentru upload_store au trecut")
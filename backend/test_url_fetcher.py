@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Teste pentru descarcarea articolelor (url_fetcher.py), pe un server HTTP local
+"""
+
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from url_fetcher import FetchError, UrlFetcher
+
+ARTICLE = (
+    "<html><head><meta charset='utf-8'><script>var x = 1;</script></head><body>"
+    "<h1>Știre importantă</h1><p>Primul paragraf.</p><div>meniu</div><p>Al doilea paragraf.</p>"
+    "</body></html>"
+).encode('utf-8')
+ETAG = '"v1"'
+
+
+class Handler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        Handler.requests_seen.append((self.path, self.headers.get('If-None-Match')))
+        if self.path == '/article':
+            if self.headers.get('If-None-Match') == ETAG:
+                self.send_response(304)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('ETag', ETAG)
+            self.send_header('Content-Length', str(len(ARTICLE)))
+            self.end_headers()
+            self.wfile.write(ARTICLE)
+        elif self.path == '/huge-declared':
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(10_000_000))
+            self.end_headers()
+        elif self.path == '/huge-streamed':
+            # Fără Content-Length: limita trebuie aplicată în timpul citirii
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.end_headers()
+            for _ in range(64):
+                self.wfile.write(b"<p>" + b"x" * 1024 + b"</p>")
+        elif self.path == '/image':
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/png')
+            self.send_header('Content-Length', '4')
+            self.end_headers()
+            self.wfile.write(b'\x89PNG')
+        else:
+            self.send_response(404)
+            self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def local_server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    Handler.requests_seen = []
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_extracts_paragraphs_and_headings():
+    """Textul este extras din titluri si paragrafe, fara scripturi, cu codificarea din <meta>"""
+    with local_server() as server:
+        fetcher = UrlFetcher()
+        assert fetcher.fetch_text(f"{server}/article") == "Știre importantă Primul paragraf. Al doilea paragraf."
+        assert fetcher.fetch_article(f"{server}/article")['title'] == "Știre importantă"
+
+
+def test_fresh_entries_are_served_from_cache():
+    """O intrare proaspata nu mai genereaza nicio cerere HTTP"""
+    with local_server() as server:
+        fetcher = UrlFetcher(fresh_seconds=60)
+        first = fetcher.fetch_text(f"{server}/article")
+        second = fetcher.fetch_text(f"{server}/article")
+        assert first == second
+        assert len(Handler.requests_seen) == 1
+        assert fetcher.get_status()['cache_hits'] == 1
+
+
+def test_stale_entries_are_revalidated_with_etag():
+    """Dupa expirare se trimite o cerere conditionala, iar 304 refoloseste textul"""
+    with local_server() as server:
+        fetcher = UrlFetcher(fresh_seconds=0)
+        first = fetcher.fetch_text(f"{server}/article")
+        second = fetcher.fetch_text(f"{server}/article")
+        assert first == second
+        assert Handler.requests_seen == [('/article', None), ('/article', ETAG)]
+        assert fetcher.get_status()['revalidated'] == 1
+
+
+def test_size_cap_and_content_type():
+    """Paginile prea mari si continutul non-text sunt refuzate"""
+    with local_server() as server:
+        fetcher = UrlFetcher(max_bytes=16 * 1024)
+        with pytest.raises(FetchError):
+            fetcher.fetch_text(f"{server}/huge-declared")
+        with pytest.raises(FetchError):
+            fetcher.fetch_text(f"{server}/huge-streamed")
+        with pytest.raises(FetchError):
+            fetcher.fetch_text(f"{server}/image")
+        with pytest.raises(FetchError):
+            fetcher.fetch_text(f"{server}/missing")
+        assert fetcher.get_status()['too_large'] == 2
+        assert fetcher.get_status()['cached_urls'] == 0
+
+
+def test_lru_limit():
+    """Cache-ul pastreaza cel mult cache_entries URL-uri"""
+    fetcher = UrlFetcher(cache_entries=2)
+    for i in range(3):
+        fetcher._cache_put(f"http://example/{i}", {'text': str(i), 'stored_at': 0})
+    assert list(fetcher._cache) == ["http://example/1", "http://example/2"]
+
+
+if __name__ == "__main__":
+    test_extracts_paragraphs_and_headings()
+    test_fresh_entries_are_served_from_cache()
+    test_stale_entries_are_revalidated_with_etag()
+    test_size_cap_and_content_type()
+    test_lru_limit()
+    print("✅ Toate testele pentru url_fetcher au trecut")
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Teste pentru analiza video intr-o singura trecere (video_features.py si VideoAnalyzer)
+"""
+
+import gc
+import os
+import random
+import tempfile
+import time
+import weakref
+
+import cv2
+import numpy as np
+
+import pytest
+
+import video_features
+from test_frame_sampler import write_video
+from video_analyzer import VideoAnalyzer
+from video_features import (DetectorPool, FrameFeatureExtractor, FrameStatistics, RunningStats, analysis_level,
+                            artifact_score, face_features, to_gray, transition_features, transition_stack_features)
+
+
+class FakeCascade:
+    """Detector de fete fals: aceeasi fata (caseta fixa) in fiecare frame."""
+
+    def detectMultiScale(self, gray, scale_factor, min_neighbors):
+        return [(8, 4, 30, 31)]
+
+
+class SlowCascade(FakeCascade):
+    """Durate aleatoare per frame, ca thread-urile / procesele sa termine in alta ordine."""
+
+    def detectMultiScale(self, gray, scale_factor, min_neighbors):
+        time.sleep(random.uniform(0, 0.01))
+        return [(int(gray[0, 0]) % 20, 4, 30, 31)]
+
+
+def make_frames(count: int = 8, size=(96, 64)):
+    width, height = size
+    rng = np.random.default_rng(1)
+    base = rng.integers(0, 255, (height, width, 3), dtype=np.uint8)
+    return [np.roll(base, i * 5, axis=1) // (1 + i % 3) for i in range(count)]
+
+
+def reference_compression(frames):
+    """Formulele implementarii anterioare (liste de scoruri, np.mean / np.max)."""
+    scores = []
+    for frame in frames:
+        magnitude = np.log(np.abs(np.fft.fftshift(np.fft.fft2(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)))) + 1)
+        scores.append(np.std(magnitude) / np.mean(magnitude))
+    return np.mean(scores), np.max(scores)
+
+
+def reference_temporal(frames):
+    entropies, differences = [], []
+    for first, second in zip(frames, frames[1:]):
+        diff = cv2.absdiff(cv2.cvtColor(first, cv2.COLOR_BGR2GRAY), cv2.cvtColor(second, cv2.COLOR_BGR2GRAY))
+        hist = cv2.calcHist([diff], [0], None, [256], [0, 256])
+        hist_norm = hist / np.sum(hist)
+        entropies.append(-np.sum(hist_norm * np.log2(hist_norm + 1e-7)))
+        differences.append(np.mean(diff))
+    return np.mean(entropies), np.std(entropies), np.mean(differences), np.std(differences)
+
+
+def test_running_stats_match_numpy():
+    """Media, abaterea standard si maximul incrementale sunt cele calculate de numpy"""
+    values = np.random.default_rng(0).normal(5, 2, 1000)
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    assert stats.count == 1000
+    assert np.isclose(stats.mean, np.mean(values), rtol=1e-12)
+    assert np.isclose(stats.std, np.std(values), rtol=1e-12)
+    assert stats.max == np.max(values)
+    assert RunningStats().std == 0.0
+
+
+def test_results_match_the_list_based_detectors():
+    """Rezultatele agregate incremental sunt aceleasi cu formulele anterioare"""
+    frames = make_frames()
+    analyzer = VideoAnalyzer()
+
+    compression = analyzer.detect_compression_artifacts(frames)
+    avg, maximum = reference_compression(frames)
+    assert np.isclose(compression['avg_compression_artifacts'], avg, rtol=1e-12)
+    assert np.isclose(compression['max_compression_artifacts'], maximum, rtol=1e-12)
+    assert compression['analyzed_frames'] == len(frames)
+
+    temporal = analyzer.detect_temporal_inconsistencies(frames)
+    reference = reference_temporal(frames)
+    computed = (temporal['avg_entropy'], temporal['entropy_variation'],
+                temporal['avg_frame_difference'], temporal['difference_variation'])
+    assert np.allclose(computed, reference, rtol=1e-6)  # entropia anterioara era float32 (calcHist)
+    assert temporal['frame_transitions_analyzed'] == len(frames) - 1
+
+    assert 'error' in analyzer.detect_compression_artifacts([])
+    assert 'error' in analyzer.detect_temporal_inconsistencies(frames[:1])
+
+
+def test_running_stats_add_many_matches_numpy():
+    """Adaugarea unei serii intregi da aceleasi statistici ca numpy si ca adaugarea pe rand"""
+    values = np.random.default_rng(3).normal(4, 3, 200)
+    batch = RunningStats()
+    batch.add_many(values)
+    assert batch.count == 200 and batch.max == np.max(values)
+    assert np.isclose(batch.mean, np.mean(values), rtol=1e-14) and np.isclose(batch.std, np.std(values), rtol=1e-14)
+
+    merged = RunningStats()
+    for value in values[:50]:
+        merged.add(value)
+    merged.add_many(values[50:])
+    merged.add_many([])
+    assert np.isclose(merged.mean, np.mean(values), rtol=1e-12) and np.isclose(merged.std, np.std(values), rtol=1e-12)
+
+
+def test_transition_stack_matches_the_pairwise_formulas():
+    """Stiva vectorizata da exact valorile calculate pereche cu pereche (calcHist si np.mean)"""
+    frames = make_frames(9, size=(97, 61))
+    stack = video_features.gray_stack(iter(frames))
+    assert stack.dtype == np.uint8 and np.array_equal(stack, np.stack([to_gray(frame) for frame in frames]))
+    original = video_features.TEMPORAL_CHUNK_PIXELS
+    for chunk in (original, 97 * 61 * 2 + 1, 1):  # bucati de toate perechile, de doua perechi, de una
+        video_features.TEMPORAL_CHUNK_PIXELS = chunk
+        try:
+            entropies, differences = transition_stack_features(stack)
+        finally:
+            video_features.TEMPORAL_CHUNK_PIXELS = original
+        for index, (first, second) in enumerate(zip(stack, stack[1:])):
+            diff = cv2.absdiff(first, second)
+            hist = cv2.calcHist([diff], [0], None, [256], [0, 256])
+            hist_norm = hist / np.sum(hist)
+            assert entropies[index] == -np.sum(hist_norm * np.log2(hist_norm + 1e-7))
+            assert differences[index] == np.mean(diff)
+            assert (float(entropies[index]), float(differences[index])) == transition_features(first, second)
+
+    entropies, differences = transition_stack_features(stack[:1])
+    assert entropies.shape == differences.shape == (0,)
+
+
+def test_gray_stack_keeps_no_bgr_frames():
+    """Frame-urile BGR sunt convertite pe masura ce sunt primite; stiva creste peste capacitatea initiala"""
+    frames = make_frames(40)
+    alive = []
+
+    def stream():
+        for frame in frames:
+            copy = frame.copy()
+            alive.append(weakref.ref(copy))
+            yield copy
+            del copy
+            gc.collect()
+            # Doar frame-ul curent al consumatorului mai poate fi in memorie
+            assert sum(ref() is not None for ref in alive[:-1]) == 0
+
+    stack = video_features.gray_stack(stream())
+    assert stack.shape == (40, 64, 96)
+    assert np.array_equal(stack, video_features.gray_stack(frames))
+    assert np.array_equal(stack, np.stack([to_gray(frame) for frame in frames]))
+    assert video_features.gray_stack(iter([])).shape == (0, 0, 0)
+    with pytest.raises(ValueError):
+        video_features.gray_stack(iter([frames[0], frames[0][:10]]))
+
+
+def test_face_features_and_deepfake_result():
+    """Textura si simetria fetelor sunt agregate pe toate frame-urile"""
+    frames = make_frames(4)
+    extractor = FrameFeatureExtractor(compression=False, temporal=False, face_cascades=DetectorPool(FakeCascade),
+                                      workers=1)
+    statistics = extractor.collect(frames)
+
+    faces = [face_features(to_gray(frame), FakeCascade())[0] for frame in frames]
+    result = VideoAnalyzer().deepfake_result(statistics)
+    assert result['total_faces_detected'] == 4 and result['avg_faces_per_frame'] == 1.0
+    assert np.isclose(result['avg_face_texture'], np.mean([texture for texture, _ in faces]))
+    assert np.isclose(result['avg_face_symmetry'], np.mean([symmetry for _, symmetry in faces]))
+
+    empty = VideoAnalyzer().deepfake_result(FrameStatistics())
+    assert empty['deepfake_verdict'] == 'nu_s-au_detectat_fete' and empty['total_faces_detected'] == 0
+
+
+def test_single_pass_converts_each_frame_once_and_keeps_no_frames():
+    """Fiecare frame este convertit in gri o singura data si nu ramane in memorie dupa procesare"""
+    frames = make_frames(10)
+    conversions = []
+    alive = []
+
+    def counting_gray(frame):
+        conversions.append(1)
+        return to_gray(frame)
+
+    def stream():
+        for frame in frames:
+            copy = frame.copy()
+            alive.append(weakref.ref(copy))
+            yield copy
+
+    original = video_features.to_gray
+    video_features.to_gray = counting_gray
+    try:
+        statistics = VideoAnalyzer().collect_frame_statistics(stream(), faces=False)
+    finally:
+        video_features.to_gray = original
+    gc.collect()
+
+    assert statistics.frames == 10 and len(conversions) == 10
+    assert statistics.artifacts.count == 10 and statistics.entropy.count == 9
+    assert sum(ref() is not None for ref in alive) == 0
+
+
+def test_parallel_extraction_is_deterministic():
+    """Thread-urile si procesele dau exact aceleasi statistici ca parcurgerea secventiala"""
+    frames = make_frames(24)
+    analyzer = VideoAnalyzer()
+
+    def summary(statistics):
+        return (analyzer.compression_result(statistics), analyzer.temporal_result(statistics),
+                analyzer.deepfake_result(statistics))
+
+    face_cascades = DetectorPool(SlowCascade)
+    serial = summary(FrameFeatureExtractor(face_cascades=face_cascades, workers=1).collect(frames))
+    for executor in ('thread', 'process'):
+        extractor = FrameFeatureExtractor(face_cascades=face_cascades, workers=3, executor=executor)
+        assert summary(extractor.collect(iter(frames))) == serial
+        # Pool-ul este refolosit de analizele urmatoare
+        assert summary(extractor.collect(frames)) == serial
+
+
+def test_process_extraction_requires_equal_frame_sizes():
+    """Bufferul partajat are dimensiunea primului frame; frame-urile diferite sunt refuzate"""
+    frames = make_frames(3) + make_frames(1, size=(48, 32))
+    with pytest.raises(ValueError):
+        FrameFeatureExtractor(workers=2, executor='process').collect(frames)
+
+
+class RecordingCascade:
+    """Detector fals care retine imaginea primita si gaseste o fata in centrul ei."""
+
+    def __init__(self):
+        self.shapes = []
+
+    def detectMultiScale(self, gray, scale_factor, min_neighbors):
+        self.shapes.append(gray.shape)
+        height, width = gray.shape
+        return [(width // 4, height // 4, width // 2, height // 2)]
+
+
+def smooth_frame(width: int, height: int) -> np.ndarray:
+    """Aceeasi imagine (zgomot netezit, comprimat JPEG) la rezolutia ceruta."""
+    noise = np.random.default_rng(2).integers(0, 255, (135, 240), dtype=np.uint8).astype(np.float32)
+    base = cv2.normalize(cv2.GaussianBlur(noise, (0, 0), 3), None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
+    _, encoded = cv2.imencode('.jpg', cv2.resize(base, (width, height), interpolation=cv2.INTER_CUBIC),
+                              [cv2.IMWRITE_JPEG_QUALITY, 40])
+    return cv2.imdecode(encoded, cv2.IMREAD_GRAYSCALE)
+
+
+def test_artifact_score_matches_the_full_spectrum():
+    """rfft2 cu ponderi pentru coloanele conjugate da acelasi scor ca fft2 pe tot spectrul"""
+    for width, height in ((96, 64), (97, 63), (1, 5)):
+        gray = np.random.default_rng(width).integers(0, 255, (height, width), dtype=np.uint8)
+        magnitude = np.log(np.abs(np.fft.fftshift(np.fft.fft2(gray))) + 1)
+        assert np.isclose(artifact_score(gray), np.std(magnitude) / np.mean(magnitude), rtol=1e-12)
+
+
+def test_analysis_level_is_resolution_independent():
+    """Frame-urile mari sunt analizate la aceeasi latura maxima; scorul de artefacte ramane stabil"""
+    small, scale = analysis_level(np.zeros((2160, 3840), np.uint8), 640)
+    assert small.shape == (360, 640) and scale == 6.0
+    frame = np.zeros((64, 96), np.uint8)
+    assert analysis_level(frame, 640)[0] is frame and analysis_level(frame, 0)[1] == 1.0
+
+    scores = [artifact_score(analysis_level(smooth_frame(width, height), 640)[0])
+              for width, height in ((640, 360), (1920, 1080), (3840, 2160))]
+    assert max(scores) - min(scores) < 0.02
+
+
+def test_faces_are_detected_small_and_measured_full_size():
+    """Detectia ruleaza pe nivelul micsorat; textura se masoara pe regiunea din frame-ul original"""
+    gray = smooth_frame(3840, 2160)
+    cascade = RecordingCascade()
+    [(texture, _)] = face_features(gray, cascade, analysis_level(gray, 640))
+    assert cascade.shapes == [(360, 640)]
+    assert np.isclose(texture, np.std(gray[540:1620, 960:2880]))
+
+
+def test_iter_frames_streams_from_the_video():
+    """iter_frames este un generator; fisierele care nu pot fi citite nu produc frame-uri"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'clip.mp4')
+        write_video(path, 60)
+        analyzer = VideoAnalyzer()
+        frames = analyzer.iter_frames(path, max_frames=5)
+        assert iter(frames) is frames
+        assert len(list(frames)) == 5
+        assert list(analyzer.iter_frames(os.path.join(directory, 'lipsa.mp4'))) == []
+
+
+if __name__ == "__main__":
+    test_running_stats_match_numpy()
+    test_running_stats_add_many_matches_numpy()
+    test_transition_stack_matches_the_pairwise_formulas()
+    test_gray_stack_keeps_no_bgr_frames()
+    test_results_match_the_list_based_detectors()
+    test_face_features_and_deepfake_result()
+    test_artifact_score_matches_the_full_spectrum()
+    test_analysis_level_is_resolution_independent()
+    test_faces_are_detected_small_and_measured_full_size()
+    test_single_pass_converts_each_frame_once_and_keeps_no_frames()
+    test_parallel_extraction_is_deterministic()
+    test_process_extraction_requires_equal_frame_sizes()
+    test_iter_frames_streams_from_the_video()
+    print("✅ Toate testele pentru video_features au trecut")
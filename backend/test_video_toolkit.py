@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Teste pentru resursele video comune procesului (video_toolkit.py)
+"""
+
+import os
+import stat
+import tempfile
+import threading
+
+from video_analyzer import VideoAnalyzer, get_advanced_video_analyzer
+from video_features import DetectorPool
+from video_toolkit import VideoToolkit, get_video_toolkit
+
+
+def make_tool(directory: str) -> str:
+    """Unealta falsa: fiecare rulare adauga o linie intr-un fisier, ca apelurile sa poata fi numarate."""
+    path = os.path.join(directory, 'unealta')
+    with open(path, 'w') as f:
+        f.write(f"#!/bin/sh\necho rulat >> {directory}/apeluri\necho 'unealta version 1.0'\n")
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path
+
+
+def calls(directory: str) -> int:
+    with open(os.path.join(directory, 'apeluri')) as f:
+        return len(f.readlines())
+
+
+def test_tool_probe_is_cached_until_the_interval_expires():
+    """Disponibilitatea unei unelte este verificata o data, apoi doar dupa intervalul configurat"""
+    with tempfile.TemporaryDirectory() as directory:
+        tool = make_tool(directory)
+        toolkit = VideoToolkit(probe_interval=3600, temp_dir=directory)
+        assert toolkit.tool_available(tool) and toolkit.tool_available(tool)
+        assert calls(directory) == 1
+        assert toolkit.get_status()['tools'][tool]['version'] == 'unealta version 1.0'
+
+        refreshing = VideoToolkit(probe_interval=0, temp_dir=directory)
+        refreshing.tool_available(tool)
+        refreshing.tool_available(tool)
+        assert calls(directory) == 3
+
+        assert not toolkit.tool_available(os.path.join(directory, 'lipsa'))
+
+
+def test_detectors_are_loaded_once_and_never_shared():
+    """Detectoarele sunt refolosite intre analize, dar doua analize simultane nu folosesc acelasi obiect"""
+    pool = DetectorPool(object)
+    with pool.borrow() as first:
+        pass
+    with pool.borrow() as second:
+        assert second is first
+    assert pool.get_status() == {'created': 1, 'idle': 1}
+
+    borrowed = []
+    inside = threading.Barrier(3)
+
+    def analysis():
+        with pool.borrow() as detector:
+            borrowed.append(detector)
+            inside.wait(5)
+
+    threads = [threading.Thread(target=analysis) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(detector) for detector in borrowed}) == 3
+    assert pool.get_status() == {'created': 3, 'idle': 3}
+
+
+def test_scratch_dirs_live_under_one_process_directory():
+    """Directoarele temporare sunt create sub directorul comun si sterse dupa folosire"""
+    with tempfile.TemporaryDirectory() as directory:
+        toolkit = VideoToolkit(temp_dir=os.path.join(directory, 'video'))
+        with toolkit.scratch_dir() as scratch:
+            assert os.path.dirname(scratch) == toolkit.temp_root()
+            open(os.path.join(scratch, 'upload.mp4'), 'wb').close()
+        assert not os.path.exists(scratch)
+
+        root = toolkit.temp_root()
+        toolkit.cleanup()
+        assert not os.path.exists(root)
+        assert toolkit.temp_root() != root  # recreat la urmatoarea folosire
+
+
+def test_analyzers_share_the_process_toolkit():
+    """Analizorul avansat este unic per proces, iar analizoarele nu mai creeaza directoare proprii"""
+    assert get_advanced_video_analyzer() is get_advanced_video_analyzer()
+    first, second = VideoAnalyzer(), VideoAnalyzer()
+    assert first.toolkit is second.toolkit is get_video_toolkit()
+    assert first.temp_dir == second.temp_dir
+
+
+if __name__ == "__main__":
+    test_tool_probe_is_cached_until_the_interval_expires()
+    test_detectors_are_loaded_once_and_never_shared()
+    test_scratch_dirs_live_under_one_process_directory()
+    test_analyzers_share_the_process_toolkit()
+    print("✅ Toate testele pentru video_toolkit au trecut")
@@ -0,0 +1,336 @@
+"""
+Pattern-uri de text folosite de euristicile din ml_analyzer si automatele compilate pentru ele.
+Fiecare grup de categorii este compilat o singura data intr-un MultiPatternMatcher,
+care numara toate categoriile intr-o singura trecere peste textul in litere mici.
+"""
+
+from functools import lru_cache
+from typing import Sequence
+
+from pattern_matcher import MultiPatternMatcher
+
+# ============================================================
+# Pattern-uri subtile (MLAnalyzer._detect_subtle_patterns)
+# ============================================================
+
+# Afirmații absurde cu aparență științifică
+ABSURD_SCIENTIFIC_CLAIMS = [
+    # Afirmații medicale absurde
+    'vindecă cancerul în', 'elimină complet diabetul', 'vindecă orice boală',
+    'crește iq-ul cu', 'dezvoltă puteri', 'puteri telepatice', 'puteri supranaturale',
+    'controlează vremea', 'controlează timpul', 'controlează gravitația',
+    'să trăiască 200', 'să trăiască 150', 'să trăiască 100 de ani',
+    'energie infinită', 'mișcare perpetuă', 'teleportare', 'citește gândurile',
+    'vindecă în 3 zile', 'vindecă în 48 ore', 'vindecă instant',
+    'elimină complet', 'vindecă 100%', 'funcționează 100%',
+    'prelungește viața cu', 'crește viața cu', 'adaugă ani de viață',
+
+    # Afirmații tehnologice absurde
+    'cipuri microscopice', 'controlul mental', 'mind control',
+    'cipuri în apă', 'cipuri în vaccin', 'tracking chips',
+    'tehnologie secretă', 'arme secrete', 'experimente secrete',
+
+    # Combinații absurde cu substanțe comune
+    'bicarbonatul vindecă', 'oțetul vindecă', 'mierea vindecă totul',
+    'apa vindecă', 'aerul vindecă', 'soarele vindecă',
+    'berea crește', 'cafeaua vindecă', 'ceaiul elimină',
+    'mirositul florilor', 'dormitul cu telefonul', 'privitul la',
+
+    # Versiuni în engleză
+    'cures cancer in', 'eliminates diabetes completely', 'increases iq by',
+    'develops telepathic powers', 'live 200 years', 'live 150 years',
+    'microscopic chips', 'mind control chips', 'secret technology'
+]
+
+# Pattern-uri de exagerare
+EXAGGERATION_PATTERNS = [
+    'complet', 'total', 'absolut', 'perfect', 'exact', '100%', 'garantat',
+    'revoluționar', 'incredibil', 'șocant', 'uimitor', 'fantastic',
+    'completely', 'totally', 'absolutely', 'perfectly', 'guaranteed',
+    'revolutionary', 'incredible', 'shocking', 'amazing', 'fantastic'
+]
+
+# Surse false cu aparență credibilă
+FAKE_CREDIBLE_SOURCES = [
+    # Instituții false care sună credibil
+    'institutul internațional de', 'centrul mondial pentru', 'fundația globală',
+    'organizația mondială de', 'institutul avansat de', 'centrul de cercetări avansate',
+    'laboratorul secret', 'institutul secret', 'centrul confidențial',
+    'international institute of', 'global center for', 'advanced research center',
+    'world organization of', 'secret laboratory', 'confidential center',
+
+    # Autorități vagi cu universități reale (red flag când e combinat cu afirmații absurde)
+    'cercetătorii de la harvard', 'experții de la mit', 'oamenii de știință de la stanford',
+    'researchers from harvard', 'experts from mit', 'scientists from stanford',
+
+    # Pattern-uri de autoritate falsă
+    'experții anonimi', 'surse anonime', 'informatori din interior',
+    'doctorii ascund', 'medicii nu vor să știi', 'industria ascunde',
+    'anonymous experts', 'anonymous sources', 'inside sources',
+    'doctors hide', 'medical industry hides', 'big pharma blocks'
+]
+
+# Pattern-uri de conspirație
+CONSPIRACY_PATTERNS = [
+    'big pharma', 'industria farmaceutică', 'industria medicală',
+    'guvernul ascunde', 'guvernele interzic', 'mass-media refuză',
+    'industria tech suprimă', 'companiile blochează', 'corporațiile ascund',
+    'agenda ascunsă', 'complot mondial', 'conspirația medicală',
+    'government hides', 'governments ban', 'mass media refuses',
+    'tech industry suppresses', 'companies block', 'corporations hide',
+    'hidden agenda', 'global conspiracy', 'medical conspiracy'
+]
+
+# Pattern-uri de urgență artificială (intrările duplicate contează de două ori)
+URGENCY_PATTERNS = [
+    'urgent!', 'breaking!', 'ultimă oră!', 'atenție!', 'alertă!',
+    'acționează acum', 'nu aștepta', 'timpul se scurge', 'înainte să fie prea târziu',
+    'urgent!', 'breaking!', 'attention!', 'alert!',
+    'act now', 'don\'t wait', 'time running out', 'before it\'s too late'
+]
+
+# Știință falsă cu aparență credibilă (comparate ca subșiruri literale, nu ca regex)
+FAKE_SCIENCE_PATTERNS = [
+    # Combinații periculoase: instituție credibilă + afirmație absurdă
+    'harvard.*vindecă', 'mit.*elimină', 'stanford.*crește',
+    'universitatea.*puteri', 'cercetătorii.*secret', 'studiul.*ascuns',
+    'journal.*vindecă', 'research.*elimină', 'scientists.*secret',
+
+    # Afirmații medicale false cu aparență științifică
+    'studiile dovedesc că.*vindecă', 'cercetarea confirmă că.*elimină',
+    'analiza arată că.*crește', 'datele demonstrează că.*dezvoltă',
+    'research proves.*cures', 'studies confirm.*eliminates',
+    'analysis shows.*increases', 'data demonstrates.*develops',
+
+    # Combinații de cuvinte științifice cu afirmații absurde
+    'metodă științifică.*secret', 'descoperire medicală.*ascuns',
+    'breakthrough.*hidden', 'discovery.*suppressed'
+]
+
+# Pattern-uri pentru credibilitate reală
+CREDIBLE_PATTERNS = [
+    # Surse oficiale concrete
+    'ministerul', 'primăria', 'guvernul român', 'parlamentul',
+    'comisia europeană', 'organizația mondială a sănătății',
+    'ministry', 'government', 'parliament', 'european commission',
+    'world health organization', 'official statement',
+
+    # Limbaj științific real
+    'conform studiului', 'potrivit cercetării', 'datele arată',
+    'statisticile indică', 'analiza dezvăluie', 'raportul confirmă',
+    'according to study', 'research indicates', 'data shows',
+    'statistics indicate', 'analysis reveals', 'report confirms',
+
+    # Contexte normale de știri
+    'ieri', 'astăzi', 'săptămâna trecută', 'luna aceasta',
+    'prețul', 'temperatura', 'traficul', 'lucrările',
+    'yesterday', 'today', 'last week', 'this month',
+    'price', 'temperature', 'traffic', 'construction'
+]
+
+# Instituții credibile folosite pentru bonusul afirmații absurde + surse credibile
+CREDIBLE_INSTITUTIONS = ['harvard', 'mit', 'stanford', 'cercetătorii']
+
+# ============================================================
+# Manipulare lingvistică (MLAnalyzer._analyze_linguistic_manipulation)
+# ============================================================
+
+# Adjective superlative și de intensificare
+SUPERLATIVES = ['best', 'worst', 'most', 'least', 'greatest', 'smallest', 'highest', 'lowest',
+                'only', 'perfect', 'ultimate', 'absolute', 'complete', 'total', 'entire',
+                'cel mai bun', 'cel mai rău', 'cel mai mare', 'cel mai mic', 'cel mai înalt',
+                'singurul', 'perfect', 'ultim', 'absolut', 'complet', 'total']
+
+# Cuvinte emoționale puternice și de manipulare
+EMOTIONAL_WORDS = ['shocking', 'amazing', 'incredible', 'unbelievable', 'devastating', 'terrifying',
+                   'stunning', 'mind-blowing', 'extraordinary', 'phenomenal', 'miraculous',
+                   'outrageous', 'scandalous', 'explosive', 'bombshell', 'sensational',
+                   'șocant', 'uimitor', 'incredibil', 'de necrezut', 'devastator', 'terifiant',
+                   'extraordinar', 'fenomenal', 'miraculos', 'scandulos', 'senzațional']
+
+# Adverbe de intensificare
+INTENSIFIERS = ['extremely', 'incredibly', 'absolutely', 'completely', 'totally', 'perfectly',
+                'dramatically', 'significantly', 'remarkably', 'extraordinarily', 'phenomenally',
+                'extrem de', 'incredibil de', 'absolut', 'complet', 'total', 'perfect',
+                'dramatic', 'semnificativ', 'remarcabil', 'extraordinar']
+
+# ============================================================
+# Clasificatorul cu dataset mare (load_simple_large_model)
+# ============================================================
+
+# Cuvinte de bază folosite dacă enhanced_keywords.json nu poate fi citit
+FALLBACK_FAKE_KEYWORDS = [
+    'breaking', 'urgent', 'shocking', 'secret', 'conspiracy', 'hoax',
+    'ultimă oră fals', 'conspirație', 'minciună', 'fals'
+]
+
+# Cuvinte de bază pentru știri reale
+FALLBACK_REAL_KEYWORDS = [
+    'research', 'study', 'analysis', 'experts', 'officials', 'data',
+    'cercetare', 'studiu', 'analiză', 'experți', 'oficiali', 'date'
+]
+
+# Pattern-uri generale de exagerare și manipulare
+SUBTLE_FAKE_PATTERNS = [
+    # Pattern-uri de exagerare generală
+    'completely', 'totally', 'absolutely', 'perfectly', 'exactly',
+    'instantly', 'immediately', 'suddenly', 'dramatically', 'massively',
+    'revolutionary', 'groundbreaking', 'unprecedented', 'extraordinary', 'incredible',
+    'shocking', 'stunning', 'amazing', 'remarkable', 'outstanding',
+    'never seen before', 'first time ever', 'only solution', 'best ever',
+    'guaranteed', 'proven', 'confirmed', 'established', 'demonstrated',
+
+    # Pattern-uri de urgență artificială  
+    'breaking', 'urgent', 'immediate', 'emergency', 'crisis',
+    'act now', 'limited time', 'don\'t wait', 'hurry', 'quickly',
+    'before it\'s too late', 'last chance', 'final warning', 'deadline',
+
+    # Pattern-uri de autoritate falsă
+    'experts agree', 'scientists confirm', 'studies prove', 'research shows',
+    'according to experts', 'leading authorities', 'top specialists', 'renowned',
+    'prestigious', 'leading', 'world-class', 'internationally recognized',
+
+    # Pattern-uri de conspirație subtile
+    'they don\'t want you to know', 'hidden truth', 'secret information',
+    'cover up', 'suppressed', 'censored', 'banned', 'forbidden',
+    'mainstream media won\'t tell you', 'government doesn\'t want',
+
+    # Versiuni în română
+    'complet', 'total', 'absolut', 'perfect', 'exact',
+    'instant', 'imediat', 'brusc', 'dramatic', 'masiv',
+    'revoluționar', 'revoluționar', 'fără precedent', 'extraordinar',
+    'ultimă oră', 'urgent', 'imediat', 'criză', 'acționează',
+    'experții confirmă', 'studiile dovedesc', 'cercetările arată'
+]
+
+# Surse vagi și credibilitate suspectă
+DUBIOUS_SOURCES = [
+    # Surse anonime/vagi
+    'anonymous source', 'unnamed expert', 'confidential report', 'insider information',
+    'leaked documents', 'whistleblower reveals', 'off-the-record', 'sources say',
+    'according to sources', 'reliable sources', 'inside sources', 'trusted sources',
+
+    # Autorități vagi
+    'experts', 'specialists', 'authorities', 'officials', 'insiders',
+    'top people', 'those in the know', 'industry leaders', 'key figures',
+
+    # Organizații vagi sau false
+    'international organization', 'global foundation', 'research institute',
+    'prestigious university', 'leading center', 'advanced facility',
+    'renowned organization', 'world-class institute', 'top-rated center',
+
+    # Pattern-uri de temporalitate suspectă
+    'will soon reveal', 'about to announce', 'preparing to release',
+    'plans to publish', 'expected to confirm', 'will shortly disclose',
+
+    # Afirmații absolute fără dovezi
+    'it\'s proven that', 'everyone knows', 'it\'s obvious that',
+    'common knowledge', 'well established', 'widely accepted',
+
+    # Versiuni în română
+    'sursă anonimă', 'expert neidentificat', 'raport confidențial', 'informații din interior',
+    'documente scurse', 'informator dezvăluie', 'organizație internațională',
+    'institut de cercetare', 'universitate prestigioasă', 'centru de cercetare'
+]
+
+# Urgență artificială
+ARTIFICIAL_URGENCY = [
+    'breaking news', 'urgent', 'act now', 'don\'t wait', 'time running out',
+    'limited time', 'exclusive offer', 'once in a lifetime',
+    'ultimă oră', 'urgent', 'acționează acum', 'nu aștepta', 'timpul se scurge',
+    'timp limitat', 'ofertă exclusivă', 'o dată în viață'
+]
+
+# Indicatori de conspirație
+CONSPIRACY_INDICATORS = [
+    'government control', 'mind control', 'cover-up', 'suppresses truth', 'hidden agenda',
+    'they don\'t want you to know', 'mainstream media', 'big pharma',
+    'guvernul controlează', 'controlul minții', 'mușamalizare', 'suprimă adevărul',
+    'agende ascunse', 'nu vor să știi', 'media mainstream'
+]
+
+# Indicatori de credibilitate
+CREDIBILITY_INDICATORS = [
+    'according to', 'data shows', 'statistics indicate', 'research suggests',
+    'experts say', 'officials confirm', 'study finds', 'analysis reveals',
+    'published in', 'peer-reviewed', 'university study', 'scientific journal',
+    'conform cu', 'datele arată', 'statisticile indică', 'cercetarea sugerează',
+    'experții spun', 'oficialii confirmă', 'studiul găsește', 'analiza dezvăluie',
+    'publicat în', 'evaluat de colegi', 'studiu universitar', 'revistă științifică'
+]
+
+# Cuvinte emoționale puternice
+CLASSIFIER_EMOTIONAL_WORDS = ['shocking', 'amazing', 'incredible', 'unbelievable', 'devastating',
+                              'șocant', 'uimitor', 'incredibil', 'de necrezut', 'devastator']
+
+# Cuvinte pentru departajarea scorurilor egale
+ACADEMIC_WORDS = ['study', 'research', 'analysis', 'studiu', 'cercetare', 'analiză']
+SENSATIONAL_WORDS = ['breaking', 'urgent', 'shocking', 'ultimă oră']
+
+# ============================================================
+# Detecție heuristică a limbii (MLAnalyzer._detect_language)
+# ============================================================
+
+# Cuvinte caracteristice românești
+RO_LANGUAGE_WORDS = ['și', 'sau', 'este', 'sunt', 'pentru', 'cu', 'de', 'la', 'în', 'pe', 'că', 'să', 'nu', 'se', 'ce', 'mai', 'foarte', 'după', 'până', 'către', 'asupra', 'dintre', 'printre']
+
+# Cuvinte caracteristice engleze
+EN_LANGUAGE_WORDS = ['the', 'and', 'or', 'is', 'are', 'for', 'with', 'of', 'at', 'in', 'on', 'that', 'to', 'not', 'what', 'more', 'very', 'after', 'until', 'towards', 'among', 'between']
+
+
+# ============================================================
+# Automate compilate (construite o singură dată, la import)
+# ============================================================
+
+SUBTLE_PATTERN_MATCHER = MultiPatternMatcher({
+    'absurd_claims': ABSURD_SCIENTIFIC_CLAIMS,
+    'exaggeration': EXAGGERATION_PATTERNS,
+    'fake_credible_sources': FAKE_CREDIBLE_SOURCES,
+    'conspiracy': CONSPIRACY_PATTERNS,
+    'urgency': URGENCY_PATTERNS,
+    'fake_science': FAKE_SCIENCE_PATTERNS,
+    'credible': CREDIBLE_PATTERNS,
+    'credible_institutions': CREDIBLE_INSTITUTIONS,
+})
+
+LINGUISTIC_MATCHER = MultiPatternMatcher({
+    'superlatives': SUPERLATIVES,
+    'emotional': EMOTIONAL_WORDS,
+    'intensifiers': INTENSIFIERS,
+})
+
+LANGUAGE_MATCHER = MultiPatternMatcher({
+    'ro': RO_LANGUAGE_WORDS,
+    'en': EN_LANGUAGE_WORDS,
+})
+
+CLASSIFIER_CATEGORIES = {
+    'subtle': SUBTLE_FAKE_PATTERNS,
+    'dubious': DUBIOUS_SOURCES,
+    'urgency': ARTIFICIAL_URGENCY,
+    'conspiracy': CONSPIRACY_INDICATORS,
+    'credibility': CREDIBILITY_INDICATORS,
+    'emotional': CLASSIFIER_EMOTIONAL_WORDS,
+    'academic': ACADEMIC_WORDS,
+    'sensational': SENSATIONAL_WORDS,
+}
+
+
+@lru_cache(maxsize=8)
+def build_classifier_matcher(fake_keywords: Sequence[str], real_keywords: Sequence[str]) -> MultiPatternMatcher:
+    """
+    Compileaza automatul clasificatorului pentru un set de keywords.
+    Rezultatul este memorat, deci automatul se construieste o singura data per set.
+
+    Args:
+        fake_keywords: Tuplu de keywords pentru fake news
+        real_keywords: Tuplu de keywords pentru stiri reale
+
+    Returns:
+        MultiPatternMatcher: Automat cu categoriile clasificatorului plus 'fake_keywords' si 'real_keywords'
+    """
+    return MultiPatternMatcher({
+        'fake_keywords': fake_keywords,
+        'real_keywords': real_keywords,
+        **CLASSIFIER_CATEGORIES,
+    })
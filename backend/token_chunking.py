@@ -0,0 +1,85 @@
+"""
+Impartirea articolelor lungi in ferestre de tokeni pentru clasificatorul mBERT.
+Textul este tokenizat o singura data, impartit in ferestre suprapuse de lungimea maxima
+a modelului, iar predictiile ferestrelor sunt agregate intr-o singura predictie (max sau medie).
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import config
+except ImportError:
+    config = None
+
+MBERT_CHUNKING = getattr(config, 'MBERT_CHUNKING', True)
+MBERT_CHUNK_OVERLAP = getattr(config, 'MBERT_CHUNK_OVERLAP', 64)
+MBERT_MAX_CHUNKS = getattr(config, 'MBERT_MAX_CHUNKS', 8)
+MBERT_CHUNK_AGGREGATION = getattr(config, 'MBERT_CHUNK_AGGREGATION', 'max')
+
+AGGREGATIONS = ('max', 'mean')
+
+
+def plan_windows(token_count: int, window: int, overlap: int = MBERT_CHUNK_OVERLAP,
+                 max_chunks: int = MBERT_MAX_CHUNKS) -> List[Tuple[int, int]]:
+    """
+    Calculeaza ferestrele (start, end) care acopera toti tokenii unui text.
+    Daca sunt mai multe ferestre decat max_chunks, se pastreaza ferestre distribuite uniform
+    (prima si ultima sunt mereu incluse), astfel incat tot articolul sa fie reprezentat.
+
+    Args:
+        token_count: Numarul de tokeni ai textului (fara tokenii speciali)
+        window: Lungimea unei ferestre
+        overlap: Numarul de tokeni comuni intre doua ferestre consecutive
+        max_chunks: Numarul maxim de ferestre
+
+    Returns:
+        list: Perechi (start, end) in ordinea din text
+    """
+    window = max(1, window)
+    if token_count <= window:
+        return [(0, token_count)]
+
+    stride = max(1, window - min(overlap, window - 1))
+    starts = list(range(0, token_count - window + 1, stride))
+    if starts[-1] + window < token_count:
+        starts.append(token_count - window)
+
+    if len(starts) > max_chunks > 0:
+        picked = np.unique(np.linspace(0, len(starts) - 1, max_chunks).round().astype(int))
+        starts = [starts[i] for i in picked]
+    return [(start, start + window) for start in starts]
+
+
+def split_into_windows(token_ids: Sequence[int], window: int, overlap: int = MBERT_CHUNK_OVERLAP,
+                       max_chunks: int = MBERT_MAX_CHUNKS) -> List[List[int]]:
+    """Imparte lista de tokeni in ferestre (vezi plan_windows)."""
+    return [list(token_ids[start:end]) for start, end in plan_windows(len(token_ids), window, overlap, max_chunks)]
+
+
+def aggregate_predictions(predictions: Sequence[Dict], method: str = MBERT_CHUNK_AGGREGATION) -> Dict:
+    """
+    Combina predictiile ferestrelor unui text.
+
+    Args:
+        predictions: Predictii {'label', 'score', 'probabilities': {eticheta: probabilitate}}
+        method: 'max' - fereastra cu cel mai sigur scor; 'mean' - media distributiilor de probabilitate
+            (fara distributii pentru toate ferestrele, 'mean' se comporta ca 'max')
+
+    Returns:
+        dict: {'label', 'score', 'chunks'}
+    """
+    if method not in AGGREGATIONS:
+        raise ValueError(f"Metodă de agregare necunoscută: {method}")
+    if not predictions:
+        raise ValueError("Nu există predicții de agregat")
+
+    if method == 'mean' and all('probabilities' in p for p in predictions):
+        labels = list(predictions[0]['probabilities'])
+        mean = np.mean([[p['probabilities'][label] for label in labels] for p in predictions], axis=0)
+        best = int(mean.argmax())
+        return {'label': labels[best], 'score': float(mean[best]), 'chunks': len(predictions)}
+
+    strongest = max(predictions, key=lambda p: p['score'])
+    return {'label': strongest['label'], 'score': float(strongest['score']), 'chunks': len(predictions)}
@@ -0,0 +1,198 @@
+"""
+Salvarea fisierelor incarcate intr-o singura trecere.
+
+Werkzeug scrie fiecare fisier dintr-un formular multipart intr-un obiect intors de
+Request._get_file_stream. StreamingUpload este acel obiect: scrie bucatile direct intr-un
+fisier temporar din directorul final si calculeaza in acelasi timp dimensiunea si SHA-256.
+Copia permanenta este apoi o simpla redenumire atomica (os.replace) a fisierului temporar,
+fara o a doua scriere si fara a citi videoclipul in memorie.
+
+BlobStore pastreaza fisierele dupa SHA-256, astfel incat acelasi continut incarcat de mai
+multe ori (de acelasi utilizator sau de utilizatori diferiti) este stocat o singura data.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import NamedTuple
+
+try:
+    import config
+except ImportError:
+    config = None
+
+UPLOAD_CHUNK_SIZE = getattr(config, 'UPLOAD_CHUNK_SIZE', 1024 * 1024)
+
+PARTIAL_SUFFIX = '.part'
+
+
+class StoredUpload(NamedTuple):
+    """Un fisier incarcat, salvat definitiv."""
+    path: str
+    size: int
+    sha256: str
+
+    @property
+    def filename(self) -> str:
+        return os.path.basename(self.path)
+
+
+class StreamingUpload:
+    """
+    Fisier temporar care calculeaza dimensiunea si SHA-256 pe masura ce este scris.
+
+    Implementeaza interfata ceruta de Werkzeug (write, read, readline, seek, tell), deci
+    poate fi intors de Request._get_file_stream. Fisierul temporar este creat in `directory`
+    (acelasi sistem de fisiere ca destinatia, ca redenumirea sa fie atomica) si este sters la
+    close() daca nu a fost pastrat cu persist().
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        fd, self.temp_path = tempfile.mkstemp(prefix='.upload-', suffix=PARTIAL_SUFFIX, dir=directory)
+        self.file = os.fdopen(fd, 'w+b')
+        self.size = 0
+        self._digest = hashlib.sha256()
+        self.persisted_path = None
+
+    def write(self, data) -> int:
+        if self.file.tell() != self.size:
+            # Scriere in mijlocul fisierului: hash-ul se recalculeaza la persist()
+            self._digest = None
+        written = self.file.write(data)
+        if self._digest is not None:
+            self._digest.update(data)
+        self.size = max(self.size, self.file.tell())
+        return written
+
+    def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
+
+    def readline(self, size: int = -1) -> bytes:
+        return self.file.readline(size)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self.file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def readable(self) -> bool:
+        return True
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def flush(self):
+        self.file.flush()
+
+    @property
+    def closed(self) -> bool:
+        return self.file.closed
+
+    @property
+    def sha256(self) -> str:
+        if self._digest is None:
+            self.file.flush()
+            self._digest = file_sha256(self.temp_path)
+        return self._digest.hexdigest()
+
+    def persist(self, path: str) -> StoredUpload:
+        """Muta fisierul temporar la `path` (redenumire atomica) si intoarce datele lui."""
+        self.file.flush()
+        digest = self.sha256
+        os.replace(self.temp_path, path)
+        self.persisted_path = path
+        return StoredUpload(path, self.size, digest)
+
+    def close(self):
+        self.file.close()
+        if self.persisted_path is None:
+            try:
+                os.unlink(self.temp_path)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def file_sha256(path: str, chunk_size: int = UPLOAD_CHUNK_SIZE):
+    """Obiectul hashlib SHA-256 al unui fisier, citit pe bucati."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest
+
+
+def _received(file_storage, directory: str, chunk_size: int = UPLOAD_CHUNK_SIZE) -> StreamingUpload:
+    """
+    StreamingUpload-ul din care poate fi mutat fisierul in `directory`: cel primit in cerere, daca
+    este pe acelasi sistem de fisiere, altfel o copie facuta o singura data, pe bucati.
+    """
+    stream = file_storage.stream
+    if (isinstance(stream, StreamingUpload) and stream.persisted_path is None
+            and os.stat(os.path.dirname(stream.temp_path)).st_dev == os.stat(directory).st_dev):
+        return stream
+
+    upload = StreamingUpload(directory)
+    try:
+        shutil.copyfileobj(stream, upload, chunk_size)
+    except BaseException:
+        upload.close()
+        raise
+    return upload
+
+
+def save_upload(file_storage, path: str, chunk_size: int = UPLOAD_CHUNK_SIZE) -> StoredUpload:
+    """
+    Salveaza un fisier incarcat (werkzeug FileStorage) la `path`.
+
+    Daca fisierul a fost primit printr-un StreamingUpload pe acelasi sistem de fisiere, este doar
+    redenumit; altfel este copiat o singura data, pe bucati, calculand dimensiunea si hash-ul.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    with _received(file_storage, directory, chunk_size) as upload:
+        return upload.persist(path)
+
+
+class BlobStore:
+    """
+    Depozit de fisiere adresat prin continut: fiecare continut unic este pastrat o singura data,
+    la <root>/<sha256[:2]>/<sha256>. Incarcarile repetate ale aceluiasi continut nu ocupa spatiu nou.
+    """
+
+    def __init__(self, root: str, chunk_size: int = UPLOAD_CHUNK_SIZE):
+        self.root = root
+        self.chunk_size = chunk_size
+
+    def path(self, sha256: str) -> str:
+        """Calea fisierului cu continutul dat."""
+        return os.path.join(self.root, sha256[:2], sha256)
+
+    def exists(self, sha256: str) -> bool:
+        return os.path.exists(self.path(sha256))
+
+    def add(self, file_storage) -> StoredUpload:
+        """
+        Adauga un fisier incarcat in depozit. Daca acelasi continut exista deja, fisierul primit
+        este sters si este intoarsa calea celui existent.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        with _received(file_storage, self.root, self.chunk_size) as upload:
+            digest = upload.sha256
+            path = self.path(digest)
+            if os.path.exists(path):
+                return StoredUpload(path, upload.size, digest)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            return upload.persist(path)
+
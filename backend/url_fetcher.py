@@ -0,0 +1,193 @@
+"""
+Descarcarea articolelor de la URL-uri pentru analiza.
+O sesiune requests comuna pastreaza conexiunile keep-alive, corpul raspunsului este citit
+in flux cu o limita de octeti, articolul este extras cu content_extractor (lxml), iar rezultatul
+este pastrat intr-un cache pe URL revalidat cu ETag / Last-Modified (cereri conditionale).
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from content_extractor import extract_article
+
+try:
+    import config
+except ImportError:
+    config = None
+
+URL_FETCH_TIMEOUT = getattr(config, 'URL_FETCH_TIMEOUT', 10)
+URL_FETCH_MAX_BYTES = getattr(config, 'URL_FETCH_MAX_BYTES', 5 * 1024 * 1024)
+URL_FETCH_POOL_SIZE = getattr(config, 'URL_FETCH_POOL_SIZE', 16)
+URL_FETCH_CACHE_ENTRIES = getattr(config, 'URL_FETCH_CACHE_ENTRIES', 256)
+URL_FETCH_CACHE_FRESH_SECONDS = getattr(config, 'URL_FETCH_CACHE_FRESH_SECONDS', 300)
+URL_FETCH_USER_AGENT = getattr(
+    config, 'URL_FETCH_USER_AGENT',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+# Tipurile de conținut din care se poate extrage text
+TEXT_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'application/xml', 'text/xml', 'text/plain')
+CHUNK_SIZE = 64 * 1024
+
+
+class FetchError(Exception):
+    """Pagina nu a putut fi descarcata sau nu contine text."""
+
+
+class UrlFetcher:
+    """
+    Descarca pagini si pastreaza articolele extrase. Intrarile din cache sunt servite direct cat timp
+    sunt proaspete; dupa aceea sunt revalidate, iar un raspuns 304 refoloseste articolul existent.
+    """
+
+    def __init__(self, timeout: float = URL_FETCH_TIMEOUT, max_bytes: int = URL_FETCH_MAX_BYTES,
+                 pool_size: int = URL_FETCH_POOL_SIZE, cache_entries: int = URL_FETCH_CACHE_ENTRIES,
+                 fresh_seconds: float = URL_FETCH_CACHE_FRESH_SECONDS, user_agent: str = URL_FETCH_USER_AGENT):
+        """
+        Args:
+            timeout: Timpul maxim de conectare / citire (secunde)
+            max_bytes: Dimensiunea maxima a unei pagini descarcate
+            pool_size: Numarul maxim de conexiuni pastrate per host
+            cache_entries: Numarul maxim de URL-uri pastrate in cache (0 = fara cache)
+            fresh_seconds: Cat timp o intrare este folosita fara revalidare
+            user_agent: Antetul User-Agent trimis
+        """
+        self.logger = logging.getLogger(__name__)
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.cache_entries = cache_entries
+        self.fresh_seconds = fresh_seconds
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'User-Agent': user_agent})
+
+        self._cache: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'fetches': 0, 'cache_hits': 0, 'revalidated': 0, 'too_large': 0, 'errors': 0}
+
+    def fetch_text(self, url: str) -> str:
+        """Returneaza doar textul articolului de la URL (vezi fetch_article)."""
+        return self.fetch_article(url)['text']
+
+    def fetch_article(self, url: str) -> Dict:
+        """
+        Returneaza articolul extras de la URL, folosind cache-ul cand este posibil.
+
+        Returns:
+            dict: {'title', 'published', 'text', 'method'} (vezi content_extractor.extract_article)
+
+        Raises:
+            FetchError: Pagina nu a putut fi descarcata, este prea mare sau nu este text
+        """
+        entry = self._cache_get(url)
+        if entry is not None and time.monotonic() - entry['stored_at'] < self.fresh_seconds:
+            self.stats['cache_hits'] += 1
+            return dict(entry['article'])
+
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        self.stats['fetches'] += 1
+        try:
+            with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as resp:
+                if resp.status_code == 304 and entry is not None:
+                    self.stats['revalidated'] += 1
+                    self._cache_put(url, dict(entry, stored_at=time.monotonic()))
+                    return dict(entry['article'])
+                resp.raise_for_status()
+                body = self._read_body(resp)
+                encoding = resp.encoding if 'charset' in resp.headers.get('Content-Type', '').lower() else None
+                etag = resp.headers.get('ETag')
+                last_modified = resp.headers.get('Last-Modified')
+        except requests.RequestException as e:
+            self.stats['errors'] += 1
+            raise FetchError(f"Descărcarea {url} a eșuat: {e}") from e
+
+        article = extract_article(body, encoding)
+        self._cache_put(url, {'article': article, 'etag': etag, 'last_modified': last_modified,
+                              'stored_at': time.monotonic()})
+        return dict(article)
+
+    def _read_body(self, resp: requests.Response) -> bytes:
+        """Citeste corpul raspunsului in flux, oprindu-se la limita de octeti."""
+        content_type = resp.headers.get('Content-Type', 'text/html').split(';')[0].strip().lower()
+        if content_type and content_type not in TEXT_CONTENT_TYPES:
+            self.stats['errors'] += 1
+            raise FetchError(f"Tip de conținut nesuportat: {content_type}")
+
+        declared = resp.headers.get('Content-Length')
+        if declared and declared.isdigit() and int(declared) > self.max_bytes:
+            self.stats['too_large'] += 1
+            raise FetchError(f"Pagina depășește limita de {self.max_bytes} octeți")
+
+        chunks = []
+        received = 0
+        for chunk in resp.iter_content(CHUNK_SIZE):
+            received += len(chunk)
+            if received > self.max_bytes:
+                self.stats['too_large'] += 1
+                raise FetchError(f"Pagina depășește limita de {self.max_bytes} octeți")
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    def _cache_get(self, url: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._cache.get(url)
+            if entry is not None:
+                self._cache.move_to_end(url)
+            return entry
+
+    def _cache_put(self, url: str, entry: Dict):
+        if self.cache_entries <= 0:
+            return
+        with self._lock:
+            self._cache[url] = entry
+            self._cache.move_to_end(url)
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        """Goleste cache-ul de pagini."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_status(self) -> Dict:
+        """Statistici pentru /system-status."""
+        with self._lock:
+            entries = len(self._cache)
+        return {
+            'cached_urls': entries,
+            'max_cached_urls': self.cache_entries,
+            'max_bytes': self.max_bytes,
+            **self.stats,
+        }
+
+    def close(self):
+        self.session.close()
+
+
+_fetcher: Optional[UrlFetcher] = None
+_fetcher_lock = threading.Lock()
+
+
+def get_url_fetcher() -> UrlFetcher:
+    """Returneaza instanta comuna a procesului."""
+    global _fetcher
+    if _fetcher is None:
+        with _fetcher_lock:
+            if _fetcher is None:
+                _fetcher = UrlFetcher()
+    return _fetcher
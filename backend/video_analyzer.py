@@ -11,12 +11,36 @@ import hashlib
 import json
 import random
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 import subprocess
-import tempfile
+import threading
 from pathlib import Path
 import logging
 
+from frame_sampler import VIDEO_FRAME_SAMPLER, FrameSampler
+from progress import ProgressCallback, track_stage
+from video_features import (VIDEO_ANALYSIS_MAX_SIDE, FrameFeatureExtractor, FrameStatistics, gray_stack,
+                            transition_stack_features)
+from video_toolkit import get_video_toolkit
+
+try:
+    import config
+except ImportError:
+    config = None
+
+VIDEO_ANALYZER_VERSION = getattr(config, 'VIDEO_ANALYZER_VERSION', '1')
+
+
+def analyzer_version() -> str:
+    """
+    Versiunea rezultatelor analizei video, folosita in cheia rezultatelor pastrate per continut:
+    VIDEO_ANALYZER_VERSION (crescuta cand se schimba detectoarele sau pragurile), metoda de
+    esantionare configurata, rezolutia de analiza si versiunea OpenCV.
+    """
+    settings = f"{VIDEO_ANALYZER_VERSION}|{VIDEO_FRAME_SAMPLER}|{VIDEO_ANALYSIS_MAX_SIDE}|{cv2.__version__}"
+    return f"{VIDEO_ANALYZER_VERSION}-{hashlib.sha256(settings.encode()).hexdigest()[:12]}"
+
+
 class VideoAnalyzer:
     """
     Clasa pentru analiza videoclipurilor si detectia modificarilor.
@@ -24,48 +48,49 @@ class VideoAnalyzer:
     """
     
     def __init__(self):
-        """Initializeaza analizorul video cu directorul temporar."""
+        """Initializeaza analizorul video; detectoarele si directorul temporar sunt comune procesului."""
         self.logger = logging.getLogger(__name__)
-        self.temp_dir = tempfile.mkdtemp()
+        self.toolkit = get_video_toolkit()
+        self.temp_dir = self.toolkit.temp_root()
         
-    def extract_frames(self, video_path: str, max_frames: int = 50) -> List[np.ndarray]:
+    def iter_frames(self, video_path: str, max_frames: int = 50) -> Iterator[np.ndarray]:
         """
-        Extrage frame-uri din video pentru analiza.
+        Frame-urile de analiza, decodate pe rand, distribuite uniform pe durata videoclipului.
+        Metoda de citire (secventiala, salt direct sau cadre cheie cu ffmpeg) este aleasa
+        de FrameSampler dupa metadatele containerului. Erorile opresc doar citirea.
         
         Args:
             video_path: Calea catre fisierul video
             max_frames: Numarul maxim de frame-uri de extras
             
-        Returns:
-            list: Lista de frame-uri ca array-uri numpy
+        Yields:
+            np.ndarray: Frame-uri BGR
         """
-        frames = []
-        
+        count = 0
         try:
-            cap = cv2.VideoCapture(video_path)
-            if not cap.isOpened():
-                raise ValueError("Nu se poate deschide videoclipul")
-            
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            duration = total_frames / fps if fps > 0 else 0
-            
-            frame_indices = np.linspace(0, total_frames - 1, min(max_frames, total_frames), dtype=int)
-            
-            for frame_idx in frame_indices:
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_idx)
-                ret, frame = cap.read()
-                if ret:
-                    frames.append(frame)
+            sampler = FrameSampler(video_path, max_frames)
+            for frame in sampler:
+                count += 1
+                yield frame
             
-            cap.release()
-            
-            self.logger.info(f"Extrase {len(frames)} frame-uri din {total_frames} total")
-            return frames
+            self.logger.info(f"Extrase {count} frame-uri din {sampler.info['total_frames']} total "
+                             f"(metoda: {sampler.method})")
             
         except Exception as e:
             self.logger.error(f"Eroare la extragerea frame-urilor: {e}")
-            return []
+
+    def extract_frames(self, video_path: str, max_frames: int = 50) -> List[np.ndarray]:
+        """
+        Extrage frame-uri din video pentru analiza (toate odata; vezi iter_frames).
+        
+        Args:
+            video_path: Calea catre fisierul video
+            max_frames: Numarul maxim de frame-uri de extras
+            
+        Returns:
+            list: Lista de frame-uri ca array-uri numpy
+        """
+        return list(self.iter_frames(video_path, max_frames))
 
     def get_video_metadata(self, video_path: str) -> Dict:
         """
@@ -77,6 +102,9 @@ class VideoAnalyzer:
         Returns:
             dict: Metadata video cu format si stream-uri
         """
+        if not self.toolkit.tool_available('ffprobe'):
+            return {'has_metadata': False, 'error': 'ffprobe indisponibil'}
+        
         try:
             cmd = [
                 'ffprobe', '-v', 'quiet', '-print_format', 'json', 
@@ -99,7 +127,24 @@ class VideoAnalyzer:
             self.logger.error(f"Eroare metadata: {e}")
             return {'has_metadata': False, 'error': str(e)}
 
-    def detect_compression_artifacts(self, frames: List[np.ndarray]) -> Dict:
+    def collect_frame_statistics(self, frames: Iterable[np.ndarray], compression: bool = True,
+                                 temporal: bool = True, faces: bool = True) -> FrameStatistics:
+        """
+        Parcurge frame-urile o singura data: fiecare frame este convertit in tonuri de gri o data,
+        iar toate analizele per frame sunt calculate din aceeasi imagine, in paralel pe nucleele
+        disponibile (VIDEO_FEATURE_WORKERS / VIDEO_FEATURE_EXECUTOR).
+        
+        Args:
+            frames: Frame-uri BGR (lista sau generator, ex. iter_frames)
+            compression, temporal, faces: Analizele calculate
+            
+        Returns:
+            FrameStatistics: Statisticile agregate ale frame-urilor
+        """
+        extractor = FrameFeatureExtractor(compression, temporal, self.toolkit.face_cascades if faces else None)
+        return extractor.collect(frames)
+
+    def detect_compression_artifacts(self, frames: Iterable[np.ndarray]) -> Dict:
         """
         Detecteaza artefacte de compresie care pot indica modificari.
         
@@ -109,27 +154,15 @@ class VideoAnalyzer:
         Returns:
             dict: Scoruri de artefacte si nivel de suspiciune
         """
-        if not frames:
+        return self.compression_result(self.collect_frame_statistics(frames, temporal=False, faces=False))
+
+    def compression_result(self, statistics: FrameStatistics) -> Dict:
+        """Nivelul de calitate si suspiciunea de modificare din scorurile de artefacte."""
+        if not statistics.artifacts.count:
             return {'error': 'Nu există frame-uri pentru analiză'}
         
-        artifacts_scores = []
-        
-        for frame in frames:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            
-            f_transform = np.fft.fft2(gray)
-            f_shift = np.fft.fftshift(f_transform)
-            magnitude_spectrum = np.log(np.abs(f_shift) + 1)
-            
-            mean_val = np.mean(magnitude_spectrum)
-            if mean_val > 0:
-                artifact_score = np.std(magnitude_spectrum) / mean_val
-            else:
-                artifact_score = 0.0
-            artifacts_scores.append(artifact_score)
-        
-        avg_artifacts = np.mean(artifacts_scores)
-        max_artifacts = np.max(artifacts_scores)
+        avg_artifacts = statistics.artifacts.mean
+        max_artifacts = statistics.artifacts.max
         
         if avg_artifacts > 2.5:
             quality_level = "foarte_scazuta"
@@ -149,49 +182,37 @@ class VideoAnalyzer:
             'max_compression_artifacts': max_artifacts,
             'quality_level': quality_level,
             'modification_suspicion': suspicion,
-            'analyzed_frames': len(frames)
+            'analyzed_frames': statistics.frames
         }
 
-    def detect_temporal_inconsistencies(self, frames: List[np.ndarray]) -> Dict:
+    def detect_temporal_inconsistencies(self, frames: Iterable[np.ndarray]) -> Dict:
         """
-        Detecteaza inconsistente temporale intre frame-uri.
+        Detecteaza inconsistente temporale intre frame-uri. Frame-urile sunt convertite o data
+        intr-o stiva (N, H, W) in tonuri de gri, iar toate tranzitiile sunt calculate vectorizat.
         
         Args:
-            frames: Lista de frame-uri pentru analiza
+            frames: Lista de frame-uri pentru analiza (de aceeasi dimensiune)
             
         Returns:
             dict: Analiza consistentei temporale si suspiciune de editare
         """
-        if len(frames) < 2:
+        stack = gray_stack(frames)
+        statistics = FrameStatistics()
+        statistics.frames = len(stack)
+        if len(stack) >= 2:
+            statistics.add_transitions(*transition_stack_features(stack))
+        return self.temporal_result(statistics)
+
+    def temporal_result(self, statistics: FrameStatistics) -> Dict:
+        """Suspiciunea de editare din variatia entropiei si a diferentelor dintre frame-uri."""
+        if not statistics.entropy.count:
             return {'error': 'Nu sunt suficiente frame-uri pentru analiza temporală'}
         
-        inconsistencies = []
-        
-        for i in range(len(frames) - 1):
-            frame1 = cv2.cvtColor(frames[i], cv2.COLOR_BGR2GRAY)
-            frame2 = cv2.cvtColor(frames[i + 1], cv2.COLOR_BGR2GRAY)
-            
-            diff = cv2.absdiff(frame1, frame2)
-            
-            hist = cv2.calcHist([diff], [0], None, [256], [0, 256])
-            
-            hist_norm = hist / np.sum(hist)
-            
-            entropy = -np.sum(hist_norm * np.log2(hist_norm + 1e-7))
-            
-            mean_diff = np.mean(diff)
-            
-            inconsistencies.append({
-                'frame_pair': f"{i}-{i+1}",
-                'entropy': entropy,
-                'mean_difference': mean_diff
-            })
-        
-        avg_entropy = np.mean([inc['entropy'] for inc in inconsistencies])
-        avg_diff = np.mean([inc['mean_difference'] for inc in inconsistencies])
+        avg_entropy = statistics.entropy.mean
+        avg_diff = statistics.difference.mean
         
-        entropy_std = np.std([inc['entropy'] for inc in inconsistencies])
-        diff_std = np.std([inc['mean_difference'] for inc in inconsistencies])
+        entropy_std = statistics.entropy.std
+        diff_std = statistics.difference.std
         
         if entropy_std > 1.5 or diff_std > 30:
             temporal_verdict = "inconsistente_detectate"
@@ -210,10 +231,10 @@ class VideoAnalyzer:
             'difference_variation': diff_std,
             'temporal_verdict': temporal_verdict,
             'edit_suspicion': edit_suspicion,
-            'frame_transitions_analyzed': len(inconsistencies)
+            'frame_transitions_analyzed': statistics.entropy.count
         }
 
-    def detect_deepfake_indicators(self, frames: List[np.ndarray]) -> Dict:
+    def detect_deepfake_indicators(self, frames: Iterable[np.ndarray]) -> Dict:
         """
         Detecteaza indicii de deepfake prin analiza faciala de baza.
         
@@ -223,42 +244,16 @@ class VideoAnalyzer:
         Returns:
             dict: Analiza detectiei de deepfake si inconsistente faciale
         """
-        face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-        
-        face_detections = []
-        face_inconsistencies = []
-        
-        for i, frame in enumerate(frames):
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            faces = face_cascade.detectMultiScale(gray, 1.3, 5)
-            
-            face_detections.append(len(faces))
-            
-            for (x, y, w, h) in faces:
-                face_roi = gray[y:y+h, x:x+w]
-                
-                texture_score = np.std(face_roi)
-                
-                left_half = face_roi[:, :w//2]
-                right_half = cv2.flip(face_roi[:, w//2:], 1)
-                
-                if left_half.shape == right_half.shape:
-                    symmetry_diff = np.mean(np.abs(left_half - right_half))
-                else:
-                    symmetry_diff = 100
-                
-                face_inconsistencies.append({
-                    'frame': i,
-                    'texture_score': texture_score,
-                    'symmetry_difference': symmetry_diff
-                })
-        
-        total_faces = sum(face_detections)
-        avg_faces_per_frame = np.mean(face_detections) if face_detections else 0
+        return self.deepfake_result(self.collect_frame_statistics(frames, compression=False, temporal=False))
+
+    def deepfake_result(self, statistics: FrameStatistics) -> Dict:
+        """Verdictul deepfake din textura si simetria fetelor detectate."""
+        total_faces = statistics.total_faces
+        avg_faces_per_frame = statistics.faces_per_frame.mean
         
-        if face_inconsistencies:
-            avg_texture = np.mean([f['texture_score'] for f in face_inconsistencies])
-            avg_symmetry = np.mean([f['symmetry_difference'] for f in face_inconsistencies])
+        if statistics.texture.count:
+            avg_texture = statistics.texture.mean
+            avg_symmetry = statistics.symmetry.mean
             
             if avg_texture < 10 or avg_symmetry > 60:
                 deepfake_verdict = "suspiciune_deepfake"
@@ -282,11 +277,19 @@ class VideoAnalyzer:
             'avg_face_symmetry': avg_symmetry,
             'deepfake_verdict': deepfake_verdict,
             'confidence': confidence,
-            'analyzed_frames': len(frames)
+            'analyzed_frames': statistics.frames
         }
 
-    def analyze_video_integrity(self, video_path: str) -> Dict:
-        """Analiză completă a integrității videoclipului"""
+    def analyze_video_integrity(self, video_path: str, progress: Optional[ProgressCallback] = None) -> Dict:
+        """
+        Analiză completă a integrității videoclipului.
+        
+        Args:
+            video_path: Calea catre fisierul video
+            progress: Callback optional pentru evenimentele etapelor (metadata, frames, compression,
+                temporal, deepfake, verdict), cu durata si rezultatul partial al fiecarei etape;
+                etapa 'frames' include decodarea si calculele per frame, cele urmatoare doar agregarea
+        """
         start_time = datetime.now()
         
         results = {
@@ -297,43 +300,55 @@ class VideoAnalyzer:
         }
         
         try:
-            # 1. Extrage frame-uri
-            frames = self.extract_frames(video_path)
-            
-            if not frames:
+            # 1. Analiză metadata
+            with track_stage(progress, 'metadata') as partial:
+                metadata = self.get_video_metadata(video_path)
+                results['metadata'] = metadata
+                
+                # Extrage informații pentru video_metadata
+                if metadata.get('has_metadata') and 'streams' in metadata:
+                    video_stream = next((s for s in metadata['streams'] if s.get('codec_type') == 'video'), {})
+                    results['video_metadata'] = {
+                        'codec': video_stream.get('codec_name', 'unknown'),
+                        'duration': float(metadata.get('format', {}).get('duration', 0)),
+                        'bitrate': int(video_stream.get('bit_rate', 0)) if video_stream.get('bit_rate') else 0,
+                        'resolution': f"{video_stream.get('width', 0)}x{video_stream.get('height', 0)}",
+                        'fps': video_stream.get('r_frame_rate', 'unknown'),
+                        'format': metadata.get('format', {}).get('format_name', 'unknown')
+                    }
+                partial.update(results['video_metadata'])
+            
+            # 2. Decodează frame-urile pe rând; fiecare frame trece o singură dată prin toate analizele
+            with track_stage(progress, 'frames') as partial:
+                statistics = self.collect_frame_statistics(self.iter_frames(video_path))
+                partial['frames'] = statistics.frames
+            
+            if not statistics.frames:
                 return {**results, 'error': 'Nu s-au putut extrage frame-uri', 'verdict': 'eroare'}
             
-            # 2. Analiză metadata
-            metadata = self.get_video_metadata(video_path)
-            results['metadata'] = metadata
-            
-            # Extrage informații pentru video_metadata
-            if metadata.get('has_metadata') and 'streams' in metadata:
-                video_stream = next((s for s in metadata['streams'] if s.get('codec_type') == 'video'), {})
-                results['video_metadata'] = {
-                    'codec': video_stream.get('codec_name', 'unknown'),
-                    'duration': float(metadata.get('format', {}).get('duration', 0)),
-                    'bitrate': int(video_stream.get('bit_rate', 0)) if video_stream.get('bit_rate') else 0,
-                    'resolution': f"{video_stream.get('width', 0)}x{video_stream.get('height', 0)}",
-                    'fps': video_stream.get('r_frame_rate', 'unknown'),
-                    'format': metadata.get('format', {}).get('format_name', 'unknown')
-                }
-            
-            # 3. Detectează artefacte de compresie
-            compression_analysis = self.detect_compression_artifacts(frames)
-            results['compression_analysis'] = compression_analysis
+            # 3. Artefacte de compresie
+            with track_stage(progress, 'compression') as partial:
+                compression_analysis = self.compression_result(statistics)
+                results['compression_analysis'] = compression_analysis
+                partial.update(compression_analysis)
             
-            # 4. Detectează inconsistențe temporale
-            temporal_analysis = self.detect_temporal_inconsistencies(frames)
-            results['temporal_analysis'] = temporal_analysis
+            # 4. Inconsistențe temporale
+            with track_stage(progress, 'temporal') as partial:
+                temporal_analysis = self.temporal_result(statistics)
+                results['temporal_analysis'] = temporal_analysis
+                partial.update(temporal_analysis)
             
-            # 5. Detectează indicii de deepfake
-            deepfake_analysis = self.detect_deepfake_indicators(frames)
-            results['deepfake_analysis'] = deepfake_analysis
+            # 5. Indicii de deepfake
+            with track_stage(progress, 'deepfake') as partial:
+                deepfake_analysis = self.deepfake_result(statistics)
+                results['deepfake_analysis'] = deepfake_analysis
+                partial.update(deepfake_analysis)
             
             # 6. Calculează verdictul final
-            final_verdict = self.calculate_final_verdict(compression_analysis, temporal_analysis, deepfake_analysis)
-            results['final_verdict'] = final_verdict
+            with track_stage(progress, 'verdict') as partial:
+                final_verdict = self.calculate_final_verdict(compression_analysis, temporal_analysis, deepfake_analysis)
+                results['final_verdict'] = final_verdict
+                partial.update(final_verdict)
             
             # 7. Calculează timpul de procesare
             end_time = datetime.now()
@@ -431,26 +446,16 @@ class VideoAnalyzer:
         }
 
     def cleanup(self):
-        """Curăță fișierele temporare"""
-        try:
-            import shutil
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
-        except:
-            pass
+        """
+        Păstrată pentru compatibilitate: directorul temporar este comun procesului și este
+        șters de VideoToolkit la oprire.
+        """
 
 def analyze_video(video_path: str) -> Dict:
     """
-    Funcție helper pentru a analiza un videoclip.
-    Creează o instanță VideoAnalyzer și apelează analyze_video_integrity.
+    Funcție helper pentru a analiza un videoclip cu analizorul comun al procesului.
     """
-    analyzer = VideoAnalyzer()
-    try:
-        result = analyzer.analyze_video_integrity(video_path)
-        analyzer.cleanup()
-        return result
-    except Exception as e:
-        analyzer.cleanup()
-        raise e
+    return get_advanced_video_analyzer().analyzer.analyze_video_integrity(video_path)
 
 # Clasa AdvancedVideoAnalyzer pentru compatibilitate cu sistemul actual
 class AdvancedVideoAnalyzer:
@@ -458,23 +463,21 @@ class AdvancedVideoAnalyzer:
         self.analyzer = VideoAnalyzer()
         
     def check_ffmpeg_availability(self):
-        """Verifică dacă FFmpeg este disponibil"""
-        try:
-            result = subprocess.run(['ffmpeg', '-version'], 
-                                  capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except Exception:
-            return False
+        """Verifică dacă FFmpeg este disponibil (rezultat păstrat de VideoToolkit)"""
+        return self.analyzer.toolkit.tool_available('ffmpeg')
     
-    def comprehensive_video_analysis(self, video_path, filename):
-        """Analiză comprehensivă a videoclipului - interfață pentru sistemul actual"""
+    def comprehensive_video_analysis(self, video_path, filename, progress=None):
+        """
+        Analiză comprehensivă a videoclipului - interfață pentru sistemul actual.
+        progress este callback-ul optional pentru evenimentele etapelor (vezi analyze_video_integrity).
+        """
         
         if not self.check_ffmpeg_availability():
             return self.fallback_analysis(filename)
         
         try:
             # Folosește noul sistem de analiză
-            result = self.analyzer.analyze_video_integrity(video_path)
+            result = self.analyzer.analyze_video_integrity(video_path, progress=progress)
             
             if 'error' in result or 'final_verdict' not in result:
                 print(f"Rezultat incomplet sau cu eroare: {result.get('error', 'lipsește final_verdict')}")
@@ -644,4 +647,18 @@ Scor suspiciune: {suspicion_score:.3f}
             'explanation': f"ANALIZĂ SIMPLIFICATĂ (FFmpeg indisponibil):\n\nVerdictul se bazează pe numele fișierului și algoritmi simpli.\nPentru analiză avansată, verifică instalarea FFmpeg.",
             'risk_level': 'medium',
             'recommendations': ['Instalează FFmpeg pentru analiză completă', 'Verifică manual videoclipul']
-        } 
\ No newline at end of file
+        } 
+
+
+_advanced_analyzer: Optional[AdvancedVideoAnalyzer] = None
+_advanced_analyzer_lock = threading.Lock()
+
+
+def get_advanced_video_analyzer() -> AdvancedVideoAnalyzer:
+    """Returneaza analizorul comun al procesului (nu pastreaza stare intre analize)."""
+    global _advanced_analyzer
+    if _advanced_analyzer is None:
+        with _advanced_analyzer_lock:
+            if _advanced_analyzer is None:
+                _advanced_analyzer = AdvancedVideoAnalyzer()
+    return _advanced_analyzer
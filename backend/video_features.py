@@ -0,0 +1,458 @@
+"""
+Caracteristicile per frame folosite de analiza video si statisticile lor incrementale.
+Fiecare frame este convertit o singura data in tonuri de gri; artefactele de compresie,
+tranzitia fata de frame-ul anterior si trasaturile fetelor sunt calculate din aceeasi imagine,
+iar rezultatele sunt agregate pe loc (medie, abatere standard, maxim). Astfel, memoria nu
+depinde de numarul de frame-uri: se pastreaza doar frame-urile aflate in lucru.
+Calculele per frame ruleaza in paralel pe toate nucleele (VIDEO_FEATURE_WORKERS), cu
+rezultatele agregate in ordinea frame-urilor, deci identice cu varianta secventiala.
+Spectrul si detectia fetelor lucreaza pe o copie micsorata a frame-ului (latura mare de cel
+mult VIDEO_ANALYSIS_MAX_SIDE pixeli), deci costul lor nu creste cu rezolutia; textura si
+simetria fetelor sunt masurate pe regiunile corespunzatoare din frame-ul original.
+"""
+
+import math
+import os
+import threading
+from collections import deque
+from concurrent import futures
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+try:
+    import config
+except ImportError:
+    config = None
+
+VIDEO_FEATURE_WORKERS = getattr(config, 'VIDEO_FEATURE_WORKERS', 0)
+VIDEO_FEATURE_EXECUTOR = getattr(config, 'VIDEO_FEATURE_EXECUTOR', 'thread')
+VIDEO_ANALYSIS_MAX_SIDE = getattr(config, 'VIDEO_ANALYSIS_MAX_SIDE', 640)
+
+TEMPORAL_CHUNK_PIXELS = 1 << 22  # Cati pixeli de diferente sunt calculati odata intr-o stiva de frame-uri
+
+
+def to_gray(frame: np.ndarray) -> np.ndarray:
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+
+def gray_stack(frames: Iterable[np.ndarray]) -> np.ndarray:
+    """
+    Frame-urile BGR convertite in gri direct intr-o stiva uint8 (N, H, W). Fiecare frame este
+    convertit cand este consumat, deci frame-urile BGR nu sunt pastrate; stiva este alocata dupa
+    primul frame (cu len(frames), daca este cunoscut) si dublata cand se umple.
+    """
+    stack = None
+    count = 0
+    for frame in frames:
+        if stack is None:
+            height, width = frame.shape[:2]
+            capacity = len(frames) if hasattr(frames, '__len__') else 16
+            stack = np.empty((max(capacity, 1), height, width), dtype=np.uint8)
+        elif frame.shape[:2] != stack.shape[1:]:
+            raise ValueError("Frame-urile trebuie sa aiba aceeasi dimensiune")
+        if count == len(stack):
+            grown = np.empty((2 * len(stack),) + stack.shape[1:], dtype=np.uint8)
+            grown[:count] = stack
+            stack = grown
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=stack[count])
+        count += 1
+    if stack is None:
+        return np.empty((0, 0, 0), dtype=np.uint8)
+    return stack[:count]
+
+
+def analysis_level(gray: np.ndarray, max_side: int = VIDEO_ANALYSIS_MAX_SIDE) -> Tuple[np.ndarray, float]:
+    """
+    Nivelul de rezolutie al analizelor costisitoare: frame-ul micsorat (INTER_AREA) la latura
+    mare max_side si factorul de scalare inapoi la rezolutia originala. Frame-urile mai mici
+    (sau max_side = 0) sunt folosite ca atare, cu factorul 1.
+    """
+    height, width = gray.shape[:2]
+    longest = max(height, width)
+    if not max_side or longest <= max_side:
+        return gray, 1.0
+    scale = longest / max_side
+    size = (max(1, round(width / scale)), max(1, round(height / scale)))
+    return cv2.resize(gray, size, interpolation=cv2.INTER_AREA), scale
+
+
+def artifact_score(gray: np.ndarray) -> float:
+    """
+    Raportul std / medie al spectrului de magnitudine (artefacte de compresie).
+    rfft2 calculeaza doar coloanele de frecventa nenegativa; celelalte sunt conjugatele lor,
+    deci sunt numarate de doua ori: rezultatul este cel al spectrului complet (fft2), la
+    jumatate din cost.
+    """
+    magnitude_spectrum = np.log(np.abs(np.fft.rfft2(gray)) + 1)
+    weights = np.full(magnitude_spectrum.shape[1], 2.0)
+    weights[0] = 1.0
+    if gray.shape[1] % 2 == 0:
+        weights[-1] = 1.0  # Frecventa Nyquist apare o singura data
+    total = gray.shape[0] * gray.shape[1]
+
+    mean_val = magnitude_spectrum.sum(axis=0) @ weights / total
+    if mean_val <= 0:
+        return 0.0
+    variance = ((magnitude_spectrum - mean_val) ** 2).sum(axis=0) @ weights / total
+    return float(math.sqrt(variance) / mean_val)
+
+
+def _difference_histogram(diff: np.ndarray) -> np.ndarray:
+    return cv2.calcHist([diff], [0], None, [256], [0, 256]).ravel()
+
+
+def histogram_features(hist: np.ndarray, pixels: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Entropia si diferenta medie pentru fiecare rand dintr-o matrice (perechi, 256) de histograme
+    ale diferentelor (float32, ca in calcHist). Media este suma exacta a valorilor din histograma
+    impartita la numarul de pixeli, deci egala cu np.mean(diff), fara a reciti pixelii.
+    """
+    hist_norm = hist / hist.sum(axis=1, keepdims=True)
+    entropies = -np.sum(hist_norm * np.log2(hist_norm + 1e-7), axis=1)
+    differences = hist.astype(np.float64) @ np.arange(256) / pixels
+    return entropies, differences
+
+
+def transition_features(previous: np.ndarray, gray: np.ndarray) -> Tuple[float, float]:
+    """Entropia histogramei diferentei dintre doua frame-uri consecutive si diferenta medie."""
+    diff = cv2.absdiff(previous, gray)
+    entropies, differences = histogram_features(_difference_histogram(diff)[np.newaxis], diff.size)
+    return float(entropies[0]), float(differences[0])
+
+
+def transition_stack_features(stack: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    transition_features pentru toate perechile consecutive dintr-o stiva uint8 (N, H, W):
+    diferentele sunt calculate cu un singur cv2.absdiff pe bucati de perechi (cel mult
+    TEMPORAL_CHUNK_PIXELS pixeli), iar entropiile si mediile cu cateva operatii numpy pe
+    matricea histogramelor.
+
+    Returns:
+        (entropii, diferente medii), cate N - 1 valori
+    """
+    count, height, width = stack.shape
+    pairs = max(count - 1, 0)
+    hist = np.empty((pairs, 256), dtype=np.float32)
+    per_chunk = max(1, TEMPORAL_CHUNK_PIXELS // (height * width))
+    for start in range(0, pairs, per_chunk):
+        stop = min(pairs, start + per_chunk)
+        # Bucata de perechi este privita ca o singura imagine de (stop - start) * H randuri
+        diffs = cv2.absdiff(stack[start + 1:stop + 1].reshape(-1, width), stack[start:stop].reshape(-1, width))
+        for offset, diff in enumerate(diffs.reshape(stop - start, height, width)):
+            hist[start + offset] = _difference_histogram(diff)
+    return histogram_features(hist, height * width)
+
+
+def face_features(gray: np.ndarray, face_cascade,
+                  level: Optional[Tuple[np.ndarray, float]] = None) -> List[Tuple[float, float]]:
+    """
+    (textura, diferenta de simetrie) pentru fiecare fata detectata in frame. Fetele sunt
+    cautate pe nivelul micsorat (vezi analysis_level), iar casetele sunt aduse la rezolutia
+    originala, unde sunt masurate.
+    """
+    small, scale = level if level is not None else analysis_level(gray)
+    height, width = gray.shape[:2]
+    features = []
+    for box in face_cascade.detectMultiScale(small, 1.3, 5):
+        x, y, right, bottom = (int(round(value * scale)) for value in
+                               (box[0], box[1], box[0] + box[2], box[1] + box[3]))
+        face_roi = gray[y:min(bottom, height), x:min(right, width)]
+        w = face_roi.shape[1]
+
+        texture_score = np.std(face_roi)
+
+        left_half = face_roi[:, :w//2]
+        right_half = cv2.flip(face_roi[:, w//2:], 1)
+
+        if left_half.shape == right_half.shape:
+            symmetry_diff = np.mean(np.abs(left_half - right_half))
+        else:
+            symmetry_diff = 100
+
+        features.append((float(texture_score), float(symmetry_diff)))
+    return features
+
+
+class RunningStats:
+    """Media, abaterea standard (ca np.std) si maximul unei serii, fara a pastra valorile (Welford)."""
+
+    __slots__ = ('count', 'mean', '_m2', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.max = -math.inf
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.max = max(self.max, value)
+
+    def add_many(self, values: np.ndarray):
+        """Adauga o serie intreaga (combinarea Chan a mediei si a sumei patratelor)."""
+        values = np.asarray(values, dtype=np.float64)
+        if not values.size:
+            return
+        count = values.size
+        mean = float(values.mean())
+        m2 = float(np.sum((values - mean) ** 2))
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.max = max(self.max, float(values.max()))
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self._m2 / self.count) if self.count else 0.0
+
+
+class FrameStatistics:
+    """Agregarea caracteristicilor per frame, aplicate in ordinea frame-urilor."""
+
+    def __init__(self):
+        self.frames = 0
+        self.total_faces = 0
+        self.artifacts = RunningStats()
+        self.entropy = RunningStats()
+        self.difference = RunningStats()
+        self.faces_per_frame = RunningStats()
+        self.texture = RunningStats()
+        self.symmetry = RunningStats()
+
+    def add(self, features: Tuple):
+        """Adauga caracteristicile unui frame, asa cum sunt intoarse de frame_features."""
+        artifact, transition, faces = features
+        self.frames += 1
+        if artifact is not None:
+            self.artifacts.add(artifact)
+        if transition is not None:
+            self.entropy.add(transition[0])
+            self.difference.add(transition[1])
+        if faces is not None:
+            self.total_faces += len(faces)
+            self.faces_per_frame.add(len(faces))
+            for texture, symmetry in faces:
+                self.texture.add(texture)
+                self.symmetry.add(symmetry)
+
+    def add_transitions(self, entropies: np.ndarray, differences: np.ndarray):
+        """Adauga tranzitiile calculate pe o stiva de frame-uri (vezi transition_stack_features)."""
+        self.entropy.add_many(entropies)
+        self.difference.add_many(differences)
+
+
+def frame_features(gray: np.ndarray, previous: Optional[np.ndarray], compression: bool, temporal: bool,
+                   face_cascade, max_side: int = VIDEO_ANALYSIS_MAX_SIDE) -> Tuple:
+    """
+    Caracteristicile unui frame: (scor de artefacte, (entropie, diferenta) fata de frame-ul
+    anterior, fete). Analizele dezactivate intorc None. Spectrul si detectia fetelor folosesc
+    acelasi nivel micsorat, calculat o singura data.
+    """
+    level = analysis_level(gray, max_side) if compression or face_cascade is not None else None
+    return (
+        artifact_score(level[0]) if compression else None,
+        transition_features(previous, gray) if temporal and previous is not None else None,
+        face_features(gray, face_cascade, level) if face_cascade is not None else None,
+    )
+
+
+def load_face_cascade():
+    return cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+
+
+class DetectorPool:
+    """
+    Detectoare OpenCV incarcate o singura data si refolosite intre analize. Un CascadeClassifier
+    nu poate fi folosit simultan din mai multe thread-uri, deci fiecare analiza imprumuta un
+    detector exclusiv, iar thread-urile / procesele de lucru il pastreaza pe toata durata lor.
+    """
+
+    def __init__(self, factory: Callable):
+        self.factory = factory
+        self.created = 0
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        detector = self.factory()
+        with self._lock:
+            self.created += 1
+        return detector
+
+    def release(self, detector):
+        with self._lock:
+            self._idle.append(detector)
+
+    @contextmanager
+    def borrow(self):
+        detector = self.acquire()
+        try:
+            yield detector
+        finally:
+            self.release(detector)
+
+    def __reduce__(self):
+        # Procesele de lucru primesc doar fabrica; detectoarele sunt create in fiecare proces
+        return DetectorPool, (self.factory,)
+
+    def get_status(self) -> Dict:
+        with self._lock:
+            return {'created': self.created, 'idle': len(self._idle)}
+
+
+# Starea fiecărui thread / proces de lucru: detectorul de fețe propriu
+_worker = threading.local()
+
+
+def _init_worker(face_cascades: Optional[DetectorPool]):
+    _worker.face_cascade = face_cascades.acquire() if face_cascades is not None else None
+
+
+def _thread_task(gray, previous, compression, temporal, faces, max_side):
+    return frame_features(gray, previous, compression, temporal, _worker.face_cascade if faces else None, max_side)
+
+
+def _process_task(ring_name, shape, slot, previous_slot, compression, temporal, faces, max_side):
+    """Frame-urile sunt citite din memoria partajata a procesului parinte, fara serializare."""
+    ring = shared_memory.SharedMemory(name=ring_name)
+    try:
+        size = shape[0] * shape[1]
+        gray = np.ndarray(shape, dtype=np.uint8, buffer=ring.buf, offset=slot * size)
+        previous = np.ndarray(shape, dtype=np.uint8, buffer=ring.buf, offset=previous_slot * size) \
+            if previous_slot is not None else None
+        features = frame_features(gray, previous, compression, temporal, _worker.face_cascade if faces else None,
+                                  max_side)
+        del gray, previous
+        return features
+    finally:
+        ring.close()
+
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def _get_executor(kind: str, workers: int, face_cascades: Optional[DetectorPool]) -> Executor:
+    """Pool-urile sunt pastrate intre analize (pornirea proceselor este scumpa)."""
+    key = (kind, workers, face_cascades)
+    with _executors_lock:
+        if key not in _executors:
+            if kind == 'process':
+                _executors[key] = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                      initargs=(face_cascades,))
+            else:
+                _executors[key] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='video-features',
+                                                     initializer=_init_worker, initargs=(face_cascades,))
+        return _executors[key]
+
+
+def _discard_executor(executor: Executor):
+    with _executors_lock:
+        for key, value in list(_executors.items()):
+            if value is executor:
+                del _executors[key]
+    executor.shutdown(wait=False)
+
+
+class FrameFeatureExtractor:
+    """
+    Calculeaza caracteristicile per frame in paralel (thread-uri sau procese) si le agrega in
+    ordinea frame-urilor, deci rezultatul este identic cu cel secvential. Frame-urile sunt
+    consumate in flux, cu cel mult 2 x workers frame-uri in lucru; procesele primesc frame-urile
+    printr-un buffer circular in memorie partajata, nu prin pickle.
+
+    Exemplu:
+        extractor = FrameFeatureExtractor(face_cascades=DetectorPool(load_face_cascade))
+        statistics = extractor.collect(frames)
+    """
+
+    def __init__(self, compression: bool = True, temporal: bool = True,
+                 face_cascades: Optional[DetectorPool] = None, workers: Optional[int] = None,
+                 executor: Optional[str] = None, max_side: int = VIDEO_ANALYSIS_MAX_SIDE):
+        self.compression = compression
+        self.temporal = temporal
+        self.face_cascades = face_cascades
+        self.workers = workers if workers is not None else (VIDEO_FEATURE_WORKERS or os.cpu_count() or 1)
+        self.executor = executor or VIDEO_FEATURE_EXECUTOR
+        self.max_side = max_side
+
+    def collect(self, frames: Iterable[np.ndarray]) -> FrameStatistics:
+        """
+        Args:
+            frames: Frame-uri BGR (lista sau generator)
+
+        Returns:
+            FrameStatistics: Statisticile agregate
+        """
+        statistics = FrameStatistics()
+        if self.workers <= 1:
+            self._collect_serial(frames, statistics)
+        else:
+            self._collect_parallel(frames, statistics)
+        return statistics
+
+    def _collect_serial(self, frames: Iterable[np.ndarray], statistics: FrameStatistics):
+        with ExitStack() as stack:
+            face_cascade = stack.enter_context(self.face_cascades.borrow()) if self.face_cascades is not None else None
+            previous = None
+            for frame in frames:
+                gray = to_gray(frame)
+                statistics.add(frame_features(gray, previous, self.compression, self.temporal, face_cascade,
+                                              self.max_side))
+                previous = gray if self.temporal else None
+
+    def _collect_parallel(self, frames: Iterable[np.ndarray], statistics: FrameStatistics):
+        executor = _get_executor(self.executor, self.workers, self.face_cascades)
+        use_processes = self.executor == 'process'
+        faces = self.face_cascades is not None
+        window = 2 * self.workers
+        pending = deque()
+        ring = shape = None
+        previous = None
+        try:
+            for index, frame in enumerate(frames):
+                gray = to_gray(frame)
+                # Rezultatele sunt preluate în ordinea frame-urilor; un slot din buffer este
+                # rescris doar după ce frame-ul vechi și succesorul lui au fost procesate
+                while len(pending) >= window:
+                    statistics.add(pending.popleft().result())
+                if use_processes:
+                    if ring is None:
+                        ring = shared_memory.SharedMemory(create=True, size=gray.size * (window + 1))
+                        shape = gray.shape
+                    if gray.shape != shape:
+                        raise ValueError("Frame-urile trebuie sa aiba aceeasi dimensiune")
+                    slot = index % (window + 1)
+                    np.ndarray(shape, dtype=np.uint8, buffer=ring.buf, offset=slot * gray.size)[...] = gray
+                    future = executor.submit(_process_task, ring.name, shape, slot, previous,
+                                             self.compression, self.temporal, faces, self.max_side)
+                    previous = slot if self.temporal else None
+                else:
+                    future = executor.submit(_thread_task, gray, previous, self.compression, self.temporal, faces,
+                                             self.max_side)
+                    previous = gray if self.temporal else None
+                pending.append(future)
+            while pending:
+                statistics.add(pending.popleft().result())
+        except BrokenExecutor:
+            _discard_executor(executor)
+            raise
+        finally:
+            # Bufferul partajat este eliberat doar după ce niciun proces nu îl mai citește
+            futures.wait(pending)
+            if ring is not None:
+                ring.close()
+                ring.unlink()
@@ -0,0 +1,115 @@
+"""
+Resursele comune ale analizei video, pregatite o singura data per proces:
+- detectoarele OpenCV (CascadeClassifier), incarcate o data si imprumutate pe rand analizelor;
+- disponibilitatea uneltelor externe (ffmpeg, ffprobe), verificata o data si reverificata
+  doar dupa VIDEO_TOOL_PROBE_INTERVAL secunde, in loc de un subproces la fiecare cerere;
+- directoarele temporare, create sub un director comun al procesului si sterse la iesire.
+"""
+
+import atexit
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from video_features import DetectorPool, load_face_cascade
+
+try:
+    import config
+except ImportError:
+    config = None
+
+VIDEO_TOOL_PROBE_INTERVAL = getattr(config, 'VIDEO_TOOL_PROBE_INTERVAL', 300)
+VIDEO_TEMP_DIR = getattr(config, 'VIDEO_TEMP_DIR', None)
+
+logger = logging.getLogger(__name__)
+
+
+class VideoToolkit:
+    """Registrul resurselor video ale procesului (vezi get_video_toolkit)."""
+
+    def __init__(self, probe_interval: float = VIDEO_TOOL_PROBE_INTERVAL, temp_dir: Optional[str] = VIDEO_TEMP_DIR):
+        self.probe_interval = probe_interval
+        self.temp_parent = temp_dir
+        self.face_cascades = DetectorPool(load_face_cascade)
+        self._probes: Dict[str, Dict] = {}
+        self._temp_root: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def tool_available(self, tool: str) -> bool:
+        """
+        Verifica daca unealta (ex. 'ffmpeg', 'ffprobe') poate fi rulata; rezultatul este
+        pastrat VIDEO_TOOL_PROBE_INTERVAL secunde.
+        """
+        with self._lock:
+            probe = self._probes.get(tool)
+            if probe and time.monotonic() - probe['checked_at'] < self.probe_interval:
+                return probe['available']
+
+        version = None
+        try:
+            result = subprocess.run([tool, '-version'], capture_output=True, text=True, timeout=10)
+            available = result.returncode == 0
+            version = result.stdout.split('\n', 1)[0] if available else None
+        except Exception:
+            available = False
+
+        with self._lock:
+            self._probes[tool] = {'available': available, 'version': version, 'checked_at': time.monotonic()}
+        return available
+
+    def temp_root(self) -> str:
+        """Directorul temporar comun al procesului, creat la prima folosire si sters la iesire."""
+        with self._lock:
+            if self._temp_root is None or not os.path.isdir(self._temp_root):
+                if self.temp_parent:
+                    os.makedirs(self.temp_parent, exist_ok=True)
+                self._temp_root = tempfile.mkdtemp(prefix='video-', dir=self.temp_parent)
+            return self._temp_root
+
+    @contextmanager
+    def scratch_dir(self) -> Iterator[str]:
+        """Un director temporar pentru o singura analiza, sters la iesirea din bloc."""
+        path = tempfile.mkdtemp(dir=self.temp_root())
+        try:
+            yield path
+        finally:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def cleanup(self):
+        """Sterge directorul temporar comun (la oprirea procesului)."""
+        with self._lock:
+            root, self._temp_root = self._temp_root, None
+        if root:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def get_status(self) -> Dict:
+        """Statistici pentru /system-status."""
+        with self._lock:
+            tools = {
+                tool: {'available': probe['available'], 'version': probe['version'],
+                       'checked_seconds_ago': round(time.monotonic() - probe['checked_at'], 1)}
+                for tool, probe in self._probes.items()
+            }
+            temp_root = self._temp_root
+        return {'tools': tools, 'face_cascades': self.face_cascades.get_status(), 'temp_root': temp_root}
+
+
+_toolkit: Optional[VideoToolkit] = None
+_toolkit_lock = threading.Lock()
+
+
+def get_video_toolkit() -> VideoToolkit:
+    """Returneaza instanta comuna a procesului."""
+    global _toolkit
+    if _toolkit is None:
+        with _toolkit_lock:
+            if _toolkit is None:
+                _toolkit = VideoToolkit()
+                atexit.register(_toolkit.cleanup)
+    return _toolkit